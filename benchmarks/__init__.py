@@ -0,0 +1,5 @@
+"""
+benchmarks — Microbenchmarks for the aida-voice hot paths.
+
+Run with ``python -m benchmarks.run``; see ``benchmarks/run.py``.
+"""
@@ -0,0 +1,74 @@
+"""
+benchmarks.bench_codecs — Per-stream cost of the G.711 / resampling layer.
+
+Cost is reported per 20 ms frame, the unit each call pays 50 times a
+second in each direction.  Correctness against the ITU-T G.711
+reference lives in ``tests/test_audio_codecs.py``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from benchmarks import payloads
+from benchmarks.harness import benchmark
+from voice_service import audio_codecs
+from voice_service.audio_codecs import build_transcoders, get_codec
+
+# ── Per-frame cost ───────────────────────────────────────────────────
+
+_ACS_FRAME = payloads.ACS_FRAME_PCM
+_FRAME_SAMPLES = np.frombuffer(_ACS_FRAME, dtype="<i2")
+
+
+@benchmark("audio_codecs.g711_ulaw.encode[20ms@8k]")
+def bench_ulaw_encode():
+    codec = get_codec("g711_ulaw")
+    samples = _FRAME_SAMPLES[::3].copy()
+
+    def op() -> None:
+        codec.encode(samples)
+
+    return op
+
+
+@benchmark("audio_codecs.g711_ulaw.decode[20ms@8k]")
+def bench_ulaw_decode():
+    codec = get_codec("g711_ulaw")
+    data = codec.encode(_FRAME_SAMPLES[::3].copy())
+
+    def op() -> None:
+        codec.decode(data)
+
+    return op
+
+
+@benchmark("audio_codecs.Transcoder[pcm16@24k->g711_ulaw]")
+def bench_transcode_inbound():
+    inbound, _ = build_transcoders(24000, "g711_ulaw")
+
+    def op() -> None:
+        inbound.convert(_ACS_FRAME)
+
+    return op
+
+
+@benchmark("audio_codecs.Transcoder[g711_ulaw->pcm16@24k]")
+def bench_transcode_outbound():
+    inbound, outbound = build_transcoders(24000, "g711_ulaw")
+    data = inbound.convert(_ACS_FRAME)
+
+    def op() -> None:
+        outbound.convert(data)
+
+    return op
+
+
+@benchmark("audio_codecs.Transcoder[pcm16 passthrough]")
+def bench_transcode_passthrough():
+    inbound, _ = build_transcoders(24000, audio_codecs.REALTIME_AUDIO_FORMAT)
+
+    def op() -> None:
+        inbound.convert(_ACS_FRAME)
+
+    return op
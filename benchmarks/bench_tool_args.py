@@ -0,0 +1,60 @@
+"""
+benchmarks.bench_tool_args — Cost of validating Realtime tool-call arguments.
+
+``parse_tool_arguments()`` replaced a bare ``json.loads`` in the tool-call
+path; ``json.loads[...]`` is timed on the same string as the reference,
+so the difference is the validation cost per call.  Validator behaviour
+(defaults, coercion, rejection) is tested in ``tests/test_tool_args.py``.
+"""
+
+from __future__ import annotations
+
+import json
+
+from benchmarks import payloads
+from benchmarks.harness import benchmark
+from voice_service.tool_args import ToolArgumentError
+from voice_service.voice_tools import parse_tool_arguments
+
+
+@benchmark("json.loads[schedule_meeting]")
+def bench_json_loads_reference():
+    arguments = payloads.TOOL_ARGS_SCHEDULE_MEETING
+
+    def op() -> None:
+        json.loads(arguments)
+
+    return op
+
+
+@benchmark("parse_tool_arguments[schedule_meeting]")
+def bench_parse_schedule_meeting():
+    arguments = payloads.TOOL_ARGS_SCHEDULE_MEETING
+
+    def op() -> None:
+        parse_tool_arguments("schedule_meeting", arguments)
+
+    return op
+
+
+@benchmark("parse_tool_arguments[get_meeting_notes,coerced]")
+def bench_parse_coerced():
+    arguments = payloads.TOOL_ARGS_MEETING_NOTES_COERCED
+
+    def op() -> None:
+        parse_tool_arguments("get_meeting_notes", arguments)
+
+    return op
+
+
+@benchmark("parse_tool_arguments[get_meeting_notes,invalid]")
+def bench_parse_invalid():
+    arguments = payloads.TOOL_ARGS_MEETING_NOTES_INVALID
+
+    def op() -> None:
+        try:
+            parse_tool_arguments("get_meeting_notes", arguments)
+        except ToolArgumentError:
+            pass
+
+    return op
@@ -0,0 +1,368 @@
+"""
+benchmarks.bench_voice_hot_paths — Per-frame and per-event hot paths.
+
+Covers the functions that run for every audio frame or Realtime event:
+``handle_acs_message``, ``_handle_realtime_event``,
+``_send_audio_to_acs``, the playout buffer,
+``WakeWordDetector.check_transcript`` and the
+``VoiceSession`` transcript helpers.  The Realtime and ACS sockets are
+replaced with no-op sinks so only our own code is measured.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from benchmarks import payloads
+from benchmarks.harness import benchmark
+from voice_service.call_reaper import CallReaper
+from voice_service.call_recorder import CallRecorder
+from voice_service.meeting_audio_worker import MeetingAudioWorker
+from voice_service.meeting_wake_word import WakeWordDetector
+from voice_service.participant_tracker import ParticipantTracker
+from voice_service.passive_transcription import NullTranscriptionBackend
+from voice_service.playout import PlayoutBuffer
+from voice_service.timer_wheel import TimerWheel
+from voice_service.voice_state import VoiceSession
+
+
+class _NullRealtimeClient:
+    """Accepts audio and events without doing any I/O."""
+
+    async def send_audio(self, audio_bytes: bytes) -> None:
+        return None
+
+    async def send_event(self, event: dict[str, Any]) -> bool:
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        return {"state": "connected", "buffered_ms": 0}
+
+    async def close(self) -> None:
+        return None
+
+
+class _NullRecordingWriter:
+    """Recycles handed-off buffers without touching disk (the real writer runs off-loop)."""
+
+    def submit(self, item: tuple[Any, ...]) -> None:
+        if item[0] == "chunk":
+            item[-1].release(item[3])
+
+
+# Not driven by a loop here, so nothing fires while benchmarks run
+_WHEEL = TimerWheel()
+
+
+def _noop() -> None:
+    return None
+
+
+class _NullAcsSocket:
+    """Stands in for the ACS media WebSocket."""
+
+    closed = False
+
+    async def send_str(self, data: str) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+def _make_recorder() -> CallRecorder:
+    return CallRecorder("bench-call", sample_rate=24000, writer=_NullRecordingWriter())  # type: ignore[arg-type]
+
+
+def _make_worker(meeting_mode: bool = False, record: bool = False) -> MeetingAudioWorker:
+    session = VoiceSession(
+        call_connection_id="bench-call",
+        acs_ws=_NullAcsSocket(),  # type: ignore[arg-type]
+        is_meeting_mode=meeting_mode,
+    )
+    worker = MeetingAudioWorker(session=session, acs_client=None, meeting_manager=None)  # type: ignore[arg-type]
+    worker._realtime_client = _NullRealtimeClient()  # type: ignore[assignment]
+    worker._realtime_connected = not meeting_mode
+    worker._passive._backend = NullTranscriptionBackend()
+    worker._running = True
+    worker._idle_timer = _WHEEL.schedule(120.0, _noop)
+    worker._reaper = CallReaper(worker._on_reap, wheel=_WHEEL)
+    worker._reaper.start()
+    if record:
+        worker._recorder = _make_recorder()
+    return worker
+
+
+def _session_with_entries(count: int) -> VoiceSession:
+    session = VoiceSession(call_connection_id="bench-call")
+    for i in range(count):
+        session.add_transcript_entry(f"Speaker {i % 6}", payloads.UTTERANCE)
+    return session
+
+
+# ── ACS -> Realtime ──────────────────────────────────────────────────
+
+@benchmark("worker.handle_acs_message[AudioData]")
+def bench_handle_acs_message_audio():
+    worker = _make_worker()
+    message = payloads.acs_audio_message()
+
+    async def op() -> None:
+        await worker.handle_acs_message(message)
+
+    return op
+
+
+@benchmark("worker.handle_acs_message[AudioData,silent]")
+def bench_handle_acs_message_silent():
+    worker = _make_worker()
+    message = payloads.acs_audio_message(silent=True)
+
+    async def op() -> None:
+        await worker.handle_acs_message(message)
+
+    return op
+
+
+@benchmark("worker.handle_acs_message[AudioData,recording]")
+def bench_handle_acs_message_recording():
+    worker = _make_worker(record=True)
+    message = payloads.acs_audio_message()
+
+    async def op() -> None:
+        await worker.handle_acs_message(message)
+
+    return op
+
+
+@benchmark("CallRecorder.write_inbound[20ms]")
+def bench_recorder_write_inbound():
+    recorder = _make_recorder()
+    frame = payloads.REALTIME_DELTA_PCM[:payloads.ACS_FRAME_BYTES]
+
+    def op() -> None:
+        recorder.write_inbound(frame)
+
+    return op
+
+
+@benchmark("worker.handle_acs_message[AudioData,meeting-passive]")
+def bench_handle_acs_message_meeting_passive():
+    worker = _make_worker(meeting_mode=True)
+    message = payloads.acs_audio_message()
+
+    async def op() -> None:
+        await worker.handle_acs_message(message)
+
+    return op
+
+
+def _bench_participant_update(participants: int):
+    tracker = ParticipantTracker()
+    ids = [f"{payloads.PARTICIPANT_RAW_ID[:-4]}{i:04x}" for i in range(participants)]
+    for raw_id in ids:
+        tracker.update(raw_id, payloads.ACS_FRAME_PCM)
+    # A fresh string per call, as json.loads produces for each frame
+    frame_id = "".join(ids[-1])
+    state = {"now": 0.0}
+
+    def op() -> None:
+        state["now"] += 0.02
+        tracker.update(frame_id, payloads.ACS_FRAME_PCM, now=state["now"])
+
+    return op
+
+
+@benchmark("ParticipantTracker.update[2 participants]")
+def bench_participant_update_small():
+    return _bench_participant_update(2)
+
+
+@benchmark("ParticipantTracker.update[200 participants]")
+def bench_participant_update_large():
+    return _bench_participant_update(200)
+
+
+# ── Realtime -> ACS ──────────────────────────────────────────────────
+
+@benchmark("worker._handle_realtime_event[response.audio.delta]")
+def bench_realtime_audio_delta():
+    worker = _make_worker()
+    event = payloads.realtime_audio_delta()
+
+    async def op() -> None:
+        await worker._handle_realtime_event(event)
+        # No pacer task here — discard the queued frames (flush() would
+        # mark the item as cut off and drop the next delta)
+        worker._playout._frames.clear()
+
+    return op
+
+
+@benchmark("worker._handle_realtime_event[response.audio_transcript.delta]")
+def bench_realtime_transcript_delta():
+    worker = _make_worker()
+    event = payloads.realtime_transcript_delta()
+
+    async def op() -> None:
+        await worker._handle_realtime_event(event)
+        # Keep the accumulator bounded like a real response would
+        worker._ctx.accumulated_text = ""
+
+    return op
+
+
+@benchmark("worker._handle_realtime_event[transcription.completed]")
+def bench_realtime_transcription_completed():
+    worker = _make_worker(meeting_mode=True)
+    event = payloads.realtime_transcription_completed()
+
+    async def op() -> None:
+        await worker._handle_realtime_event(event)
+
+    return op
+
+
+@benchmark("worker._handle_realtime_event[rate_limits.updated]")
+def bench_realtime_rate_limits():
+    worker = _make_worker()
+    event: dict[str, Any] = {"type": "rate_limits.updated", "rate_limits": []}
+
+    async def op() -> None:
+        await worker._handle_realtime_event(event)
+
+    return op
+
+
+@benchmark("worker._handle_realtime_event[unknown]")
+def bench_realtime_unknown_event():
+    worker = _make_worker()
+    event: dict[str, Any] = {"type": "conversation.item.truncated", "item_id": "item_B3kL9n5oQ9rS3tU7"}
+
+    async def op() -> None:
+        await worker._handle_realtime_event(event)
+
+    return op
+
+
+@benchmark("worker._send_audio_to_acs")
+def bench_send_audio_to_acs():
+    worker = _make_worker()
+    audio_b64 = payloads.REALTIME_DELTA_B64
+
+    async def op() -> None:
+        await worker._send_audio_to_acs(audio_b64)
+
+    return op
+
+
+@benchmark("worker._send_frame_to_acs[20ms]")
+def bench_send_frame_to_acs():
+    worker = _make_worker()
+    frame = payloads.REALTIME_DELTA_PCM[:payloads.ACS_FRAME_BYTES]
+
+    async def op() -> None:
+        await worker._send_frame_to_acs(frame)
+
+    return op
+
+
+@benchmark("PlayoutBuffer.enqueue[100ms delta]")
+def bench_playout_enqueue():
+    playout = PlayoutBuffer(_NullAcsSocket().send_str)  # type: ignore[arg-type]
+    pcm = payloads.REALTIME_DELTA_PCM
+
+    def op() -> None:
+        playout.enqueue(pcm, "item_B3kL9n5oQ9rS3tU7")
+        playout._frames.clear()
+
+    return op
+
+
+# ── Wake word ────────────────────────────────────────────────────────
+
+@benchmark("WakeWordDetector.check_transcript[miss]")
+def bench_wake_word_miss():
+    detector = WakeWordDetector()
+    text = payloads.UTTERANCE
+
+    def op() -> None:
+        detector.check_transcript(text)
+
+    return op
+
+
+@benchmark("WakeWordDetector.check_transcript[hit]")
+def bench_wake_word_hit():
+    detector = WakeWordDetector()
+    text = payloads.WAKE_UTTERANCE
+
+    def op() -> None:
+        detector.check_transcript(text)
+
+    return op
+
+
+# ── Timer wheel ──────────────────────────────────────────────────────
+
+def _busy_wheel(timers: int) -> TimerWheel:
+    wheel = TimerWheel()
+    for i in range(timers):
+        wheel.schedule(1 + i % 7200, _noop)
+    return wheel
+
+
+@benchmark("TimerWheel.reset[same tick]")
+def bench_timer_reset_same_tick():
+    timer = _busy_wheel(10_000).schedule(120.0, _noop)
+
+    def op() -> None:
+        timer.reset()
+
+    return op
+
+
+@benchmark("TimerWheel.reset[moved]")
+def bench_timer_reset_moved():
+    timer = _busy_wheel(10_000).schedule(120.0, _noop)
+    delays = (30.0, 60.0)
+    state = [0]
+
+    def op() -> None:
+        state[0] ^= 1
+        timer.reset(delays[state[0]])
+
+    return op
+
+
+@benchmark("TimerWheel.schedule+cancel[10k pending]")
+def bench_timer_schedule_cancel():
+    wheel = _busy_wheel(10_000)
+
+    def op() -> None:
+        wheel.schedule(30.0, _noop).cancel()
+
+    return op
+
+
+# ── Session state ────────────────────────────────────────────────────
+
+@benchmark("VoiceSession.add_transcript_entry")
+def bench_add_transcript_entry():
+    session = VoiceSession(call_connection_id="bench-call")
+    text = payloads.UTTERANCE
+
+    def op() -> None:
+        session.add_transcript_entry("Priya", text)
+
+    return op
+
+
+@benchmark("VoiceSession.to_dict[500 entries]")
+def bench_to_dict():
+    session = _session_with_entries(500)
+
+    def op() -> None:
+        session.to_dict()
+
+    return op
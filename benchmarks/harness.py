@@ -0,0 +1,174 @@
+"""
+benchmarks.harness — Minimal microbenchmark runner.
+
+Benchmarks register with ``@benchmark(name)``.  The decorated function
+does its setup and returns the operation to time — either a plain
+callable or a coroutine function.  The runner:
+
+  1. calibrates an iteration count so one round takes ~``min_time``;
+  2. runs ``rounds`` rounds and keeps the best (least disturbed) one
+     for ops/sec, plus the median for reference;
+  3. measures memory for a batch of operations under ``tracemalloc``:
+     peak bytes per op and blocks still held per op afterwards
+     (non-zero retained blocks usually means per-op growth).
+
+Timing and allocation passes are separate so tracemalloc overhead
+never skews ops/sec.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import inspect
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+Operation = Callable[[], Any] | Callable[[], Awaitable[Any]]
+
+_REGISTRY: dict[str, Callable[[], Operation]] = {}
+
+# Single-op runs averaged for the peak-memory figure
+_PEAK_SAMPLES = 20
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Operation]], Callable[[], Operation]]:
+    """Register a benchmark factory under ``name``."""
+
+    def decorator(factory: Callable[[], Operation]) -> Callable[[], Operation]:
+        if name in _REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        _REGISTRY[name] = factory
+        return factory
+
+    return decorator
+
+
+def registered() -> dict[str, Callable[[], Operation]]:
+    """Return the registered benchmark factories by name."""
+    return dict(_REGISTRY)
+
+
+@dataclass
+class BenchResult:
+    """Result of one benchmark."""
+
+    name: str
+    ops_per_sec: float
+    median_ops_per_sec: float
+    ns_per_op: float
+    iterations: int
+    rounds: int
+    peak_bytes_per_op: float
+    retained_blocks_per_op: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+async def _time_async(op: Callable[[], Awaitable[Any]], n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        await op()
+    return time.perf_counter() - start
+
+
+def _time_sync(op: Callable[[], Any], n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        op()
+    return time.perf_counter() - start
+
+
+async def _run_op(op: Operation, is_async: bool, n: int) -> float:
+    if is_async:
+        return await _time_async(op, n)  # type: ignore[arg-type]
+    return _time_sync(op, n)
+
+
+async def run_benchmark(
+    name: str,
+    factory: Callable[[], Operation],
+    min_time: float = 0.2,
+    rounds: int = 5,
+    alloc_ops: int = 200,
+) -> BenchResult:
+    """Calibrate, time and memory-profile one benchmark."""
+    op = factory()
+    is_async = inspect.iscoroutinefunction(op)
+
+    # Warm up caches, lazy imports and interned strings
+    await _run_op(op, is_async, 10)
+
+    # Calibrate: double n until one round takes at least min_time
+    n = 1
+    while True:
+        elapsed = await _run_op(op, is_async, n)
+        if elapsed >= min_time or n >= 1 << 24:
+            break
+        n *= 2
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = [await _run_op(op, is_async, n) for _ in range(rounds)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    best = min(timings)
+    median = statistics.median(timings)
+
+    # Allocation pass
+    gc.collect()
+    tracemalloc.start()
+    try:
+        # Peak transient memory of a single op, averaged over several ops
+        peak_total = 0
+        for _ in range(_PEAK_SAMPLES):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await _run_op(op, is_async, 1)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += max(0, peak - current)
+
+        # Blocks still alive after a batch of ops
+        before = tracemalloc.take_snapshot()
+        await _run_op(op, is_async, alloc_ops)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+    return BenchResult(
+        name=name,
+        ops_per_sec=n / best,
+        median_ops_per_sec=n / median,
+        ns_per_op=best / n * 1e9,
+        iterations=n,
+        rounds=rounds,
+        peak_bytes_per_op=peak_total / _PEAK_SAMPLES,
+        retained_blocks_per_op=max(0, retained) / alloc_ops,
+    )
+
+
+def run_all(
+    names: list[str] | None = None,
+    min_time: float = 0.2,
+    rounds: int = 5,
+) -> list[BenchResult]:
+    """Run the selected (default: all) registered benchmarks in one event loop."""
+
+    async def _main() -> list[BenchResult]:
+        results = []
+        for name, factory in sorted(_REGISTRY.items()):
+            if names and not any(sel in name for sel in names):
+                continue
+            results.append(await run_benchmark(name, factory, min_time=min_time, rounds=rounds))
+        return results
+
+    return asyncio.run(_main())
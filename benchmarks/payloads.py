@@ -0,0 +1,123 @@
+"""
+benchmarks.payloads — Realistic message payloads for the hot-path benchmarks.
+
+Shapes and sizes follow traffic captured from live calls:
+
+  - ACS ``AudioData`` frames: 20 ms of 24 kHz PCM16 (960 bytes, ~1.3 KB
+    base64) with timestamp, participantRawId and silent flag.
+  - Realtime ``response.audio.delta``: ~100 ms of audio per delta
+    (4800 bytes, 6.4 KB base64).
+  - Transcript deltas and completed transcription events with
+    typical meeting-length utterances.
+  - Tool-call argument strings as the model writes them, well-formed
+    and with the near misses the validators coerce or reject.
+
+Audio content is deterministic synthetic speech-band noise so runs are
+reproducible without shipping binary recordings.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import random
+
+SAMPLE_RATE = 24000
+ACS_FRAME_BYTES = SAMPLE_RATE * 2 * 20 // 1000
+REALTIME_DELTA_BYTES = SAMPLE_RATE * 2 * 100 // 1000
+
+PARTICIPANT_RAW_ID = "8:acs:5f2c1b9e-3a7d-4c21-9d8e-0b6f7e2a4c11_0000001a-7f3e-41b2-85f4-343a0d00a1b2"
+
+_rng = random.Random(20240611)
+
+
+def _pcm(nbytes: int, amplitude: int = 3000) -> bytes:
+    samples = [_rng.randint(-amplitude, amplitude) for _ in range(nbytes // 2)]
+    return b"".join(s.to_bytes(2, "little", signed=True) for s in samples)
+
+
+ACS_FRAME_PCM = _pcm(ACS_FRAME_BYTES)
+REALTIME_DELTA_PCM = _pcm(REALTIME_DELTA_BYTES)
+REALTIME_DELTA_B64 = base64.b64encode(REALTIME_DELTA_PCM).decode("ascii")
+
+
+def acs_audio_message(silent: bool = False) -> str:
+    """Serialized ACS ``AudioData`` message as it arrives on ``/voice-v2``."""
+    return json.dumps({
+        "kind": "AudioData",
+        "audioData": {
+            "timestamp": "2024-06-11T14:03:27.412Z",
+            "participantRawId": PARTICIPANT_RAW_ID,
+            "data": base64.b64encode(bytes(ACS_FRAME_BYTES) if silent else ACS_FRAME_PCM).decode("ascii"),
+            "silent": silent,
+        },
+    })
+
+
+def acs_metadata_message() -> str:
+    """Serialized ACS ``AudioMetadata`` message (first message on the socket)."""
+    return json.dumps({
+        "kind": "AudioMetadata",
+        "audioMetadata": {
+            "subscriptionId": "7e2bd2a1-6c4a-4d0b-9f42-2b8c1d7a9e30",
+            "encoding": "PCM",
+            "sampleRate": SAMPLE_RATE,
+            "channels": 1,
+            "length": ACS_FRAME_BYTES,
+        },
+    })
+
+
+def realtime_audio_delta() -> dict:
+    """Parsed ``response.audio.delta`` event."""
+    return {
+        "type": "response.audio.delta",
+        "event_id": "event_B3kL9pQ2rT7vX1yZ",
+        "response_id": "resp_B3kL9m4nP8qR2sT6",
+        "item_id": "item_B3kL9n5oQ9rS3tU7",
+        "output_index": 0,
+        "content_index": 0,
+        "delta": REALTIME_DELTA_B64,
+    }
+
+
+def realtime_transcript_delta() -> dict:
+    """Parsed ``response.audio_transcript.delta`` event."""
+    return {
+        "type": "response.audio_transcript.delta",
+        "event_id": "event_B3kLA1bC2dE3fG4h",
+        "response_id": "resp_B3kL9m4nP8qR2sT6",
+        "item_id": "item_B3kL9n5oQ9rS3tU7",
+        "output_index": 0,
+        "content_index": 0,
+        "delta": " the action items",
+    }
+
+
+UTTERANCE = (
+    "Okay so for the rollout next week I think we should keep the canary at five percent "
+    "until the latency dashboards look clean, and then Priya can take the second wave."
+)
+WAKE_UTTERANCE = "Hey AIDA, what were the action items from yesterday's standup?"
+
+
+def realtime_transcription_completed(text: str = UTTERANCE) -> dict:
+    """Parsed ``conversation.item.input_audio_transcription.completed`` event."""
+    return {
+        "type": "conversation.item.input_audio_transcription.completed",
+        "event_id": "event_B3kLB7cD8eF9gH0i",
+        "item_id": "item_B3kLB2aZ3bY4cX5d",
+        "content_index": 0,
+        "transcript": text,
+    }
+
+
+# ``response.function_call_arguments.done`` argument strings
+TOOL_ARGS_SCHEDULE_MEETING = json.dumps({
+    "subject": "Release review",
+    "attendees": ["priya@contoso.com", "Marcus Chen", "dana@contoso.com"],
+    "time": "next Thursday at 2pm",
+    "duration_minutes": 45,
+})
+TOOL_ARGS_MEETING_NOTES_COERCED = '{"query": "  latency dashboard  ", "days_back": "14"}'
+TOOL_ARGS_MEETING_NOTES_INVALID = '{"days_back": "last month"}'
@@ -0,0 +1,161 @@
+"""
+benchmarks.run — Run the microbenchmarks and compare against a baseline.
+
+Usage::
+
+    python -m benchmarks.run                      # run all, compare to baseline
+    python -m benchmarks.run -k handle_acs        # substring filter
+    python -m benchmarks.run --update-baseline    # accept current numbers
+
+Results are written as JSON (``--output``, default
+``benchmarks/results.json``).  A benchmark regresses when its ops/sec
+drops more than ``--tolerance`` below the baseline, or when its peak
+bytes per op grows by more than the same fraction (and at least
+``ALLOC_SLACK_BYTES``).  The exit status is 1 if anything regressed.
+
+Baselines are machine-specific — regenerate ``baseline.json`` on the
+machine (or CI runner class) you compare against.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import pkgutil
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import benchmarks
+from benchmarks.harness import BenchResult, run_all
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCH_DIR / "results.json"
+
+# Ignore peak-memory growth smaller than this (allocator noise)
+ALLOC_SLACK_BYTES = 256
+
+
+def discover() -> None:
+    """Import every ``benchmarks.bench_*`` module so its benchmarks register."""
+    for module in pkgutil.iter_modules(benchmarks.__path__):
+        if module.name.startswith("bench_"):
+            importlib.import_module(f"benchmarks.{module.name}")
+
+
+def _document(results: list[BenchResult]) -> dict[str, Any]:
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": {r.name: r.to_dict() for r in results},
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[dict[str, Any]]:
+    """
+    Compare two result documents.
+
+    Returns:
+        One row per benchmark present in ``current`` with the ops/sec
+        ratio, peak-bytes delta and a ``status`` of ``ok``,
+        ``regressed``, ``improved`` or ``new``.
+    """
+    rows = []
+    base_results = baseline.get("results", {})
+    for name, cur in current["results"].items():
+        base = base_results.get(name)
+        if base is None:
+            rows.append({"name": name, "status": "new", "ops_per_sec": cur["ops_per_sec"]})
+            continue
+        ratio = cur["ops_per_sec"] / base["ops_per_sec"] if base["ops_per_sec"] else 1.0
+        alloc_delta = cur["peak_bytes_per_op"] - base["peak_bytes_per_op"]
+        alloc_regressed = (
+            alloc_delta > ALLOC_SLACK_BYTES
+            and alloc_delta > base["peak_bytes_per_op"] * tolerance
+        )
+        if ratio < 1 - tolerance or alloc_regressed:
+            status = "regressed"
+        elif ratio > 1 + tolerance:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append({
+            "name": name,
+            "status": status,
+            "ops_per_sec": cur["ops_per_sec"],
+            "baseline_ops_per_sec": base["ops_per_sec"],
+            "ratio": ratio,
+            "peak_bytes_delta": alloc_delta,
+        })
+    return rows
+
+
+def _print_table(results: list[BenchResult], rows: list[dict[str, Any]]) -> None:
+    by_name = {row["name"]: row for row in rows}
+    width = max((len(r.name) for r in results), default=10)
+    print(f"{'benchmark':<{width}}  {'ops/sec':>12}  {'ns/op':>10}  {'peak B/op':>10}  {'kept/op':>8}  vs baseline")
+    for r in results:
+        row = by_name.get(r.name, {})
+        versus = row.get("status", "")
+        if "ratio" in row:
+            versus = f"{row['ratio']:.2f}x {row['status']}"
+        print(
+            f"{r.name:<{width}}  {r.ops_per_sec:>12,.0f}  {r.ns_per_op:>10,.0f}  "
+            f"{r.peak_bytes_per_op:>10,.0f}  {r.retained_blocks_per_op:>8.2f}  {versus}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run aida-voice hot-path microbenchmarks.")
+    parser.add_argument("-k", dest="filters", action="append", default=[], help="Substring filter (repeatable)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed fractional slowdown")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per timing round")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    # Production logs at INFO to a handler; keep benchmark output clean
+    # while still paying for the level checks.
+    logging.basicConfig(level=logging.WARNING)
+
+    discover()
+    results = run_all(args.filters or None, min_time=args.min_time, rounds=args.rounds)
+    document = _document(results)
+
+    args.output.write_text(json.dumps(document, indent=2) + "\n")
+
+    rows: list[dict[str, Any]] = []
+    if args.baseline.exists() and not args.update_baseline:
+        rows = compare(document, json.loads(args.baseline.read_text()), args.tolerance)
+
+    _print_table(results, rows)
+
+    if args.update_baseline:
+        merged = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"results": {}}
+        merged["meta"] = document["meta"]
+        merged["results"].update(document["results"])
+        args.baseline.write_text(json.dumps(merged, indent=2) + "\n")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    regressed = [row["name"] for row in rows if row["status"] == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} benchmark(s) regressed: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+loadtest — Concurrent-call load harness for aida-voice.
+
+Contains a fake OpenAI Realtime API server, a fake ACS media-streaming
+client, and a ramping harness that finds how many calls one replica
+can sustain.
+"""
@@ -0,0 +1,228 @@
+"""
+loadtest.fake_acs_client — Simulated ACS media-streaming call.
+
+Imitates what Azure Communication Services does for one answered call:
+
+  1. Opens the ``/voice-v2`` WebSocket with the ACS handshake headers.
+  2. Sends an ``AudioMetadata`` message, then ``AudioData`` frames every
+     20 ms on an absolute schedule (talk spurts followed by frames
+     flagged ``silent``).
+  3. Fires the matching Call Automation webhook events —
+     ``CallConnected``, ``ParticipantsUpdated``,
+     ``MediaStreamingStarted`` and finally ``CallDisconnected``.
+
+While running it measures frame pacing (frames that missed their slot
+by more than one frame are counted as dropped), reply audio received,
+and client-side turn latency: the time from the last non-silent frame
+sent to the first reply frame received after it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import math
+import struct
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import aiohttp
+
+SAMPLE_RATE = 24000
+FRAME_MS = 20
+SAMPLES_PER_FRAME = SAMPLE_RATE * FRAME_MS // 1000
+FRAME_BYTES = SAMPLES_PER_FRAME * 2
+
+
+def _speech_frame(index: int, amplitude: int = 4000) -> str:
+    """Base64 PCM16 frame of a warbling tone — loud enough to count as speech."""
+    freq = 180.0 + 40.0 * math.sin(index / 10)
+    offset = index * SAMPLES_PER_FRAME
+    pcm = struct.pack(
+        f"<{SAMPLES_PER_FRAME}h",
+        *(int(amplitude * math.sin(2 * math.pi * freq * (offset + i) / SAMPLE_RATE)) for i in range(SAMPLES_PER_FRAME)),
+    )
+    return base64.b64encode(pcm).decode("ascii")
+
+
+# Precompute a short loop of speech frames and one silent frame so the
+# client spends its CPU on pacing, not on synthesis.
+_SPEECH_FRAMES = [_speech_frame(i) for i in range(50)]
+_SILENT_FRAME = base64.b64encode(bytes(FRAME_BYTES)).decode("ascii")
+
+
+@dataclass
+class CallProfile:
+    """Shape of the simulated caller's speech."""
+
+    talk_ms: int = 3000
+    """Length of each talk spurt."""
+    listen_ms: int = 4000
+    """Silence after each spurt (time for AIDA to reply)."""
+    participants: int = 1
+    """Number of distinct participantRawIds to rotate through."""
+
+
+@dataclass
+class CallResult:
+    """Measurements collected for one simulated call."""
+
+    call_connection_id: str
+    frames_sent: int = 0
+    frames_dropped: int = 0
+    frames_received: int = 0
+    bytes_received: int = 0
+    turn_latencies: list[float] = field(default_factory=list)
+    error: str = ""
+
+    @property
+    def drop_rate(self) -> float:
+        total = self.frames_sent + self.frames_dropped
+        return self.frames_dropped / total if total else 0.0
+
+
+def _cloud_event(event_type: str, call_connection_id: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Build a CloudEvent envelope like the ones ACS posts to the webhook."""
+    return {
+        "id": str(uuid.uuid4()),
+        "source": f"calling/callConnections/{call_connection_id}",
+        "type": event_type,
+        "specversion": "1.0",
+        "time": datetime.now(timezone.utc).isoformat(),
+        "data": {
+            "callConnectionId": call_connection_id,
+            "serverCallId": f"server-{call_connection_id}",
+            "correlationId": str(uuid.uuid4()),
+            **(data or {}),
+        },
+    }
+
+
+class FakeAcsCall:
+    """One simulated ACS call against a running voice service."""
+
+    def __init__(
+        self,
+        base_url: str,
+        http: aiohttp.ClientSession,
+        profile: CallProfile | None = None,
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._ws_url = self._base_url.replace("https://", "wss://").replace("http://", "ws://") + "/voice-v2"
+        self._http = http
+        self._profile = profile or CallProfile()
+        self._participants = [
+            f"8:acs:loadtest-{uuid.uuid4().hex[:12]}" for _ in range(self._profile.participants)
+        ]
+        self.result = CallResult(call_connection_id=f"loadtest-{uuid.uuid4()}")
+        self._last_speech_sent = 0.0
+        self._awaiting_reply = False
+
+    async def _post_event(self, event_type: str, data: dict[str, Any] | None = None) -> None:
+        body = [_cloud_event(event_type, self.result.call_connection_id, data)]
+        async with self._http.post(f"{self._base_url}/api/calls/webhook", json=body) as resp:
+            await resp.read()
+
+    async def run(self, duration: float, stop: asyncio.Event | None = None) -> CallResult:
+        """
+        Run the call for ``duration`` seconds (or until ``stop`` is set).
+
+        Returns:
+            The collected CallResult.
+        """
+        headers = {
+            "x-ms-call-connection-id": self.result.call_connection_id,
+            "x-ms-call-correlation-id": str(uuid.uuid4()),
+        }
+        try:
+            async with self._http.ws_connect(self._ws_url, headers=headers, max_msg_size=0) as ws:
+                await self._post_event("Microsoft.Communication.CallConnected")
+                await self._post_event("Microsoft.Communication.ParticipantsUpdated", {
+                    "participants": [
+                        {"rawId": raw_id, "displayName": f"Load Tester {i + 1}"}
+                        for i, raw_id in enumerate(self._participants)
+                    ],
+                })
+                await ws.send_str(json.dumps({
+                    "kind": "AudioMetadata",
+                    "audioMetadata": {
+                        "subscriptionId": str(uuid.uuid4()),
+                        "encoding": "PCM",
+                        "sampleRate": SAMPLE_RATE,
+                        "channels": 1,
+                        "length": FRAME_BYTES,
+                    },
+                }))
+                await self._post_event("Microsoft.Communication.MediaStreamingStarted")
+
+                receiver = asyncio.create_task(self._receive_loop(ws))
+                try:
+                    await self._send_loop(ws, duration, stop)
+                finally:
+                    receiver.cancel()
+                    try:
+                        await receiver
+                    except asyncio.CancelledError:
+                        pass
+                await self._post_event("Microsoft.Communication.CallDisconnected")
+        except Exception as exc:
+            self.result.error = f"{type(exc).__name__}: {exc}"
+        return self.result
+
+    async def _send_loop(self, ws: aiohttp.ClientWebSocketResponse, duration: float, stop: asyncio.Event | None) -> None:
+        """Send 20 ms frames on an absolute schedule until the call ends."""
+        frame_s = FRAME_MS / 1000
+        cycle_frames = (self._profile.talk_ms + self._profile.listen_ms) // FRAME_MS
+        talk_frames = self._profile.talk_ms // FRAME_MS
+        start = time.perf_counter()
+        end = start + duration
+        index = 0
+        while not ws.closed and (stop is None or not stop.is_set()):
+            deadline = start + index * frame_s
+            now = time.perf_counter()
+            if now >= end:
+                break
+            if deadline > now:
+                await asyncio.sleep(deadline - now)
+            elif now - deadline > frame_s:
+                # Missed the slot entirely — a real media stream drops it
+                self.result.frames_dropped += 1
+                index += 1
+                continue
+
+            position = index % cycle_frames
+            speaking = position < talk_frames
+            participant = self._participants[(index // cycle_frames) % len(self._participants)]
+            await ws.send_str(json.dumps({
+                "kind": "AudioData",
+                "audioData": {
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "participantRawId": participant,
+                    "data": _SPEECH_FRAMES[index % len(_SPEECH_FRAMES)] if speaking else _SILENT_FRAME,
+                    "silent": not speaking,
+                },
+            }))
+            self.result.frames_sent += 1
+            if speaking:
+                self._last_speech_sent = time.perf_counter()
+            elif position == talk_frames:
+                self._awaiting_reply = True
+            index += 1
+
+    async def _receive_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Count reply audio and record first-reply-frame latency per turn."""
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                continue
+            message = json.loads(msg.data)
+            if message.get("kind") != "AudioData":
+                continue
+            self.result.frames_received += 1
+            self.result.bytes_received += len(message.get("audioData", {}).get("data", "")) * 3 // 4
+            if self._awaiting_reply and self._last_speech_sent:
+                self.result.turn_latencies.append(time.perf_counter() - self._last_speech_sent)
+                self._awaiting_reply = False
@@ -0,0 +1,284 @@
+"""
+loadtest.fake_realtime_server — Local stand-in for the OpenAI Realtime API.
+
+Speaks enough of the Realtime WebSocket protocol to drive the audio
+worker under load without touching Azure:
+
+  - sends ``session.created`` on connect and ``session.updated`` for
+    every ``session.update``;
+  - counts appended input audio and simulates server VAD — after
+    ``turn_audio_ms`` of caller audio it emits speech started/stopped,
+    ``input_audio_buffer.committed`` and the input transcription;
+  - streams a response: ``response.created``, ``response.audio.delta``
+    chunks (faster than real time, like the real service),
+    transcript deltas, ``response.audio.done`` and ``response.done``;
+  - every ``tool_call_every`` turns, answers with a function call
+    first and streams audio only after the ``function_call_output``
+    item and ``response.create`` arrive.
+
+Run standalone::
+
+    python -m loadtest.fake_realtime_server --port 8765
+
+and point the voice service at it with
+``AZURE_OPENAI_REALTIME_ENDPOINT=http://localhost:8765``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import math
+import struct
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 24000
+BYTES_PER_SAMPLE = 2
+
+
+def _tone(duration_ms: int, freq: float = 220.0, amplitude: int = 6000) -> bytes:
+    """Generate a PCM16 sine tone used as synthetic assistant speech."""
+    n = SAMPLE_RATE * duration_ms // 1000
+    return struct.pack(
+        f"<{n}h",
+        *(int(amplitude * math.sin(2 * math.pi * freq * i / SAMPLE_RATE)) for i in range(n)),
+    )
+
+
+@dataclass
+class FakeRealtimeConfig:
+    """Behaviour knobs for the fake Realtime server."""
+
+    turn_audio_ms: int = 3000
+    """Caller audio (ms) that makes up one simulated utterance."""
+    response_audio_ms: int = 2000
+    """Length of each synthetic assistant reply."""
+    delta_ms: int = 100
+    """Audio duration carried by each ``response.audio.delta``."""
+    burst_factor: float = 4.0
+    """How much faster than real time deltas are streamed."""
+    response_delay_ms: int = 150
+    """Simulated model think time between commit and ``response.created``."""
+    tool_call_every: int = 4
+    """Emit a function call instead of audio every N turns (0 disables)."""
+    tool_name: str = "get_call_context"
+    """Tool requested by simulated function calls."""
+
+
+class _Connection:
+    """State for one client WebSocket connection."""
+
+    def __init__(self, ws: web.WebSocketResponse, config: FakeRealtimeConfig, reply_audio: bytes) -> None:
+        self.ws = ws
+        self.config = config
+        self.reply_audio = reply_audio
+        self.session_id = f"sess_{uuid.uuid4().hex[:12]}"
+        self.buffered_ms = 0.0
+        self.audio_ms_total = 0.0
+        self.turns = 0
+        self.pending_tool_call = False
+        self.response_task: asyncio.Task | None = None
+
+    async def send(self, event: dict[str, Any]) -> None:
+        if not self.ws.closed:
+            await self.ws.send_str(json.dumps(event))
+
+
+class FakeRealtimeServer:
+    """
+    aiohttp application that imitates the Realtime API WebSocket.
+
+    Also exposes ``POST /admin/drop`` to close every open connection
+    (or ``?count=N`` of them), which is used to exercise reconnects.
+    """
+
+    def __init__(self, config: FakeRealtimeConfig | None = None) -> None:
+        self.config = config or FakeRealtimeConfig()
+        self._reply_audio = _tone(self.config.response_audio_ms)
+        self._connections: set[_Connection] = set()
+        self.stats = {"connections": 0, "turns": 0, "tool_calls": 0, "audio_in_ms": 0.0, "drops": 0}
+        self._runner: web.AppRunner | None = None
+
+    # ── App ──────────────────────────────────────────────────────────
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/admin/drop", self._handle_drop)
+        app.router.add_get("/admin/stats", self._handle_stats)
+        app.router.add_get("/{tail:.*}", self._handle_ws)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Start serving in the current event loop."""
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        logger.info("Fake Realtime server listening on ws://%s:%d", host, port)
+
+    async def stop(self) -> None:
+        for conn in list(self._connections):
+            await conn.ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def drop_connections(self, count: int | None = None) -> int:
+        """Abruptly close up to ``count`` open connections (all if None)."""
+        victims = list(self._connections)[: count if count is not None else None]
+        for conn in victims:
+            if conn.response_task:
+                conn.response_task.cancel()
+            await conn.ws.close(code=aiohttp.WSCloseCode.GOING_AWAY, message=b"fake drop")
+        self.stats["drops"] += len(victims)
+        return len(victims)
+
+    # ── Handlers ─────────────────────────────────────────────────────
+
+    async def _handle_drop(self, request: web.Request) -> web.Response:
+        count = request.query.get("count")
+        dropped = await self.drop_connections(int(count) if count else None)
+        return web.json_response({"dropped": dropped})
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.stats, "open": len(self._connections)})
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        conn = _Connection(ws, self.config, self._reply_audio)
+        self._connections.add(conn)
+        self.stats["connections"] += 1
+
+        await conn.send({"type": "session.created", "session": {"id": conn.session_id}})
+        try:
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                await self._on_client_event(conn, json.loads(msg.data))
+        finally:
+            if conn.response_task:
+                conn.response_task.cancel()
+            self._connections.discard(conn)
+        return ws
+
+    async def _on_client_event(self, conn: _Connection, event: dict[str, Any]) -> None:
+        event_type = event.get("type", "")
+
+        if event_type == "session.update":
+            await conn.send({"type": "session.updated", "session": event.get("session", {})})
+
+        elif event_type == "input_audio_buffer.append":
+            chunk_ms = len(event.get("audio", "")) * 3 / 4 / BYTES_PER_SAMPLE / SAMPLE_RATE * 1000
+            conn.buffered_ms += chunk_ms
+            conn.audio_ms_total += chunk_ms
+            self.stats["audio_in_ms"] += chunk_ms
+            if conn.buffered_ms >= self.config.turn_audio_ms:
+                conn.buffered_ms = 0.0
+                await self._commit_turn(conn)
+
+        elif event_type == "conversation.item.create":
+            item = event.get("item", {})
+            await conn.send({"type": "conversation.item.created", "item": {**item, "id": f"item_{uuid.uuid4().hex[:8]}"}})
+
+        elif event_type == "response.create":
+            if conn.pending_tool_call:
+                conn.pending_tool_call = False
+                self._start_response(conn, with_tool_call=False)
+
+        elif event_type == "response.cancel":
+            if conn.response_task:
+                conn.response_task.cancel()
+
+    async def _commit_turn(self, conn: _Connection) -> None:
+        """Simulate server VAD detecting the end of an utterance."""
+        conn.turns += 1
+        self.stats["turns"] += 1
+        item_id = f"item_{uuid.uuid4().hex[:8]}"
+        end_ms = int(conn.audio_ms_total)
+        start_ms = max(0, end_ms - self.config.turn_audio_ms)
+        await conn.send({"type": "input_audio_buffer.speech_started", "audio_start_ms": start_ms, "item_id": item_id})
+        await conn.send({"type": "input_audio_buffer.speech_stopped", "audio_end_ms": end_ms, "item_id": item_id})
+        await conn.send({"type": "input_audio_buffer.committed", "item_id": item_id})
+        await conn.send({
+            "type": "conversation.item.input_audio_transcription.completed",
+            "item_id": item_id,
+            "content_index": 0,
+            "transcript": f"Synthetic caller utterance number {conn.turns}.",
+        })
+        every = self.config.tool_call_every
+        self._start_response(conn, with_tool_call=bool(every) and conn.turns % every == 0)
+
+    def _start_response(self, conn: _Connection, with_tool_call: bool) -> None:
+        if conn.response_task and not conn.response_task.done():
+            conn.response_task.cancel()
+        conn.response_task = asyncio.create_task(self._stream_response(conn, with_tool_call))
+
+    async def _stream_response(self, conn: _Connection, with_tool_call: bool) -> None:
+        cfg = self.config
+        response_id = f"resp_{uuid.uuid4().hex[:10]}"
+        await asyncio.sleep(cfg.response_delay_ms / 1000)
+        await conn.send({"type": "response.created", "response": {"id": response_id}})
+
+        if with_tool_call:
+            self.stats["tool_calls"] += 1
+            conn.pending_tool_call = True
+            await conn.send({
+                "type": "response.function_call_arguments.done",
+                "response_id": response_id,
+                "call_id": f"call_{uuid.uuid4().hex[:8]}",
+                "name": cfg.tool_name,
+                "arguments": "{}",
+            })
+            await conn.send({"type": "response.done", "response": {"id": response_id}})
+            return
+
+        item_id = f"item_{uuid.uuid4().hex[:8]}"
+        chunk_bytes = SAMPLE_RATE * BYTES_PER_SAMPLE * cfg.delta_ms // 1000
+        pause = cfg.delta_ms / 1000 / cfg.burst_factor
+        words = "This is a synthetic assistant reply used for load testing.".split()
+        for i in range(0, len(conn.reply_audio), chunk_bytes):
+            chunk = conn.reply_audio[i : i + chunk_bytes]
+            await conn.send({
+                "type": "response.audio.delta",
+                "response_id": response_id,
+                "item_id": item_id,
+                "delta": base64.b64encode(chunk).decode("ascii"),
+            })
+            word = words[(i // chunk_bytes) % len(words)]
+            await conn.send({"type": "response.audio_transcript.delta", "item_id": item_id, "delta": word + " "})
+            await asyncio.sleep(pause)
+        await conn.send({"type": "response.audio.done", "item_id": item_id})
+        await conn.send({"type": "response.audio_transcript.done", "item_id": item_id, "transcript": " ".join(words)})
+        await conn.send({"type": "response.done", "response": {"id": response_id}})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the fake OpenAI Realtime API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--turn-audio-ms", type=int, default=3000)
+    parser.add_argument("--response-audio-ms", type=int, default=2000)
+    parser.add_argument("--tool-call-every", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s — %(message)s")
+    server = FakeRealtimeServer(FakeRealtimeConfig(
+        turn_audio_ms=args.turn_audio_ms,
+        response_audio_ms=args.response_audio_ms,
+        tool_call_every=args.tool_call_every,
+    ))
+    web.run_app(server.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+loadtest.harness — Ramp concurrent calls against one voice replica.
+
+Starts a fake Realtime API server (unless ``--no-fake-realtime``), then
+runs steps of N simultaneous fake ACS calls against the voice service,
+increasing N each step.  For every step it reports frame drop rate,
+client-side turn latency percentiles, and the service process's CPU
+and RSS (read from ``/proc/<pid>``).  The highest step that meets all
+thresholds is reported as the maximum sustainable call count.
+
+Typical run::
+
+    # terminal 1 — voice service wired to the fake Realtime server
+    AZURE_OPENAI_REALTIME_ENDPOINT=http://127.0.0.1:8765 \\
+        python -c "from voice_service.app import main; main()"
+
+    # terminal 2
+    python -m loadtest.harness --target http://127.0.0.1:3979 \\
+        --pid $(pgrep -f voice_service.app) --start 10 --step 10 --max 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+
+import aiohttp
+
+from loadtest.fake_acs_client import CallProfile, CallResult, FakeAcsCall
+from loadtest.fake_realtime_server import FakeRealtimeConfig, FakeRealtimeServer
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Process sampling (/proc — no psutil dependency)
+# ---------------------------------------------------------------------------
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def _read_cpu_seconds(pid: int) -> float:
+    """Total user+system CPU seconds consumed by ``pid``."""
+    with open(f"/proc/{pid}/stat") as fh:
+        # comm (field 2) may contain spaces; split after the closing paren
+        fields = fh.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / _CLK_TCK
+
+
+def _read_rss_mb(pid: int) -> float:
+    """Resident set size of ``pid`` in MiB."""
+    with open(f"/proc/{pid}/status") as fh:
+        for line in fh:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+class ProcessSampler:
+    """Measures CPU% and peak RSS of a process across a time window."""
+
+    def __init__(self, pid: int | None) -> None:
+        self._pid = pid
+        self._cpu_start = 0.0
+        self._wall_start = 0.0
+        self.peak_rss_mb = 0.0
+
+    def begin(self) -> None:
+        self._wall_start = time.perf_counter()
+        self.peak_rss_mb = 0.0
+        if self._pid:
+            self._cpu_start = _read_cpu_seconds(self._pid)
+
+    def sample(self) -> None:
+        if self._pid:
+            self.peak_rss_mb = max(self.peak_rss_mb, _read_rss_mb(self._pid))
+
+    def cpu_percent(self) -> float:
+        if not self._pid:
+            return 0.0
+        wall = time.perf_counter() - self._wall_start
+        return (_read_cpu_seconds(self._pid) - self._cpu_start) / wall * 100 if wall else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Ramp
+# ---------------------------------------------------------------------------
+
+@dataclass
+class StepReport:
+    """Aggregated measurements for one concurrency step."""
+
+    concurrency: int
+    calls_ok: int
+    calls_failed: int
+    frame_drop_rate: float
+    reply_frames: int
+    turns: int
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    cpu_percent: float
+    peak_rss_mb: float
+    sustainable: bool
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_step(
+    target: str,
+    concurrency: int,
+    duration: float,
+    profile: CallProfile,
+    sampler: ProcessSampler,
+    args: argparse.Namespace,
+) -> StepReport:
+    """Run ``concurrency`` simultaneous calls for ``duration`` seconds."""
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as http:
+        sampler.begin()
+        stop = asyncio.Event()
+
+        async def _staggered(i: int) -> CallResult:
+            # Spread call setup over the first second
+            await asyncio.sleep(i / max(concurrency, 1))
+            return await FakeAcsCall(target, http, profile).run(duration, stop)
+
+        tasks = [asyncio.create_task(_staggered(i)) for i in range(concurrency)]
+        while not all(t.done() for t in tasks):
+            sampler.sample()
+            await asyncio.sleep(1.0)
+        results = [t.result() for t in tasks]
+        cpu = sampler.cpu_percent()
+
+    ok = [r for r in results if not r.error]
+    failed = [r for r in results if r.error]
+    for r in failed[:3]:
+        logger.warning("Call %s failed: %s", r.call_connection_id, r.error)
+
+    sent = sum(r.frames_sent for r in ok)
+    dropped = sum(r.frames_dropped for r in ok)
+    latencies = [lat for r in ok for lat in r.turn_latencies]
+    drop_rate = dropped / (sent + dropped) if sent + dropped else 0.0
+    p95 = _percentile(latencies, 0.95) * 1000
+
+    sustainable = (
+        not failed
+        and drop_rate <= args.max_drop_rate
+        and (not latencies or p95 <= args.max_p95_ms)
+        and (not args.pid or cpu <= args.max_cpu)
+    )
+    return StepReport(
+        concurrency=concurrency,
+        calls_ok=len(ok),
+        calls_failed=len(failed),
+        frame_drop_rate=round(drop_rate, 5),
+        reply_frames=sum(r.frames_received for r in ok),
+        turns=len(latencies),
+        latency_p50_ms=round((statistics.median(latencies) if latencies else 0.0) * 1000, 1),
+        latency_p95_ms=round(p95, 1),
+        latency_p99_ms=round(_percentile(latencies, 0.99) * 1000, 1),
+        cpu_percent=round(cpu, 1),
+        peak_rss_mb=round(sampler.peak_rss_mb, 1),
+        sustainable=sustainable,
+    )
+
+
+async def ramp(args: argparse.Namespace) -> list[StepReport]:
+    """Run concurrency steps until ``--max`` or the first unsustainable step."""
+    fake: FakeRealtimeServer | None = None
+    if not args.no_fake_realtime:
+        fake = FakeRealtimeServer(FakeRealtimeConfig(tool_call_every=args.tool_call_every))
+        await fake.start(port=args.fake_realtime_port)
+
+    profile = CallProfile(talk_ms=args.talk_ms, listen_ms=args.listen_ms, participants=args.participants)
+    sampler = ProcessSampler(args.pid)
+    reports: list[StepReport] = []
+    try:
+        concurrency = args.start
+        while concurrency <= args.max:
+            logger.info("Step: %d concurrent calls for %ds", concurrency, args.step_duration)
+            report = await run_step(args.target, concurrency, args.step_duration, profile, sampler, args)
+            reports.append(report)
+            logger.info(
+                "  drop=%.3f%% p50=%.0fms p95=%.0fms cpu=%.0f%% rss=%.0fMiB %s",
+                report.frame_drop_rate * 100,
+                report.latency_p50_ms,
+                report.latency_p95_ms,
+                report.cpu_percent,
+                report.peak_rss_mb,
+                "OK" if report.sustainable else "UNSUSTAINABLE",
+            )
+            if not report.sustainable:
+                break
+            concurrency += args.step
+            await asyncio.sleep(args.cooldown)
+    finally:
+        if fake is not None:
+            await fake.stop()
+    return reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent-call load test for aida-voice.")
+    parser.add_argument("--target", default="http://127.0.0.1:3979", help="Voice service base URL")
+    parser.add_argument("--pid", type=int, default=None, help="Voice service PID for CPU/RSS sampling")
+    parser.add_argument("--start", type=int, default=5)
+    parser.add_argument("--step", type=int, default=5)
+    parser.add_argument("--max", type=int, default=100)
+    parser.add_argument("--step-duration", type=int, default=30, help="Seconds per step")
+    parser.add_argument("--cooldown", type=float, default=5.0, help="Seconds between steps")
+    parser.add_argument("--talk-ms", type=int, default=3000)
+    parser.add_argument("--listen-ms", type=int, default=4000)
+    parser.add_argument("--participants", type=int, default=1)
+    parser.add_argument("--max-drop-rate", type=float, default=0.01)
+    parser.add_argument("--max-p95-ms", type=float, default=1500.0)
+    parser.add_argument("--max-cpu", type=float, default=85.0)
+    parser.add_argument("--no-fake-realtime", action="store_true", help="Use an already running Realtime endpoint")
+    parser.add_argument("--fake-realtime-port", type=int, default=8765)
+    parser.add_argument("--tool-call-every", type=int, default=4)
+    parser.add_argument("--json", dest="json_path", default="", help="Write the step reports to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s — %(message)s")
+    reports = asyncio.run(ramp(args))
+
+    sustainable = [r.concurrency for r in reports if r.sustainable]
+    summary = {
+        "max_sustainable_calls": max(sustainable) if sustainable else 0,
+        "steps": [asdict(r) for r in reports],
+    }
+    print(json.dumps(summary, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as fh:
+            json.dump(summary, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+loadtest.long_meeting — Peak RSS of long meetings' transcripts.
+
+Simulates ``--sessions`` concurrent meetings of ``--hours`` each (on a
+simulated clock, so an 8-hour meeting runs in seconds): a transcript
+entry every ``--entry-seconds`` from a rotating cast of speakers, with
+``to_dict()`` serialised every ``--context-every-minutes`` as API and
+tool calls do.  Each mode runs in its own child process so peak RSS
+(``VmHWM``) is measured cleanly:
+
+  - ``unbounded`` — every entry kept in memory (the old list behaviour);
+  - ``windowed`` — the default ``TranscriptWindow`` limits, older
+    entries spilled to disk.
+
+Typical run::
+
+    python -m loadtest.long_meeting --hours 8 --sessions 20 --json long_meeting.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+_WORDS = (
+    "agenda budget roadmap customer release migration latency dashboard incident review "
+    "hiring quarter forecast design proposal feedback deadline priority risk estimate"
+).split()
+
+
+def _read_status_mb(field: str) -> float:
+    """A ``/proc/self/status`` memory field in MiB (0 where unavailable)."""
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def _utterance(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(6, 60))).capitalize() + "."
+
+
+def simulate(mode: str, args: argparse.Namespace) -> dict[str, Any]:
+    """Run the simulation in this process and report its memory use."""
+    # Imported after the spill directory is set: the window reads it at import
+    from voice_service.transcript_window import TranscriptWindow
+    from voice_service.voice_state import VoiceSession
+
+    def window() -> TranscriptWindow:
+        if mode == "unbounded":
+            return TranscriptWindow(max_entries=sys.maxsize, max_minutes=math.inf, memory_limit_bytes=sys.maxsize)
+        return TranscriptWindow()
+
+    baseline_mb = _read_status_mb("VmRSS")
+    rng = random.Random(args.seed)
+    sessions = [VoiceSession(transcript_entries=window()) for _ in range(args.sessions)]
+    speakers = [f"Participant {i}" for i in range(args.speakers)]
+    start = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+    steps = int(args.hours * 3600 / args.entry_seconds)
+    context_every = max(1, int(args.context_every_minutes * 60 / args.entry_seconds))
+
+    began = time.perf_counter()
+    serialised = 0
+    for step in range(steps):
+        at = start + timedelta(seconds=step * args.entry_seconds)
+        timestamp = at.isoformat()
+        for session in sessions:
+            session.add_transcript_entry(rng.choice(speakers), _utterance(rng), timestamp)
+        if step % context_every == 0:
+            for session in sessions:
+                serialised += len(json.dumps(session.to_dict()))
+    elapsed = time.perf_counter() - began
+
+    # Stream the full transcript once, as the final persist does
+    streamed = sum(1 for session in sessions for _ in session.transcript_entries)
+    stats = [session.transcript_entries.stats() for session in sessions]
+    report = {
+        "mode": mode,
+        "sessions": args.sessions,
+        "simulated_hours": args.hours,
+        "entries_per_session": steps,
+        "entries_streamed": streamed,
+        "peak_rss_mb": round(_read_status_mb("VmHWM"), 1),
+        "baseline_rss_mb": round(baseline_mb, 1),
+        "peak_over_baseline_mb": round(_read_status_mb("VmHWM") - baseline_mb, 1),
+        "window_memory_kb_max": round(max(s["peak_memory_bytes"] for s in stats) / 1024, 1),
+        "spill_mb_total": round(sum(s["spill_bytes"] for s in stats) / 2**20, 1),
+        "index_kb_per_session": round(max(s["index_bytes"] for s in stats) / 1024, 1),
+        "to_dict_mb_serialised": round(serialised / 2**20, 1),
+        "seconds": round(elapsed, 2),
+    }
+    for session in sessions:
+        session.transcript_entries.close()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Peak RSS of long meeting transcripts, unbounded vs windowed.")
+    parser.add_argument("--hours", type=float, default=8.0)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--speakers", type=int, default=12)
+    parser.add_argument("--entry-seconds", type=float, default=4.0, help="Simulated seconds between entries")
+    parser.add_argument("--context-every-minutes", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--mode", choices=("unbounded", "windowed"), default="", help="Run one mode in-process")
+    parser.add_argument("--json", dest="json_path", default="", help="Write the reports to this file")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(simulate(args.mode, args)))
+        return
+
+    spill_dir = tempfile.mkdtemp(prefix="aida-long-meeting-")
+    env = {**os.environ, "AIDA_TRANSCRIPT_SPILL_DIR": spill_dir}
+    reports = []
+    try:
+        for mode in ("unbounded", "windowed"):
+            child = subprocess.run(
+                [sys.executable, "-m", "loadtest.long_meeting", "--mode", mode, *sys.argv[1:]],
+                env=env, capture_output=True, text=True, check=True,
+            )
+            reports.append(json.loads(child.stdout.strip().splitlines()[-1]))
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+
+    print(json.dumps(reports, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as fh:
+            json.dump(reports, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
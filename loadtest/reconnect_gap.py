@@ -0,0 +1,179 @@
+"""
+loadtest.reconnect_gap — Audio gap per Realtime reconnect under forced drops.
+
+Opens a ``ResilientRealtimeSession`` against the fake Realtime server,
+streams paced 20 ms caller frames into it, and repeatedly drops the
+connection with ``POST /admin/drop``.  For every reconnect it reports:
+
+  - ``detect_ms`` — drop command until the session noticed;
+  - ``gap_ms`` — drop noticed until live audio flowed on the new
+    connection (reconnect, session + transcript restore, replay);
+  - attempts, replayed and lost caller audio, replayed transcript items.
+
+Typical run::
+
+    python -m loadtest.reconnect_gap --drops 10 --interval 4 --json gaps.json
+
+With ``--no-fake-realtime`` it drops connections on an already running
+fake server at ``AZURE_OPENAI_REALTIME_ENDPOINT``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import aiohttp
+
+from loadtest.fake_realtime_server import BYTES_PER_SAMPLE, SAMPLE_RATE, FakeRealtimeConfig, FakeRealtimeServer
+
+logger = logging.getLogger(__name__)
+
+_FRAME_MS = 20
+_POLL_SECONDS = 0.005
+
+
+@dataclass
+class GapReport:
+    """One forced drop and the reconnect that followed."""
+
+    drop: int
+    detect_ms: float
+    gap_ms: int
+    total_ms: float
+    attempts: int
+    replayed_audio_ms: int
+    lost_audio_ms: int
+    replayed_items: int
+
+
+async def _stream_audio(session: Any, stop: asyncio.Event) -> None:
+    """Send paced 20 ms PCM16 frames until stopped (the fake server only counts them)."""
+    frame = bytes(SAMPLE_RATE * BYTES_PER_SAMPLE * _FRAME_MS // 1000)
+    interval = _FRAME_MS / 1000
+    next_at = time.monotonic()
+    while not stop.is_set():
+        await session.send_audio(frame)
+        next_at += interval
+        await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+
+
+async def _consume_events(session: Any, history: list[tuple[str, str]]) -> None:
+    """Drain server events, keeping the transcript replayed on reconnect."""
+    async for event in session.receive_events():
+        event_type = event.get("type", "")
+        if event_type == "conversation.item.input_audio_transcription.completed":
+            history.append(("user", f"Caller: {event.get('transcript', '')}"))
+        elif event_type == "response.audio_transcript.done":
+            history.append(("assistant", event.get("transcript", "")))
+
+
+async def run(args: argparse.Namespace) -> list[GapReport]:
+    endpoint = os.environ.setdefault("AZURE_OPENAI_REALTIME_ENDPOINT", f"http://127.0.0.1:{args.fake_realtime_port}")
+    # Imported after the endpoint is set: the SDK settings read it at import
+    from voice_service.realtime_session import ResilientRealtimeSession
+
+    fake: FakeRealtimeServer | None = None
+    if not args.no_fake_realtime:
+        fake = FakeRealtimeServer(FakeRealtimeConfig(turn_audio_ms=args.turn_audio_ms, tool_call_every=0))
+        await fake.start(port=args.fake_realtime_port)
+
+    history: list[tuple[str, str]] = []
+    session = ResilientRealtimeSession(
+        name="reconnect-gap",
+        bytes_per_second=SAMPLE_RATE * BYTES_PER_SAMPLE,
+        history=lambda: history,
+    )
+    reports: list[GapReport] = []
+    stop = asyncio.Event()
+    http = aiohttp.ClientSession()
+    try:
+        await session.connect(instructions="Reconnect gap test.", tools=[])
+        tasks = [
+            asyncio.create_task(_stream_audio(session, stop)),
+            asyncio.create_task(_consume_events(session, history)),
+        ]
+        for drop in range(1, args.drops + 1):
+            await asyncio.sleep(args.interval)
+            seen = len(session.reconnects)
+            dropped_at = time.monotonic()
+            async with http.post(f"{endpoint}/admin/drop") as resp:
+                resp.raise_for_status()
+            detected_at = None
+            deadline = dropped_at + args.timeout
+            while len(session.reconnects) == seen and time.monotonic() < deadline:
+                if detected_at is None and not session.connected:
+                    detected_at = time.monotonic()
+                await asyncio.sleep(_POLL_SECONDS)
+            if len(session.reconnects) == seen:
+                logger.error("Drop %d: no reconnect within %.0fs (%s)", drop, args.timeout, session.stats()["state"])
+                break
+            record = session.reconnects[-1]
+            detect_ms = ((detected_at or dropped_at) - dropped_at) * 1000
+            report = GapReport(
+                drop=drop,
+                detect_ms=round(detect_ms, 1),
+                gap_ms=record.gap_ms,
+                total_ms=round(detect_ms + record.gap_ms, 1),
+                attempts=record.attempts,
+                replayed_audio_ms=record.replayed_audio_ms,
+                lost_audio_ms=record.lost_audio_ms,
+                replayed_items=record.replayed_items,
+            )
+            reports.append(report)
+            logger.info(
+                "Drop %d: detect=%.0fms gap=%dms attempts=%d replayed=%dms lost=%dms items=%d",
+                drop, report.detect_ms, report.gap_ms, report.attempts,
+                report.replayed_audio_ms, report.lost_audio_ms, report.replayed_items,
+            )
+        stop.set()
+        await session.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await session.close()
+        await http.close()
+        if fake is not None:
+            await fake.stop()
+    return reports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure the audio gap of Realtime reconnects.")
+    parser.add_argument("--drops", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=4.0, help="Seconds of streaming between drops")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for each reconnect")
+    parser.add_argument("--turn-audio-ms", type=int, default=2000)
+    parser.add_argument("--no-fake-realtime", action="store_true", help="Use an already running fake server")
+    parser.add_argument("--fake-realtime-port", type=int, default=8765)
+    parser.add_argument("--json", dest="json_path", default="", help="Write the gap reports to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s — %(message)s")
+    reports = asyncio.run(run(args))
+
+    totals = [r.total_ms for r in reports]
+    summary = {
+        "reconnects": len(reports),
+        "drops": args.drops,
+        "gap_ms_p50": statistics.median(r.gap_ms for r in reports) if reports else 0,
+        "gap_ms_max": max((r.gap_ms for r in reports), default=0),
+        "total_ms_p50": statistics.median(totals) if totals else 0,
+        "total_ms_max": max(totals, default=0),
+        "lost_audio_ms": sum(r.lost_audio_ms for r in reports),
+        "reports": [asdict(r) for r in reports],
+    }
+    print(json.dumps(summary, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as fh:
+            json.dump(summary, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+loadtest.transcript_fanout — Live transcript fan-out cost per published entry.
+
+Subscribes ``--subscribers`` readers to one session's transcript stream
+on the process-wide hub (``--stalled`` of which never read) and adds
+``--events`` transcript entries at ``--rate`` per second through
+``VoiceSession.add_transcript_entry``, as the audio path does.  It
+reports:
+
+  - ``publish_ms`` — time spent inside ``add_transcript_entry`` (the
+    cost the audio path pays), p50 / p99 / max;
+  - ``loop_lag_ms`` — how late the paced publisher woke, i.e. the
+    loop time the readers took;
+  - events delivered per live reader and stalled readers evicted.
+
+Typical run::
+
+    python -m loadtest.transcript_fanout --subscribers 5000 --stalled 50 --events 300 --json fanout.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+
+_TEXT = "Let's move the release review to Thursday and check the latency dashboard before then."
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    from voice_service.transcript_stream import get_stream_hub
+    from voice_service.voice_state import VoiceSession
+
+    hub = get_stream_hub()
+    session = VoiceSession()
+    live = [hub.subscribe(session.session_id) for _ in range(args.subscribers - args.stalled)]
+    stalled = [hub.subscribe(session.session_id) for _ in range(args.stalled)]
+    if any(s is None for s in live + stalled):
+        raise SystemExit(f"More subscribers than AIDA_TRANSCRIPT_STREAM_MAX_SUBSCRIBERS ({hub.max_subscribers})")
+
+    received = [0] * len(live)
+
+    async def reader(index: int) -> None:
+        subscriber = live[index]
+        while not subscriber.closed:
+            received[index] += len(await subscriber.next_frames())
+
+    readers = [asyncio.create_task(reader(i)) for i in range(len(live))]
+    await asyncio.sleep(0)
+
+    publish_ms: list[float] = []
+    lag_ms: list[float] = []
+    interval = 1 / args.rate
+    next_at = time.perf_counter()
+    for _ in range(args.events):
+        started = time.perf_counter()
+        session.add_transcript_entry("Priya", _TEXT)
+        publish_ms.append((time.perf_counter() - started) * 1000)
+        next_at += interval
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        lag_ms.append(max(0.0, (time.perf_counter() - next_at) * 1000))
+
+    await asyncio.sleep(0.1)
+    stats = hub.stats()
+    hub.end_session(session.session_id)
+    await asyncio.gather(*readers)
+    session.transcript_entries.close()
+
+    return {
+        "subscribers": args.subscribers,
+        "stalled": args.stalled,
+        "events": args.events,
+        "publish_ms_p50": round(statistics.median(publish_ms), 3),
+        "publish_ms_p99": round(_percentile(publish_ms, 0.99), 3),
+        "publish_ms_max": round(max(publish_ms), 3),
+        "publish_us_per_subscriber_p50": round(statistics.median(publish_ms) * 1000 / args.subscribers, 3),
+        "loop_lag_ms_p50": round(statistics.median(lag_ms), 3),
+        "loop_lag_ms_p99": round(_percentile(lag_ms, 0.99), 3),
+        "delivered_min": min(received, default=0),
+        "delivered_max": max(received, default=0),
+        "evicted": stats["evicted"],
+        "stalled_evicted": sum(1 for s in stalled if s.closed_reason == "slow_consumer"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure live transcript fan-out cost with many subscribers.")
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--stalled", type=int, default=50, help="Subscribers that never read")
+    parser.add_argument("--events", type=int, default=300)
+    parser.add_argument("--rate", type=float, default=2.0, help="Entries per second (a busy meeting is ~1)")
+    parser.add_argument("--json", dest="json_path", default="", help="Write the report to this file")
+    args = parser.parse_args()
+    args.stalled = min(args.stalled, args.subscribers)
+
+    report = asyncio.run(run(args))
+    print(json.dumps(report, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
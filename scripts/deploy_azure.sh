@@ -16,6 +16,15 @@ IDENTITY_NAME="aida-bot-identity"
 KV_NAME="aida-kv-poc"
 OPENAI_NAME="aida-openai-poc"
 ACS_NAME="aida-acs-poc"
+# Suffix of the revision this deploy creates (lowercase letters, digits, hyphens)
+REVISION_SUFFIX="v${IMAGE_TAG//./-}-$(date +%Y%m%d%H%M%S)"
+# How long old replicas may keep serving live calls after traffic moves
+DRAIN_DEADLINE_SECONDS="${DRAIN_DEADLINE_SECONDS:-1800}"
+DRAIN_POLL_SECONDS=15
+# How long the new revision may take to become healthy
+READY_TIMEOUT_SECONDS=600
+# Attempts per `az containerapp exec` call before the deploy stops
+EXEC_ATTEMPTS=5
 
 echo "============================================"
 echo "  AIDA Voice — Azure Deployment"
@@ -77,6 +86,9 @@ echo "  Intel SVC:    ${INTELLIGENCE_SERVICE_URL}"
 echo "Endpoints collected"
 
 # ─── Step 5: Deploy to Container Apps ───────────────────────────────────
+# An existing app gets the new image as a separate revision next to the
+# running one (multiple-revision mode), so live calls stay where they are
+# until traffic has moved and the old replicas have drained (Step 6).
 echo ""
 echo ">>> Step 5: Deploy to Azure Container Apps"
 
@@ -129,11 +141,21 @@ if [ -z "$APP_EXISTS" ]; then
             PORT="3979" \
             APPINSIGHTS_CONNECTION_STRING="${APPINSIGHTS_CS}"
 else
-    echo "  Updating existing Container App..."
+    OLD_REVISIONS=$(az containerapp revision list --name ${CONTAINER_APP_NAME} -g ${RG} --query "[?properties.active].name" -o tsv)
+    az containerapp revision set-mode --name ${CONTAINER_APP_NAME} -g ${RG} --mode multiple > /dev/null
+    # Pin traffic so the new revision gets none until it is healthy
+    CURRENT_REVISION=$(az containerapp show --name ${CONTAINER_APP_NAME} -g ${RG} --query properties.latestReadyRevisionName -o tsv)
+    if [ -n "$CURRENT_REVISION" ]; then
+        az containerapp ingress traffic set --name ${CONTAINER_APP_NAME} -g ${RG} \
+            --revision-weight "${CURRENT_REVISION}=100" > /dev/null
+    fi
+
+    echo "  Creating revision ${CONTAINER_APP_NAME}--${REVISION_SUFFIX} (old: $(echo ${OLD_REVISIONS}))..."
     az containerapp update \
         --name ${CONTAINER_APP_NAME} \
         --resource-group ${RG} \
         --image ${FULL_IMAGE} \
+        --revision-suffix "${REVISION_SUFFIX}" \
         --min-replicas 0 \
         --max-replicas 3 \
         --set-env-vars \
@@ -170,9 +192,115 @@ fi
 
 echo "Container App deployed"
 
-# ─── Step 6: Health check ──────────────────────────────────────────────
+# ─── Step 6: Shift traffic, then drain the old revision ────────────────
+# New calls go to the new revision once it is healthy.  Each old replica
+# is then put in drain mode and polled until its live calls have ended
+# (or the drain deadline stopped them) before its revision is
+# deactivated.  Anything unclear stops the deploy with the old revision
+# still running — it never counts as drained.
+if [ -n "$APP_EXISTS" ]; then
+    echo ""
+    echo ">>> Step 6: Shift traffic and drain the old revision"
+    NEW_REVISION="${CONTAINER_APP_NAME}--${REVISION_SUFFIX}"
+
+    abort_drain() {
+        echo "ERROR: $1" >&2
+        echo "  ${NEW_REVISION} is deployed; still active: $(echo ${OLD_REVISIONS})" >&2
+        echo "  Once their calls have ended, deactivate them with:" >&2
+        echo "  az containerapp revision deactivate --name ${CONTAINER_APP_NAME} -g ${RG} --revision <revision>" >&2
+        exit 1
+    }
+
+    READY_UNTIL=$(( $(date +%s) + READY_TIMEOUT_SECONDS ))
+    while true; do
+        STATE=$(az containerapp revision show --name ${CONTAINER_APP_NAME} -g ${RG} --revision "${NEW_REVISION}" \
+            --query "[properties.provisioningState, properties.healthState]" -o tsv | tr '\n\t' '  ' || echo "")
+        case "$STATE" in
+            *Failed*) abort_drain "revision ${NEW_REVISION} failed to provision" ;;
+            *Provisioned*Healthy*) break ;;
+        esac
+        [ "$(date +%s)" -lt "${READY_UNTIL}" ] || abort_drain "revision ${NEW_REVISION} not healthy after ${READY_TIMEOUT_SECONDS}s (${STATE})"
+        echo "  ${NEW_REVISION}: ${STATE:-unknown} — waiting"
+        sleep 10
+    done
+
+    az containerapp ingress traffic set --name ${CONTAINER_APP_NAME} -g ${RG} \
+        --revision-weight "${NEW_REVISION}=100" > /dev/null
+    echo "  All traffic on ${NEW_REVISION}"
+
+    replica_exec() {
+        # Run a Python one-liner against a replica's local admin endpoint.
+        # exec is built for interactive sessions and can exit 0 without
+        # output, so no output counts as a failure as well.
+        local out
+        out=$(az containerapp exec --name ${CONTAINER_APP_NAME} -g ${RG} \
+            --revision "$1" --replica "$2" \
+            --command "python -c \"$3\"" < /dev/null 2>/dev/null) || return 1
+        [ -n "$out" ] || return 1
+        echo "$out"
+    }
+
+    replica_gone() {
+        # True only when the revision's replica list loads and lacks the replica
+        local replicas
+        replicas=$(az containerapp replica list --name ${CONTAINER_APP_NAME} -g ${RG} --revision "$1" \
+            --query "[].name" -o tsv 2>/dev/null) || return 1
+        ! echo "$replicas" | grep -qx "$2"
+    }
+
+    replica_admin() {
+        # replica_exec with retries; prints "gone" for a replica that has exited
+        local attempt out
+        for attempt in $(seq 1 ${EXEC_ATTEMPTS}); do
+            if out=$(replica_exec "$1" "$2" "$3"); then
+                echo "$out"
+                return 0
+            fi
+            if replica_gone "$1" "$2"; then
+                echo "gone"
+                return 0
+            fi
+            sleep 5
+        done
+        return 1
+    }
+
+    DRAIN_START_PY="import urllib.request as u; print(u.urlopen(u.Request('http://localhost:3979/admin/drain?deadline_seconds=${DRAIN_DEADLINE_SECONDS}', method='POST')).read().decode())"
+    DRAIN_STATUS_PY="import urllib.request as u; print(u.urlopen('http://localhost:3979/admin/drain').read().decode())"
+
+    for REVISION in ${OLD_REVISIONS}; do
+        [ "${REVISION}" != "${NEW_REVISION}" ] || continue
+        REPLICAS=$(az containerapp replica list --name ${CONTAINER_APP_NAME} -g ${RG} --revision "${REVISION}" --query "[].name" -o tsv)
+        for REPLICA in ${REPLICAS}; do
+            echo "  Draining ${REPLICA} (revision ${REVISION})"
+            replica_admin "${REVISION}" "${REPLICA}" "${DRAIN_START_PY}" > /dev/null \
+                || abort_drain "could not start drain on ${REPLICA}"
+        done
+
+        # Deadline plus slack for the replica to stop its remaining workers
+        DRAIN_UNTIL=$(( $(date +%s) + DRAIN_DEADLINE_SECONDS + 60 ))
+        for REPLICA in ${REPLICAS}; do
+            while true; do
+                STATUS=$(replica_admin "${REVISION}" "${REPLICA}" "${DRAIN_STATUS_PY}") \
+                    || abort_drain "no drain status from ${REPLICA}"
+                if [ "$STATUS" = "gone" ] || echo "$STATUS" | grep -q '"complete": true'; then
+                    break
+                fi
+                [ "$(date +%s)" -lt "${DRAIN_UNTIL}" ] || abort_drain "${REPLICA} still draining after the deadline"
+                echo "  ${REPLICA}: $(echo "$STATUS" | grep -o '"active_sessions": [0-9]*') — waiting"
+                sleep ${DRAIN_POLL_SECONDS}
+            done
+            echo "  ${REPLICA} drained"
+        done
+
+        az containerapp revision deactivate --name ${CONTAINER_APP_NAME} -g ${RG} --revision "${REVISION}" > /dev/null
+        echo "  Revision ${REVISION} deactivated"
+    done
+fi
+
+# ─── Step 7: Health check ──────────────────────────────────────────────
 echo ""
-echo ">>> Step 6: Health check"
+echo ">>> Step 7: Health check"
 FQDN=$(az containerapp show --name ${CONTAINER_APP_NAME} -g ${RG} --query properties.configuration.ingress.fqdn -o tsv)
 echo "  Container App FQDN: ${FQDN}"
 echo "  Waiting 30s for container to start..."
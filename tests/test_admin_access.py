@@ -0,0 +1,102 @@
+"""Tests for /admin/* access control and drain request validation."""
+
+from unittest import mock
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from voice_service import app as app_module
+from voice_service.app import (
+    admin_drain_start,
+    admin_drain_status,
+    admin_session,
+    admin_sessions,
+)
+
+
+class _Drain:
+    def __init__(self) -> None:
+        self.started: list[tuple[str, float]] = []
+
+    def start(self, reason: str, deadline_seconds: float) -> None:
+        self.started.append((reason, deadline_seconds))
+
+    def status(self) -> dict:
+        return {"draining": bool(self.started)}
+
+
+@pytest.fixture
+def drain(monkeypatch):
+    fake = _Drain()
+    monkeypatch.setattr(app_module, "_drain", fake)
+    monkeypatch.setattr(app_module, "ADMIN_TOKEN", "")
+    return fake
+
+
+def _request(method: str, path: str, remote: str = "203.0.113.7", headers: dict | None = None, **match_info):
+    transport = mock.Mock()
+    transport.get_extra_info.return_value = (remote, 50000)
+    return make_mocked_request(method, path, headers=headers, match_info=match_info, transport=transport)
+
+
+# ── Access ───────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("remote", ["127.0.0.1", "::1", "::ffff:127.0.0.1"])
+async def test_loopback_callers_are_admitted(drain, remote):
+    response = await admin_drain_status(_request("GET", "/admin/drain", remote))
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_remote_callers_need_the_admin_token(drain, monkeypatch):
+    refused = await admin_drain_start(_request("POST", "/admin/drain"))
+    assert refused.status == 403
+    assert drain.started == []
+
+    # A forwarded header does not make the caller local
+    spoofed = _request("POST", "/admin/drain", headers={"X-Forwarded-For": "127.0.0.1"})
+    assert (await admin_drain_start(spoofed)).status == 403
+
+    # No token configured: an empty header must not match
+    assert (await admin_drain_start(_request("POST", "/admin/drain", headers={"X-Admin-Token": ""}))).status == 403
+
+    monkeypatch.setattr(app_module, "ADMIN_TOKEN", "s3cret")
+    wrong = _request("POST", "/admin/drain", headers={"X-Admin-Token": "guess"})
+    assert (await admin_drain_start(wrong)).status == 403
+    right = _request("POST", "/admin/drain", headers={"X-Admin-Token": "s3cret"})
+    assert (await admin_drain_start(right)).status == 202
+    assert drain.started == [("admin", app_module.DRAIN_DEADLINE_SECONDS)]
+
+
+@pytest.mark.asyncio
+async def test_session_introspection_is_admin_only(drain, monkeypatch):
+    gateway = mock.Mock()
+    gateway.list_workers.return_value = []
+    gateway.get_worker.return_value = None
+    monkeypatch.setattr(app_module, "_voice_gateway", gateway)
+
+    assert (await admin_sessions(_request("GET", "/admin/sessions"))).status == 403
+    assert (await admin_session(_request("GET", "/admin/sessions/s1", session_id="s1"))).status == 403
+    gateway.get_worker.assert_not_called()
+
+    assert (await admin_sessions(_request("GET", "/admin/sessions", "127.0.0.1"))).status == 200
+    local = _request("GET", "/admin/sessions/s1", "127.0.0.1", session_id="s1")
+    assert (await admin_session(local)).status == 404
+
+
+# ── Drain deadline ───────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", ["nan", "inf", "-1", "soon"])
+async def test_invalid_drain_deadline_is_rejected(drain, value):
+    response = await admin_drain_start(_request("POST", f"/admin/drain?deadline_seconds={value}", "127.0.0.1"))
+    assert response.status == 400
+    assert drain.started == []
+
+
+@pytest.mark.asyncio
+async def test_drain_deadline_is_passed_on(drain):
+    response = await admin_drain_start(_request("POST", "/admin/drain?deadline_seconds=600", "127.0.0.1"))
+    assert response.status == 202
+    assert drain.started == [("admin", 600.0)]
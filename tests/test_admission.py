@@ -0,0 +1,157 @@
+"""Tests for admission control and the Realtime circuit breaker."""
+
+import pytest
+
+from voice_service import admission as admission_module
+from voice_service.admission import AdmissionController, RealtimeAvailability
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(admission_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _controller(sessions: int = 0, lag: float = 0.0, **kwargs) -> AdmissionController:
+    controller = AdmissionController(
+        session_count=lambda: sessions,
+        loop_lag=lambda: lag,
+        realtime=kwargs.pop("realtime", RealtimeAvailability(failure_threshold=3, retry_seconds=30)),
+        max_sessions=10,
+        max_loop_lag=0.1,
+        max_cpu=0,  # CPU is not deterministic under test
+        **kwargs,
+    )
+    return controller
+
+
+# ── Scoring ──────────────────────────────────────────────────────────
+
+def test_score_is_the_highest_ratio():
+    score, reason = _controller(sessions=5, lag=0.08).load()
+    assert reason == "loop_lag"
+    assert score == pytest.approx(0.8)
+
+
+def test_admits_below_one_and_sheds_at_one():
+    assert _controller(sessions=9).evaluate("4:+15550000001").admitted
+    decision = _controller(sessions=10).evaluate("4:+15550000001")
+    assert not decision.admitted
+    assert decision.reason == "sessions"
+    assert decision.reject_headers()["Retry-After"]
+
+
+def test_vip_bypasses_capacity_for_direct_calls_only():
+    controller = _controller(sessions=12, vip_callers=frozenset({"+15550000001"}))
+    assert controller.evaluate("4:+15550000001", direct_call=True).admitted
+    assert not controller.evaluate("4:+15550000001", direct_call=False).admitted
+    assert not controller.evaluate("4:+15550000002", direct_call=True).admitted
+
+
+def test_draining_sheds_everyone_including_vips():
+    controller = _controller(draining=lambda: True, vip_callers=frozenset({"+15550000001"}))
+    decision = controller.evaluate("4:+15550000001")
+    assert not decision.admitted
+    assert decision.reason == "draining"
+    assert controller.stats()["shed"]["draining"] == 1
+
+
+# ── Reservations ─────────────────────────────────────────────────────
+
+def test_reservations_count_until_the_session_connects(clock):
+    connected: set[str] = set()
+    controller = _controller(sessions=8, connected_calls=lambda: connected, reservation_seconds=60)
+    first = controller.evaluate("4:+15550000001", reserve=True)
+    second = controller.evaluate("4:+15550000002", reserve=True)
+    assert first.admitted and second.admitted
+    # Two calls in flight fill the last two sessions
+    decision = controller.evaluate("4:+15550000003", reserve=True)
+    assert not decision.admitted
+    assert decision.reason == "sessions"
+    assert decision.reservation is None
+    assert controller.stats()["reserved_sessions"] == 2
+
+    # A failed create frees its capacity at once
+    second.reservation.release()
+    assert controller.reserved() == 1
+    # A created call holds it until its session is active
+    first.reservation.attach("call-1")
+    assert controller.reserved() == 1
+    connected.add("call-1")
+    assert controller.reserved() == 0
+
+
+def test_unanswered_reservation_expires(clock):
+    controller = _controller(connected_calls=set, reservation_seconds=60)
+    decision = controller.evaluate("4:+15550000001", reserve=True)
+    decision.reservation.attach("call-1")
+    clock[0] += 59
+    assert controller.reserved() == 1
+    clock[0] += 1
+    assert controller.reserved() == 0
+
+
+def test_no_reservation_unless_asked():
+    controller = _controller()
+    assert controller.evaluate("4:+15550000001").reservation is None
+    assert controller.reserved() == 0
+
+
+# ── Realtime circuit ─────────────────────────────────────────────────
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    realtime = RealtimeAvailability(failure_threshold=3, retry_seconds=30)
+    realtime.record_failure()
+    realtime.record_failure()
+    realtime.record_success()
+    realtime.record_failure()
+    realtime.record_failure()
+    assert realtime.state == "closed"
+    realtime.record_failure()
+    assert realtime.state == "open"
+    assert not realtime.available
+
+
+def test_half_open_admits_one_probe(clock):
+    realtime = RealtimeAvailability(failure_threshold=1, retry_seconds=30)
+    controller = _controller(realtime=realtime)
+    realtime.record_failure()
+    assert controller.evaluate().reason == "realtime"
+
+    clock[0] += 30
+    assert realtime.state == "half_open"
+    assert controller.evaluate().admitted
+    # Everyone else waits for the probe's outcome
+    decision = controller.evaluate()
+    assert not decision.admitted
+    assert decision.reason == "realtime"
+
+    realtime.record_success()
+    assert realtime.state == "closed"
+    assert controller.evaluate().admitted
+    assert controller.evaluate().admitted
+
+
+def test_failed_probe_reopens_circuit(clock):
+    realtime = RealtimeAvailability(failure_threshold=1, retry_seconds=30)
+    controller = _controller(realtime=realtime)
+    realtime.record_failure()
+    clock[0] += 30
+    assert controller.evaluate().admitted
+
+    realtime.record_failure()
+    assert realtime.state == "open"
+    assert not controller.evaluate().admitted
+
+
+def test_silent_probe_is_abandoned(clock):
+    realtime = RealtimeAvailability(failure_threshold=1, retry_seconds=30)
+    controller = _controller(realtime=realtime)
+    realtime.record_failure()
+    clock[0] += 30
+    assert controller.evaluate().admitted
+    clock[0] += 29
+    assert not controller.evaluate().admitted
+    clock[0] += 1
+    assert controller.evaluate().admitted
@@ -0,0 +1,126 @@
+"""Tests for the G.711 / PCM codec layer."""
+
+import numpy as np
+import pytest
+
+from voice_service.audio_codecs import Resampler, build_transcoders, get_codec
+
+# ── Scalar G.711 reference (ITU-T G.711 / Sun g711.c) ────────────────
+
+_SEG_UEND = (0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF)
+_SEG_AEND = (0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF)
+
+
+def _search(value: int, table: tuple[int, ...]) -> int:
+    for i, end in enumerate(table):
+        if value <= end:
+            return i
+    return len(table)
+
+
+def _linear2ulaw(pcm: int) -> int:
+    pcm >>= 2
+    if pcm < 0:
+        pcm, mask = -pcm, 0x7F
+    else:
+        mask = 0xFF
+    pcm = min(pcm, 8159) + (0x84 >> 2)
+    seg = _search(pcm, _SEG_UEND)
+    if seg >= 8:
+        return 0x7F ^ mask
+    return ((seg << 4) | ((pcm >> (seg + 1)) & 0xF)) ^ mask
+
+
+def _ulaw2linear(code: int) -> int:
+    code = ~code & 0xFF
+    t = (((code & 0x0F) << 3) + 0x84) << ((code & 0x70) >> 4)
+    return 0x84 - t if code & 0x80 else t - 0x84
+
+
+def _linear2alaw(pcm: int) -> int:
+    pcm >>= 3
+    if pcm >= 0:
+        mask = 0xD5
+    else:
+        mask, pcm = 0x55, -pcm - 1
+    seg = _search(pcm, _SEG_AEND)
+    if seg >= 8:
+        return 0x7F ^ mask
+    aval = seg << 4
+    aval |= (pcm >> 1 if seg < 2 else pcm >> seg) & 0xF
+    return aval ^ mask
+
+
+def _alaw2linear(code: int) -> int:
+    code ^= 0x55
+    t = (code & 0x0F) << 4
+    seg = (code & 0x70) >> 4
+    if seg == 0:
+        t += 8
+    elif seg == 1:
+        t += 0x108
+    else:
+        t = (t + 0x108) << (seg - 1)
+    return t if code & 0x80 else -t
+
+
+# Published values (ITU-T G.711 tables / Sun g711.c)
+_REFERENCE_VECTORS = {
+    "g711_ulaw": {"encode": {0: 0xFF, -1: 0x7E, 32767: 0x80, -32768: 0x00}, "decode": {0xFF: 0, 0x80: 32124, 0x00: -32124}},
+    "g711_alaw": {"encode": {0: 0xD5, -1: 0x55, 32767: 0xAA, -32768: 0x2A}, "decode": {0xD5: 8, 0x55: -8, 0xAA: 32256, 0x2A: -32256}},
+}
+
+
+_CODECS = [
+    ("g711_ulaw", _linear2ulaw, _ulaw2linear),
+    ("g711_alaw", _linear2alaw, _alaw2linear),
+]
+
+
+@pytest.mark.parametrize(("name", "encode_ref", "decode_ref"), _CODECS)
+def test_g711_matches_scalar_reference_for_every_input(name, encode_ref, decode_ref):
+    codec = get_codec(name)
+    samples = np.arange(-32768, 32768, dtype=np.int16)
+    encoded = np.frombuffer(codec.encode(samples), dtype=np.uint8)
+    expected = np.array([encode_ref(int(s)) for s in samples], dtype=np.uint8)
+    mismatches = np.flatnonzero(encoded != expected)
+    assert not len(mismatches), f"encode mismatch at {samples[mismatches[:5]].tolist()}"
+
+    codes = np.arange(256, dtype=np.uint8)
+    assert codec.decode(codes.tobytes()).tolist() == [decode_ref(int(c)) for c in codes]
+
+
+@pytest.mark.parametrize("name", sorted(_REFERENCE_VECTORS))
+def test_g711_published_vectors(name):
+    codec = get_codec(name)
+    for pcm, code in _REFERENCE_VECTORS[name]["encode"].items():
+        assert codec.encode(np.array([pcm], dtype=np.int16)) == bytes([code]), f"encode({pcm})"
+    for code, pcm in _REFERENCE_VECTORS[name]["decode"].items():
+        assert int(codec.decode(bytes([code]))[0]) == pcm, f"decode({code:#04x})"
+
+
+def test_resampler_round_trip_keeps_tone_level():
+    """A 1 kHz tone survives 24 kHz -> 8 kHz -> 24 kHz, streamed in 20 ms frames."""
+    t = np.arange(24000) / 24000
+    tone = (8000 * np.sin(2 * np.pi * 1000 * t)).astype(np.int16)
+    down, up = Resampler(24000, 8000), Resampler(8000, 24000)
+    out = np.concatenate([up.process(down.process(tone[i:i + 480])) for i in range(0, len(tone), 480)])
+    assert len(out) == len(tone)
+    # Compare after the filter delay has settled
+    rms_in = np.sqrt(np.mean(tone[2400:].astype(np.float64) ** 2))
+    rms_out = np.sqrt(np.mean(out[2400:].astype(np.float64) ** 2))
+    assert rms_out / rms_in == pytest.approx(1, abs=0.05)
+
+
+def test_pcm16_transcoders_pass_through():
+    inbound, outbound = build_transcoders(24000, "pcm16")
+    assert inbound.passthrough
+    assert outbound.passthrough
+
+
+def test_g711_transcoders_change_rate_and_size():
+    inbound, outbound = build_transcoders(24000, "g711_ulaw")
+    frame = (4000 * np.sin(np.arange(480) / 5)).astype("<i2").tobytes()  # 20 ms at 24 kHz
+    encoded = inbound.convert(frame)
+    assert len(encoded) == 160  # 20 ms at 8 kHz, one byte per sample
+    assert len(outbound.convert(encoded)) == len(frame)
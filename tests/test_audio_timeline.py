@@ -0,0 +1,122 @@
+"""Tests for the speaker interval timeline."""
+
+from voice_service.audio_timeline import AudioTimeline
+
+# One sample per millisecond keeps positions readable
+RATE = 1000
+
+
+def _timeline(**kwargs) -> AudioTimeline:
+    kwargs.setdefault("retention_seconds", 300)
+    kwargs.setdefault("merge_gap_ms", 200)
+    kwargs.setdefault("max_interval_ms", 5000)
+    return AudioTimeline(rate=RATE, **kwargs)
+
+
+def _speak(timeline: AudioTimeline, speaker: str, ms: int, frame_ms: int = 20) -> None:
+    for _ in range(ms // frame_ms):
+        timeline.append(frame_ms, RATE, speaker)
+
+
+# ── Recording ────────────────────────────────────────────────────────
+
+def test_frames_within_the_merge_gap_extend_one_interval():
+    timeline = _timeline()
+    _speak(timeline, "alice", 400)
+    _speak(timeline, "", 200)
+    _speak(timeline, "alice", 400)
+    assert len(timeline) == 1
+    # Silence beyond the gap starts a new interval
+    _speak(timeline, "", 220)
+    _speak(timeline, "alice", 100)
+    assert len(timeline) == 2
+    assert timeline.speakers_between(0, timeline.position_ms) == {"alice": 1000 + 100}
+
+
+def test_frames_at_other_rates_are_scaled():
+    timeline = _timeline()
+    timeline.append(24000, 24000, "alice")
+    timeline.append(8000, 16000, "")
+    assert timeline.position_ms == 1500
+    assert timeline.speakers_between(0, 2000) == {"alice": 1000}
+
+
+def test_long_runs_are_split_at_the_max_interval():
+    timeline = _timeline(max_interval_ms=1000)
+    _speak(timeline, "alice", 3500)
+    assert len(timeline) == 4
+    assert max(e - s for s, e in zip(timeline._starts, timeline._ends, strict=True)) <= 1000
+    # Lookups still see the whole run, including one starting inside an interval
+    assert timeline.speakers_between(0, 3500) == {"alice": 3500}
+    assert timeline.speakers_between(2500, 3000) == {"alice": 500}
+
+
+# ── Lookup ───────────────────────────────────────────────────────────
+
+def test_dominant_speaker_with_overlapping_speakers():
+    timeline = _timeline()
+    # Alternating frames: each speaker's interval spans the other's frames
+    for _ in range(10):
+        timeline.append(20, RATE, "alice")
+        timeline.append(20, RATE, "bob")
+    _speak(timeline, "bob", 600)
+    totals = timeline.speakers_between(0, 400)
+    assert totals == {"alice": 380, "bob": 380}
+    # Bob talks on alone after the overlap
+    assert timeline.dominant_speaker(0, 1000) == "bob"
+    assert timeline.dominant_speaker(1000, 1200) == ""
+    assert timeline.dominant_speaker(500, 500) == ""
+
+
+def test_rebase_moves_realtime_offset_zero():
+    timeline = _timeline()
+    _speak(timeline, "alice", 1000)
+    _speak(timeline, "bob", 1000)
+    # The new connection first receives the last 500 ms again
+    timeline.rebase(500)
+    assert timeline.speakers_between(0, 500) == {"bob": 500}
+    assert timeline.dominant_speaker(0, 500) == "bob"
+    # Nothing replayed: offsets start at the current position
+    timeline.rebase(0)
+    _speak(timeline, "alice", 200)
+    assert timeline.speakers_between(0, 200) == {"alice": 200}
+    # More than was ever appended clamps to the start
+    timeline.rebase(10_000)
+    assert timeline.dominant_speaker(0, 1000) == "alice"
+
+
+# ── Retention ────────────────────────────────────────────────────────
+
+def test_old_intervals_are_pruned():
+    timeline = _timeline(retention_seconds=1, merge_gap_ms=0, max_interval_ms=100)
+    _speak(timeline, "alice", 2000, frame_ms=100)
+    _speak(timeline, "bob", 1000, frame_ms=100)
+    # Kept: the retention window plus one max interval
+    assert len(timeline) <= 12
+    assert timeline.speakers_between(0, 1000) == {}
+    assert timeline.dominant_speaker(2000, 3000) == "bob"
+
+
+def test_compaction_remaps_open_intervals():
+    timeline = _timeline(retention_seconds=0.1, merge_gap_ms=10, max_interval_ms=20)
+    speaker = ""
+    compacted = False
+    count = 0
+    while not compacted:
+        speaker = "ab"[count % 2]
+        before = len(timeline._starts)
+        timeline.append(10, RATE, speaker)
+        compacted = len(timeline._starts) < before
+        count += 1
+    assert count > 1024
+    assert timeline._head == 0
+    assert len(timeline) < 20
+    for name, index in timeline._open.items():
+        assert timeline._speakers[index] == name
+
+    # The last speaker keeps talking: its remapped interval is extended
+    intervals = len(timeline)
+    timeline.append(5, RATE, speaker)
+    assert len(timeline) == intervals
+    assert timeline._ends[timeline._open[speaker]] == timeline.position
+    assert timeline.dominant_speaker(timeline.position_ms - 15, timeline.position_ms) == speaker
@@ -0,0 +1,174 @@
+"""Tests for the abandoned-call reaper: head count and timers."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from voice_service import call_reaper as call_reaper_module
+from voice_service import outbound_calls as outbound_calls_module
+from voice_service import timer_wheel as timer_wheel_module
+from voice_service.call_reaper import CallReaper, count_humans, note_bot_identity
+from voice_service.outbound_calls import TokenBucket, place_call
+from voice_service.participant_tracker import PARTICIPANT_VAD_THRESHOLD_DBFS
+from voice_service.timer_wheel import TimerWheel
+
+BOT = "28:acs:bot"
+SPEECH_DBFS = PARTICIPANT_VAD_THRESHOLD_DBFS + 10
+QUIET_DBFS = PARTICIPANT_VAD_THRESHOLD_DBFS - 10
+
+
+@pytest.fixture(autouse=True)
+def learned(monkeypatch):
+    ids: dict[str, None] = {}
+    monkeypatch.setattr(call_reaper_module, "_learned_bot_raw_ids", ids)
+    monkeypatch.setattr(call_reaper_module, "REAPER_BOT_RAW_IDS", frozenset())
+    return ids
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(timer_wheel_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _run(wheel: TimerWheel, clock: list[float], seconds: float) -> None:
+    for _ in range(round(seconds / 0.1)):
+        clock[0] += 0.1
+        wheel.advance()
+
+
+def _reaper(clock, **kwargs):
+    reaped: list[str] = []
+    wheel = TimerWheel(tick_ms=100, levels=4)
+    kwargs.setdefault("silence_seconds", 10)
+    kwargs.setdefault("alone_seconds", 5)
+    return CallReaper(reaped.append, wheel=wheel, **kwargs), wheel, reaped
+
+
+# ── Head count ───────────────────────────────────────────────────────
+
+def test_count_humans_skips_the_bot_and_participants_on_hold():
+    participants = [
+        {"rawId": BOT},
+        {"rawId": "8:acs:priya"},
+        {"identifier": {"rawId": "4:+15551234567"}},
+        {"rawId": "8:acs:marcus", "isOnHold": True},
+    ]
+    assert count_humans(participants, frozenset({BOT})) == 2
+    assert count_humans([{"rawId": BOT}], frozenset({BOT})) == 0
+
+
+def test_bot_identity_is_learned_from_calls(learned, monkeypatch, caplog):
+    monkeypatch.setattr(call_reaper_module, "_warned_unknown_bot", False)
+    # Unknown bot: it counts as a human, which is logged once
+    assert count_humans([{"rawId": BOT}]) == 1
+    assert count_humans([{"rawId": BOT}]) == 1
+    assert sum("Bot identity unknown" in record.message for record in caplog.records) == 1
+    note_bot_identity(BOT)
+    note_bot_identity("")
+    assert list(learned) == [BOT]
+    assert count_humans([{"rawId": BOT}, {"rawId": "8:acs:priya"}]) == 1
+
+
+@pytest.mark.asyncio
+async def test_answered_and_created_calls_teach_the_bot_identity(learned, monkeypatch):
+    monkeypatch.setattr(outbound_calls_module, "_bucket", TokenBucket(rate=0))
+    acs = mock.Mock()
+    acs.create_call = mock.AsyncMock(return_value=SimpleNamespace(
+        call_connection=SimpleNamespace(call_connection_id="call-1"),
+        call_connection_properties=SimpleNamespace(source=SimpleNamespace(raw_id=BOT)),
+    ))
+    assert await place_call(acs, mock.AsyncMock(), "+15551234567") == "call-1"
+    assert list(learned) == [BOT]
+
+
+def test_configured_identities_still_count(monkeypatch, learned):
+    monkeypatch.setattr(call_reaper_module, "REAPER_BOT_RAW_IDS", frozenset({"28:acs:other"}))
+    note_bot_identity("28:acs:other")
+    assert learned == {}
+    assert count_humans([{"rawId": "28:acs:other"}]) == 0
+
+
+def test_learned_identities_are_bounded(monkeypatch, learned):
+    monkeypatch.setattr(call_reaper_module, "_MAX_LEARNED_BOT_IDS", 2)
+    for raw_id in ("a", "b", "c"):
+        note_bot_identity(raw_id)
+    assert list(learned) == ["b", "c"]
+
+
+# ── Silence timer ────────────────────────────────────────────────────
+
+def test_silence_timer_fires_without_human_speech(clock):
+    reaper, wheel, reaped = _reaper(clock)
+    reaper.start()
+    for _ in range(3):
+        _run(wheel, clock, 6)
+        reaper.audio(b"", False, SPEECH_DBFS)
+    # Quiet frames and frames ACS flags as silent do not count
+    for _ in range(5):
+        _run(wheel, clock, 1)
+        reaper.audio(b"", False, QUIET_DBFS)
+        reaper.audio(b"", True, SPEECH_DBFS)
+    assert reaped == []
+    _run(wheel, clock, 5.2)
+    assert reaped == ["silence"]
+    assert reaper.stats()["reaped"] == "silence"
+
+
+def test_unattributed_frames_are_sampled(clock, monkeypatch):
+    monkeypatch.setattr(call_reaper_module, "REAPER_SAMPLE_FRAMES", 5)
+    reaper, wheel, reaped = _reaper(clock)
+    reaper.start()
+    loud = (8000).to_bytes(2, "little", signed=True) * 480
+    _run(wheel, clock, 9)
+    levels = [reaper.audio(loud, False, None) for _ in range(5)]
+    # Four in five frames are not measured; the fifth is speech and resets the timer
+    assert levels[:4] == [None] * 4
+    assert levels[4] >= PARTICIPANT_VAD_THRESHOLD_DBFS
+    _run(wheel, clock, 9)
+    assert reaped == []
+    _run(wheel, clock, 1.2)
+    assert reaped == ["silence"]
+
+
+# ── Alone timer ──────────────────────────────────────────────────────
+
+def test_alone_timer_is_cancelled_when_a_human_returns(clock):
+    reaper, wheel, reaped = _reaper(clock, silence_seconds=0)
+    reaper.participants(0)
+    _run(wheel, clock, 4)
+    reaper.participants(1)
+    assert not reaper.stats()["alone_timer"]
+    _run(wheel, clock, 10)
+    assert reaped == []
+
+    # Alone again: a full period from now
+    reaper.participants(0)
+    _run(wheel, clock, 4.8)
+    assert reaped == []
+    _run(wheel, clock, 0.4)
+    assert reaped == ["alone"]
+
+
+def test_a_call_is_reaped_once(clock):
+    reaper, wheel, reaped = _reaper(clock, silence_seconds=3, alone_seconds=3)
+    reaper.start()
+    reaper.participants(0)
+    _run(wheel, clock, 5)
+    assert len(reaped) == 1
+    reaper.participants(0)
+    _run(wheel, clock, 5)
+    assert len(reaped) == 1
+    assert not reaper.stats()["silence_timer"]
+    assert not reaper.stats()["alone_timer"]
+
+
+def test_zero_disables_both_timers(clock):
+    reaper, wheel, reaped = _reaper(clock, silence_seconds=0, alone_seconds=0)
+    reaper.start()
+    reaper.participants(0)
+    _run(wheel, clock, 60)
+    assert reaped == []
+    assert reaper.stats() == {"humans": 0, "silence_timer": False, "alone_timer": False, "reaped": None}
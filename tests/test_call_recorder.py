@@ -0,0 +1,169 @@
+"""Tests for the call recorder and its WAV writer."""
+
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from voice_service import call_recorder as call_recorder_module
+from voice_service.call_recorder import (
+    INBOUND,
+    OUTBOUND,
+    CallRecorder,
+    RecordingWriter,
+    _RecordingFile,
+)
+
+# One sample per millisecond keeps positions readable
+RATE = 1000
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    # Only the recorder's clock: the event loop keeps the real one
+    monkeypatch.setattr(call_recorder_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def writer():
+    writer = RecordingWriter()
+    yield writer
+    writer.stop()
+
+
+def _pcm(value: int, samples: int) -> bytes:
+    return np.full(samples, value, dtype="<i2").tobytes()
+
+
+def _read(path: str) -> tuple[int, np.ndarray]:
+    """Sample rate and (frames, 2) samples of a stereo WAV."""
+    with wave.open(path, "rb") as wav:
+        assert wav.getnchannels() == 2
+        assert wav.getsampwidth() == 2
+        frames = wav.readframes(wav.getnframes())
+        return wav.getframerate(), np.frombuffer(frames, dtype="<i2").reshape(-1, 2)
+
+
+def _speak(recorder: CallRecorder, clock: list[float], value: int, ms: int, outbound: bool = False) -> None:
+    write = recorder.write_outbound if outbound else recorder.write_inbound
+    for _ in range(ms // 20):
+        write(_pcm(value, 20 * recorder._sample_rate // 1000))
+        clock[0] += 0.02
+
+
+# ── CallRecorder ─────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_close_finalises_a_stereo_wav(tmp_path, clock, writer):
+    recorder = CallRecorder("call-1", RATE, directory=str(tmp_path), writer=writer)
+    for _ in range(25):
+        recorder.write_inbound(_pcm(1, 20))
+        recorder.write_outbound(_pcm(2, 20))
+        clock[0] += 0.02
+    paths = await recorder.close()
+
+    assert paths == [str(recorder.base_path) + ".wav"]
+    assert Path(paths[0]).parent.parent == tmp_path
+    # The header carries the real length
+    rate, samples = _read(paths[0])
+    assert rate == RATE
+    assert samples.shape == (500, 2)
+    assert (samples[:, 0] == 1).all()
+    assert (samples[:, 1] == 2).all()
+    assert recorder.bytes_recorded == 2 * 500 * 2
+    # Closing again is a no-op
+    assert await recorder.close() == paths
+    recorder.write_inbound(_pcm(1, 20))
+    assert recorder.bytes_recorded == 2 * 500 * 2
+
+
+@pytest.mark.asyncio
+async def test_gaps_in_a_stream_are_padded_with_silence(tmp_path, clock, writer):
+    recorder = CallRecorder("call-1", RATE, directory=str(tmp_path), writer=writer)
+    _speak(recorder, clock, 1, 200)
+    clock[0] += 0.5
+    _speak(recorder, clock, 2, 100)
+    # AIDA starts answering 300 ms in; jitter under the tolerance is absorbed
+    clock[0] = 100.3
+    _speak(recorder, clock, 3, 100, outbound=True)
+    clock[0] += 0.05
+    _speak(recorder, clock, 3, 100, outbound=True)
+    (path,) = await recorder.close()
+
+    _, samples = _read(path)
+    left, right = samples[:, 0], samples[:, 1]
+    assert len(samples) == 800
+    assert (left[:200] == 1).all()
+    assert (left[200:700] == 0).all()
+    assert (left[700:] == 2).all()
+    assert (right[:300] == 0).all()
+    assert (right[300:500] == 3).all()
+    # The short channel is padded to the end of the recording
+    assert (right[500:] == 0).all()
+
+
+@pytest.mark.asyncio
+async def test_sample_rate_change_continues_in_a_new_file(tmp_path, clock, writer):
+    recorder = CallRecorder("call-1", RATE, directory=str(tmp_path), writer=writer)
+    _speak(recorder, clock, 1, 200)
+    recorder.set_sample_rate(2 * RATE)
+    recorder.set_sample_rate(2 * RATE)
+    _speak(recorder, clock, 2, 100)
+    paths = await recorder.close()
+
+    assert [Path(p).name for p in paths] == [
+        f"{recorder.base_path.name}.wav",
+        f"{recorder.base_path.name}-part001.wav",
+    ]
+    first_rate, first = _read(paths[0])
+    second_rate, second = _read(paths[1])
+    assert (first_rate, len(first)) == (RATE, 200)
+    assert (first[:, 0] == 1).all()
+    assert (second_rate, len(second)) == (2 * RATE, 200)
+    assert (second[:, 0] == 2).all()
+
+
+# ── _RecordingFile ───────────────────────────────────────────────────
+
+def test_lagging_channel_is_padded_once_the_other_runs_too_far_ahead(tmp_path):
+    recording = _RecordingFile(tmp_path / "rec", RATE, segment_seconds=0, started_at=0.0)
+    recording.add(INBOUND, memoryview(_pcm(1, 1500)), 0.0)
+    # Within the allowed skew: nothing can be interleaved yet
+    assert recording.wav is None
+    recording.add(INBOUND, memoryview(_pcm(1, 1500)), 1.5)
+    # 3 s ahead: the outbound channel is padded to within 2 s and written
+    assert recording.segment_written == 1000
+    assert len(recording.pending[INBOUND]) == 2000 * 2
+    assert recording.positions[OUTBOUND] == 1000
+
+    # Late outbound audio lands after the padding
+    recording.add(OUTBOUND, memoryview(_pcm(2, 500)), 1.0)
+    recording.finish_segment()
+    _, samples = _read(recording.paths[0])
+    assert len(samples) == 3000
+    assert (samples[:, 0] == 1).all()
+    assert (samples[:1000, 1] == 0).all()
+    assert (samples[1000:1500, 1] == 2).all()
+    assert (samples[1500:, 1] == 0).all()
+
+
+def test_long_recordings_roll_over_into_segments(tmp_path):
+    recording = _RecordingFile(tmp_path / "rec", RATE, segment_seconds=1, started_at=0.0)
+    for chunk in range(5):
+        recording.add(INBOUND, memoryview(_pcm(1, 500)), chunk * 0.5)
+        recording.add(OUTBOUND, memoryview(_pcm(2, 500)), chunk * 0.5)
+    recording.finish_segment()
+
+    assert [Path(p).name for p in recording.paths] == ["rec-part000.wav", "rec-part001.wav", "rec-part002.wav"]
+    lengths = []
+    for path in recording.paths:
+        rate, samples = _read(path)
+        assert rate == RATE
+        assert (samples[:, 0] == 1).all()
+        assert (samples[:, 1] == 2).all()
+        lengths.append(len(samples))
+    assert lengths == [1000, 1000, 500]
@@ -0,0 +1,140 @@
+"""Tests for the per-call ACS event queue."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from voice_service.webhooks.acs_webhook import handle_acs_event
+from voice_service.webhooks.event_queue import CallEventQueue, QueuedEvent
+
+
+def _event(call: str, name: str) -> QueuedEvent:
+    return QueuedEvent(name, {"callConnectionId": call}, call)
+
+
+class _Recorder:
+    """Process function that records events and can hold one call back."""
+
+    def __init__(self) -> None:
+        self.seen: list[tuple[str, str]] = []
+        self.gates: dict[str, asyncio.Event] = {}
+
+    async def __call__(self, event: QueuedEvent) -> None:
+        gate = self.gates.get(event.call_connection_id)
+        if gate is not None:
+            await gate.wait()
+        await asyncio.sleep(0)
+        if event.event_type == "boom":
+            raise RuntimeError("handler failed")
+        self.seen.append((event.call_connection_id, event.event_type))
+
+
+# ── Ordering ─────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_events_of_one_call_run_in_arrival_order():
+    recorder = _Recorder()
+    queue = CallEventQueue(recorder, max_pending=100)
+    names = ["CallConnected", "ParticipantsUpdated", "PlayCompleted", "CallDisconnected"]
+    for name in names:
+        assert queue.submit(_event("a", name))
+    assert queue.active_calls == 1
+    await queue.close()
+    assert recorder.seen == [("a", name) for name in names]
+    assert queue.pending == 0
+    assert queue.active_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_a_slow_call_does_not_hold_up_another():
+    recorder = _Recorder()
+    recorder.gates["slow"] = asyncio.Event()
+    queue = CallEventQueue(recorder, max_pending=100)
+    queue.submit(_event("slow", "CallDisconnected"))
+    queue.submit(_event("fast", "CallConnected"))
+    queue.submit(_event("fast", "CallDisconnected"))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert recorder.seen == [("fast", "CallConnected"), ("fast", "CallDisconnected")]
+    assert queue.pending == 1
+
+    recorder.gates["slow"].set()
+    await queue.close()
+    assert recorder.seen[-1] == ("slow", "CallDisconnected")
+
+
+@pytest.mark.asyncio
+async def test_failed_handler_does_not_stop_the_call():
+    recorder = _Recorder()
+    queue = CallEventQueue(recorder, max_pending=100)
+    queue.submit(_event("a", "boom"))
+    queue.submit(_event("a", "CallDisconnected"))
+    await queue.close()
+    assert recorder.seen == [("a", "CallDisconnected")]
+    assert queue.stats()["processed"] == 2
+
+
+# ── Capacity ─────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_submit_refuses_events_beyond_capacity_and_after_close():
+    recorder = _Recorder()
+    recorder.gates["a"] = asyncio.Event()
+    queue = CallEventQueue(recorder, max_pending=2)
+    assert queue.submit(_event("a", "one"))
+    assert queue.submit(_event("b", "two"))
+    assert not queue.has_capacity()
+    assert not queue.submit(_event("c", "three"))
+
+    recorder.gates["a"].set()
+    await queue.close()
+    assert not queue.submit(_event("a", "late"))
+    assert sorted(recorder.seen) == [("a", "one"), ("b", "two")]
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_events_still_running_after_the_timeout():
+    recorder = _Recorder()
+    recorder.gates["stuck"] = asyncio.Event()
+    queue = CallEventQueue(recorder, max_pending=10)
+    queue.submit(_event("stuck", "one"))
+    queue.submit(_event("stuck", "two"))
+    await queue.close(timeout=0.01)
+    assert recorder.seen == []
+    assert queue.pending == 0
+    assert queue.active_calls == 0
+
+
+# ── Webhook ──────────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_webhook_answers_503_for_a_batch_that_does_not_fit():
+    recorder = _Recorder()
+    recorder.gates["a"] = asyncio.Event()
+    queue = CallEventQueue(recorder, max_pending=2)
+    app = web.Application()
+    app["acs_event_queue"] = queue
+    app.router.add_post("/acs", handle_acs_event)
+
+    batch = [
+        {"type": "Microsoft.Communication.CallConnected", "data": {"callConnectionId": "a"}},
+        {"type": "Microsoft.Communication.ParticipantsUpdated", "data": {"callConnectionId": "a"}},
+    ]
+    async with TestClient(TestServer(app)) as client:
+        accepted = await client.post("/acs", json=batch)
+        assert accepted.status == 200
+        assert queue.pending == 2
+
+        # The whole batch is refused, not just the part that does not fit
+        refused = await client.post("/acs", json=batch[:1])
+        assert refused.status == 503
+        assert queue.pending == 2
+
+        recorder.gates["a"].set()
+        await queue.close()
+    assert recorder.seen == [
+        ("a", "Microsoft.Communication.CallConnected"),
+        ("a", "Microsoft.Communication.ParticipantsUpdated"),
+    ]
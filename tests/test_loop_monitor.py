@@ -0,0 +1,58 @@
+"""Tests for the event-loop lag monitor."""
+
+import asyncio
+import time
+
+import pytest
+
+from voice_service.loop_monitor import LoopMonitor
+
+
+def _blocking_handler(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_stall_is_attributed_to_tracked_handler():
+    monitor = LoopMonitor(interval=0.02, slow_threshold=0.03)
+    monitor.track(_blocking_handler, label="blocker")
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        # Longer than interval + threshold, so the probe always sees it
+        _blocking_handler(0.2)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    report = monitor.report()
+    assert report["slow_callbacks"]["total"] >= 1
+    offender = report["top_offenders"][0]
+    assert offender["handler"] == "blocker"
+    assert offender["max_ms"] >= 100
+    assert any("_blocking_handler" in line for line in offender["last_stack"])
+
+
+@pytest.mark.asyncio
+async def test_healthy_loop_reports_no_stalls():
+    monitor = LoopMonitor(interval=0.01, slow_threshold=0.1)
+    await monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+    finally:
+        await monitor.stop()
+
+    report = monitor.report()
+    assert report["slow_callbacks"]["total"] == 0
+    assert report["lag_ms"]["samples"] > 0
+
+
+@pytest.mark.asyncio
+async def test_asyncio_handle_is_not_patched():
+    run = asyncio.Handle._run
+    monitor = LoopMonitor(interval=0.01)
+    await monitor.start()
+    try:
+        assert asyncio.Handle._run is run
+    finally:
+        await monitor.stop()
@@ -0,0 +1,258 @@
+"""Tests for wake-word detection in meeting mode."""
+
+import asyncio
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from voice_service.meeting_audio_worker import ACS_SAMPLE_RATE, MeetingAudioWorker
+from voice_service.meeting_wake_word import (
+    _WAKE_LATENCY,
+    PartialWakeMatcher,
+    WakeWordDetector,
+)
+from voice_service.passive_transcription import (
+    TranscriptionBackend,
+    Utterance,
+    set_backend,
+)
+from voice_service.realtime_session import ResilientRealtimeSession
+from voice_service.voice_state import VoiceSession
+
+FRAME_MS = 20
+SPEECH = (8000 * np.sin(np.arange(ACS_SAMPLE_RATE * FRAME_MS // 1000) / 3)).astype("<i2").tobytes()
+QUIET = bytes(len(SPEECH))
+
+
+# ── Matching ─────────────────────────────────────────────────────────
+
+def test_detector_matches_wake_and_deactivation_phrases():
+    detector = WakeWordDetector(auto_deactivate_seconds=0)
+    assert detector.check_transcript("OK, hey Aida, what's next?")
+    assert detector.check_transcript("hey ada can you check")
+    assert not detector.check_transcript("Aidan sent the notes")
+    assert detector.check_deactivate("thanks AIDA")
+    assert not detector.check_deactivate("AIDA, thanks for waiting")
+
+
+def test_partial_match_waits_for_text_after_the_wake_word():
+    matcher = PartialWakeMatcher()
+    # "Aida" could still become "Aidan"
+    assert not matcher.update("s1", "so hey aida")
+    assert not matcher.update("s1", "so hey aidan")
+    assert matcher.update("s1", "so hey aida can you")
+    # Reported once per segment
+    assert not matcher.update("s1", "so hey aida can you book")
+    assert matcher.complete("s1")
+    assert not matcher.complete("s1")
+    assert not matcher.complete("never-matched")
+
+
+# ── Worker ───────────────────────────────────────────────────────────
+
+class _WakeBackend(TranscriptionBackend):
+    """Every utterance, interim or final, contains the wake word."""
+
+    name = "wake"
+
+    def __init__(self) -> None:
+        self.requests: list[int] = []
+
+    async def transcribe(self, utterances: list[Utterance]) -> list[str | None]:
+        self.requests.extend(u.duration_ms for u in utterances)
+        return ["Hey Aida, what is on my calendar" for _ in utterances]
+
+
+class _FakeRealtimeClient:
+    def __init__(self) -> None:
+        self._ws = None
+        self.audio: list[bytes] = []
+        self.closed = False
+
+    async def connect(self, instructions: str, tools: list) -> None:
+        pass
+
+    async def send_audio(self, audio: bytes) -> None:
+        self.audio.append(audio)
+
+    async def receive_events(self):
+        await asyncio.Event().wait()
+        yield {}
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def backend():
+    fake = _WakeBackend()
+    set_backend(fake)
+    yield fake
+    set_backend(None)
+
+
+@pytest_asyncio.fixture
+async def worker(backend):
+    clients: list[_FakeRealtimeClient] = []
+
+    def factory() -> _FakeRealtimeClient:
+        clients.append(_FakeRealtimeClient())
+        return clients[-1]
+
+    session = VoiceSession(call_connection_id="call-1", is_meeting_mode=True, record=False)
+    worker = MeetingAudioWorker(session, None, None)
+    worker._realtime_client = ResilientRealtimeSession(
+        name="test", bytes_per_second=ACS_SAMPLE_RATE * 2, client_factory=factory
+    )
+    worker.clients = clients
+    worker._running = True
+    yield worker
+    await worker.stop()
+
+
+async def _speak(worker: MeetingAudioWorker, frame: bytes, ms: int) -> None:
+    for _ in range(ms // FRAME_MS):
+        await worker._forward_audio_to_realtime(frame)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_interim_transcript_activates_mid_utterance_once(worker, backend):
+    session = worker._session
+    partial_before = _WAKE_LATENCY["partial"].count
+    passive_before = _WAKE_LATENCY["passive"].count
+
+    # Still talking: no silence has closed the utterance yet
+    await _speak(worker, SPEECH, 1200)
+    assert session.is_voice_active
+    assert len(worker.clients) == 1
+    assert _WAKE_LATENCY["partial"].count == partial_before + 1
+    # Only the interim snapshot had been transcribed when voice came on
+    assert backend.requests[0] == 1000
+
+    # Switched off again before the utterance's final transcript arrives:
+    # that transcript must not wake the session a second time
+    worker._wake_word.deactivate(session)
+    await worker._passive.close()
+    assert len(session.transcript_entries) == 1
+    assert not session.is_voice_active
+    assert len(worker.clients) == 1
+    assert _WAKE_LATENCY["passive"].count == passive_before
+
+
+@pytest.mark.asyncio
+async def test_short_utterance_activates_on_its_final_transcript(worker, backend):
+    session = worker._session
+    passive_before = _WAKE_LATENCY["passive"].count
+
+    # Too short for an interim transcript
+    await _speak(worker, SPEECH, 600)
+    await _speak(worker, QUIET, 800)
+    assert not session.is_voice_active
+    await worker._passive.close()
+
+    assert session.is_voice_active
+    # Speech plus the 700 ms hangover, in one final request
+    assert backend.requests == [1300]
+    assert _WAKE_LATENCY["passive"].count == passive_before + 1
+
+
+# ── Deactivation ─────────────────────────────────────────────────────
+
+async def _caller_says(worker: MeetingAudioWorker, text: str) -> None:
+    await worker._handle_realtime_event({
+        "type": "conversation.item.input_audio_transcription.completed",
+        "item_id": "item-1",
+        "transcript": text,
+    })
+
+
+@pytest.mark.asyncio
+async def test_deactivation_phrase_closes_realtime_until_the_next_wake_word(worker):
+    session = worker._session
+    await _speak(worker, SPEECH, 1200)
+    assert session.is_voice_active
+    assert worker._realtime_connected
+
+    await _caller_says(worker, "what's the weather like")
+    assert session.is_voice_active
+
+    await _caller_says(worker, "Thanks Aida")
+    assert not session.is_voice_active
+    assert not worker._realtime_connected
+    await worker._realtime_close_task
+    assert worker.clients[0].closed
+    assert worker._realtime_to_acs_task is None
+    # A deliberate close is not a lost session: the call goes on
+    assert worker._end_task is None
+
+    # Passive again until the wake word opens a new session
+    await _speak(worker, QUIET, 800)
+    await _speak(worker, SPEECH, 1200)
+    assert session.is_voice_active
+    assert worker._realtime_connected
+    assert len(worker.clients) == 2
+    assert not worker.clients[1].closed
+
+
+@pytest.mark.asyncio
+async def test_auto_deactivation_closes_realtime(worker):
+    await _speak(worker, SPEECH, 1200)
+    assert worker._realtime_connected
+
+    worker._wake_word._auto_deactivate(worker._session)
+    await worker._realtime_close_task
+    assert worker.clients[0].closed
+    assert not worker._realtime_connected
+    assert worker._end_task is None
+
+
+# ── Pre-roll ─────────────────────────────────────────────────────────
+
+class _SlowRealtimeClient(_FakeRealtimeClient):
+    """Yields on every send, so live frames can arrive mid-replay."""
+
+    async def send_audio(self, audio: bytes) -> None:
+        await super().send_audio(audio)
+        await asyncio.sleep(0)
+
+
+def _frame(value: int) -> bytes:
+    return np.full(ACS_SAMPLE_RATE * FRAME_MS // 1000, value, dtype="<i2").tobytes()
+
+
+@pytest.mark.asyncio
+async def test_preroll_reaches_realtime_ahead_of_live_frames(worker):
+    clients: list[_SlowRealtimeClient] = []
+
+    def factory() -> _SlowRealtimeClient:
+        clients.append(_SlowRealtimeClient())
+        return clients[-1]
+
+    worker._realtime_client = ResilientRealtimeSession(
+        name="test", bytes_per_second=ACS_SAMPLE_RATE * 2, client_factory=factory
+    )
+    # 400 ms heard while passive: too quiet to be an utterance
+    held = [_frame(1)] * 20
+    for frame in held:
+        await worker._forward_audio_to_realtime(frame)
+    assert len(worker._preroll) == len(b"".join(held))
+
+    activation = asyncio.create_task(worker._activate_voice())
+    mid_replay: list[bytes] = []
+    await asyncio.sleep(0)
+    while worker._preroll_pending:
+        mid_replay.append(_frame(2))
+        await worker._forward_audio_to_realtime(mid_replay[-1])
+        # Live frames come in slower than the replay sends them
+        for _ in range(3):
+            await asyncio.sleep(0)
+    await activation
+    live = _frame(3)
+    await worker._forward_audio_to_realtime(live)
+
+    # Frames that arrived during the replay were queued behind the pre-roll
+    assert mid_replay
+    assert b"".join(clients[0].audio) == b"".join(held + mid_replay + [live])
+    assert len(worker._preroll) == 0
@@ -0,0 +1,219 @@
+"""Tests for outbound call rate limiting, batching and the batch endpoint."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from voice_service import app as app_module
+from voice_service import outbound_calls as outbound_calls_module
+from voice_service.admission import AdmissionController, RealtimeAvailability
+from voice_service.app import create_outbound_call, create_outbound_calls_batch
+from voice_service.outbound_calls import TokenBucket, place_calls
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    # Only the bucket's clock: the event loop keeps the real one
+    monkeypatch.setattr(outbound_calls_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the bucket's sleeps and hold them until the test releases them."""
+    waits: list[float] = []
+    gate = asyncio.Event()
+
+    async def sleep(seconds: float) -> None:
+        waits.append(seconds)
+        await gate.wait()
+
+    fake_asyncio = SimpleNamespace(sleep=sleep, CancelledError=asyncio.CancelledError)
+    monkeypatch.setattr(outbound_calls_module, "asyncio", fake_asyncio)
+    return waits, gate
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ── TokenBucket ──────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_bucket_serves_waiters_in_arrival_order(clock, sleeps):
+    waits, gate = sleeps
+    bucket = TokenBucket(rate=2, burst=2)
+    done: list[int] = []
+
+    async def acquire(n: int) -> None:
+        await bucket.acquire()
+        done.append(n)
+
+    tasks = [asyncio.create_task(acquire(n)) for n in range(5)]
+    await _settle()
+    # The burst is taken at once; each later waiter is due 1/rate after the last
+    assert done == [0, 1]
+    assert waits == [0.5, 1.0, 1.5]
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert done == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_its_token_back(clock, sleeps):
+    waits, _ = sleeps
+    bucket = TokenBucket(rate=2, burst=1)
+    await bucket.acquire()
+    first = asyncio.create_task(bucket.acquire())
+    second = asyncio.create_task(bucket.acquire())
+    await _settle()
+    assert waits == [0.5, 1.0]
+
+    first.cancel()
+    second.cancel()
+    await asyncio.gather(first, second, return_exceptions=True)
+    # The next caller waits as if the cancelled ones had never queued
+    third = asyncio.create_task(bucket.acquire())
+    await _settle()
+    assert waits[-1] == 0.5
+    third.cancel()
+    await asyncio.gather(third, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_zero_rate_disables_the_limit():
+    bucket = TokenBucket(rate=0, burst=1)
+    assert [await bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+# ── place_calls ──────────────────────────────────────────────────────
+
+class _Placer:
+    """Place function that blocks until released and tracks concurrency."""
+
+    def __init__(self) -> None:
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, index: int, call: str) -> dict:
+        self.started.append(index)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if call == "boom":
+                raise RuntimeError("place failed")
+            if call != "fast":
+                await self.release.wait()
+            return {"index": index, "status": "created"}
+        except asyncio.CancelledError:
+            self.cancelled.append(index)
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_place_calls_runs_at_most_concurrency_calls_at_once():
+    placer = _Placer()
+    results = place_calls(["slow"] * 10, placer, concurrency=3)
+    first = asyncio.create_task(results.__anext__())
+    await _settle()
+    assert placer.started == [0, 1, 2]
+
+    placer.release.set()
+    collected = [await first] + [result async for result in results]
+    assert sorted(result["index"] for result in collected) == list(range(10))
+    assert placer.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_place_calls_reports_an_exception_as_failed():
+    placer = _Placer()
+    collected = [result async for result in place_calls(["fast", "boom", "fast"], placer, concurrency=2)]
+    assert sorted((r["index"], r["status"]) for r in collected) == [(0, "created"), (1, "failed"), (2, "created")]
+
+
+@pytest.mark.asyncio
+async def test_closing_early_cancels_calls_not_yet_placed():
+    placer = _Placer()
+    results = place_calls(["fast"] + ["slow"] * 9, placer, concurrency=3)
+    assert (await results.__anext__())["index"] == 0
+    await _settle()
+    # One worker moved on after the fast call; three calls are in flight
+    assert placer.started == [0, 1, 2, 3]
+
+    await results.aclose()
+    assert sorted(placer.cancelled) == [1, 2, 3]
+    assert placer.in_flight == 0
+    await _settle()
+    assert placer.started == [0, 1, 2, 3]
+
+
+# ── Endpoints ────────────────────────────────────────────────────────
+
+@pytest.fixture
+def placed(monkeypatch):
+    """Stub out ACS: every admitted call is created, none connects."""
+    calls: list[str] = []
+
+    async def place_call(acs, manager, target, meeting_id="", media_streaming=True) -> str:
+        calls.append(target)
+        await asyncio.sleep(0)
+        return f"call-{len(calls)}"
+
+    admission = AdmissionController(
+        session_count=lambda: 8,
+        loop_lag=lambda: 0.0,
+        realtime=RealtimeAvailability(failure_threshold=3, retry_seconds=30),
+        max_sessions=10,
+        max_loop_lag=0.1,
+        max_cpu=0,
+        connected_calls=set,
+    )
+    monkeypatch.setattr(app_module, "place_call", place_call)
+    monkeypatch.setattr(app_module, "_admission", admission)
+    monkeypatch.setattr(app_module, "_acs_client", object())
+    monkeypatch.setattr(app_module, "_meeting_manager", object())
+    return calls
+
+
+def _app() -> web.Application:
+    app = web.Application()
+    app.router.add_post("/api/calls/create", create_outbound_call)
+    app.router.add_post("/api/calls/batch", create_outbound_calls_batch)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_batch_calls_hold_capacity_until_their_sessions_connect(placed):
+    body = {"calls": [{"target": f"4:+1555000000{n}"} for n in range(4)], "concurrency": 4}
+    async with TestClient(TestServer(_app())) as client:
+        response = await client.post("/api/calls/batch", json=body)
+        assert response.status == 200
+        lines = [json.loads(line) for line in (await response.text()).splitlines()]
+
+        # Two free sessions: the first two calls are placed, the rest shed
+        assert lines[-1] == {"done": True, "created": 2, "rejected": 2, "invalid": 0, "failed": 0}
+        assert len(placed) == 2
+        single = await client.post("/api/calls/create", json={"target": "4:+15550000009"})
+        assert single.status == 503
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/api/calls/create", "/api/calls/batch"])
+@pytest.mark.parametrize("body", ["[]", '"calls"', "not json"])
+async def test_non_object_body_is_a_bad_request(placed, path, body):
+    async with TestClient(TestServer(_app())) as client:
+        response = await client.post(path, data=body, headers={"Content-Type": "application/json"})
+        assert response.status == 400
+    assert placed == []
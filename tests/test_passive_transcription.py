@@ -0,0 +1,205 @@
+"""Tests for passive meeting transcription."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from voice_service import passive_transcription
+from voice_service.passive_transcription import (
+    PassiveTranscriber,
+    TranscriptionBackend,
+    Utterance,
+    UtteranceSegmenter,
+    register_backend,
+    set_backend,
+)
+
+SAMPLE_RATE = 16000
+FRAME_MS = 20
+SPEECH = (8000 * np.sin(np.arange(SAMPLE_RATE * FRAME_MS // 1000) / 3)).astype("<i2").tobytes()
+QUIET = bytes(len(SPEECH))
+
+
+class FakeBackend(TranscriptionBackend):
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.batches: list[list[Utterance]] = []
+
+    async def transcribe(self, utterances: list[Utterance]) -> list[str | None]:
+        self.batches.append(utterances)
+        return [f"{u.speaker_raw_id} spoke {u.duration_ms} ms" for u in utterances]
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = FakeBackend()
+    register_backend("fake", lambda: fake)
+    monkeypatch.setattr(passive_transcription, "PASSIVE_TRANSCRIPTION_BACKEND", "fake")
+    set_backend(None)
+    yield fake
+    set_backend(None)
+
+
+def _talk(target, speaker: str, speech_ms: int, silence_ms: int = 800) -> None:
+    for _ in range(speech_ms // FRAME_MS):
+        target.push(SPEECH, speaker)
+    for _ in range(silence_ms // FRAME_MS):
+        target.push(QUIET, speaker)
+
+
+def _segmenter() -> UtteranceSegmenter:
+    return UtteranceSegmenter(
+        SAMPLE_RATE, threshold_dbfs=-45, silence_ms=700, min_speech_ms=300, max_utterance_ms=15000, preroll_ms=200
+    )
+
+
+# ── Segmentation ─────────────────────────────────────────────────────
+
+def test_silence_and_flagged_frames_never_open_an_utterance():
+    segmenter = _segmenter()
+    for _ in range(100):
+        assert segmenter.push(QUIET, "alice") is None
+        # A loud frame ACS flagged as silent is not inspected
+        assert segmenter.push(SPEECH, "alice", silent=True) is None
+    assert segmenter.flush() is None
+
+
+def test_speech_is_cut_after_the_silence_hangover():
+    segmenter = _segmenter()
+    for _ in range(20):
+        segmenter.push(QUIET, "alice")
+    closed = [u for u in (segmenter.push(SPEECH, "alice") for _ in range(25)) if u]
+    assert not closed
+    for index in range(40):
+        utterance = segmenter.push(QUIET, "alice")
+        if utterance is not None:
+            break
+    assert utterance is not None
+    # Closed on the 700 ms hangover: 200 ms pre-roll + 500 ms speech + 700 ms silence
+    assert index + 1 == 700 // FRAME_MS
+    assert utterance.duration_ms == 200 + 500 + 700
+    assert utterance.speaker_raw_id == "alice"
+
+
+def test_short_noise_is_dropped():
+    segmenter = _segmenter()
+    results = [segmenter.push(SPEECH, "alice") for _ in range(5)]
+    results += [segmenter.push(QUIET, "alice") for _ in range(50)]
+    assert not any(results)
+
+
+def test_long_monologue_is_cut_at_max_length():
+    segmenter = UtteranceSegmenter(SAMPLE_RATE, max_utterance_ms=1000, preroll_ms=0)
+    utterances = [u for u in (segmenter.push(SPEECH, "alice") for _ in range(120)) if u]
+    assert [u.duration_ms for u in utterances] == [1000, 1000]
+
+
+def test_utterance_is_attributed_to_the_main_speaker():
+    segmenter = _segmenter()
+    for _ in range(10):
+        segmenter.push(SPEECH, "alice")
+    for _ in range(30):
+        segmenter.push(SPEECH, "bob")
+    utterance = segmenter.flush()
+    assert utterance is not None
+    assert utterance.speaker_raw_id == "bob"
+
+
+# ── Transcriber ──────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_utterances_are_batched_to_the_registered_backend(backend):
+    transcripts: list[tuple[str, str]] = []
+
+    async def on_transcript(utterance: Utterance, text: str) -> None:
+        transcripts.append((utterance.speaker_raw_id, text))
+
+    transcriber = PassiveTranscriber(on_transcript, SAMPLE_RATE, batch_size=2, batch_wait_ms=60_000)
+    _talk(transcriber, "alice", 400)
+    _talk(transcriber, "bob", 600)
+    await transcriber.close()
+
+    assert [len(batch) for batch in backend.batches] == [2]
+    # Speech plus the 700 ms hangover; bob's pre-roll is the 100 ms of silence after alice's
+    assert transcripts == [("alice", "alice spoke 1100 ms"), ("bob", "bob spoke 1400 ms")]
+    assert transcriber.stats() == {"utterances": 2, "transcribed": 2, "dropped": 0, "interims": 0, "pending": 0}
+
+
+@pytest.mark.asyncio
+async def test_close_transcribes_the_backlog(backend):
+    transcripts: list[str] = []
+
+    async def on_transcript(utterance: Utterance, text: str) -> None:
+        transcripts.append(text)
+
+    # Nothing would be sent for a minute — close() must not wait for that
+    transcriber = PassiveTranscriber(on_transcript, SAMPLE_RATE, batch_size=10, batch_wait_ms=60_000)
+    _talk(transcriber, "alice", 400)
+    # Still speaking when the session ends
+    for _ in range(20):
+        transcriber.push(SPEECH, "carol")
+    assert backend.batches == []
+
+    await transcriber.close(timeout=5)
+    assert transcripts == ["alice spoke 1100 ms", "carol spoke 500 ms"]
+
+
+@pytest.mark.asyncio
+async def test_vad_gating_keeps_silence_away_from_the_backend(backend):
+    async def on_transcript(utterance: Utterance, text: str) -> None:
+        raise AssertionError("no transcript expected")
+
+    transcriber = PassiveTranscriber(on_transcript, SAMPLE_RATE)
+    for _ in range(500):
+        transcriber.push(QUIET, "alice")
+        transcriber.push(SPEECH, "alice", silent=True)
+    await transcriber.close()
+    assert backend.batches == []
+    assert transcriber.stats()["utterances"] == 0
+
+
+@pytest.mark.asyncio
+async def test_interim_transcripts_cover_the_opening_of_each_utterance(backend):
+    interims: list[tuple[int, int, str]] = []
+    finals: list[tuple[int, str]] = []
+
+    async def on_interim(utterance: Utterance, text: str) -> None:
+        interims.append((utterance.segment, utterance.duration_ms, text))
+
+    async def on_transcript(utterance: Utterance, text: str) -> None:
+        finals.append((utterance.segment, text))
+
+    transcriber = PassiveTranscriber(
+        on_transcript, SAMPLE_RATE, batch_size=1, on_interim=on_interim, interim_ms=400, interim_max_ms=1000
+    )
+    for speaker in ("alice", "bob"):
+        for _ in range(2000 // FRAME_MS):
+            transcriber.push(SPEECH, speaker)
+            await asyncio.sleep(0)
+        for _ in range(800 // FRAME_MS):
+            transcriber.push(QUIET, speaker)
+    await transcriber.close()
+
+    # Every 400 ms up to 1 s into each utterance (bob's counts 100 ms of pre-roll)
+    assert interims == [
+        (1, 400, "alice spoke 400 ms"),
+        (1, 800, "alice spoke 800 ms"),
+        (2, 400, "bob spoke 400 ms"),
+        (2, 800, "bob spoke 800 ms"),
+    ]
+    assert finals == [(1, "alice spoke 2700 ms"), (2, "bob spoke 2800 ms")]
+    assert transcriber.stats()["interims"] == 4
+
+
+@pytest.mark.asyncio
+async def test_no_interims_without_a_handler(backend):
+    async def on_transcript(utterance: Utterance, text: str) -> None:
+        pass
+
+    transcriber = PassiveTranscriber(on_transcript, SAMPLE_RATE, interim_ms=400)
+    _talk(transcriber, "alice", 2000)
+    await transcriber.close()
+    assert [len(batch) for batch in backend.batches] == [1]
+    assert transcriber.stats()["interims"] == 0
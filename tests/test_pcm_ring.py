@@ -0,0 +1,100 @@
+"""Tests for the bounded PCM ring buffer."""
+
+from voice_service.pcm_ring import PcmRingBuffer
+
+
+def _pcm(*samples: int) -> bytes:
+    return b"".join(s.to_bytes(2, "little", signed=True) for s in samples)
+
+
+# ── Writing ──────────────────────────────────────────────────────────
+
+def test_capacity_is_rounded_down_to_whole_samples():
+    assert PcmRingBuffer(9).capacity == 8
+    assert PcmRingBuffer(9, sample_width=4).capacity == 8
+
+
+def test_writes_wrap_around_the_end_of_the_buffer():
+    ring = PcmRingBuffer(8)
+    assert ring.write(_pcm(1, 2, 3)) == 0
+    assert ring.read(4) == _pcm(1, 2)
+    # Starts at byte 6 of 8: one sample at the end, two at the front
+    assert ring.write(_pcm(4, 5, 6)) == 0
+    assert len(ring) == 8
+    assert ring.peek() == _pcm(3, 4, 5, 6)
+    assert ring.read() == _pcm(3, 4, 5, 6)
+    assert len(ring) == 0
+
+
+def test_overflow_overwrites_the_oldest_whole_samples():
+    ring = PcmRingBuffer(8)
+    ring.write(_pcm(1, 2, 3))
+    # Three bytes do not fit; whole samples are dropped, so four go
+    assert ring.write(_pcm(4, 5) + b"\x06") == 4
+    assert ring.peek() == _pcm(3, 4, 5) + b"\x06"
+    assert ring.dropped_bytes == 4
+
+
+def test_write_larger_than_the_ring_keeps_its_tail():
+    ring = PcmRingBuffer(8)
+    ring.write(_pcm(1, 2))
+    assert ring.write(_pcm(3, 4, 5, 6, 7, 8)) == 8
+    assert ring.peek() == _pcm(5, 6, 7, 8)
+    # Exactly full is not an overflow of the new audio
+    ring.clear()
+    assert ring.write(_pcm(1, 2, 3, 4)) == 0
+    assert ring.peek() == _pcm(1, 2, 3, 4)
+
+
+def test_zero_capacity_discards_everything():
+    ring = PcmRingBuffer(1)
+    assert ring.capacity == 0
+    assert ring.write(_pcm(1, 2)) == 4
+    assert ring.write(b"") == 0
+    assert len(ring) == 0
+    assert ring.read() == b""
+    assert ring.dropped_bytes == 4
+
+
+# ── Reading / skipping ───────────────────────────────────────────────
+
+def test_read_takes_whole_samples_only():
+    ring = PcmRingBuffer(8)
+    ring.write(_pcm(1, 2, 3))
+    assert ring.read(1) == b""
+    assert ring.read(3) == _pcm(1)
+    assert ring.read(100) == _pcm(2, 3)
+    assert ring.read() == b""
+
+
+def test_read_across_the_wrap_point():
+    ring = PcmRingBuffer(8)
+    ring.write(_pcm(1, 2, 3))
+    ring.skip(4)
+    ring.write(_pcm(4, 5, 6))
+    assert ring.read(6) == _pcm(3, 4, 5)
+    assert ring.read() == _pcm(6)
+
+
+def test_skip_drops_whole_samples_without_copying():
+    ring = PcmRingBuffer(8)
+    ring.write(_pcm(1, 2, 3))
+    assert ring.skip(0) == 0
+    assert ring.skip(-2) == 0
+    assert ring.skip(3) == 2
+    assert ring.peek() == _pcm(2, 3)
+    assert ring.skip(100) == 4
+    assert len(ring) == 0
+    assert ring.skip(2) == 0
+    # Skipped audio is not counted as overwritten
+    assert ring.dropped_bytes == 0
+
+
+def test_clear_empties_the_ring():
+    ring = PcmRingBuffer(8)
+    ring.write(_pcm(1, 2, 3))
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.peek() == b""
+    ring.write(_pcm(4))
+    assert ring.read() == _pcm(4)
@@ -0,0 +1,96 @@
+"""Tests for the paced playout buffer."""
+
+import asyncio
+import time
+
+import pytest
+
+from voice_service.playout import PlayoutBuffer
+
+SAMPLE_RATE = 8000
+FRAME_MS = 20
+FRAME_BYTES = SAMPLE_RATE * 2 * FRAME_MS // 1000
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.frames: list[bytes] = []
+        self.times: list[float] = []
+
+    async def send(self, frame: bytes) -> None:
+        self.frames.append(frame)
+        self.times.append(time.monotonic())
+
+
+def _buffer(sink: _Sink, lead_ms: int = 40) -> PlayoutBuffer:
+    return PlayoutBuffer(sink.send, sample_rate=SAMPLE_RATE, frame_ms=FRAME_MS, lead_ms=lead_ms)
+
+
+def test_deltas_are_rechunked_into_frames():
+    buffer = _buffer(_Sink())
+    buffer.enqueue(bytes(FRAME_BYTES + 10), "item-1")
+    assert buffer.buffered_ms == FRAME_MS
+    buffer.enqueue(bytes(FRAME_BYTES - 10), "item-1")
+    assert buffer.buffered_ms == 2 * FRAME_MS
+    # The tail of an item is padded to a whole frame when it ends
+    buffer.enqueue(bytes(10), "item-1")
+    buffer.end_item()
+    assert buffer.buffered_ms == 3 * FRAME_MS
+
+
+@pytest.mark.asyncio
+async def test_frames_are_released_in_real_time():
+    sink = _Sink()
+    buffer = _buffer(sink, lead_ms=40)
+    buffer.start()
+    started = time.monotonic()
+    buffer.enqueue(bytes(FRAME_BYTES * 10), "item-1")
+    await asyncio.sleep(0.1)
+    # 100 ms in: about 100 ms of audio plus the 40 ms lead is out, not all 200 ms
+    assert 5 <= len(sink.frames) <= 8
+    while len(sink.frames) < 10:
+        await asyncio.sleep(0.01)
+    await buffer.stop()
+
+    # The last frame leaves no earlier than its play time minus the lead
+    assert sink.times[-1] - started >= (10 * FRAME_MS - 40 - FRAME_MS) / 1000
+
+
+@pytest.mark.asyncio
+async def test_flush_drops_unreleased_audio_and_reports_played_ms():
+    sink = _Sink()
+    buffer = _buffer(sink, lead_ms=20)
+    buffer.start()
+    buffer.enqueue(bytes(FRAME_BYTES * 50), "item-1")
+    await asyncio.sleep(0.1)
+
+    item_id, played_ms = buffer.flush()
+    released = len(sink.frames)
+    assert item_id == "item-1"
+    assert 0 < played_ms <= released * FRAME_MS
+    assert buffer.buffered_ms == 0
+
+    await asyncio.sleep(0.06)
+    assert len(sink.frames) == released
+    await buffer.stop()
+
+
+@pytest.mark.asyncio
+async def test_late_deltas_of_flushed_item_are_dropped_until_next_item():
+    sink = _Sink()
+    buffer = _buffer(sink)
+    buffer.start()
+    buffer.enqueue(bytes(FRAME_BYTES * 20), "item-1")
+    await asyncio.sleep(0.05)
+    buffer.flush()
+
+    # Deltas the model had already sent for the cut-off item
+    assert buffer.discards("item-1")
+    buffer.enqueue(bytes(FRAME_BYTES * 5), "item-1")
+    assert buffer.buffered_ms == 0
+
+    # The next response plays normally, and the flushed item is forgotten
+    buffer.enqueue(bytes(FRAME_BYTES * 2), "item-2")
+    assert buffer.buffered_ms == 2 * FRAME_MS
+    assert not buffer.discards("item-1")
+    await buffer.stop()
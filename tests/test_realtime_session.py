@@ -0,0 +1,214 @@
+"""Tests for the reconnecting Realtime session."""
+
+import asyncio
+
+import pytest
+
+from voice_service import realtime_session
+from voice_service.admission import RealtimeAvailability
+from voice_service.meeting_audio_worker import MeetingAudioWorker
+from voice_service.realtime_session import ResilientRealtimeSession, compact_history
+from voice_service.voice_state import VoiceSession
+
+_DROP = object()
+
+
+class _FakeSocket:
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self.closed = False
+
+    async def send_json(self, event: dict) -> None:
+        self.sent.append(event)
+
+
+class _FakeClient:
+    """Realtime client whose connection drops when ``_DROP`` is queued."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.gate: asyncio.Event | None = None
+        self._ws = _FakeSocket()
+        self.audio: list[bytes] = []
+        self.events: asyncio.Queue = asyncio.Queue()
+
+    async def connect(self, instructions: str, tools: list) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("connect refused")
+
+    async def send_audio(self, audio: bytes) -> None:
+        self.audio.append(audio)
+
+    async def receive_events(self):
+        while True:
+            event = await self.events.get()
+            if event is _DROP:
+                return
+            yield event
+
+    async def close(self) -> None:
+        self._ws.closed = True
+
+
+class _Factory:
+    """Hands out clients; the ones listed in ``failing`` refuse to connect."""
+
+    def __init__(self, failing: set[int] = frozenset()) -> None:
+        self.failing = failing
+        self.clients: list[_FakeClient] = []
+        # Connects wait for this once set (None: connect at once)
+        self.gate: asyncio.Event | None = None
+
+    def __call__(self) -> _FakeClient:
+        client = _FakeClient(fail=len(self.clients) in self.failing)
+        client.gate = self.gate
+        self.clients.append(client)
+        return client
+
+
+@pytest.fixture
+def circuit(monkeypatch):
+    fresh = RealtimeAvailability(failure_threshold=3, retry_seconds=30)
+    monkeypatch.setattr(realtime_session, "REALTIME_AVAILABILITY", fresh)
+    return fresh
+
+
+def _session(factory: _Factory, **kwargs) -> ResilientRealtimeSession:
+    kwargs.setdefault("backoff_ms", 1)
+    kwargs.setdefault("backoff_max_ms", 2)
+    return ResilientRealtimeSession(name="test", bytes_per_second=1000, client_factory=factory, **kwargs)
+
+
+async def _next(events, timeout: float = 1.0):
+    return await asyncio.wait_for(events.__anext__(), timeout)
+
+
+def test_compact_history_merges_turns_and_keeps_the_newest():
+    entries = [("user", "one"), ("user", "two"), ("assistant", "three"), ("user", "four")]
+    assert compact_history(entries, max_items=2) == [("assistant", "three"), ("user", "four")]
+    assert compact_history(entries, max_items=10)[0] == ("user", "one\ntwo")
+    assert compact_history([("user", "x" * 50)], max_chars=10) == [("user", "…" + "x" * 9)]
+
+
+@pytest.mark.asyncio
+async def test_drop_reconnects_restores_and_replays_in_order(circuit):
+    factory = _Factory()
+    reconnected: list[float] = []
+    session = _session(
+        factory,
+        history=lambda: [("user", "book a room"), ("assistant", "for when?")],
+        on_reconnected=reconnected.append,
+    )
+    await session.connect("instructions", [])
+    await session.send_event({"type": "session.update", "session": {"voice": "sage"}})
+    first = factory.clients[0]
+    events = session.receive_events()
+
+    first.events.put_nowait({"type": "one"})
+    assert (await _next(events))["type"] == "one"
+
+    # The socket drops; the next read starts the reconnect
+    factory.gate = asyncio.Event()
+    first.events.put_nowait(_DROP)
+    pending = asyncio.ensure_future(_next(events))
+    await asyncio.sleep(0.01)
+    assert session.reconnecting
+    # Audio sent meanwhile is buffered, not lost
+    await session.send_audio(b"ab")
+    await session.send_audio(b"cd")
+    factory.gate.set()
+
+    second = factory.clients[1]
+    second.events.put_nowait({"type": "two"})
+    assert (await pending)["type"] == "two"
+    assert session.connected
+
+    assert second._ws.sent[0] == {"type": "session.update", "session": {"voice": "sage"}}
+    assert [e["item"]["role"] for e in second._ws.sent[1:]] == ["user", "assistant"]
+    assert b"".join(second.audio) == b"abcd"
+    assert reconnected == [4.0]
+    assert session.stats()["reconnects"] == 1
+    assert circuit.consecutive_failures == 0
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_attempts_back_off_then_succeed(circuit):
+    factory = _Factory(failing={1, 2})
+    session = _session(factory, attempts=4)
+    await session.connect("instructions", [])
+    events = session.receive_events()
+    factory.clients[0].events.put_nowait(_DROP)
+    pending = asyncio.ensure_future(_next(events))
+    while len(factory.clients) < 4:
+        await asyncio.sleep(0.001)
+    factory.clients[3].events.put_nowait({"type": "back"})
+    assert (await pending)["type"] == "back"
+    assert session.reconnects[-1].attempts == 3
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_giving_up_ends_the_stream_and_opens_the_circuit(circuit):
+    factory = _Factory(failing={1, 2, 3})
+    session = _session(factory, attempts=3)
+    await session.connect("instructions", [])
+    factory.clients[0].events.put_nowait(_DROP)
+
+    received = [event async for event in session.receive_events()]
+    assert received == []
+    assert session.failed
+    assert not circuit.available
+    # Nothing is sent or buffered once failed
+    await session.send_audio(b"ab")
+    assert not await session.send_event({"type": "response.create"})
+    assert session.stats()["buffered_ms"] == 0
+
+
+@pytest.mark.asyncio
+async def test_close_stops_a_reconnect_in_progress(circuit):
+    factory = _Factory(failing={1, 2, 3, 4, 5})
+    session = _session(factory, attempts=6, backoff_ms=1000, backoff_max_ms=1000)
+    await session.connect("instructions", [])
+    events = session.receive_events()
+    factory.clients[0].events.put_nowait(_DROP)
+    pending = asyncio.ensure_future(_next(events))
+    await asyncio.sleep(0.01)
+    assert session.reconnecting
+
+    await session.close()
+    with pytest.raises(StopAsyncIteration):
+        await pending
+    assert not session.reconnecting
+    assert len(factory.clients) == 2
+
+
+# ── Worker ───────────────────────────────────────────────────────────
+
+class _ACS:
+    def __init__(self) -> None:
+        self.hung_up: list[str] = []
+
+    async def hang_up(self, call_connection_id: str) -> None:
+        self.hung_up.append(call_connection_id)
+
+
+@pytest.mark.asyncio
+async def test_worker_ends_the_call_when_reconnection_gives_up(circuit):
+    acs = _ACS()
+    worker = MeetingAudioWorker(VoiceSession(call_connection_id="call-1"), acs, None)
+    factory = _Factory(failing={1, 2})
+    worker._realtime_client = _session(factory, attempts=2)
+    await worker._realtime_client.connect("instructions", [])
+    worker._running = True
+
+    factory.clients[0].events.put_nowait(_DROP)
+    await worker._realtime_to_acs_loop()
+    assert worker._end_task is not None
+    await worker._end_task
+
+    assert acs.hung_up == ["call-1"]
+    assert worker._stopped
+    assert circuit.consecutive_failures == 2
@@ -0,0 +1,165 @@
+"""Tests for the hierarchical timer wheel."""
+
+import asyncio
+
+import pytest
+
+from voice_service import timer_wheel as timer_wheel_module
+from voice_service.timer_wheel import TimerWheel
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [500.0]
+    monkeypatch.setattr(timer_wheel_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _run(wheel: TimerWheel, clock: list[float], seconds: float, step: float = 0.1) -> None:
+    """Advance the fake clock tick by tick, driving the wheel by hand."""
+    for _ in range(round(seconds / step)):
+        clock[0] += step
+        wheel.advance()
+
+
+# ── Firing ───────────────────────────────────────────────────────────
+
+def test_timer_fires_within_one_tick_and_never_early(clock):
+    wheel = TimerWheel(tick_ms=100, levels=4)
+    fired = []
+    wheel.schedule(1.0, fired.append, "a")
+    _run(wheel, clock, 0.9)
+    assert fired == []
+    _run(wheel, clock, 0.2)
+    assert fired == ["a"]
+    assert len(wheel) == 0
+    assert wheel.stats()["fired"] == 1
+
+
+def test_long_timers_cascade_down_from_higher_levels(clock):
+    wheel = TimerWheel(tick_ms=100, levels=2)
+    fired = []
+    # 64 ticks per level-0 turn, 4096 per level-1 turn: 10 s and 500 s
+    # start in level 1 and the overflow slot respectively
+    wheel.schedule(10.0, fired.append, "level1")
+    wheel.schedule(500.0, fired.append, "overflow")
+    assert wheel.stats()["overflow"] == 1
+    _run(wheel, clock, 9.9)
+    assert fired == []
+    _run(wheel, clock, 0.2)
+    assert fired == ["level1"]
+    _run(wheel, clock, 489.7)
+    assert fired == ["level1"]
+    _run(wheel, clock, 0.2)
+    assert fired == ["level1", "overflow"]
+
+
+def test_failing_callback_does_not_stop_other_timers(clock):
+    wheel = TimerWheel(tick_ms=100, levels=4)
+    fired = []
+
+    def boom() -> None:
+        raise RuntimeError("callback failed")
+
+    wheel.schedule(0.5, boom)
+    wheel.schedule(0.5, fired.append, "b")
+    _run(wheel, clock, 0.6)
+    assert fired == ["b"]
+
+
+def test_callback_can_cancel_or_reset_a_timer_due_in_the_same_tick(clock):
+    wheel = TimerWheel(tick_ms=100, levels=4)
+    fired = []
+
+    def first() -> None:
+        fired.append("first")
+        cancelled.cancel()
+        rearmed.reset(1.0)
+
+    # Same slot, fired in scheduling order
+    wheel.schedule(0.5, first)
+    cancelled = wheel.schedule(0.5, fired.append, "cancelled")
+    rearmed = wheel.schedule(0.5, fired.append, "rearmed")
+    _run(wheel, clock, 0.6)
+    assert fired == ["first"]
+    assert len(wheel) == 1
+    assert not cancelled.active
+    _run(wheel, clock, 1.0)
+    assert fired == ["first", "rearmed"]
+    assert len(wheel) == 0
+
+
+# ── Reset / cancel ───────────────────────────────────────────────────
+
+def test_reset_pushes_the_deadline_back(clock):
+    wheel = TimerWheel(tick_ms=100, levels=4)
+    fired = []
+    timer = wheel.schedule(1.0, fired.append, "idle")
+    for _ in range(5):
+        _run(wheel, clock, 0.5)
+        timer.reset()
+    assert fired == []
+    assert timer.active
+    _run(wheel, clock, 1.1)
+    assert fired == ["idle"]
+    assert not timer.active
+
+
+def test_reset_with_a_new_delay_and_after_firing(clock):
+    wheel = TimerWheel(tick_ms=100, levels=4)
+    fired = []
+    timer = wheel.schedule(5.0, fired.append, "t")
+    timer.reset(0.3)
+    assert timer.delay == 0.3
+    _run(wheel, clock, 0.4)
+    assert fired == ["t"]
+
+    # A fired timer re-arms with its latest delay
+    timer.reset()
+    assert timer.active
+    _run(wheel, clock, 0.4)
+    assert fired == ["t", "t"]
+
+
+def test_reset_within_the_same_tick_keeps_the_slot(clock):
+    wheel = TimerWheel(tick_ms=100, levels=4)
+    clock[0] += 0.02
+    timer = wheel.schedule(1.0, lambda: None)
+    slot = timer._slot
+    clock[0] += 0.05
+    timer.reset()
+    assert timer._slot is slot
+    assert len(wheel) == 1
+
+
+def test_cancel_disarms_and_is_idempotent(clock):
+    wheel = TimerWheel(tick_ms=100, levels=4)
+    fired = []
+    timer = wheel.schedule(0.5, fired.append, "t")
+    timer.cancel()
+    timer.cancel()
+    assert not timer.active
+    assert len(wheel) == 0
+    _run(wheel, clock, 1.0)
+    assert fired == []
+
+
+def test_close_drops_every_pending_timer(clock):
+    wheel = TimerWheel(tick_ms=100, levels=2)
+    timers = [wheel.schedule(delay, lambda: None) for delay in (0.5, 10.0, 1000.0)]
+    wheel.close()
+    assert len(wheel) == 0
+    assert not any(timer.active for timer in timers)
+    assert wheel.stats()["overflow"] == 0
+
+
+# ── Loop driver ──────────────────────────────────────────────────────
+
+@pytest.mark.asyncio
+async def test_running_loop_drives_the_wheel():
+    wheel = TimerWheel(tick_ms=10, levels=4)
+    fired = asyncio.Event()
+    wheel.schedule(0.03, fired.set)
+    await asyncio.wait_for(fired.wait(), timeout=2)
+    assert len(wheel) == 0
+    wheel.close()
@@ -0,0 +1,154 @@
+"""Tests for the precompiled tool-argument validators."""
+
+import json
+
+import pytest
+
+from voice_service.tool_args import (
+    ToolArgumentError,
+    compile_validator,
+    parse_arguments,
+)
+from voice_service.voice_tools import parse_tool_arguments
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string"},
+        "days_back": {"type": "integer", "minimum": 1, "maximum": 365, "default": 30},
+        "ratio": {"type": "number"},
+        "urgent": {"type": "boolean"},
+        "priority": {"type": "string", "enum": ["low", "high"]},
+        "attendees": {"type": "array", "items": {"type": "string"}},
+        "window": {
+            "type": "object",
+            "properties": {"start": {"type": "string"}, "hours": {"type": "integer"}},
+            "required": ["start"],
+        },
+    },
+    "required": ["query"],
+}
+
+validate = compile_validator("search", SCHEMA)
+
+
+def _problems(args) -> list[str]:
+    with pytest.raises(ToolArgumentError) as excinfo:
+        validate(args)
+    assert excinfo.value.tool_name == "search"
+    return excinfo.value.problems
+
+
+# ── Coercion and defaults ────────────────────────────────────────────
+
+def test_defaults_are_filled_and_unknown_properties_dropped():
+    assert validate({"query": " standup ", "extra": 1}) == {"query": "standup", "days_back": 30}
+
+
+@pytest.mark.parametrize(
+    ("field", "raw", "expected"),
+    [
+        ("days_back", "14", 14),
+        ("days_back", 14.0, 14),
+        ("ratio", "0.5", 0.5),
+        ("ratio", 2, 2),
+        ("urgent", "yes", True),
+        ("urgent", "False", False),
+        ("attendees", "Priya", ["Priya"]),
+        ("attendees", ["Priya", 7], ["Priya", "7"]),
+        ("query", 42, "42"),
+    ],
+)
+def test_near_miss_types_are_coerced(field, raw, expected):
+    args = {"query": "q", field: raw}
+    assert validate(args)[field] == expected
+
+
+def test_nested_objects_are_validated():
+    assert validate({"query": "q", "window": {"start": "9am", "hours": "2"}})["window"] == {
+        "start": "9am",
+        "hours": 2,
+    }
+    assert _problems({"query": "q", "window": {"hours": 2}}) == ["window: start: required"]
+
+
+# ── Rejection ────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize(
+    ("args", "problem"),
+    [
+        ({}, "query: required"),
+        ({"query": "   "}, "query: must not be empty"),
+        ({"query": "q", "days_back": 0}, "days_back: must be at least 1, got 0"),
+        ({"query": "q", "days_back": 400}, "days_back: must be at most 365, got 400"),
+        ({"query": "q", "days_back": 1.5}, "days_back: expected an integer, got 1.5"),
+        ({"query": "q", "urgent": "maybe"}, "urgent: expected true or false, got 'maybe'"),
+        ({"query": "q", "priority": "medium"}, "priority: must be one of ['high', 'low'], got 'medium'"),
+        ({"query": "q", "attendees": ["a", {}]}, "attendees: item 1: expected a string, got {}"),
+    ],
+)
+def test_invalid_arguments_are_reported(args, problem):
+    assert _problems(args) == [problem]
+
+
+def test_every_problem_is_reported_at_once():
+    problems = _problems({"days_back": "last month", "urgent": 3})
+    assert problems == [
+        "query: required",
+        "days_back: expected an integer, got 'last month'",
+        "urgent: expected true or false, got 3",
+    ]
+
+
+def test_arguments_must_be_an_object():
+    assert _problems(["q"]) == ['expected an object, got ["q"]']
+
+
+def test_unsupported_schema_type_fails_at_compile_time():
+    with pytest.raises(ValueError, match="Unsupported schema type"):
+        compile_validator("bad", {"properties": {"x": {"type": "null"}}})
+
+
+def test_error_result_tells_the_model_what_to_fix():
+    with pytest.raises(ToolArgumentError) as excinfo:
+        validate({})
+    assert excinfo.value.to_result() == {
+        "error": "Invalid arguments for search",
+        "problems": ["query: required"],
+        "hint": "Correct the arguments and call the tool again.",
+    }
+
+
+# ── JSON decoding ────────────────────────────────────────────────────
+
+def test_parse_arguments_decodes_and_validates():
+    assert parse_arguments("search", '{"query": "q"}', validate) == {"query": "q", "days_back": 30}
+    assert parse_arguments("search", "  ", None) == {}
+    # No validator (unknown tool): the object is passed through, anything else dropped
+    assert parse_arguments("other", '{"a": 1}', None) == {"a": 1}
+    assert parse_arguments("other", "[1]", None) == {}
+
+
+def test_invalid_json_is_a_tool_argument_error():
+    with pytest.raises(ToolArgumentError) as excinfo:
+        parse_arguments("search", '{"query": ', validate)
+    assert excinfo.value.problems[0].startswith("arguments are not valid JSON")
+
+
+# ── VOICE_TOOLS ──────────────────────────────────────────────────────
+
+def test_voice_tool_arguments():
+    schedule = {
+        "subject": "Release review",
+        "attendees": ["priya@contoso.com", "Marcus Chen", "dana@contoso.com"],
+        "time": "next Thursday at 2pm",
+        "duration_minutes": 45,
+    }
+    assert parse_tool_arguments("schedule_meeting", json.dumps(schedule)) == schedule
+    assert parse_tool_arguments(
+        "get_meeting_notes", '{"query": "  latency dashboard  ", "days_back": "14"}'
+    ) == {"query": "latency dashboard", "days_back": 14}
+    assert parse_tool_arguments("get_meeting_notes", '{"query": "standup"}') == {"query": "standup", "days_back": 30}
+    with pytest.raises(ToolArgumentError) as excinfo:
+        parse_tool_arguments("get_meeting_notes", '{"days_back": "last month"}')
+    assert len(excinfo.value.problems) == 2
@@ -0,0 +1,99 @@
+"""Tests for transcript stream tokens and the SSE endpoint's access checks."""
+
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from voice_service import app as app_module
+from voice_service import transcript_stream as stream_module
+from voice_service.transcript_stream import (
+    get_stream_hub,
+    sign_stream_token,
+    verify_stream_token,
+)
+
+SECRET = "stream-secret"
+DASHBOARD = "https://dashboard.example.com"
+
+
+# ── Tokens ───────────────────────────────────────────────────────────
+
+def test_token_is_bound_to_its_session_and_secret():
+    token = sign_stream_token("s1", secret=SECRET)
+    assert verify_stream_token("s1", token, secret=SECRET)
+    assert not verify_stream_token("s2", token, secret=SECRET)
+    assert not verify_stream_token("s1", token, secret="other")
+    expires, _, signature = token.partition(".")
+    assert not verify_stream_token("s1", f"{int(expires) + 60}.{signature}", secret=SECRET)
+    assert not verify_stream_token("s1", f"{expires}.{signature[:-1]}é", secret=SECRET)
+    assert not verify_stream_token("s1", "", secret=SECRET)
+
+
+def test_expired_token_and_missing_secret_are_refused():
+    assert not verify_stream_token("s1", sign_stream_token("s1", ttl_seconds=-1, secret=SECRET), secret=SECRET)
+    token = sign_stream_token("s1", secret=SECRET)
+    assert not verify_stream_token("s1", token, secret="")
+    with pytest.raises(ValueError):
+        sign_stream_token("s1", secret="")
+
+
+# ── Endpoint ─────────────────────────────────────────────────────────
+
+@pytest.fixture
+def stream_app(monkeypatch):
+    monkeypatch.setattr(stream_module, "TRANSCRIPT_STREAM_SECRET", SECRET)
+    monkeypatch.setattr(app_module, "TRANSCRIPT_STREAM_ALLOWED_ORIGINS", frozenset({DASHBOARD}))
+    session = SimpleNamespace(
+        is_voice_active=False,
+        transcript_entries=SimpleNamespace(window=[{"speaker": "Priya", "text": "hello"}]),
+    )
+    gateway = mock.Mock()
+    gateway.get_session.side_effect = lambda session_id: session if session_id == "s1" else None
+    monkeypatch.setattr(app_module, "_voice_gateway", gateway)
+    app = web.Application()
+    app.router.add_get("/api/sessions/{session_id}/transcript/stream", app_module.transcript_stream)
+    return app
+
+
+async def _first_frames(response) -> bytes:
+    frames = await response.content.readuntil(b"\n\n")
+    frames += await response.content.readuntil(b"\n\n")
+    get_stream_hub().end_session("s1")
+    return frames + await response.read()
+
+
+@pytest.mark.asyncio
+async def test_stream_requires_a_token_for_the_session(stream_app):
+    path = "/api/sessions/s1/transcript/stream"
+    async with TestClient(TestServer(stream_app)) as client:
+        assert (await client.get(path)).status == 401
+        other = sign_stream_token("s2", secret=SECRET)
+        assert (await client.get(path, params={"token": other})).status == 401
+        # Auth comes before the lookup: unknown sessions are not revealed
+        assert (await client.get("/api/sessions/nope/transcript/stream")).status == 401
+
+        token = sign_stream_token("s1", secret=SECRET)
+        response = await client.get(path, headers={"Authorization": f"Bearer {token}"})
+        assert response.status == 200
+        body = await _first_frames(response)
+        assert b"event: state" in body
+        assert b"event: transcript" in body
+        assert b'"reason":"session_ended"' in body
+
+
+@pytest.mark.asyncio
+async def test_cross_origin_reads_only_from_configured_dashboards(stream_app):
+    path = "/api/sessions/s1/transcript/stream"
+    params = {"token": sign_stream_token("s1", secret=SECRET)}
+    async with TestClient(TestServer(stream_app)) as client:
+        allowed = await client.get(path, params=params, headers={"Origin": DASHBOARD})
+        assert allowed.headers["Access-Control-Allow-Origin"] == DASHBOARD
+        await _first_frames(allowed)
+
+        foreign = await client.get(path, params=params, headers={"Origin": "https://evil.example"})
+        assert foreign.status == 200
+        assert "Access-Control-Allow-Origin" not in foreign.headers
+        await _first_frames(foreign)
@@ -0,0 +1,159 @@
+"""Tests for the bounded transcript window with on-disk spill."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from voice_service.transcript_window import TranscriptWindow, sweep_retained
+
+BASE = 1_700_000_000.0
+
+
+def _window(tmp_path, **kwargs) -> TranscriptWindow:
+    kwargs.setdefault("max_entries", 8)
+    kwargs.setdefault("max_minutes", 60)
+    kwargs.setdefault("memory_limit_bytes", 1 << 20)
+    return TranscriptWindow(spill_dir=str(tmp_path), **kwargs)
+
+
+def _fill(window: TranscriptWindow, count: int, start: int = 0) -> None:
+    for i in range(start, start + count):
+        window.append({"speaker": f"S{i % 3}", "text": f"line {i}", "timestamp": ""}, at=BASE + i)
+
+
+def _texts(entries) -> list[str]:
+    return [entry["text"] for entry in entries]
+
+
+def test_window_stays_bounded_and_spills_oldest(tmp_path):
+    window = _window(tmp_path)
+    _fill(window, 100)
+    assert len(window) == 100
+    assert len(window.window) <= 8
+    stats = window.stats()
+    assert stats["spilled"] + stats["in_memory"] == 100
+    assert stats["spill_bytes"] > 0
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_reads_span_disk_and_memory_in_order(tmp_path):
+    window = _window(tmp_path)
+    _fill(window, 100)
+    assert _texts(window) == [f"line {i}" for i in range(100)]
+    assert window[0]["text"] == "line 0"
+    assert window[-1]["text"] == "line 99"
+    assert _texts(window.entries(40, 45)) == [f"line {i}" for i in range(40, 45)]
+    assert _texts(window.recent(3)) == ["line 97", "line 98", "line 99"]
+    assert _texts(window.between(BASE + 10, BASE + 13)) == ["line 10", "line 11", "line 12"]
+    with pytest.raises(IndexError):
+        window[100]
+
+
+def test_memory_ceiling_and_age_span_force_spills(tmp_path):
+    by_memory = _window(tmp_path / "memory", max_entries=1000, memory_limit_bytes=4096)
+    _fill(by_memory, 100)
+    assert by_memory.stats()["memory_bytes"] <= 4096
+
+    by_age = _window(tmp_path / "age", max_entries=1000, max_minutes=1)
+    _fill(by_age, 300)
+    in_memory = by_age.window
+    assert BASE + 299 - by_age._times[0] <= 60
+    assert len(in_memory) < 300
+
+
+def test_close_deletes_the_spill_file(tmp_path):
+    window = _window(tmp_path)
+    _fill(window, 50)
+    window.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_retain_keeps_the_whole_transcript_on_disk(tmp_path):
+    window = _window(tmp_path)
+    _fill(window, 50)
+    path = window.retain()
+    window.close()
+    del window
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+    assert os.path.basename(path).startswith("aida-transcript-retained-")
+    with open(path, encoding="utf-8") as fh:
+        texts = [entry["text"] for line in fh for entry in json.loads(line)]
+    assert texts == [f"line {i}" for i in range(50)]
+
+
+def test_retain_without_a_spill_keeps_nothing(tmp_path):
+    window = _window(tmp_path)
+    _fill(window, 3)
+    assert window.retain() == ""
+    assert os.listdir(tmp_path) == []
+
+
+def test_startup_sweep_bounds_retained_files_by_age_and_size(tmp_path):
+    now = time.time()
+    for name, age_hours, size in [
+        ("aida-transcript-retained-new.jsonl", 1, 400),
+        ("aida-transcript-retained-mid.jsonl", 5, 400),
+        ("aida-transcript-retained-older.jsonl", 10, 100),
+        ("aida-transcript-retained-stale.jsonl", 30, 100),
+        ("aida-transcript-live.jsonl", 30, 100),
+        ("notes.txt", 30, 100),
+    ]:
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        os.utime(path, (now - age_hours * 3600,) * 2)
+
+    # "older" would fit the budget, but files older than one over budget go too
+    assert sweep_retained(str(tmp_path), max_age_hours=24, max_bytes=700) == 3
+    assert sorted(os.listdir(tmp_path)) == [
+        "aida-transcript-live.jsonl",
+        "aida-transcript-retained-new.jsonl",
+        "notes.txt",
+    ]
+    # Retention switched off: every retained file goes
+    assert sweep_retained(str(tmp_path), max_age_hours=0, max_bytes=1 << 30) == 1
+    assert sweep_retained(str(tmp_path / "missing")) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_reads_match_sync_reads(tmp_path):
+    window = _window(tmp_path)
+    _fill(window, 100)
+    assert _texts(await window.read()) == _texts(window)
+    assert _texts(await window.read(5, 12)) == [f"line {i}" for i in range(5, 12)]
+    assert _texts(await window.read(95)) == [f"line {i}" for i in range(95, 100)]
+    assert _texts(await window.read_between(BASE + 90, BASE + 95)) == [f"line {i}" for i in range(90, 95)]
+    assert await window.read(200) == []
+
+
+@pytest.mark.asyncio
+async def test_async_reads_do_not_touch_disk_on_the_loop(tmp_path, monkeypatch):
+    window = _window(tmp_path)
+    _fill(window, 100)
+    loop_thread = threading.get_ident()
+    reader_threads: set[int] = set()
+    read_batches = TranscriptWindow._read_batches
+
+    def spy(path, plan):
+        reader_threads.add(threading.get_ident())
+        yield from read_batches(path, plan)
+
+    monkeypatch.setattr(TranscriptWindow, "_read_batches", staticmethod(spy))
+    await window.read()
+    await window.read_between(BASE, BASE + 50)
+    assert reader_threads
+    assert loop_thread not in reader_threads
+
+
+@pytest.mark.asyncio
+async def test_async_read_is_a_snapshot(tmp_path):
+    window = _window(tmp_path)
+    _fill(window, 50)
+    reading = asyncio.ensure_future(window.read())
+    await asyncio.sleep(0)
+    # Appends (and the spills they cause) while the read is in flight
+    _fill(window, 50, start=50)
+    assert _texts(await reading) == [f"line {i}" for i in range(50)]
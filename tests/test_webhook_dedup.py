@@ -0,0 +1,128 @@
+"""Tests for webhook deduplication."""
+
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from voice_service.admission import AdmissionDecision
+from voice_service.webhooks import dedup as dedup_module
+from voice_service.webhooks.calling_webhook import handle_incoming_call
+from voice_service.webhooks.dedup import EventDeduplicator, event_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(dedup_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _event(event_id: str = "evt-1", **data) -> dict:
+    return {"id": event_id, "type": "Microsoft.Communication.CallConnected", "data": data}
+
+
+# ── EventDeduplicator ────────────────────────────────────────────────
+
+def test_event_key_falls_back_to_correlation_and_sequence():
+    event = {"type": "T", "data": {"correlationId": "c1", "sequenceNumber": 4}}
+    assert event_key(event) == "T|c1|4"
+    assert event_key({"type": "T", "data": {}}) is None
+
+
+def test_redelivery_within_ttl_is_duplicate(clock):
+    dedup = EventDeduplicator(ttl=60, max_entries=10)
+    assert not dedup.is_duplicate(_event(), "acs")
+    clock[0] += 59
+    assert dedup.is_duplicate(_event(), "acs")
+    assert dedup.stats() == {"entries": 1, "suppressed": 1}
+
+
+def test_key_expires_after_ttl(clock):
+    dedup = EventDeduplicator(ttl=60, max_entries=10)
+    assert not dedup.is_duplicate(_event(), "acs")
+    clock[0] += 60
+    assert not dedup.is_duplicate(_event(), "acs")
+
+
+def test_oldest_key_evicted_when_full(clock):
+    dedup = EventDeduplicator(ttl=60, max_entries=2)
+    for event_id in ("a", "b", "c"):
+        assert not dedup.is_duplicate(_event(event_id), "acs")
+    assert len(dedup) == 2
+    # "a" was evicted, so it is processed again
+    assert not dedup.is_duplicate(_event("a"), "acs")
+    assert dedup.is_duplicate(_event("c"), "acs")
+
+
+def test_events_without_identity_are_never_duplicates(clock):
+    dedup = EventDeduplicator(ttl=60, max_entries=10)
+    event = {"type": "T", "data": {}}
+    assert not dedup.is_duplicate(event, "acs")
+    assert not dedup.is_duplicate(event, "acs")
+    assert len(dedup) == 0
+
+
+def test_forget_lets_redelivery_through(clock):
+    dedup = EventDeduplicator(ttl=60, max_entries=10)
+    assert not dedup.is_duplicate(_event(), "acs")
+    dedup.forget(_event())
+    assert not dedup.is_duplicate(_event(), "acs")
+
+
+# ── IncomingCall redelivery ──────────────────────────────────────────
+
+class _Admission:
+    def __init__(self) -> None:
+        self.admit = False
+
+    def evaluate(self, party_id: str = "", direct_call: bool = True) -> AdmissionDecision:
+        if self.admit:
+            return AdmissionDecision(admitted=True, score=0.1)
+        return AdmissionDecision(admitted=False, score=1.2, reason="sessions")
+
+
+class _ACS:
+    def __init__(self) -> None:
+        self.answered = 0
+
+    async def answer_call(self, **kwargs):
+        self.answered += 1
+        return SimpleNamespace(call_connection=SimpleNamespace(call_connection_id=f"conn-{self.answered}"))
+
+
+INCOMING_CALL = {
+    "id": "incoming-1",
+    "type": "Microsoft.Communication.IncomingCall",
+    "data": {
+        "incomingCallContext": "ctx",
+        "from": {"rawId": "4:+15551230000", "displayName": "Caller"},
+        "to": {"rawId": "8:acs:bot"},
+    },
+}
+
+
+@pytest.mark.asyncio
+async def test_shed_incoming_call_is_answered_on_redelivery():
+    admission = _Admission()
+    acs = _ACS()
+    app = web.Application()
+    app["webhook_dedup"] = EventDeduplicator(ttl=60, max_entries=10)
+    app["admission"] = admission
+    app["acs_client"] = acs
+    app.router.add_post("/incoming", handle_incoming_call)
+
+    async with TestClient(TestServer(app)) as client:
+        shed = await client.post("/incoming", json=INCOMING_CALL)
+        assert shed.status == 503
+        assert acs.answered == 0
+
+        admission.admit = True
+        redelivered = await client.post("/incoming", json=INCOMING_CALL)
+        assert redelivered.status == 200
+        assert (await redelivered.json())["call_connection_id"] == "conn-1"
+
+        duplicate = await client.post("/incoming", json=INCOMING_CALL)
+        assert (await duplicate.json()) == {"status": "duplicate"}
+        assert acs.answered == 1
@@ -0,0 +1,345 @@
+"""
+voice_service.admission — Admission control and load shedding for new calls.
+
+Every call on a replica shares one event loop and one CPU core, so
+answering a call the replica cannot carry degrades audio for all the
+calls already on it.  ``AdmissionController.evaluate()`` computes a
+load score from:
+
+  - active sessions relative to ``AIDA_MAX_SESSIONS``;
+  - event-loop lag (p90 over the monitor's window) relative to
+    ``AIDA_ADMISSION_MAX_LOOP_LAG_MS``;
+  - process CPU (fraction of one core) relative to
+    ``AIDA_ADMISSION_MAX_CPU``;
+  - Realtime API availability — consecutive connect failures open a
+    circuit during which no call can be served, then a single probe
+    call is admitted before the rest;
+  - drain mode — a draining replica takes no new calls at all.
+
+Outbound calls hold a reservation from admission until their session
+connects (``AIDA_ADMISSION_RESERVATION_SECONDS`` at most), so a burst of
+calls placed before any of them connects cannot overshoot
+``AIDA_MAX_SESSIONS``.
+
+The score is the highest of the ratios; at 1.0 or above new calls are
+shed with a fast 503 and ``Retry-After`` so ACS / the caller can try
+another replica.  Direct calls from VIP callers (``AIDA_VIP_CALLERS``)
+bypass the capacity thresholds — but not a Realtime outage, which
+would fail the call anyway, nor drain mode.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+MAX_SESSIONS = int(os.getenv("AIDA_MAX_SESSIONS", "40"))
+MAX_LOOP_LAG_SECONDS = float(os.getenv("AIDA_ADMISSION_MAX_LOOP_LAG_MS", "100")) / 1000
+# Fraction of one core; the event loop cannot use more than one
+MAX_CPU = float(os.getenv("AIDA_ADMISSION_MAX_CPU", "0.85"))
+RETRY_AFTER_SECONDS = int(os.getenv("AIDA_ADMISSION_RETRY_AFTER_SECONDS", "30"))
+# Longest an admitted outbound call counts as a session before its own connects
+RESERVATION_SECONDS = float(os.getenv("AIDA_ADMISSION_RESERVATION_SECONDS", "60"))
+# Comma-separated caller raw IDs / phone numbers always admitted for direct calls
+VIP_CALLERS = frozenset(c.strip() for c in os.getenv("AIDA_VIP_CALLERS", "").split(",") if c.strip())
+
+# Realtime circuit: this many consecutive connect failures mark the API
+# unavailable for REALTIME_RETRY_SECONDS.
+REALTIME_FAILURE_THRESHOLD = int(os.getenv("AIDA_REALTIME_FAILURE_THRESHOLD", "3"))
+REALTIME_RETRY_SECONDS = float(os.getenv("AIDA_REALTIME_RETRY_SECONDS", "30"))
+
+# Minimum wall time between CPU samples
+_CPU_SAMPLE_SECONDS = 1.0
+
+# Labels in the order they are reported
+_SHED_REASONS = ("sessions", "loop_lag", "cpu", "realtime", "draining")
+# Reasons no priority rule can override
+_HARD_REASONS = frozenset({"realtime", "draining"})
+
+
+class RealtimeAvailability:
+    """
+    Tracks Realtime API connect outcomes as a circuit breaker.
+
+    Workers report every connect attempt.  After
+    ``REALTIME_FAILURE_THRESHOLD`` consecutive failures the circuit
+    opens and new calls are shed.  Once ``REALTIME_RETRY_SECONDS`` have
+    passed since the last failure it is half-open: the next admitted
+    call is the probe (``start_probe()``), and calls are shed again
+    until a connect outcome is reported — success closes the circuit,
+    failure reopens it.  A probe that reports nothing within
+    ``REALTIME_RETRY_SECONDS`` (a meeting call that never activated
+    voice) is given up and another call is let through.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = REALTIME_FAILURE_THRESHOLD,
+        retry_seconds: float = REALTIME_RETRY_SECONDS,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._retry_seconds = retry_seconds
+        self._consecutive_failures = 0
+        self._last_failure = 0.0
+        # When the half-open probe was admitted (None: no probe in flight)
+        self._probe_started: float | None = None
+
+    def record_success(self) -> None:
+        if self._consecutive_failures >= self._failure_threshold:
+            logger.info("Realtime API available again")
+        self._consecutive_failures = 0
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        self._last_failure = time.monotonic()
+        self._probe_started = None
+        if self._consecutive_failures == self._failure_threshold:
+            logger.warning("Realtime API marked unavailable after %d connect failures", self._consecutive_failures)
+
+    @property
+    def state(self) -> str:
+        """``"closed"`` (healthy), ``"open"`` (shedding) or ``"half_open"`` (probing)."""
+        if self._consecutive_failures < self._failure_threshold:
+            return "closed"
+        if time.monotonic() - self._last_failure < self._retry_seconds:
+            return "open"
+        return "half_open"
+
+    def _probe_in_flight(self) -> bool:
+        started = self._probe_started
+        return started is not None and time.monotonic() - started < self._retry_seconds
+
+    @property
+    def available(self) -> bool:
+        """Whether a new call may be admitted (half-open: only while no probe is in flight)."""
+        state = self.state
+        if state == "closed":
+            return True
+        return state == "half_open" and not self._probe_in_flight()
+
+    def start_probe(self) -> None:
+        """Mark an admitted call as the half-open probe; no-op unless half-open."""
+        if self.state == "half_open" and not self._probe_in_flight():
+            self._probe_started = time.monotonic()
+            logger.info("Realtime circuit half-open: admitting one probe call")
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._consecutive_failures
+
+
+# Process-wide — every worker on the replica shares the same deployment
+REALTIME_AVAILABILITY = RealtimeAvailability()
+
+
+class Reservation:
+    """
+    Capacity held for an admitted outbound call until its session connects.
+
+    Counted as a session until ``release()`` (the call could not be
+    placed), until a session for the call connection given to
+    ``attach()`` is active, or until it expires (never answered).
+    """
+
+    __slots__ = ("_reservations", "call_connection_id", "expires")
+
+    def __init__(self, reservations: dict[Reservation, None], expires: float) -> None:
+        self._reservations = reservations
+        self.call_connection_id = ""
+        self.expires = expires
+
+    def attach(self, call_connection_id: str) -> None:
+        """The call was created: hold until its session is active."""
+        self.call_connection_id = call_connection_id
+
+    def release(self) -> None:
+        """The call was not placed: free the capacity now."""
+        self._reservations.pop(self, None)
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of one admission check."""
+
+    admitted: bool
+    score: float
+    reason: str = ""
+    vip: bool = False
+    # Set for admitted calls evaluated with reserve=True
+    reservation: Reservation | None = None
+
+    def reject_headers(self) -> dict[str, str]:
+        """Headers for the 503 sent when the call is shed."""
+        return {"Retry-After": str(RETRY_AFTER_SECONDS)}
+
+
+class AdmissionController:
+    """
+    Decides whether the replica takes on another call.
+
+    Args:
+        session_count: Returns the number of active sessions.
+        loop_lag: Returns recent event-loop lag in seconds (``None``
+            to ignore loop lag, e.g. when the monitor is not running).
+        realtime: Realtime API circuit shared with the workers.
+        draining: Returns True while the replica is draining.
+        connected_calls: Returns the call connection IDs of active
+            sessions, which end their reservations.
+    """
+
+    def __init__(
+        self,
+        session_count: Callable[[], int],
+        loop_lag: Callable[[], float] | None = None,
+        realtime: RealtimeAvailability = REALTIME_AVAILABILITY,
+        draining: Callable[[], bool] | None = None,
+        max_sessions: int = MAX_SESSIONS,
+        max_loop_lag: float = MAX_LOOP_LAG_SECONDS,
+        max_cpu: float = MAX_CPU,
+        vip_callers: frozenset[str] = VIP_CALLERS,
+        connected_calls: Callable[[], set[str]] | None = None,
+        reservation_seconds: float = RESERVATION_SECONDS,
+    ) -> None:
+        self._session_count = session_count
+        self._connected_calls = connected_calls
+        self._reservation_seconds = reservation_seconds
+        # Admitted outbound calls whose sessions have not connected yet
+        self._reservations: dict[Reservation, None] = {}
+        self._loop_lag = loop_lag
+        self._realtime = realtime
+        self._draining = draining
+        self._max_sessions = max_sessions
+        self._max_loop_lag = max_loop_lag
+        self._max_cpu = max_cpu
+        self._vip_callers = vip_callers
+
+        self._cpu_wall = time.monotonic()
+        self._cpu_time = time.process_time()
+        self._cpu = 0.0
+
+        self._admitted = 0
+        self._shed: dict[str, int] = dict.fromkeys(_SHED_REASONS, 0)
+        self._shed_counters = {
+            reason: REGISTRY.counter(
+                "aida_voice_calls_shed_total",
+                "New calls declined by admission control, by reason.",
+                labels={"reason": reason},
+            )
+            for reason in _SHED_REASONS
+        }
+        REGISTRY.gauge(
+            "aida_voice_load_score",
+            "Admission load score (>= 1.0 means new calls are shed).",
+            fn=lambda: self.load()[0],
+        )
+
+    def _cpu_fraction(self) -> float:
+        """Process CPU as a fraction of one core, resampled at most once a second."""
+        now = time.monotonic()
+        elapsed = now - self._cpu_wall
+        if elapsed >= _CPU_SAMPLE_SECONDS:
+            cpu_time = time.process_time()
+            self._cpu = (cpu_time - self._cpu_time) / elapsed
+            self._cpu_wall = now
+            self._cpu_time = cpu_time
+        return self._cpu
+
+    def reserved(self) -> int:
+        """Admitted outbound calls still waiting for their session (expired ones dropped)."""
+        if not self._reservations:
+            return 0
+        now = time.monotonic()
+        connected = self._connected_calls() if self._connected_calls is not None else ()
+        for reservation in list(self._reservations):
+            if reservation.expires <= now or reservation.call_connection_id in connected:
+                del self._reservations[reservation]
+        return len(self._reservations)
+
+    def load(self) -> tuple[float, str]:
+        """
+        Current load score and the dominating factor.
+
+        Returns:
+            ``(score, reason)`` — the highest of the per-factor ratios
+            and its name.  Drain mode and a Realtime outage score ``inf``.
+        """
+        if self._draining is not None and self._draining():
+            return float("inf"), "draining"
+        if not self._realtime.available:
+            return float("inf"), "realtime"
+        ratios = {
+            "sessions": (self._session_count() + self.reserved()) / self._max_sessions if self._max_sessions > 0 else 0.0,
+            "loop_lag": self._loop_lag() / self._max_loop_lag if self._loop_lag and self._max_loop_lag > 0 else 0.0,
+            "cpu": self._cpu_fraction() / self._max_cpu if self._max_cpu > 0 else 0.0,
+        }
+        reason = max(ratios, key=ratios.__getitem__)
+        return ratios[reason], reason
+
+    def is_vip(self, party_id: str) -> bool:
+        """Whether a caller raw ID or phone number is on the VIP list."""
+        if not party_id:
+            return False
+        # Raw IDs for PSTN callers look like "4:+15551234567"
+        return party_id in self._vip_callers or party_id.partition(":")[2] in self._vip_callers
+
+    def evaluate(self, party_id: str = "", direct_call: bool = True, reserve: bool = False) -> AdmissionDecision:
+        """
+        Decide whether to take a new call and record the outcome.
+
+        Args:
+            party_id: The remote party (caller for incoming calls, target
+                for outbound ones).
+            direct_call: False for meeting joins — VIP priority only
+                applies to direct calls.
+            reserve: Hold capacity for an admitted call whose session
+                connects later (outbound calls): ``decision.reservation``
+                must be attached to the created call or released.
+
+        Returns:
+            The decision; when not admitted, respond 503 with
+            ``decision.reject_headers()``.
+        """
+        score, reason = self.load()
+        vip = direct_call and self.is_vip(party_id)
+        admitted = score < 1.0 or (vip and reason not in _HARD_REASONS)
+        if admitted:
+            self._admitted += 1
+            # After an outage the first admitted call probes the Realtime API
+            self._realtime.start_probe()
+            reservation = None
+            if reserve:
+                reservation = Reservation(self._reservations, time.monotonic() + self._reservation_seconds)
+                self._reservations[reservation] = None
+            return AdmissionDecision(
+                admitted=True, score=score, reason=reason if score >= 1.0 else "", vip=vip, reservation=reservation
+            )
+
+        self._shed[reason] += 1
+        self._shed_counters[reason].inc()
+        logger.warning("Shedding new call: reason=%s, score=%.2f, party=%s", reason, score, party_id)
+        return AdmissionDecision(admitted=False, score=score, reason=reason, vip=vip)
+
+    def stats(self) -> dict[str, Any]:
+        """Load score, admitted and shed counts — reported on ``/health``."""
+        score, reason = self.load()
+        return {
+            "load_score": round(score, 3) if score != float("inf") else "inf",
+            "dominant_factor": reason,
+            "accepting_calls": score < 1.0,
+            "active_sessions": self._session_count(),
+            "reserved_sessions": self.reserved(),
+            "max_sessions": self._max_sessions,
+            "realtime_available": self._realtime.available,
+            "realtime_circuit": self._realtime.state,
+            "admitted": self._admitted,
+            "shed": dict(self._shed),
+        }
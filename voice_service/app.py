@@ -6,7 +6,15 @@ Configures the aiohttp web.Application with routes for:
   - POST /api/calls/webhook   — ACS call lifecycle event handler
   - POST /api/calls/incoming  — Teams incoming call notification handler
   - POST /api/calls/create    — Create outbound call endpoint
+  - POST /api/calls/batch     — Create many outbound calls (NDJSON results)
+  - GET  /api/sessions/{id}/transcript/stream — Live transcript (SSE)
   - GET  /health              — Health check endpoint
+  - GET  /metrics             — Prometheus metrics (turn latency, sessions)
+  - GET  /admin/loop          — Event-loop lag percentiles and slow handlers
+  - GET  /admin/sessions      — Live per-session mode, audio rates, queue depths
+  - GET  /admin/sessions/{id} — Full runtime stats of one session's worker
+  - GET  /admin/drain         — Drain progress
+  - POST /admin/drain         — Enter drain mode (also SIGUSR1)
 
 Initialises the ACS client and data gateway client on startup, then
 starts the server on port 3979.
@@ -14,24 +22,62 @@ starts the server on port 3979.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hmac
+import ipaddress
+import json
 import logging
+import math
 import os
+import signal
 from typing import Any
 
-from aiohttp import web
-from aiohttp.web import Request, Response
-
 from aida_sdk.clients.acs_client import ACSClient
 from aida_sdk.config import settings
+from aiohttp import web
+from aiohttp.web import Request, Response
 
+from voice_service.admission import AdmissionController
+from voice_service.call_recorder import close_writer as close_recording_writer
+from voice_service.drain import (
+    DRAIN_DEADLINE_SECONDS,
+    DRAIN_ON_SHUTDOWN_SECONDS,
+    DrainController,
+)
+from voice_service.loop_monitor import LoopMonitor
+from voice_service.meeting_audio_worker import MeetingAudioWorker
+from voice_service.meeting_state import MeetingSessionManager
+from voice_service.outbound_calls import (
+    CALL_BATCH_CONCURRENCY,
+    CALL_BATCH_MAX_CALLS,
+    place_call,
+    place_calls,
+)
+from voice_service.passive_transcription import (
+    close_backend as close_transcription_backend,
+)
+from voice_service.transcript_stream import (
+    HEARTBEAT_FRAME,
+    TRANSCRIPT_STREAM_ALLOWED_ORIGINS,
+    encode_event,
+    get_stream_hub,
+    verify_stream_token,
+)
+from voice_service.transcript_window import sweep_retained as sweep_retained_transcripts
 from voice_service.voice_gateway import VoiceGateway
-from voice_service.webhooks.acs_webhook import handle_acs_event
+from voice_service.voice_metrics import PROMETHEUS_CONTENT_TYPE, REGISTRY
+from voice_service.voice_tools import get_tool_handlers
+from voice_service.webhooks.acs_webhook import handle_acs_event, process_acs_event
 from voice_service.webhooks.calling_webhook import handle_incoming_call
-from voice_service.meeting_state import MeetingSessionManager
+from voice_service.webhooks.dedup import EventDeduplicator
+from voice_service.webhooks.event_queue import CallEventQueue
 
 logger = logging.getLogger(__name__)
 
 PORT = int(os.getenv("PORT", "3979"))
+# Shared secret for /admin/* callers not on loopback, sent as X-Admin-Token (unset: loopback only)
+ADMIN_TOKEN = os.getenv("AIDA_ADMIN_TOKEN", "")
 
 
 # ---------------------------------------------------------------------------
@@ -40,6 +86,10 @@ PORT = int(os.getenv("PORT", "3979"))
 _acs_client: ACSClient | None = None
 _meeting_manager: MeetingSessionManager | None = None
 _voice_gateway: VoiceGateway | None = None
+_loop_monitor: LoopMonitor | None = None
+_acs_event_queue: CallEventQueue | None = None
+_admission: AdmissionController | None = None
+_drain: DrainController | None = None
 
 
 def get_acs_client() -> ACSClient:
@@ -60,12 +110,39 @@ def get_voice_gateway() -> VoiceGateway:
     return _voice_gateway
 
 
+def get_loop_monitor() -> LoopMonitor:
+    """Return the singleton event-loop monitor."""
+    assert _loop_monitor is not None, "Loop monitor not initialised"
+    return _loop_monitor
+
+
+def get_acs_event_queue() -> CallEventQueue:
+    """Return the singleton ACS webhook event queue."""
+    assert _acs_event_queue is not None, "ACS event queue not initialised"
+    return _acs_event_queue
+
+
+def get_admission_controller() -> AdmissionController:
+    """Return the singleton admission controller."""
+    assert _admission is not None, "Admission controller not initialised"
+    return _admission
+
+
+def get_drain_controller() -> DrainController:
+    """Return the singleton drain controller."""
+    assert _drain is not None, "Drain controller not initialised"
+    return _drain
+
+
 # ---------------------------------------------------------------------------
 # Startup / Shutdown
 # ---------------------------------------------------------------------------
 async def on_startup(app: web.Application) -> None:
     """Initialise shared clients and services."""
-    global _acs_client, _meeting_manager, _voice_gateway
+    global _acs_client, _meeting_manager, _voice_gateway, _loop_monitor, _acs_event_queue, _admission, _drain
+
+    # Unpersisted transcripts kept by earlier runs: expire by age and total size
+    await asyncio.to_thread(sweep_retained_transcripts)
 
     logger.info("Initialising ACS client...")
     _acs_client = ACSClient()
@@ -82,28 +159,153 @@ async def on_startup(app: web.Application) -> None:
         meeting_manager=_meeting_manager,
     )
 
+    logger.info("Initialising ACS event queue...")
+    _acs_event_queue = CallEventQueue(functools.partial(process_acs_event, app))
+
+    logger.info("Starting event-loop monitor...")
+    _loop_monitor = LoopMonitor()
+    _loop_monitor.track(MeetingAudioWorker.handle_acs_message)
+    _loop_monitor.track(MeetingAudioWorker.handle_acs_audio)
+    _loop_monitor.track(MeetingAudioWorker._handle_realtime_event)
+    _loop_monitor.track(MeetingAudioWorker._send_audio_to_acs)
+    _loop_monitor.track(handle_acs_event)
+    _loop_monitor.track(process_acs_event)
+    _loop_monitor.track(handle_incoming_call)
+    for tool_name, tool_handler in get_tool_handlers().items():
+        _loop_monitor.track(tool_handler, label=f"tool:{tool_name}")
+    await _loop_monitor.start()
+
+    logger.info("Initialising drain controller...")
+    _drain = DrainController(_voice_gateway)
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, _drain.start, "signal")
+    except (AttributeError, NotImplementedError):
+        # No SIGUSR1 / loop signal handlers on Windows — admin endpoint only
+        pass
+
+    logger.info("Initialising admission controller...")
+    _admission = AdmissionController(
+        session_count=lambda: _voice_gateway.active_session_count if _voice_gateway else 0,
+        loop_lag=lambda: _loop_monitor.lag_percentile(0.9) if _loop_monitor else 0.0,
+        draining=lambda: _drain.draining if _drain else False,
+        connected_calls=lambda: _voice_gateway.call_connection_ids() if _voice_gateway else set(),
+    )
+
     # Stash references on the app dict so handlers can access them
     app["acs_client"] = _acs_client
     app["meeting_manager"] = _meeting_manager
     app["voice_gateway"] = _voice_gateway
+    app["loop_monitor"] = _loop_monitor
+    app["acs_event_queue"] = _acs_event_queue
+    app["webhook_dedup"] = EventDeduplicator()
+    app["admission"] = _admission
+    app["drain"] = _drain
+
+    REGISTRY.gauge(
+        "aida_voice_active_sessions",
+        "Number of active voice sessions on this replica.",
+        fn=lambda: _voice_gateway.active_session_count if _voice_gateway else 0,
+    )
+    REGISTRY.gauge(
+        "aida_voice_acs_event_queue_depth",
+        "ACS webhook events accepted but not yet handled.",
+        fn=lambda: _acs_event_queue.pending if _acs_event_queue else 0,
+    )
 
     logger.info("Voice service startup complete")
 
 
 async def on_shutdown(app: web.Application) -> None:
-    """Graceful shutdown — close active sessions and clients."""
+    """
+    Graceful shutdown — drain, then close active sessions and clients.
+
+    Calls still running get ``DRAIN_ON_SHUTDOWN_SECONDS`` to finish
+    unless a drain (admin / SIGUSR1) already completed.
+    """
+    drain: DrainController | None = app.get("drain")
+    if drain and not drain.complete:
+        drain.start("shutdown", DRAIN_ON_SHUTDOWN_SECONDS)
+        await drain.wait()
+    # Let queued call events (disconnects in particular) finish first
+    event_queue: CallEventQueue | None = app.get("acs_event_queue")
+    if event_queue:
+        await event_queue.close()
     gateway: VoiceGateway | None = app.get("voice_gateway")
     if gateway:
         await gateway.shutdown()
+    # End transcript streams so their handlers return before the server stops
+    get_stream_hub().close_all()
+    await close_transcription_backend()
+    await close_recording_writer()
+    monitor: LoopMonitor | None = app.get("loop_monitor")
+    if monitor:
+        await monitor.stop()
     logger.info("Voice service shutdown complete")
 
 
+# ---------------------------------------------------------------------------
+# Admin access
+# ---------------------------------------------------------------------------
+def _is_admin_caller(request: Request) -> bool:
+    """Loopback peer (``az containerapp exec`` inside the replica), or the admin token."""
+    try:
+        address = ipaddress.ip_address(request.remote or "")
+    except ValueError:
+        address = None
+    if address is not None:
+        if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+            address = address.ipv4_mapped
+        if address.is_loopback:
+            return True
+    supplied = request.headers.get("X-Admin-Token", "")
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(supplied.encode(), ADMIN_TOKEN.encode())
+
+
+def admin_only(handler):
+    """
+    Restrict a route to admin callers; everyone else gets 403.
+
+    ``request.remote`` is the TCP peer, never a forwarded header, so
+    traffic through the ingress does not count as loopback.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(request: Request) -> web.StreamResponse:
+        if not _is_admin_caller(request):
+            logger.warning("Admin request refused: %s %s from %s", request.method, request.path, request.remote)
+            return web.json_response({"error": "Forbidden"}, status=403)
+        return await handler(request)
+
+    return wrapper
+
+
 # ---------------------------------------------------------------------------
 # Route handlers
 # ---------------------------------------------------------------------------
 async def health(request: Request) -> Response:
-    """Health check endpoint for container orchestrators."""
-    return web.json_response({"status": "healthy", "service": "aida-voice"})
+    """
+    Health check endpoint for container orchestrators (plus admission load).
+
+    Answers 503 ``draining`` in drain mode so no new calls are routed here.
+    """
+    body: dict[str, Any] = {"status": "healthy", "service": "aida-voice"}
+    admission: AdmissionController | None = request.app.get("admission")
+    if admission:
+        body["admission"] = admission.stats()
+    drain: DrainController | None = request.app.get("drain")
+    if drain and drain.draining:
+        body["status"] = "draining"
+        body["drain"] = drain.status()
+        return web.json_response(body, status=503)
+    return web.json_response(body)
+
+
+async def metrics(request: Request) -> Response:
+    """Prometheus scrape endpoint (text exposition format)."""
+    return Response(
+        body=REGISTRY.render().encode("utf-8"),
+        headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+    )
 
 
 async def create_outbound_call(request: Request) -> Response:
@@ -117,44 +319,241 @@ async def create_outbound_call(request: Request) -> Response:
         "media_streaming": true | false
     }
     """
-    body: dict[str, Any] = await request.json()
+    try:
+        body: dict[str, Any] = await request.json()
+    except json.JSONDecodeError:
+        return web.json_response({"error": "Invalid JSON"}, status=400)
+    if not isinstance(body, dict):
+        return web.json_response({"error": "Expected a JSON object"}, status=400)
     target = body.get("target", "")
     meeting_id = body.get("meeting_id", "")
 
     if not target:
         return web.json_response({"error": "target is required"}, status=400)
 
-    acs = get_acs_client()
-    callback_uri = f"{settings.BOT_CALLBACK_HOST}/api/calls/webhook"
-
-    # Configure media streaming if requested
-    media_config: dict[str, Any] | None = None
-    if body.get("media_streaming", True):
-        ws_host = settings.BOT_CALLBACK_HOST.replace("https://", "wss://").replace("http://", "ws://")
-        media_config = {
-            "transport_url": f"{ws_host}/voice-v2",
-        }
+    decision = get_admission_controller().evaluate(target, direct_call=not meeting_id, reserve=True)
+    if not decision.admitted:
+        return web.json_response(
+            {"error": "Not accepting new calls", "reason": decision.reason},
+            status=503,
+            headers=decision.reject_headers(),
+        )
 
     try:
-        result = await acs.create_call(
-            target=target,
-            callback_uri=callback_uri,
-            media_config=media_config,
+        connection_id = await place_call(
+            get_acs_client(),
+            get_meeting_manager(),
+            target,
+            meeting_id,
+            media_streaming=body.get("media_streaming", True),
         )
-        connection_id = result.call_connection.call_connection_id
-
-        # Register with meeting manager if meeting_id provided
-        if meeting_id:
-            manager = get_meeting_manager()
-            await manager.create_session(meeting_id, connection_id)
-
-        return web.json_response({
-            "call_connection_id": connection_id,
-            "meeting_id": meeting_id or connection_id,
-        })
     except Exception:
+        decision.reservation.release()
         logger.exception("Failed to create outbound call to %s", target)
         return web.json_response({"error": "Failed to create call"}, status=500)
+    decision.reservation.attach(connection_id)
+    return web.json_response({
+        "call_connection_id": connection_id,
+        "meeting_id": meeting_id or connection_id,
+    })
+
+
+async def create_outbound_calls_batch(request: Request) -> web.StreamResponse:
+    """
+    Create many outbound calls, streaming each result as it completes.
+
+    Expects JSON body:
+    {
+        "calls": [{"target": "+15551234567", "meeting_id": "optional"}, ...],
+        "media_streaming": true | false,
+        "concurrency": 8
+    }
+
+    Responds with NDJSON: one line per call as it finishes — ``index``,
+    ``target``, ``meeting_id``, ``status`` (``created``, ``rejected``,
+    ``invalid`` or ``failed``) and ``call_connection_id`` / ``reason`` /
+    ``error`` — then a ``{"done": true, ...}`` line with the counts.
+    Calls are admitted one by one, each holding its capacity until its
+    session connects, share the replica's call-creation rate limit, and
+    at most ``concurrency`` (capped at ``AIDA_CALL_BATCH_CONCURRENCY``)
+    are in flight.
+    """
+    try:
+        body: dict[str, Any] = await request.json()
+    except json.JSONDecodeError:
+        return web.json_response({"error": "Invalid JSON"}, status=400)
+    if not isinstance(body, dict):
+        return web.json_response({"error": "Expected a JSON object"}, status=400)
+    calls = body.get("calls")
+    if not isinstance(calls, list) or not calls:
+        return web.json_response({"error": "calls must be a non-empty list"}, status=400)
+    if len(calls) > CALL_BATCH_MAX_CALLS:
+        return web.json_response({"error": f"At most {CALL_BATCH_MAX_CALLS} calls per batch"}, status=413)
+    try:
+        concurrency = min(CALL_BATCH_CONCURRENCY, max(1, int(body.get("concurrency", CALL_BATCH_CONCURRENCY))))
+    except (TypeError, ValueError):
+        return web.json_response({"error": "concurrency must be an integer"}, status=400)
+    media_streaming = body.get("media_streaming", True)
+    acs = get_acs_client()
+    manager = get_meeting_manager()
+    admission = get_admission_controller()
+
+    async def place(index: int, call: Any) -> dict[str, Any]:
+        if not isinstance(call, dict) or not call.get("target"):
+            return {"index": index, "status": "invalid", "error": "target is required"}
+        target, meeting_id = call["target"], call.get("meeting_id", "")
+        result: dict[str, Any] = {"index": index, "target": target, "meeting_id": meeting_id}
+        decision = admission.evaluate(target, direct_call=not meeting_id, reserve=True)
+        if not decision.admitted:
+            result.update(status="rejected", reason=decision.reason)
+            return result
+        try:
+            connection_id = await place_call(acs, manager, target, meeting_id, media_streaming=media_streaming)
+        except asyncio.CancelledError:
+            # The client went away mid-create
+            decision.reservation.release()
+            raise
+        except Exception:
+            decision.reservation.release()
+            logger.exception("Failed to create outbound call to %s", target)
+            result.update(status="failed", error="Failed to create call")
+            return result
+        decision.reservation.attach(connection_id)
+        result.update(status="created", call_connection_id=connection_id, meeting_id=meeting_id or connection_id)
+        return result
+
+    response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson", "Cache-Control": "no-cache"})
+    await response.prepare(request)
+    counts = {"created": 0, "rejected": 0, "invalid": 0, "failed": 0}
+    results = place_calls(calls, place, concurrency)
+    try:
+        async for result in results:
+            counts[result["status"]] += 1
+            await response.write(json.dumps(result).encode() + b"\n")
+        await response.write(json.dumps({"done": True, **counts}).encode() + b"\n")
+    except ConnectionError:
+        # Client went away: calls not yet placed are cancelled
+        logger.warning("Batch call client disconnected after %d of %d calls", sum(counts.values()), len(calls))
+    finally:
+        await results.aclose()
+    return response
+
+
+async def transcript_stream(request: Request) -> web.StreamResponse:
+    """
+    Live transcript of a session as Server-Sent Events.
+
+    Sends a ``state`` event and the last ``backlog`` in-memory entries
+    (query parameter, default 50), then ``transcript`` and ``state``
+    events as they happen, with keep-alive comments while idle.  The
+    stream finishes with an ``end`` event whose ``reason`` is
+    ``session_ended``, ``shutdown`` or ``slow_consumer`` (the client fell
+    ``AIDA_TRANSCRIPT_STREAM_QUEUE`` events behind and should reconnect).
+
+    Requires a stream token for the session (``sign_stream_token``), as
+    ``Authorization: Bearer <token>`` or — for ``EventSource``, which
+    cannot set headers — ``?token=<token>``.  Cross-origin reads are
+    allowed only from ``AIDA_TRANSCRIPT_STREAM_ALLOWED_ORIGINS``.
+    """
+    session_id = request.match_info["session_id"]
+    authorization = request.headers.get("Authorization", "")
+    token = authorization[7:] if authorization.startswith("Bearer ") else request.query.get("token", "")
+    if not verify_stream_token(session_id, token):
+        return web.json_response({"error": "Invalid or missing stream token"}, status=401)
+    session = get_voice_gateway().get_session(session_id)
+    if session is None:
+        return web.json_response({"error": "Session not found"}, status=404)
+    try:
+        backlog = max(0, int(request.query.get("backlog", "50")))
+    except ValueError:
+        return web.json_response({"error": "backlog must be an integer"}, status=400)
+
+    hub = get_stream_hub()
+    subscriber = hub.subscribe(session_id)
+    if subscriber is None:
+        return web.json_response({"error": "Too many transcript subscribers"}, status=503)
+
+    # Snapshot in the same step as subscribing so no entry is missed or repeated
+    window = session.transcript_entries.window
+    initial = [encode_event("state", {"is_voice_active": session.is_voice_active})]
+    initial.extend(encode_event("transcript", entry) for entry in (window[-backlog:] if backlog else ()))
+
+    headers = {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+        "Vary": "Origin",
+    }
+    origin = request.headers.get("Origin", "")
+    if origin in TRANSCRIPT_STREAM_ALLOWED_ORIGINS:
+        headers["Access-Control-Allow-Origin"] = origin
+    response = web.StreamResponse(headers=headers)
+    try:
+        await response.prepare(request)
+        await response.write(b"".join(initial))
+        while True:
+            frames = await subscriber.next_frames()
+            if frames:
+                await response.write(b"".join(frames))
+            elif subscriber.closed:
+                break
+            else:
+                await response.write(HEARTBEAT_FRAME)
+        # A slow consumer's socket may be full: do not wait long on the last word
+        async with asyncio.timeout(1.0):
+            await response.write(encode_event("end", {"reason": subscriber.closed_reason}))
+    except (ConnectionError, TimeoutError):
+        pass
+    finally:
+        hub.unsubscribe(subscriber)
+    return response
+
+
+@admin_only
+async def admin_loop(request: Request) -> Response:
+    """Event-loop lag percentiles and the handlers responsible for stalls."""
+    return web.json_response(get_loop_monitor().report())
+
+
+@admin_only
+async def admin_sessions(request: Request) -> Response:
+    """Every active session's mode, frames per second and queue depths."""
+    sessions = [worker.get_summary() for worker in get_voice_gateway().list_workers()]
+    return web.json_response({"count": len(sessions), "sessions": sessions})
+
+
+@admin_only
+async def admin_session(request: Request) -> Response:
+    """Throughput, queues, Realtime event counts and tool latencies of one session."""
+    worker = get_voice_gateway().get_worker(request.match_info["session_id"])
+    if worker is None:
+        return web.json_response({"error": "Session not found"}, status=404)
+    return web.json_response(worker.get_stats())
+
+
+@admin_only
+async def admin_drain_status(request: Request) -> Response:
+    """Drain progress — the deploy pipeline polls this until ``complete``."""
+    return web.json_response(get_drain_controller().status())
+
+
+@admin_only
+async def admin_drain_start(request: Request) -> Response:
+    """
+    Enter drain mode.
+
+    Optional query parameter ``deadline_seconds`` (default
+    ``AIDA_DRAIN_DEADLINE_SECONDS``), e.g. ``POST /admin/drain?deadline_seconds=600``.
+    """
+    try:
+        deadline = float(request.query.get("deadline_seconds", DRAIN_DEADLINE_SECONDS))
+    except (TypeError, ValueError):
+        deadline = math.nan
+    if not math.isfinite(deadline) or deadline < 0:
+        return web.json_response({"error": "deadline_seconds must be a non-negative number"}, status=400)
+    drain = get_drain_controller()
+    drain.start("admin", deadline)
+    return web.json_response(drain.status(), status=202)
 
 
 # ---------------------------------------------------------------------------
@@ -183,7 +582,7 @@ def create_app() -> web.Application:
     app.on_shutdown.append(on_shutdown)
 
     # ── Voice gateway (WebSocket) ────────────────────────────────────
-    gateway_handler = lambda request: get_voice_gateway().handle_websocket(request)  # noqa: E731
+    gateway_handler = lambda request: get_voice_gateway().handle_websocket(request)
     app.router.add_get("/voice-v2", gateway_handler)
 
     # ── ACS webhooks ─────────────────────────────────────────────────
@@ -192,10 +591,24 @@ def create_app() -> web.Application:
 
     # ── Outbound call creation ───────────────────────────────────────
     app.router.add_post("/api/calls/create", create_outbound_call)
+    app.router.add_post("/api/calls/batch", create_outbound_calls_batch)
+
+    # ── Live transcript ──────────────────────────────────────────────
+    app.router.add_get("/api/sessions/{session_id}/transcript/stream", transcript_stream)
 
     # ── Health ───────────────────────────────────────────────────────
     app.router.add_get("/health", health)
 
+    # ── Metrics ──────────────────────────────────────────────────────
+    app.router.add_get("/metrics", metrics)
+
+    # ── Admin ────────────────────────────────────────────────────────
+    app.router.add_get("/admin/loop", admin_loop)
+    app.router.add_get("/admin/sessions", admin_sessions)
+    app.router.add_get("/admin/sessions/{session_id}", admin_session)
+    app.router.add_get("/admin/drain", admin_drain_status)
+    app.router.add_post("/admin/drain", admin_drain_start)
+
     return app
 
 
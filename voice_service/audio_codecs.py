@@ -0,0 +1,303 @@
+"""
+voice_service.audio_codecs — Audio codec registry and streaming transcoding.
+
+The ACS leg carries PCM16 at the rate announced in ``AudioMetadata``
+(16 or 24 kHz).  The Realtime API leg can use ``pcm16`` (24 kHz) or
+G.711 ``g711_ulaw`` / ``g711_alaw`` (8 kHz) — a sixth of the bandwidth,
+and the native format of PSTN-originated audio.  Each session picks its
+Realtime format (``VoiceSession.realtime_audio_format``) and the worker
+builds one ``Transcoder`` per direction once the ACS format is known.
+
+G.711 encode/decode is table-driven and vectorised with NumPy: every
+int16 sample maps through a 64 K-entry encode table, every code byte
+through a 256-entry decode table.  The tables are generated at import
+with a vectorised form of the ITU-T G.711 reference algorithm.
+Resampling uses a windowed-sinc FIR filter with rational up/down
+factors, keeping filter history between frames so streams are
+continuous.
+
+Transcoders between identical formats are passthroughs and never touch
+NumPy, so the default ``pcm16`` path costs nothing.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default Realtime API audio format for new sessions
+REALTIME_AUDIO_FORMAT = os.getenv("AIDA_REALTIME_AUDIO_FORMAT", "pcm16")
+
+# Realtime API pcm16 is fixed at 24 kHz
+REALTIME_PCM16_RATE = 24000
+G711_RATE = 8000
+
+# FIR taps per unit of the larger resampling factor
+_TAPS_PER_FACTOR = 16
+
+
+# ── G.711 tables ─────────────────────────────────────────────────────
+
+_ULAW_BIAS = 0x84
+_ULAW_CLIP = 8159
+_ULAW_SEG_END = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF], dtype=np.int32)
+_ALAW_SEG_END = np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF], dtype=np.int32)
+
+
+def _ulaw_encode_reference(pcm: np.ndarray) -> np.ndarray:
+    """Vectorised G.711 μ-law encoder (14-bit magnitude, as in the ITU reference)."""
+    pcm = pcm.astype(np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    pcm = np.minimum(np.abs(pcm), _ULAW_CLIP) + (_ULAW_BIAS >> 2)
+    seg = np.searchsorted(_ULAW_SEG_END, pcm, side="left")
+    uval = (seg << 4) | ((pcm >> (np.minimum(seg, 7) + 1)) & 0xF)
+    uval = np.where(seg >= 8, 0x7F, uval)
+    return (uval ^ mask).astype(np.uint8)
+
+
+def _ulaw_decode_reference(codes: np.ndarray) -> np.ndarray:
+    """Vectorised G.711 μ-law decoder."""
+    u = ~codes.astype(np.int32) & 0xFF
+    t = (((u & 0x0F) << 3) + _ULAW_BIAS) << ((u & 0x70) >> 4)
+    return np.where(u & 0x80, _ULAW_BIAS - t, t - _ULAW_BIAS).astype(np.int16)
+
+
+def _alaw_encode_reference(pcm: np.ndarray) -> np.ndarray:
+    """Vectorised G.711 A-law encoder (13-bit magnitude, as in the ITU reference)."""
+    pcm = pcm.astype(np.int32) >> 3
+    mask = np.where(pcm >= 0, 0xD5, 0x55)
+    pcm = np.where(pcm >= 0, pcm, -pcm - 1)
+    seg = np.searchsorted(_ALAW_SEG_END, pcm, side="left")
+    shift = np.where(seg < 2, 1, np.minimum(seg, 7))
+    aval = (seg << 4) | ((pcm >> shift) & 0xF)
+    aval = np.where(seg >= 8, 0x7F, aval)
+    return (aval ^ mask).astype(np.uint8)
+
+
+def _alaw_decode_reference(codes: np.ndarray) -> np.ndarray:
+    """Vectorised G.711 A-law decoder."""
+    a = codes.astype(np.int32) ^ 0x55
+    seg = (a & 0x70) >> 4
+    t = (a & 0x0F) << 4
+    t = np.where(seg == 0, t + 8, (t + 0x108) << np.maximum(seg - 1, 0))
+    return np.where(a & 0x80, t, -t).astype(np.int16)
+
+
+# Encode tables are indexed by the int16 sample reinterpreted as uint16
+_ALL_SAMPLES = np.arange(65536, dtype=np.uint16).view(np.int16)
+_ALL_CODES = np.arange(256, dtype=np.uint8)
+ULAW_ENCODE_TABLE = _ulaw_encode_reference(_ALL_SAMPLES)
+ULAW_DECODE_TABLE = _ulaw_decode_reference(_ALL_CODES)
+ALAW_ENCODE_TABLE = _alaw_encode_reference(_ALL_SAMPLES)
+ALAW_DECODE_TABLE = _alaw_decode_reference(_ALL_CODES)
+del _ALL_SAMPLES, _ALL_CODES
+
+
+# ── Codecs ───────────────────────────────────────────────────────────
+
+class Codec:
+    """
+    Base codec: converts between encoded bytes and int16 sample arrays.
+
+    Attributes:
+        name: Registry key — matches the Realtime API format name.
+        sample_rate: Fixed sample rate, or ``None`` if the codec carries
+            any rate (PCM16).
+        bytes_per_sample: Encoded size of one sample.
+    """
+
+    name = ""
+    sample_rate: int | None = None
+    bytes_per_sample = 2
+
+    def encode(self, samples: np.ndarray) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> np.ndarray:
+        raise NotImplementedError
+
+
+class Pcm16Codec(Codec):
+    """Little-endian signed 16-bit PCM."""
+
+    name = "pcm16"
+
+    def encode(self, samples: np.ndarray) -> bytes:
+        return samples.astype("<i2", copy=False).tobytes()
+
+    def decode(self, data: bytes) -> np.ndarray:
+        # Drop a trailing odd byte rather than fail on a truncated frame
+        return np.frombuffer(data, dtype="<i2", count=len(data) // 2)
+
+
+class _TableCodec(Codec):
+    """G.711 codec driven by precomputed encode/decode tables."""
+
+    sample_rate = G711_RATE
+    bytes_per_sample = 1
+
+    def __init__(self, encode_table: np.ndarray, decode_table: np.ndarray) -> None:
+        self._encode_table = encode_table
+        self._decode_table = decode_table
+
+    def encode(self, samples: np.ndarray) -> bytes:
+        return self._encode_table[samples.astype(np.int16, copy=False).view(np.uint16)].tobytes()
+
+    def decode(self, data: bytes) -> np.ndarray:
+        return self._decode_table[np.frombuffer(data, dtype=np.uint8)]
+
+
+class MuLawCodec(_TableCodec):
+    """G.711 μ-law (8 kHz, 8 bits per sample)."""
+
+    name = "g711_ulaw"
+
+    def __init__(self) -> None:
+        super().__init__(ULAW_ENCODE_TABLE, ULAW_DECODE_TABLE)
+
+
+class ALawCodec(_TableCodec):
+    """G.711 A-law (8 kHz, 8 bits per sample)."""
+
+    name = "g711_alaw"
+
+    def __init__(self) -> None:
+        super().__init__(ALAW_ENCODE_TABLE, ALAW_DECODE_TABLE)
+
+
+_CODECS: dict[str, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """Register a codec under ``codec.name`` (replacing any existing one)."""
+    _CODECS[codec.name] = codec
+
+
+def get_codec(name: str) -> Codec:
+    """
+    Look up a registered codec.
+
+    Raises:
+        ValueError: If no codec is registered under ``name``.
+    """
+    codec = _CODECS.get(name)
+    if codec is None:
+        raise ValueError(f"Unknown audio codec {name!r} (available: {', '.join(sorted(_CODECS))})")
+    return codec
+
+
+def available_codecs() -> list[str]:
+    """Names of all registered codecs."""
+    return sorted(_CODECS)
+
+
+for _codec in (Pcm16Codec(), MuLawCodec(), ALawCodec()):
+    register_codec(_codec)
+
+
+def codec_rate(codec: Codec, default: int) -> int:
+    """Sample rate a codec runs at — its fixed rate, or ``default`` for PCM16."""
+    return codec.sample_rate or default
+
+
+# ── Resampling ───────────────────────────────────────────────────────
+
+class Resampler:
+    """
+    Streaming rational resampler (upsample by L, FIR low-pass, decimate by M).
+
+    Filter history and output phase carry over between ``process()``
+    calls, so frame boundaries introduce no clicks.
+
+    Args:
+        src_rate: Input sample rate.
+        dst_rate: Output sample rate.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int) -> None:
+        g = math.gcd(src_rate, dst_rate)
+        self.up = dst_rate // g
+        self.down = src_rate // g
+        factor = max(self.up, self.down)
+        taps = _TAPS_PER_FACTOR * factor + 1
+        # Cut off just below the lower Nyquist, in cycles per upsampled sample
+        cutoff = 0.45 / factor
+        n = np.arange(taps) - (taps - 1) / 2
+        h = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(taps)
+        self._taps = (h / h.sum() * self.up).astype(np.float32)
+        self._history = np.zeros(taps - 1, dtype=np.float32)
+        self._phase = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample one chunk of int16 samples."""
+        x = samples.astype(np.float32)
+        if self.up > 1:
+            stuffed = np.zeros(len(x) * self.up, dtype=np.float32)
+            stuffed[::self.up] = x
+            x = stuffed
+        x = np.concatenate((self._history, x))
+        y = np.convolve(x, self._taps, mode="valid")
+        self._history = x[len(x) - len(self._history):]
+        start = (-self._phase) % self.down
+        self._phase += len(y)
+        y = y[start::self.down]
+        return np.clip(np.rint(y), -32768, 32767).astype(np.int16)
+
+
+# ── Transcoding ──────────────────────────────────────────────────────
+
+class Transcoder:
+    """
+    One direction of a session's audio path: decode, resample, encode.
+
+    Args:
+        src: Codec of the incoming bytes.
+        src_rate: Their sample rate.
+        dst: Codec to produce.
+        dst_rate: Sample rate to produce.
+    """
+
+    def __init__(self, src: Codec, src_rate: int, dst: Codec, dst_rate: int) -> None:
+        self.src = src
+        self.dst = dst
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        self.passthrough = src.name == dst.name and src_rate == dst_rate
+        self._resampler = Resampler(src_rate, dst_rate) if src_rate != dst_rate else None
+
+    def convert(self, data: bytes) -> bytes:
+        """Transcode one chunk (returned unchanged for passthroughs)."""
+        if self.passthrough:
+            return data
+        samples = self.src.decode(data)
+        if self._resampler is not None:
+            samples = self._resampler.process(samples)
+        return self.dst.encode(samples)
+
+    def __repr__(self) -> str:
+        return f"Transcoder({self.src.name}@{self.src_rate} -> {self.dst.name}@{self.dst_rate})"
+
+
+def build_transcoders(acs_rate: int, realtime_format: str) -> tuple[Transcoder, Transcoder]:
+    """
+    Negotiate a session's audio path.
+
+    Args:
+        acs_rate: PCM16 sample rate announced by ACS ``AudioMetadata``.
+        realtime_format: Realtime API format name (``pcm16``,
+            ``g711_ulaw``, ``g711_alaw``).
+
+    Returns:
+        ``(inbound, outbound)`` — ACS -> Realtime and Realtime -> ACS.
+    """
+    pcm16 = get_codec("pcm16")
+    realtime = get_codec(realtime_format)
+    realtime_rate = codec_rate(realtime, REALTIME_PCM16_RATE)
+    inbound = Transcoder(pcm16, acs_rate, realtime, realtime_rate)
+    outbound = Transcoder(realtime, realtime_rate, pcm16, acs_rate)
+    return inbound, outbound
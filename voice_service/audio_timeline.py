@@ -0,0 +1,190 @@
+"""
+voice_service.audio_timeline — Who spoke when, in Realtime input-buffer time.
+
+The Realtime API reports user speech as offsets into the audio it has
+received (``audio_start_ms`` / ``audio_end_ms`` on
+``input_audio_buffer.speech_started`` / ``speech_stopped``), and the
+matching transcript arrives seconds later.  Attributing that transcript
+to whoever sent the most recent frame is wrong whenever speakers
+overlap or someone else has started talking by then.
+
+``AudioTimeline`` counts the samples forwarded to the Realtime API —
+the same clock the API's offsets use — and records each participant's
+voiced audio as intervals on it.  A finished transcript's offsets are
+then resolved to the participant with the most voiced audio inside
+them.
+
+Intervals are stored in start order in parallel lists.  Every interval
+is capped at ``AIDA_TIMELINE_MAX_INTERVAL_MS``, so the intervals that
+can overlap ``[start, end)`` all start in
+``[start - max_interval, end)`` — two ``bisect`` calls bound the scan.
+Intervals older than ``AIDA_TIMELINE_RETENTION_SECONDS`` are pruned as
+the timeline advances, so memory stays bounded for long meetings.
+
+A Realtime reconnect restarts the API's offsets at zero; ``rebase()``
+moves the lookup origin to the first sample the new connection received.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from bisect import bisect_left
+
+logger = logging.getLogger(__name__)
+
+# How much history is kept for lookups (transcripts arrive within seconds)
+TIMELINE_RETENTION_SECONDS = float(os.getenv("AIDA_TIMELINE_RETENTION_SECONDS", "300"))
+# Voiced frames this close together extend the same interval
+TIMELINE_MERGE_GAP_MS = int(os.getenv("AIDA_TIMELINE_MERGE_GAP_MS", "200"))
+# Longer runs are split so lookups stay bounded
+TIMELINE_MAX_INTERVAL_MS = int(os.getenv("AIDA_TIMELINE_MAX_INTERVAL_MS", "5000"))
+
+
+class AudioTimeline:
+    """
+    Per-session interval index of participant speech.
+
+    Positions are integer samples at ``rate`` (frames at other rates are
+    scaled on append), counted from the first sample sent to the
+    Realtime API.
+
+    Args:
+        rate: Timeline resolution in samples per second.
+        retention_seconds: History kept before pruning.
+        merge_gap_ms: Gap within which a participant's voiced frames
+            extend their current interval.
+        max_interval_ms: Maximum length of one interval.
+    """
+
+    def __init__(
+        self,
+        rate: int = 24000,
+        retention_seconds: float = TIMELINE_RETENTION_SECONDS,
+        merge_gap_ms: int = TIMELINE_MERGE_GAP_MS,
+        max_interval_ms: int = TIMELINE_MAX_INTERVAL_MS,
+    ) -> None:
+        self.rate = rate
+        self._retention = int(retention_seconds * rate)
+        self._merge_gap = merge_gap_ms * rate // 1000
+        self._max_interval = max(1, max_interval_ms * rate // 1000)
+
+        self._position = 0
+        # Timeline position of Realtime offset 0 (moves on reconnect)
+        self._origin = 0
+        # Parallel lists in start order; entries before _head are pruned
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._speakers: list[str] = []
+        self._head = 0
+        # Open interval index per participant
+        self._open: dict[str, int] = {}
+
+    @property
+    def position(self) -> int:
+        """Samples appended so far."""
+        return self._position
+
+    @property
+    def position_ms(self) -> int:
+        return self._position * 1000 // self.rate
+
+    def __len__(self) -> int:
+        return len(self._starts) - self._head
+
+    def rebase(self, replayed_ms: float) -> None:
+        """
+        Realtime offsets restart on a new connection.
+
+        Args:
+            replayed_ms: Audio already appended that the new connection
+                receives first (replayed from the reconnect buffer).
+        """
+        self._origin = max(0, self._position - int(replayed_ms * self.rate // 1000))
+
+    # ── Recording ────────────────────────────────────────────────────
+
+    def append(self, samples: int, sample_rate: int, speaker_raw_id: str = "") -> None:
+        """
+        Advance the timeline by one forwarded frame.
+
+        Args:
+            samples: Samples in the frame.
+            sample_rate: Its sample rate.
+            speaker_raw_id: Participant whose voiced audio this is, or
+                empty for silence / unattributed audio.
+        """
+        if sample_rate != self.rate:
+            samples = samples * self.rate // sample_rate
+        start = self._position
+        end = start + samples
+        self._position = end
+        if not speaker_raw_id:
+            return
+
+        index = self._open.get(speaker_raw_id)
+        if (
+            index is not None
+            and index >= self._head
+            and start - self._ends[index] <= self._merge_gap
+            and end - self._starts[index] <= self._max_interval
+        ):
+            self._ends[index] = end
+        else:
+            self._open[speaker_raw_id] = len(self._starts)
+            self._starts.append(start)
+            self._ends.append(end)
+            self._speakers.append(speaker_raw_id)
+            self._prune()
+
+    def _prune(self) -> None:
+        """Drop intervals that ended before the retention window."""
+        horizon = self._position - self._retention - self._max_interval
+        if horizon <= 0:
+            return
+        # Every interval starting before the horizon ended before position - retention
+        head = bisect_left(self._starts, horizon, self._head)
+        if head == self._head:
+            return
+        self._head = head
+        # Compact once the dead prefix dominates, keeping appends amortised O(1)
+        if head > 1024 and head * 2 > len(self._starts):
+            del self._starts[:head]
+            del self._ends[:head]
+            del self._speakers[:head]
+            self._head = 0
+            self._open = {s: i - head for s, i in self._open.items() if i >= head}
+
+    # ── Lookup ───────────────────────────────────────────────────────
+
+    def speakers_between(self, start_ms: float, end_ms: float) -> dict[str, int]:
+        """
+        Voiced samples per participant overlapping ``[start_ms, end_ms)``.
+
+        ``O(log n + k)`` where ``k`` is the number of intervals that can
+        overlap the range.
+        """
+        start = self._origin + int(start_ms * self.rate // 1000)
+        end = self._origin + int(end_ms * self.rate // 1000)
+        if end <= start:
+            return {}
+        starts, ends, speakers = self._starts, self._ends, self._speakers
+        lo = bisect_left(starts, start - self._max_interval, self._head)
+        hi = bisect_left(starts, end, lo)
+        totals: dict[str, int] = {}
+        for i in range(lo, hi):
+            overlap = min(ends[i], end) - max(starts[i], start)
+            if overlap > 0:
+                speaker = speakers[i]
+                totals[speaker] = totals.get(speaker, 0) + overlap
+        return totals
+
+    def dominant_speaker(self, start_ms: float, end_ms: float) -> str:
+        """The participant with the most voiced audio in the range ("" if none)."""
+        totals = self.speakers_between(start_ms, end_ms)
+        if not totals:
+            return ""
+        return max(totals, key=totals.__getitem__)
+
+    def stats(self) -> dict[str, int]:
+        return {"position_ms": self.position_ms, "intervals": len(self)}
@@ -0,0 +1,212 @@
+"""
+voice_service.call_reaper — Reclaim calls nobody is on any more.
+
+A meeting everyone left without removing AIDA, or a PSTN call parked on
+hold, keeps its worker and (once activated) its Realtime session alive
+until the maximum-duration timeout.  ``CallReaper`` ends such calls
+early on two signals:
+
+  - **silence** — no frame of human speech for
+    ``AIDA_REAPER_SILENCE_SECONDS``.  Speech is the participant tracker's
+    frame level at or above ``AIDA_PARTICIPANT_VAD_THRESHOLD_DBFS``;
+    frames ACS does not attribute to a participant are measured here,
+    one in ``AIDA_REAPER_SAMPLE_FRAMES`` so the audio path stays cheap.
+    AIDA's own audio never counts.
+  - **alone** — the latest ``ParticipantsUpdated`` showed no human on
+    the call (only the bot, or everyone else on hold) for
+    ``AIDA_REAPER_ALONE_SECONDS``.  The bot's identities are the ones in
+    ``AIDA_REAPER_BOT_RAW_IDS`` plus those learned from calls it
+    answered or created (``note_bot_identity()``).
+
+Both are timers on the process-wide timer wheel: the silence timer is
+reset by speech, the alone timer is armed and cancelled by participant
+updates.  The worker hangs up through the ACS client and stops through
+its normal path when either fires.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+from voice_service.participant_tracker import PARTICIPANT_VAD_THRESHOLD_DBFS
+from voice_service.passive_transcription import frame_dbfs
+from voice_service.timer_wheel import Timer, TimerWheel, get_timer_wheel
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# End the call after this long without human speech (0 disables)
+REAPER_SILENCE_SECONDS = float(os.getenv("AIDA_REAPER_SILENCE_SECONDS", "900"))
+# End the call after this long with no human present (0 disables)
+REAPER_ALONE_SECONDS = float(os.getenv("AIDA_REAPER_ALONE_SECONDS", "60"))
+# Measure one in N unattributed frames for speech
+REAPER_SAMPLE_FRAMES = max(1, int(os.getenv("AIDA_REAPER_SAMPLE_FRAMES", "5")))
+# Raw IDs the bot joins calls as (comma-separated); never counted as human
+REAPER_BOT_RAW_IDS = frozenset(
+    raw_id.strip() for raw_id in os.getenv("AIDA_REAPER_BOT_RAW_IDS", "").split(",") if raw_id.strip()
+)
+# Identities learned from answered and created calls, oldest first (bounded)
+_MAX_LEARNED_BOT_IDS = 64
+_learned_bot_raw_ids: dict[str, None] = {}
+_warned_unknown_bot = False
+
+_REAPED = {
+    reason: REGISTRY.counter(
+        "aida_voice_reaped_sessions_total",
+        "Calls hung up by the reaper to reclaim their worker and Realtime session.",
+        labels={"reason": reason},
+    )
+    for reason in ("silence", "alone")
+}
+
+
+def note_bot_identity(raw_id: str) -> None:
+    """
+    Remember a raw ID the bot is on calls as, so it is never counted as human.
+
+    Called with the callee of every answered call and the source of every
+    created one; ``AIDA_REAPER_BOT_RAW_IDS`` need only list identities
+    never seen there.
+    """
+    if not raw_id or raw_id in _learned_bot_raw_ids or raw_id in REAPER_BOT_RAW_IDS:
+        return
+    if len(_learned_bot_raw_ids) >= _MAX_LEARNED_BOT_IDS:
+        _learned_bot_raw_ids.pop(next(iter(_learned_bot_raw_ids)))
+    _learned_bot_raw_ids[raw_id] = None
+    logger.info("Bot identity learned: %s", raw_id)
+
+
+def count_humans(participants: list[dict[str, Any]], bot_raw_ids: frozenset[str] | None = None) -> int:
+    """
+    Participants of a ``ParticipantsUpdated`` event who can still talk.
+
+    The bot itself and participants on hold are not counted.
+
+    Args:
+        participants: The event's participant list.
+        bot_raw_ids: The bot's identities (default: configured and learned).
+    """
+    global _warned_unknown_bot
+    if bot_raw_ids is None:
+        bot_raw_ids = REAPER_BOT_RAW_IDS.union(_learned_bot_raw_ids)
+        if not bot_raw_ids and not _warned_unknown_bot:
+            _warned_unknown_bot = True
+            logger.warning(
+                "Bot identity unknown: the bot counts as a human, so the alone timer cannot fire "
+                "(set AIDA_REAPER_BOT_RAW_IDS)"
+            )
+    humans = 0
+    for participant in participants:
+        raw_id = participant.get("rawId") or participant.get("identifier", {}).get("rawId", "")
+        if raw_id in bot_raw_ids or participant.get("isOnHold"):
+            continue
+        humans += 1
+    return humans
+
+
+class CallReaper:
+    """
+    Silence and alone timers for one call.
+
+    Args:
+        on_reap: Called with ``"silence"`` or ``"alone"`` when the call
+            should be ended (on the event loop, must not block).
+        silence_seconds: Human-speech timeout (0 disables).
+        alone_seconds: No-human timeout (0 disables).
+        wheel: Timer wheel (defaults to the process-wide one).
+    """
+
+    __slots__ = (
+        "_alone_seconds",
+        "_alone_timer",
+        "_on_reap",
+        "_silence_seconds",
+        "_silence_timer",
+        "_unattributed",
+        "_wheel",
+        "humans",
+        "reaped",
+    )
+
+    def __init__(
+        self,
+        on_reap: Callable[[str], None],
+        silence_seconds: float = REAPER_SILENCE_SECONDS,
+        alone_seconds: float = REAPER_ALONE_SECONDS,
+        wheel: TimerWheel | None = None,
+    ) -> None:
+        self._on_reap = on_reap
+        self._silence_seconds = silence_seconds
+        self._alone_seconds = alone_seconds
+        self._wheel = wheel if wheel is not None else get_timer_wheel()
+        self._silence_timer: Timer | None = None
+        self._alone_timer: Timer | None = None
+        self._unattributed = 0
+        # Humans present per the last participant update (None before one)
+        self.humans: int | None = None
+        self.reaped = ""
+
+    def start(self) -> None:
+        """Arm the silence timer; the call has just started."""
+        if self._silence_seconds > 0 and self._silence_timer is None:
+            self._silence_timer = self._wheel.schedule(self._silence_seconds, self._fire, "silence")
+
+    def audio(self, pcm: bytes, is_silent: bool, level_dbfs: float | None) -> float | None:
+        """
+        Note one inbound frame; human speech resets the silence timer.
+
+        Args:
+            pcm: PCM16 frame.
+            is_silent: ACS flagged the frame as silence.
+            level_dbfs: Level from the participant tracker, if computed.
+
+        Returns:
+            The frame level, when known, for the rest of the audio path.
+        """
+        timer = self._silence_timer
+        if timer is None or is_silent:
+            return level_dbfs
+        if level_dbfs is None:
+            self._unattributed += 1
+            if self._unattributed % REAPER_SAMPLE_FRAMES:
+                return None
+            level_dbfs = frame_dbfs(pcm)
+        if level_dbfs >= PARTICIPANT_VAD_THRESHOLD_DBFS:
+            timer.reset()
+        return level_dbfs
+
+    def participants(self, humans: int) -> None:
+        """Apply a participant update: arm the alone timer at zero humans."""
+        self.humans = humans
+        if humans:
+            if self._alone_timer is not None:
+                self._alone_timer.cancel()
+        elif self._alone_seconds > 0 and not self.reaped:
+            if self._alone_timer is None:
+                self._alone_timer = self._wheel.schedule(self._alone_seconds, self._fire, "alone")
+            elif not self._alone_timer.active:
+                self._alone_timer.reset()
+
+    def _fire(self, reason: str) -> None:
+        if self.reaped:
+            return
+        self.reaped = reason
+        self.close()
+        _REAPED[reason].inc()
+        self._on_reap(reason)
+
+    def close(self) -> None:
+        for timer in (self._silence_timer, self._alone_timer):
+            if timer is not None:
+                timer.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "humans": self.humans,
+            "silence_timer": self._silence_timer is not None and self._silence_timer.active,
+            "alone_timer": self._alone_timer is not None and self._alone_timer.active,
+            "reaped": self.reaped or None,
+        }
@@ -0,0 +1,423 @@
+"""
+voice_service.call_recorder — Streaming call recording written off the event loop.
+
+When a session is recorded (``VoiceSession.record``, default
+``AIDA_RECORDING_ENABLED``), every inbound ACS frame and every outbound
+frame actually sent to ACS is captured into a stereo PCM16 WAV file —
+left channel the caller(s), right channel AIDA.
+
+The audio path only copies bytes:
+
+  - each direction fills a buffer taken from a preallocated
+    ``BufferPool``; a full buffer (or one interrupted by a gap in the
+    stream) is handed to the writer thread with the time its first
+    frame arrived;
+  - one ``RecordingWriter`` thread serves every session on the replica.
+    It places each buffer on its channel by arrival time (padding gaps
+    with silence), interleaves the two channels and writes them in
+    batches, returning the buffers to the pool.
+
+``CallRecorder.close()`` flushes what is buffered and waits for the
+writer to finalise the file (the WAV header is patched with the real
+length).  ``AIDA_RECORDING_SEGMENT_SECONDS`` splits long calls into
+numbered files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+import wave
+from collections import deque
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+RECORDING_ENABLED = os.getenv("AIDA_RECORDING_ENABLED", "false").lower() in ("1", "true", "yes")
+RECORDING_DIR = os.getenv("AIDA_RECORDING_DIR", "recordings")
+# 0 writes one file per call
+RECORDING_SEGMENT_SECONDS = int(os.getenv("AIDA_RECORDING_SEGMENT_SECONDS", "0"))
+RECORDING_BUFFER_KB = int(os.getenv("AIDA_RECORDING_BUFFER_KB", "32"))
+RECORDING_POOL_BUFFERS = int(os.getenv("AIDA_RECORDING_POOL_BUFFERS", "6"))
+
+# Arrival-time jitter absorbed without inserting silence
+_GAP_TOLERANCE_SECONDS = 0.1
+# How far one channel may run ahead before the other is padded with silence
+_MAX_SKEW_SECONDS = 2.0
+# Time allowed for the writer to finalise a file on close
+_CLOSE_TIMEOUT_SECONDS = 10.0
+
+INBOUND = 0
+OUTBOUND = 1
+
+_BYTES = REGISTRY.counter(
+    "aida_voice_recording_bytes_total",
+    "PCM bytes handed to the recording writer.",
+)
+_POOL_MISSES = REGISTRY.counter(
+    "aida_voice_recording_pool_misses_total",
+    "Recording buffers allocated because the preallocated pool was empty.",
+)
+_WRITE_ERRORS = REGISTRY.counter(
+    "aida_voice_recording_write_errors_total",
+    "Recording files abandoned after a write error.",
+)
+
+
+class BufferPool:
+    """
+    Fixed-size reusable byte buffers.
+
+    ``acquire`` runs on the event loop and ``release`` on the writer
+    thread; ``deque`` appends and pops are atomic, so no lock is needed.
+    """
+
+    def __init__(self, buffer_bytes: int, count: int) -> None:
+        self.buffer_bytes = buffer_bytes
+        self._count = count
+        self._free: deque[bytearray] = deque(bytearray(buffer_bytes) for _ in range(count))
+
+    def acquire(self) -> bytearray:
+        try:
+            return self._free.popleft()
+        except IndexError:
+            # Writer is behind; allocate rather than drop audio
+            _POOL_MISSES.inc()
+            return bytearray(self.buffer_bytes)
+
+    def release(self, buf: bytearray) -> None:
+        if len(self._free) < self._count:
+            self._free.append(buf)
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
+
+
+# ── Writer thread ────────────────────────────────────────────────────
+
+class _RecordingFile:
+    """Writer-side state of one recording (only touched by the writer thread)."""
+
+    def __init__(self, base_path: Path, sample_rate: int, segment_seconds: int, started_at: float) -> None:
+        self.base_path = base_path
+        self.sample_rate = sample_rate
+        self.segment_seconds = segment_seconds
+        self.segment_frames = segment_seconds * sample_rate
+        self.t0 = started_at
+        self.positions = [0, 0]
+        self.pending = [bytearray(), bytearray()]
+        self.wav: wave.Wave_write | None = None
+        self.segment = 0
+        self.segment_written = 0
+        self.paths: list[str] = []
+        self.failed = False
+
+    # ── Placement ────────────────────────────────────────────────────
+
+    def add(self, channel: int, data: memoryview, started: float) -> None:
+        """Place one chunk on its channel by arrival time."""
+        target = round((started - self.t0) * self.sample_rate)
+        gap = target - self.positions[channel]
+        if gap > _GAP_TOLERANCE_SECONDS * self.sample_rate:
+            self.pending[channel] += bytes(gap * 2)
+            self.positions[channel] += gap
+        self.pending[channel] += data
+        self.positions[channel] += len(data) // 2
+        self.emit()
+
+    def emit(self, final: bool = False) -> None:
+        """Write every frame both channels have; pad a lagging channel first."""
+        pending = self.pending
+        lengths = [len(pending[0]) // 2, len(pending[1]) // 2]
+        lead = max(lengths)
+        limit = lead if final else lead - int(_MAX_SKEW_SECONDS * self.sample_rate)
+        for channel in (INBOUND, OUTBOUND):
+            short = limit - lengths[channel]
+            if short > 0:
+                pending[channel] += bytes(short * 2)
+                self.positions[channel] += short
+                lengths[channel] += short
+        frames = min(lengths)
+        if frames <= 0:
+            return
+        left = np.frombuffer(pending[0], dtype="<i2", count=frames)
+        right = np.frombuffer(pending[1], dtype="<i2", count=frames)
+        stereo = np.empty(frames * 2, dtype="<i2")
+        stereo[0::2] = left
+        stereo[1::2] = right
+        del left, right
+        del pending[0][:frames * 2]
+        del pending[1][:frames * 2]
+        self._write(stereo.tobytes())
+
+    # ── Files ────────────────────────────────────────────────────────
+
+    def _open_segment(self) -> wave.Wave_write:
+        if self.segment_frames or self.segment:
+            # Segmented, or continuing after a sample-rate change
+            path = self.base_path.with_name(f"{self.base_path.name}-part{self.segment:03d}.wav")
+        else:
+            path = self.base_path.with_name(f"{self.base_path.name}.wav")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Stays open across writes until the segment fills or the recording finishes
+        wav = wave.open(str(path), "wb")  # noqa: SIM115
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(self.sample_rate)
+        self.paths.append(str(path))
+        self.segment += 1
+        self.segment_written = 0
+        return wav
+
+    def _write(self, data: bytes) -> None:
+        if self.failed:
+            return
+        try:
+            view = memoryview(data)
+            while view:
+                if self.wav is None:
+                    self.wav = self._open_segment()
+                chunk = view
+                if self.segment_frames:
+                    room = (self.segment_frames - self.segment_written) * 4
+                    chunk = view[:room]
+                self.wav.writeframesraw(chunk)
+                self.segment_written += len(chunk) // 4
+                view = view[len(chunk):]
+                if self.segment_frames and self.segment_written >= self.segment_frames:
+                    self.wav.close()
+                    self.wav = None
+        except OSError:
+            logger.exception("Recording write failed, abandoning: %s", self.base_path)
+            _WRITE_ERRORS.inc()
+            self.failed = True
+
+    def set_sample_rate(self, sample_rate: int, at: float) -> None:
+        """Finish the current segment and continue at a new rate."""
+        self.finish_segment()
+        self.sample_rate = sample_rate
+        self.segment_frames = self.segment_seconds * sample_rate
+        self.t0 = at
+        self.positions = [0, 0]
+
+    def finish_segment(self) -> None:
+        self.emit(final=True)
+        if self.wav is not None:
+            try:
+                self.wav.close()
+            except OSError:
+                logger.exception("Recording finalise failed: %s", self.base_path)
+                _WRITE_ERRORS.inc()
+            self.wav = None
+
+
+class RecordingWriter:
+    """The replica's recording writer thread (shared by every session)."""
+
+    def __init__(self) -> None:
+        self._queue: queue.SimpleQueue[tuple[Any, ...] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="recording-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, item: tuple[Any, ...]) -> None:
+        self._queue.put(item)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._handle(item)
+            except Exception:
+                logger.exception("Recording writer error")
+
+    def _handle(self, item: tuple[Any, ...]) -> None:
+        kind, recording = item[0], item[1]
+        if kind == "chunk":
+            _, _, channel, buf, nbytes, started, pool = item
+            try:
+                recording.add(channel, memoryview(buf)[:nbytes], started)
+            finally:
+                pool.release(buf)
+        elif kind == "rate":
+            _, _, sample_rate, at = item
+            recording.set_sample_rate(sample_rate, at)
+        elif kind == "close":
+            _, _, loop, future = item
+            recording.finish_segment()
+            loop.call_soon_threadsafe(_resolve, future, list(recording.paths))
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Finish queued work and stop the thread (blocking)."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+def _resolve(future: asyncio.Future, paths: list[str]) -> None:
+    if not future.done():
+        future.set_result(paths)
+
+
+_writer: RecordingWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> RecordingWriter:
+    """The shared writer, started on first use."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = RecordingWriter()
+        return _writer
+
+
+async def close_writer() -> None:
+    """Stop the shared writer on shutdown, after recorders have closed."""
+    global _writer
+    writer, _writer = _writer, None
+    if writer is not None:
+        await asyncio.to_thread(writer.stop)
+
+
+# ── Per-session recorder ─────────────────────────────────────────────
+
+class _Channel:
+    __slots__ = ("buf", "fill", "started", "view")
+
+    def __init__(self, buf: bytearray) -> None:
+        self.buf = buf
+        self.view = memoryview(buf)
+        self.fill = 0
+        self.started = 0.0
+
+
+class CallRecorder:
+    """
+    Captures one session's inbound and outbound PCM16 to a stereo WAV.
+
+    ``write_inbound`` / ``write_outbound`` only copy into pooled buffers
+    and never block; file I/O happens on the shared writer thread.
+
+    Args:
+        name: File name stem (call connection or session ID).
+        sample_rate: PCM16 rate of both directions.
+        directory: Recording root; files go in a per-day subdirectory.
+        segment_seconds: Split into files of this length (0 = one file).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sample_rate: int,
+        directory: str = RECORDING_DIR,
+        segment_seconds: int = RECORDING_SEGMENT_SECONDS,
+        buffer_bytes: int = RECORDING_BUFFER_KB * 1024,
+        pool_buffers: int = RECORDING_POOL_BUFFERS,
+        writer: RecordingWriter | None = None,
+    ) -> None:
+        now = datetime.now(UTC)
+        stem = f"{now:%H%M%S}-{name}"
+        self.base_path = Path(directory) / f"{now:%Y-%m-%d}" / stem
+        self._sample_rate = sample_rate
+        self._bytes_per_second = sample_rate * 2
+        self._pool = BufferPool(buffer_bytes, pool_buffers)
+        self._writer = writer or get_writer()
+        self._file = _RecordingFile(self.base_path, sample_rate, segment_seconds, time.monotonic())
+        self._channels = (_Channel(self._pool.acquire()), _Channel(self._pool.acquire()))
+        self._closed = False
+        self.paths: list[str] = []
+        self.bytes_recorded = 0
+
+    # ── Audio path ───────────────────────────────────────────────────
+
+    def write_inbound(self, pcm: bytes) -> None:
+        """Record a frame received from ACS."""
+        self._write(self._channels[INBOUND], INBOUND, pcm)
+
+    def write_outbound(self, pcm: bytes) -> None:
+        """Record a frame sent to ACS."""
+        self._write(self._channels[OUTBOUND], OUTBOUND, pcm)
+
+    def _write(self, ch: _Channel, channel: int, pcm: bytes) -> None:
+        if self._closed:
+            return
+        n = len(pcm)
+        now = time.monotonic()
+        if ch.fill:
+            # A gap in the stream starts a new chunk so it is placed by its own arrival time
+            expected = ch.started + ch.fill / self._bytes_per_second
+            if now - expected > _GAP_TOLERANCE_SECONDS or ch.fill + n > len(ch.buf):
+                self._hand_off(ch, channel)
+        if n > len(ch.buf):
+            # Oversized frame: hand off a copy directly
+            self._writer.submit(("chunk", self._file, channel, bytearray(pcm), n, now, self._pool))
+            _BYTES.inc(n)
+            self.bytes_recorded += n
+            return
+        if not ch.fill:
+            ch.started = now
+        ch.view[ch.fill:ch.fill + n] = pcm
+        ch.fill += n
+        self.bytes_recorded += n
+
+    def _hand_off(self, ch: _Channel, channel: int) -> None:
+        self._writer.submit(("chunk", self._file, channel, ch.buf, ch.fill, ch.started, self._pool))
+        _BYTES.inc(ch.fill)
+        ch.buf = self._pool.acquire()
+        ch.view = memoryview(ch.buf)
+        ch.fill = 0
+
+    # ── Control ──────────────────────────────────────────────────────
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        """Continue at a new rate (a new segment file if audio was already written)."""
+        if sample_rate == self._sample_rate or self._closed:
+            return
+        for channel, ch in enumerate(self._channels):
+            if ch.fill:
+                self._hand_off(ch, channel)
+        self._sample_rate = sample_rate
+        self._bytes_per_second = sample_rate * 2
+        self._writer.submit(("rate", self._file, sample_rate, time.monotonic()))
+
+    async def close(self) -> list[str]:
+        """
+        Flush buffered audio and wait for the file to be finalised.
+
+        Returns:
+            Paths of the recording files written.
+        """
+        if self._closed:
+            return self.paths
+        self._closed = True
+        for channel, ch in enumerate(self._channels):
+            if ch.fill:
+                self._hand_off(ch, channel)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[str]] = loop.create_future()
+        self._writer.submit(("close", self._file, loop, future))
+        try:
+            self.paths = await asyncio.wait_for(future, _CLOSE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning("Recording not finalised within %.0fs: %s", _CLOSE_TIMEOUT_SECONDS, self.base_path)
+        return self.paths
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.base_path),
+            "bytes_recorded": self.bytes_recorded,
+            "pool_free": self._pool.free,
+            "files": self.paths,
+        }
@@ -0,0 +1,142 @@
+"""
+voice_service.drain — Graceful drain mode for rolling deploys.
+
+Stopping the replica used to stop every worker immediately, cutting off
+live calls on every deploy.  In drain mode:
+
+  - ``/health`` answers 503 ``draining`` so no new calls are routed here;
+  - admission control refuses new IncomingCall / outbound calls;
+  - existing sessions continue until they end, or until the drain
+    deadline passes — then the remaining workers are stopped (which
+    still persists their transcripts).
+
+Drain is started by ``POST /admin/drain``, by ``SIGUSR1``, or — bounded
+by ``AIDA_DRAIN_ON_SHUTDOWN_SECONDS`` — when the process is asked to
+shut down.  ``GET /admin/drain`` reports progress so the deploy
+pipeline can wait for ``complete`` instead of killing the replica.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+
+from voice_service.voice_gateway import VoiceGateway
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Longest a drain waits for calls to end before stopping the rest
+DRAIN_DEADLINE_SECONDS = float(os.getenv("AIDA_DRAIN_DEADLINE_SECONDS", "1800"))
+# Drain budget when shutdown starts without a prior drain — keep below the
+# platform's termination grace period (30 s on Container Apps by default).
+DRAIN_ON_SHUTDOWN_SECONDS = float(os.getenv("AIDA_DRAIN_ON_SHUTDOWN_SECONDS", "25"))
+# How often drain progress is checked and logged
+_POLL_SECONDS = 1.0
+
+
+class DrainController:
+    """
+    Drives one drain of the replica's voice sessions.
+
+    Args:
+        gateway: The voice gateway whose sessions are drained.
+    """
+
+    def __init__(self, gateway: VoiceGateway) -> None:
+        self._gateway = gateway
+        self._started_at: float | None = None
+        self._deadline: float | None = None
+        self._reason = ""
+        self._initial_sessions = 0
+        self._forced_sessions = 0
+        self._completed_at: float | None = None
+        self._task: asyncio.Task | None = None
+        REGISTRY.gauge(
+            "aida_voice_draining",
+            "1 while the replica is draining (not accepting new calls).",
+            fn=lambda: 1.0 if self.draining else 0.0,
+        )
+
+    @property
+    def draining(self) -> bool:
+        """True once a drain has started (new calls are refused)."""
+        return self._started_at is not None
+
+    @property
+    def complete(self) -> bool:
+        """True once every session has ended or been stopped."""
+        return self._completed_at is not None
+
+    def start(self, reason: str, deadline_seconds: float = DRAIN_DEADLINE_SECONDS) -> None:
+        """
+        Enter drain mode (idempotent — a second call can only shorten
+        the deadline).
+
+        Args:
+            reason: Logged and reported (``admin``, ``signal``, ``shutdown``).
+            deadline_seconds: Seconds to wait for sessions to end.
+        """
+        now = time.monotonic()
+        deadline = now + max(0.0, deadline_seconds)
+        if self._started_at is not None:
+            if self._deadline is not None and deadline < self._deadline:
+                self._deadline = deadline
+                logger.info("Drain deadline shortened: %.0fs left (%s)", deadline_seconds, reason)
+            return
+
+        self._started_at = now
+        self._deadline = deadline
+        self._reason = reason
+        self._initial_sessions = self._gateway.active_session_count
+        logger.warning(
+            "Drain started: reason=%s, sessions=%d, deadline=%.0fs",
+            reason,
+            self._initial_sessions,
+            deadline_seconds,
+        )
+        self._task = asyncio.create_task(self._run(), name="voice-drain")
+
+    async def wait(self) -> None:
+        """Wait for the current drain to finish."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    async def _run(self) -> None:
+        try:
+            while self._gateway.active_session_count > 0:
+                assert self._deadline is not None
+                if time.monotonic() >= self._deadline:
+                    self._forced_sessions = self._gateway.active_session_count
+                    logger.warning("Drain deadline reached: stopping %d remaining session(s)", self._forced_sessions)
+                    await self._gateway.shutdown()
+                    break
+                logger.info("Draining: %d session(s) remaining", self._gateway.active_session_count)
+                await asyncio.sleep(min(_POLL_SECONDS, max(0.0, self._deadline - time.monotonic())))
+        finally:
+            self._completed_at = time.monotonic()
+            logger.warning(
+                "Drain complete in %.1fs: sessions=%d, stopped_at_deadline=%d",
+                self._completed_at - (self._started_at or self._completed_at),
+                self._initial_sessions,
+                self._forced_sessions,
+            )
+
+    def status(self) -> dict[str, Any]:
+        """Drain progress for ``GET /admin/drain`` and ``/health``."""
+        if self._started_at is None:
+            return {"draining": False, "complete": False, "active_sessions": self._gateway.active_session_count}
+        now = self._completed_at or time.monotonic()
+        return {
+            "draining": True,
+            "complete": self.complete,
+            "reason": self._reason,
+            "elapsed_seconds": round(now - self._started_at, 1),
+            "deadline_in_seconds": round(max(0.0, (self._deadline or now) - now), 1),
+            "initial_sessions": self._initial_sessions,
+            "active_sessions": self._gateway.active_session_count,
+            "stopped_at_deadline": self._forced_sessions,
+        }
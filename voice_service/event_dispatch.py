@@ -0,0 +1,239 @@
+"""
+voice_service.event_dispatch — Table-driven event dispatch with per-type stats.
+
+Realtime API and ACS events are routed through a dict keyed by event
+type instead of an if/elif chain.  Handlers register on an
+``EventTable`` with a decorator; ``EventTable.bind(owner)`` produces an
+``EventDispatcher`` whose handlers are bound to ``owner`` (a worker
+instance, or ``None`` for module-level functions) and which keeps
+per-type counters and cumulative handler time (sampled for cheap
+plain-function handlers, see ``SYNC_TIMING_MASK``).
+
+One event type can be marked as the *fast path*: it is compared first,
+before the dict lookup — used for ``response.audio.delta``, which makes
+up the bulk of Realtime traffic.  Unknown types are logged once at
+debug level and afterwards cost a single dict lookup and a counter
+increment.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from time import perf_counter_ns
+from typing import Any
+
+from voice_service.voice_metrics import REGISTRY, Counter
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[..., Awaitable[Any]] | Callable[..., Any]
+
+# Distinct unknown event types tracked individually before being lumped
+# together, so a misbehaving peer cannot grow the stats table unbounded.
+MAX_UNKNOWN_TYPES = 64
+OTHER_EVENT_TYPE = "<other>"
+
+# Plain-function handlers are timed on one call in (mask + 1); reading the
+# clock costs as much as the handlers themselves.  Coroutine handlers are
+# always timed.
+SYNC_TIMING_MASK = 7
+
+
+class EventTable:
+    """
+    Registry of event handlers keyed by event type.
+
+    Handlers may be coroutine functions or plain functions — trivial
+    handlers (flag flips, counters) should be plain functions so the
+    dispatcher does not create a coroutine per event.
+
+    Usage::
+
+        _events = EventTable("realtime", metric_name="aida_voice_realtime_events_total")
+
+        class Worker:
+            @_events.on("session.created")
+            async def _on_session_created(self, event): ...
+
+            def __init__(self):
+                self._dispatch = _events.bind(self)
+
+            async def handle(self, event):
+                pending = self._dispatch.dispatch(event["type"], event)
+                if pending is not None:
+                    await pending
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fast_path: str | None = None,
+        metric_name: str | None = None,
+    ) -> None:
+        self.name = name
+        self.fast_path = fast_path
+        self.metric_name = metric_name
+        self._handlers: dict[str, Handler] = {}
+
+    def on(self, *event_types: str) -> Callable[[Handler], Handler]:
+        """Decorator registering a handler for one or more event types."""
+
+        def decorator(func: Handler) -> Handler:
+            for event_type in event_types:
+                if event_type in self._handlers:
+                    raise ValueError(f"{self.name}: duplicate handler for {event_type!r}")
+                self._handlers[event_type] = func
+            return func
+
+        return decorator
+
+    @property
+    def event_types(self) -> list[str]:
+        """Registered event types."""
+        return list(self._handlers)
+
+    def bind(self, owner: Any = None) -> EventDispatcher:
+        """Create a dispatcher with handlers bound to ``owner``."""
+        if owner is None:
+            handlers = dict(self._handlers)
+        else:
+            handlers = {t: f.__get__(owner) for t, f in self._handlers.items()}
+        return EventDispatcher(self, handlers)
+
+
+class _Route:
+    """A bound handler plus the counters for its event type."""
+
+    __slots__ = ("count", "handler", "is_async", "max_ns", "metric", "timed", "total_ns")
+
+    def __init__(self, handler: Handler | None, metric: Counter | None) -> None:
+        self.handler = handler
+        self.is_async = handler is not None and inspect.iscoroutinefunction(handler)
+        self.count = 0
+        self.timed = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.metric = metric
+
+
+class EventDispatcher:
+    """Routes events to bound handlers and accumulates per-type statistics."""
+
+    __slots__ = ("_fast_route", "_fast_type", "_routes", "_table", "_unknown_types")
+
+    def __init__(self, table: EventTable, handlers: dict[str, Handler]) -> None:
+        self._table = table
+        self._routes: dict[str, _Route] = {
+            event_type: _Route(handler, self._metric(event_type)) for event_type, handler in handlers.items()
+        }
+        self._unknown_types = 0
+        self._fast_type = table.fast_path
+        self._fast_route = self._routes.get(table.fast_path) if table.fast_path else None
+
+    def _metric(self, event_type: str) -> Counter | None:
+        if not self._table.metric_name:
+            return None
+        return REGISTRY.counter(
+            self._table.metric_name,
+            f"{self._table.name} events dispatched, by type.",
+            labels={"type": event_type},
+        )
+
+    def _unknown_route(self, event_type: str) -> _Route:
+        """Create (bounded) a handler-less route so unknown types are still counted."""
+        if self._unknown_types >= MAX_UNKNOWN_TYPES:
+            route = self._routes.get(OTHER_EVENT_TYPE)
+            if route is None:
+                route = self._routes[OTHER_EVENT_TYPE] = _Route(None, self._metric(OTHER_EVENT_TYPE))
+            return route
+        self._unknown_types += 1
+        logger.debug("%s: no handler for event type %s", self._table.name, event_type)
+        route = self._routes[event_type] = _Route(None, self._metric(event_type))
+        return route
+
+    def dispatch(self, event_type: str, *args: Any) -> Awaitable[Any] | None:
+        """
+        Dispatch one event to its handler.
+
+        Plain-function handlers run inline (timed on a sample of calls)
+        and ``None`` is returned.  Coroutine handlers are returned wrapped in a
+        timing coroutine which the caller must await::
+
+            pending = dispatcher.dispatch(event_type, event)
+            if pending is not None:
+                await pending
+
+        Keeping this method synchronous means cheap events and unknown
+        types never allocate a coroutine.
+
+        Args:
+            event_type: The event's type string.
+            *args: Arguments passed through to the handler.
+
+        Returns:
+            An awaitable for coroutine handlers, otherwise ``None``.
+        """
+        if event_type == self._fast_type:
+            route = self._fast_route
+        else:
+            route = self._routes.get(event_type)
+        if route is None:
+            route = self._unknown_route(event_type)
+
+        handler = route.handler
+        route.count += 1
+        if route.metric is not None:
+            route.metric.value += 1
+        if handler is None:
+            return None
+        if route.is_async:
+            return self._run_timed(route, handler(*args))
+        if route.count & SYNC_TIMING_MASK:
+            handler(*args)
+            return None
+
+        start = perf_counter_ns()
+        try:
+            handler(*args)
+        finally:
+            elapsed = perf_counter_ns() - start
+            route.timed += 1
+            route.total_ns += elapsed
+            route.max_ns = max(route.max_ns, elapsed)
+        return None
+
+    @staticmethod
+    async def _run_timed(route: _Route, coro: Awaitable[Any]) -> Any:
+        start = perf_counter_ns()
+        try:
+            return await coro
+        finally:
+            elapsed = perf_counter_ns() - start
+            route.timed += 1
+            route.total_ns += elapsed
+            route.max_ns = max(route.max_ns, elapsed)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Per-type count, cumulative and max handler time (ms), busiest first.
+
+        Cumulative time for sampled (plain-function) handlers is
+        extrapolated from the timed calls.
+        """
+        rows = []
+        for event_type, route in self._routes.items():
+            if not route.count:
+                continue
+            total_ns = route.total_ns * route.count / route.timed if route.timed else 0.0
+            rows.append((event_type, route, total_ns))
+        rows.sort(key=lambda row: (row[2], row[1].count), reverse=True)
+        return {
+            event_type: {
+                "count": route.count,
+                "total_ms": round(total_ns / 1e6, 3),
+                "max_ms": round(route.max_ns / 1e6, 3),
+            }
+            for event_type, route, total_ns in rows
+        }
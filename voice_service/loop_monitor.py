@@ -0,0 +1,283 @@
+"""
+voice_service.loop_monitor — Event-loop lag monitor and slow-callback detector.
+
+Every call on a replica shares one event loop, so a single callback that
+blocks — ``json.loads`` on a large Realtime event, a synchronous log
+write, a tool doing blocking I/O — delays audio for all of them.  This
+module provides:
+
+  - **Lag sampling** — a background task sleeps for a fixed interval
+    and records how late it wakes up.  Samples feed a process-wide
+    histogram on ``/metrics`` and a short window used for percentiles.
+  - **Slow-callback detection** — a watchdog thread watches the probe.
+    When the probe is overdue by more than the threshold, the loop is
+    stuck in some callback; the watchdog captures a stack sample of the
+    loop thread while it is still blocked, and the stall is attributed
+    to the innermost *tracked* handler on that stack.  Nothing is
+    patched into asyncio, so healthy callbacks pay nothing; the cost is
+    that a stall shorter than the probe interval is only caught when it
+    overlaps a probe wake-up (any stall longer than interval plus
+    threshold always is).
+
+Tracked handlers are registered by function (``track()``), so
+attribution works on code objects rather than names.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from types import CodeType, FrameType
+from typing import Any
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# How often the lag probe wakes up
+LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("AIDA_LOOP_LAG_INTERVAL_MS", "100")) / 1000
+# Callbacks running longer than this are reported as slow
+SLOW_CALLBACK_SECONDS = float(os.getenv("AIDA_SLOW_CALLBACK_MS", "50")) / 1000
+# Number of recent lag samples kept for percentile queries (~1 min at 100 ms)
+LAG_WINDOW_SIZE = 600
+# Stack depth captured for slow-callback samples
+STACK_SAMPLE_DEPTH = 25
+
+_LAG_HISTOGRAM = REGISTRY.histogram(
+    "aida_voice_event_loop_lag_seconds",
+    "Event loop scheduling lag measured by a periodic probe.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+_SLOW_CALLBACKS = REGISTRY.counter(
+    "aida_voice_slow_callbacks_total",
+    "Event loop callbacks that exceeded the slow-callback threshold.",
+)
+
+
+class _Offender:
+    """Aggregated slow-callback statistics for one handler label."""
+
+    __slots__ = ("count", "label", "last_stack", "max_seconds", "total_seconds")
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.last_stack: list[str] = []
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "handler": self.label,
+            "count": self.count,
+            "total_ms": round(self.total_seconds * 1000, 2),
+            "max_ms": round(self.max_seconds * 1000, 2),
+            "last_stack": self.last_stack,
+        }
+
+
+class LoopMonitor:
+    """
+    Measures event-loop lag and attributes slow callbacks to handlers.
+
+    Usage::
+
+        monitor = LoopMonitor()
+        monitor.track(worker_cls.handle_acs_message)
+        await monitor.start()
+        ...
+        monitor.report()   # lag percentiles + top offenders
+        await monitor.stop()
+    """
+
+    def __init__(
+        self,
+        interval: float = LOOP_LAG_INTERVAL_SECONDS,
+        slow_threshold: float = SLOW_CALLBACK_SECONDS,
+    ) -> None:
+        self._interval = interval
+        self._slow_threshold = slow_threshold
+        self._tracked: dict[CodeType, str] = {}
+        self._lag_samples: deque[float] = deque(maxlen=LAG_WINDOW_SIZE)
+        self._offenders: dict[str, _Offender] = {}
+        self._slow_count = 0
+
+        self._probe_task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._loop_thread_id = 0
+
+        # Written by the loop thread, read by the watchdog thread.
+        # A tuple assignment is atomic under the GIL.
+        self._probe_due: tuple[float, int] | None = None
+        self._probe_seq = 0
+        self._sampled: tuple[int, list[str], str | None] | None = None
+
+    # ── Registration ─────────────────────────────────────────────────
+
+    def track(self, func: Callable[..., Any], label: str | None = None) -> None:
+        """
+        Register a handler for stall attribution.
+
+        Args:
+            func: The (async) function or method to track.
+            label: Name reported for stalls inside it (defaults to the
+                function's ``__name__``).
+        """
+        code = getattr(func, "__code__", None) or getattr(getattr(func, "__func__", None), "__code__", None)
+        if code is None:
+            logger.warning("Cannot track %r — no code object", func)
+            return
+        self._tracked[code] = label or func.__name__
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Start the lag probe and the watchdog thread."""
+        if self._probe_task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._watchdog = threading.Thread(target=self._watchdog_loop, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        self._probe_task = asyncio.create_task(self._probe_loop())
+        logger.info(
+            "Loop monitor started: interval=%.0fms, slow_threshold=%.0fms",
+            self._interval * 1000,
+            self._slow_threshold * 1000,
+        )
+
+    async def stop(self) -> None:
+        """Stop the probe and the watchdog thread."""
+        if self._probe_task and not self._probe_task.done():
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+        self._probe_task = None
+        self._stop_event.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        self._probe_due = None
+
+    # ── Lag probe ────────────────────────────────────────────────────
+
+    async def _probe_loop(self) -> None:
+        """Sleep for a fixed interval and record how late we woke up."""
+        while True:
+            expected = time.perf_counter() + self._interval
+            self._probe_seq += 1
+            seq = self._probe_seq
+            self._probe_due = (expected, seq)
+            await asyncio.sleep(self._interval)
+            self._probe_due = None
+            lag = max(0.0, time.perf_counter() - expected)
+            self._lag_samples.append(lag)
+            _LAG_HISTOGRAM.observe(lag)
+            if lag >= self._slow_threshold:
+                self._record_slow(seq, lag)
+
+    @property
+    def current_lag(self) -> float:
+        """Most recent lag sample in seconds (0.0 before the first sample)."""
+        return self._lag_samples[-1] if self._lag_samples else 0.0
+
+    def lag_percentile(self, q: float) -> float:
+        """Return the ``q`` (0..1) percentile of recent lag samples, in seconds."""
+        if not self._lag_samples:
+            return 0.0
+        ordered = sorted(self._lag_samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    # ── Slow-callback detection ──────────────────────────────────────
+
+    def _watchdog_loop(self) -> None:
+        """Sample the loop thread's stack while the probe is overdue."""
+        poll = max(self._slow_threshold / 2, 0.005)
+        while not self._stop_event.wait(poll):
+            due = self._probe_due
+            if due is None:
+                continue
+            expected, seq = due
+            if time.perf_counter() - expected < self._slow_threshold:
+                continue
+            if self._sampled is not None and self._sampled[0] == seq:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            self._sampled = (seq, self._format_stack(frame), self._attribute_frame(frame))
+
+    def _record_slow(self, seq: int, duration: float) -> None:
+        """Attribute a stall seen by probe ``seq`` and update offender statistics."""
+        sampled = self._sampled if self._sampled is not None and self._sampled[0] == seq else None
+        stack = sampled[1] if sampled else []
+        # Untracked code: fall back to the innermost function on the sample
+        label = (sampled[2] if sampled else None) or (stack[-1].rsplit(" in ", 1)[-1] if stack else "unsampled")
+
+        self._slow_count += 1
+        _SLOW_CALLBACKS.inc()
+        offender = self._offenders.get(label)
+        if offender is None:
+            offender = self._offenders[label] = _Offender(label)
+        offender.count += 1
+        offender.total_seconds += duration
+        offender.max_seconds = max(offender.max_seconds, duration)
+        if stack:
+            offender.last_stack = stack
+
+        logger.warning("Slow callback: handler=%s, stall=%.1fms", label, duration * 1000)
+
+    def _attribute_frame(self, frame: FrameType | None) -> str | None:
+        """Return the label of the innermost tracked function on a stack."""
+        while frame is not None:
+            label = self._tracked.get(frame.f_code)
+            if label is not None:
+                return label
+            frame = frame.f_back
+        return None
+
+    @staticmethod
+    def _format_stack(frame: FrameType) -> list[str]:
+        """Format a stack sample as ``file:line in func`` strings, innermost last."""
+        summary = traceback.extract_stack(frame, limit=STACK_SAMPLE_DEPTH)
+        return [f"{os.path.basename(fs.filename)}:{fs.lineno} in {fs.name}" for fs in summary]
+
+    # ── Reporting ────────────────────────────────────────────────────
+
+    def report(self, top: int = 10) -> dict[str, Any]:
+        """
+        Summarise loop health for the admin endpoint.
+
+        Args:
+            top: Number of offenders to include, ordered by total stall time.
+
+        Returns:
+            Dict with lag percentiles (ms), slow-callback totals and the
+            top offending handlers with their most recent stack sample.
+        """
+        offenders = sorted(self._offenders.values(), key=lambda o: o.total_seconds, reverse=True)
+        return {
+            "lag_ms": {
+                "current": round(self.current_lag * 1000, 2),
+                "p50": round(self.lag_percentile(0.50) * 1000, 2),
+                "p90": round(self.lag_percentile(0.90) * 1000, 2),
+                "p99": round(self.lag_percentile(0.99) * 1000, 2),
+                "max": round(max(self._lag_samples, default=0.0) * 1000, 2),
+                "samples": len(self._lag_samples),
+            },
+            "slow_callbacks": {
+                "threshold_ms": round(self._slow_threshold * 1000, 2),
+                "total": self._slow_count,
+            },
+            "top_offenders": [o.to_dict() for o in offenders[:top]],
+        }
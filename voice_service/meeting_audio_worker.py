@@ -13,20 +13,46 @@ import asyncio
 import base64
 import json
 import logging
+import os
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from typing import Any
 
-import aiohttp
-
 from aida_sdk.clients.acs_client import ACSClient
-from aida_sdk.clients.realtime_client import RealtimeClient
-from aida_sdk.config import settings
 
-from voice_service.voice_state import VoiceSession
-from voice_service.voice_tools import VOICE_TOOLS, execute_tool
-from voice_service.meeting_wake_word import WakeWordDetector
+from voice_service.admission import REALTIME_AVAILABILITY
+from voice_service.audio_codecs import (
+    REALTIME_PCM16_RATE,
+    available_codecs,
+    build_transcoders,
+    codec_rate,
+    get_codec,
+)
+from voice_service.audio_timeline import AudioTimeline
+from voice_service.call_reaper import CallReaper
+from voice_service.call_recorder import CallRecorder
+from voice_service.event_dispatch import EventTable
 from voice_service.meeting_state import MeetingSessionManager
+from voice_service.meeting_wake_word import (
+    PartialWakeMatcher,
+    WakeWordDetector,
+    record_wake_latency,
+)
+from voice_service.participant_tracker import PARTICIPANT_VAD_THRESHOLD_DBFS
+from voice_service.passive_transcription import PassiveTranscriber, Utterance
+from voice_service.pcm_ring import PcmRingBuffer
+from voice_service.playout import PlayoutBuffer
+from voice_service.realtime_session import ResilientRealtimeSession
+from voice_service.session_stats import SessionStats
+from voice_service.timer_wheel import Timer, get_timer_wheel
+from voice_service.tool_args import ToolArgumentError
+from voice_service.transcript_stream import get_stream_hub
+from voice_service.transcript_window import TRANSCRIPT_RETAIN_HOURS
+from voice_service.turn_latency import TurnLatencyTracker
+from voice_service.voice_metrics import REGISTRY
+from voice_service.voice_state import VoiceSession
+from voice_service.voice_tools import VOICE_TOOLS, execute_tool, parse_tool_arguments
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +63,50 @@ ACS_BYTES_PER_SAMPLE = 2
 # Persist transcript to data service every N entries
 TRANSCRIPT_PERSIST_INTERVAL = 5
 
+# End the call when ACS sends no media for this long (0 disables)
+CALL_IDLE_TIMEOUT_SECONDS = float(os.getenv("AIDA_CALL_IDLE_TIMEOUT_SECONDS", "120"))
+# End the call after this long regardless (0 disables)
+CALL_MAX_DURATION_SECONDS = float(os.getenv("AIDA_CALL_MAX_DURATION_SECONDS", "14400"))
+
+# Passive meeting audio kept and replayed to the Realtime API on activation (0 disables)
+WAKE_PREROLL_MS = int(os.getenv("AIDA_WAKE_PREROLL_MS", "5000"))
+# Pre-roll is replayed in appends of this much audio
+_PREROLL_CHUNK_MS = 200
+
+_PREROLL_SECONDS = REGISTRY.counter(
+    "aida_voice_preroll_replayed_seconds_total",
+    "Seconds of pre-roll meeting audio replayed to the Realtime API on activation.",
+)
+
+_TIMEOUTS = {
+    reason: REGISTRY.counter(
+        "aida_voice_call_timeouts_total",
+        "Calls ended by the worker's idle or maximum-duration timeout.",
+        labels={"reason": reason},
+    )
+    for reason in ("idle", "max_duration")
+}
+
+_REALTIME_LOST = {
+    reason: REGISTRY.counter(
+        "aida_voice_realtime_lost_calls_total",
+        "Calls ended because their Realtime session could not be kept or restored.",
+        labels={"reason": reason},
+    )
+    for reason in ("realtime_failed", "realtime_closed", "realtime_error")
+}
+
+# Speech spans (server VAD offsets) kept while awaiting their transcripts
+_MAX_SPEECH_SPANS = 64
+
+# Realtime API event handlers, registered on MeetingAudioWorker methods below.
+# Audio deltas are the bulk of the traffic and take the fast path.
+_realtime_events = EventTable(
+    "Realtime API",
+    fast_path="response.audio.delta",
+    metric_name="aida_voice_realtime_events_total",
+)
+
 
 @dataclass
 class CallContext:
@@ -84,13 +154,68 @@ class MeetingAudioWorker:
         self._session = session
         self._acs_client = acs_client
         self._meeting_manager = meeting_manager
-        self._realtime_client = RealtimeClient()
-        self._wake_word = WakeWordDetector()
+        self._wake_word = WakeWordDetector(on_deactivate=self._on_voice_deactivated)
+        # Wake word on interim passive transcripts, ahead of the utterance's final one
+        self._partial_wake = PartialWakeMatcher()
         self._ctx = CallContext()
+        self._latency = TurnLatencyTracker()
+        self._realtime_dispatch = _realtime_events.bind(self)
+        self._playout = PlayoutBuffer(self._send_frame_to_acs, sample_rate=ACS_SAMPLE_RATE)
+
+        if session.realtime_audio_format not in available_codecs():
+            logger.warning(
+                "Unknown Realtime audio format %r, using pcm16: session=%s",
+                session.realtime_audio_format,
+                session.session_id,
+            )
+            session.realtime_audio_format = "pcm16"
+        # Survives socket drops: buffers audio, reconnects, restores the conversation
+        realtime_codec = get_codec(session.realtime_audio_format)
+        self._realtime_client = ResilientRealtimeSession(
+            name=session.session_id,
+            bytes_per_second=codec_rate(realtime_codec, REALTIME_PCM16_RATE) * realtime_codec.bytes_per_sample,
+            sample_width=realtime_codec.bytes_per_sample,
+            history=self._replay_history,
+            on_reconnected=self._on_realtime_reconnected,
+        )
+        # ACS -> Realtime and Realtime -> ACS; rebuilt if ACS announces another rate
+        self._acs_sample_rate = ACS_SAMPLE_RATE
+        self._inbound, self._outbound = build_transcoders(ACS_SAMPLE_RATE, session.realtime_audio_format)
+        # Meeting audio heard while AIDA is not addressed goes to the notes only
+        self._passive = PassiveTranscriber(
+            self._on_passive_transcript,
+            sample_rate=ACS_SAMPLE_RATE,
+            on_interim=self._on_passive_interim if session.is_meeting_mode else None,
+        )
+        # Participant speech in Realtime input-buffer time, and server VAD
+        # spans (item_id -> [audio_start_ms, audio_end_ms]) to resolve against it
+        self._timeline = AudioTimeline(rate=ACS_SAMPLE_RATE)
+        self._speech_spans: dict[str, list[float | None]] = {}
+        # Recent passive meeting audio (fixed size), replayed on activation so a
+        # command spoken in the same breath as the wake word reaches the model;
+        # while _preroll_pending, live frames queue behind it
+        self._preroll: PcmRingBuffer | None = None
+        if session.is_meeting_mode and WAKE_PREROLL_MS > 0:
+            self._preroll = PcmRingBuffer(self._preroll_bytes(ACS_SAMPLE_RATE))
+        self._preroll_pending = False
+        # Created in start() for recorded sessions
+        self._recorder: CallRecorder | None = None
+        # Frames, bytes and rates per direction, tool latencies (/admin/sessions)
+        self._io = SessionStats()
+        # Timeouts on the process-wide timer wheel, armed in start()
+        self._idle_timer: Timer | None = None
+        self._max_duration_timer: Timer | None = None
+        # Ends calls with no human speech or no human left (armed in start())
+        self._reaper = CallReaper(self._on_reap)
+        self._end_task: asyncio.Task | None = None
 
         self._acs_to_realtime_task: asyncio.Task | None = None
         self._realtime_to_acs_task: asyncio.Task | None = None
+        # Closes the Realtime session when a meeting goes back to passive
+        self._realtime_close_task: asyncio.Task | None = None
         self._running = False
+        self._stopped = False
+        self._realtime_connected = False
 
     # ── Lifecycle ────────────────────────────────────────────────────
 
@@ -98,6 +223,10 @@ class MeetingAudioWorker:
         """
         Connect to the Realtime API and begin audio bridging.
 
+        A meeting session that starts passive defers the Realtime
+        connection until AIDA is addressed; until then its audio only
+        feeds passive transcription.
+
         Args:
             call_connection_id: Optional ACS call connection ID (may be
                 set later when the first ACS metadata message arrives).
@@ -111,29 +240,67 @@ class MeetingAudioWorker:
             self._session.call_connection_id,
         )
 
-        # Build system instructions
-        instructions = self._build_instructions()
+        if not self._session.is_meeting_mode or self._session.is_voice_active:
+            await self._connect_realtime()
 
-        # Connect to the OpenAI Realtime API
-        await self._realtime_client.connect(
-            instructions=instructions,
-            tools=VOICE_TOOLS,
-        )
+        if self._session.record:
+            self._recorder = CallRecorder(
+                self._session.call_connection_id or self._session.session_id,
+                sample_rate=self._acs_sample_rate,
+            )
 
         self._running = True
+        self._playout.start()
 
-        # TODO: Spawn the two bridging loops as background tasks
-        # self._realtime_to_acs_task = asyncio.create_task(self._realtime_to_acs_loop())
-        # The ACS->Realtime direction is driven by handle_acs_message/handle_acs_audio
-
-        # Start listening for Realtime API events
-        self._realtime_to_acs_task = asyncio.create_task(self._realtime_to_acs_loop())
+        wheel = get_timer_wheel()
+        if CALL_IDLE_TIMEOUT_SECONDS > 0:
+            self._idle_timer = wheel.schedule(CALL_IDLE_TIMEOUT_SECONDS, self._on_timeout, "idle")
+        if CALL_MAX_DURATION_SECONDS > 0:
+            self._max_duration_timer = wheel.schedule(CALL_MAX_DURATION_SECONDS, self._on_timeout, "max_duration")
+        self._reaper.start()
 
         logger.info("Audio worker started: session=%s", self._session.session_id)
 
+    async def _connect_realtime(self) -> None:
+        """Open the Realtime API session and start its event loop."""
+        # Build system instructions
+        instructions = self._build_instructions()
+
+        # Connect to the OpenAI Realtime API (outcome feeds admission control)
+        try:
+            await self._realtime_client.connect(
+                instructions=instructions,
+                tools=VOICE_TOOLS,
+            )
+        except Exception:
+            REALTIME_AVAILABILITY.record_failure()
+            raise
+        REALTIME_AVAILABILITY.record_success()
+        self._realtime_connected = True
+        await self._negotiate_audio_format()
+
+        # The ACS->Realtime direction is driven by handle_acs_message/handle_acs_audio;
+        # listen for Realtime API events in the background.
+        self._realtime_to_acs_task = asyncio.create_task(self._realtime_to_acs_loop())
+
     async def stop(self) -> None:
-        """Cancel loops, close Realtime API connection, persist transcript."""
+        """
+        Cancel loops, close Realtime API connection, persist transcript.
+
+        Idempotent: the gateway (socket closed) and the CallDisconnected
+        webhook can both stop the same worker, and the transcript must
+        only be persisted and post-processed once.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
         self._running = False
+        for timer in (self._idle_timer, self._max_duration_timer):
+            if timer is not None:
+                timer.cancel()
+        self._reaper.close()
+        self._wake_word.close()
+        await self._playout.stop()
 
         # Cancel background tasks
         for task in [self._acs_to_realtime_task, self._realtime_to_acs_task]:
@@ -144,11 +311,27 @@ class MeetingAudioWorker:
                 except asyncio.CancelledError:
                     pass
 
-        # Persist final transcript
-        await self._persist_transcript()
+        # Finalise the recording; transcribe the passive backlog, then persist the final transcript
+        if self._recorder is not None:
+            paths = await self._recorder.close()
+            logger.info("Recording finalised: session=%s, files=%s", self._session.session_id, paths)
+        await self._passive.close()
+        transcript = self._session.transcript_entries
+        if not await self._persist_transcript() and TRANSCRIPT_RETAIN_HOURS > 0:
+            # Not persisted: keep the spilled transcript for the startup sweep to expire
+            kept = await asyncio.to_thread(transcript.retain)
+            if kept:
+                logger.warning(
+                    "Transcript not persisted, kept on disk: session=%s, path=%s", self._session.session_id, kept
+                )
+        transcript.close()
+        get_stream_hub().end_session(self._session.session_id)
 
         # Close Realtime API connection
-        await self._realtime_client.close()
+        if self._realtime_close_task is not None:
+            await self._realtime_close_task
+        if self._realtime_connected:
+            await self._realtime_client.close()
 
         # Trigger post-processing if this was a meeting
         if self._session.meeting_id:
@@ -177,9 +360,9 @@ class MeetingAudioWorker:
         kind = message.get("kind", "")
 
         if kind == "AudioMetadata":
-            # Extract audio format info
-            # TODO: Validate sample rate matches our expected 24kHz/16-bit
-            logger.info("ACS AudioMetadata received: %s", json.dumps(message.get("audioMetadata", {})))
+            metadata = message.get("audioMetadata", {})
+            logger.info("ACS AudioMetadata received: %s", json.dumps(metadata))
+            self._set_acs_sample_rate(int(metadata.get("sampleRate") or ACS_SAMPLE_RATE))
 
         elif kind == "AudioData":
             # Forward audio to Realtime API
@@ -187,12 +370,22 @@ class MeetingAudioWorker:
             audio_b64 = audio_data.get("data", "")
             if audio_b64:
                 audio_bytes = base64.b64decode(audio_b64)
-                await self._forward_audio_to_realtime(audio_bytes)
+                is_silent = audio_data.get("silent", False)
+                self._io.inbound.add(len(audio_bytes), time.monotonic())
+                if self._idle_timer is not None:
+                    self._idle_timer.reset()
+                if self._recorder is not None:
+                    self._recorder.write_inbound(audio_bytes)
 
                 # Track speaker if participant info is present
+                level_dbfs = None
                 participant_raw_id = audio_data.get("participantRawId", "")
                 if participant_raw_id:
                     self._ctx.last_speaker_raw_id = participant_raw_id
+                    level_dbfs = self._session.participant_activity.update(participant_raw_id, audio_bytes, is_silent)
+                level_dbfs = self._reaper.audio(audio_bytes, is_silent, level_dbfs)
+
+                await self._forward_audio_to_realtime(audio_bytes, is_silent=is_silent, level_dbfs=level_dbfs)
 
         elif kind == "StoppedMediaStreaming":
             logger.info("ACS media streaming stopped")
@@ -208,42 +401,122 @@ class MeetingAudioWorker:
         Args:
             data: Raw PCM audio bytes.
         """
-        await self._forward_audio_to_realtime(data)
+        self._io.inbound.add(len(data), time.monotonic())
+        if self._idle_timer is not None:
+            self._idle_timer.reset()
+        if self._recorder is not None:
+            self._recorder.write_inbound(data)
+        level_dbfs = self._reaper.audio(data, False, None)
+        await self._forward_audio_to_realtime(data, level_dbfs=level_dbfs)
 
     # ── ACS -> Realtime ──────────────────────────────────────────────
 
-    async def _forward_audio_to_realtime(self, audio_bytes: bytes) -> None:
+    async def _forward_audio_to_realtime(
+        self, audio_bytes: bytes, is_silent: bool = False, level_dbfs: float | None = None
+    ) -> None:
         """
         Forward PCM audio from ACS to the Realtime API.
 
         In meeting mode, audio is only forwarded when voice is active
-        (wake word detected).  In direct call mode, audio is always
-        forwarded.
+        (wake word detected); otherwise it goes to passive
+        transcription.  In direct call mode, audio is always forwarded.
 
         Args:
             audio_bytes: Raw PCM16 audio data from ACS.
+            is_silent: ACS flagged the frame as silence (not counted as
+                caller speech for turn latency).
+            level_dbfs: Frame level if already computed by the
+                participant tracker (reused by the passive VAD).
         """
         if not self._running:
             return
 
         # In meeting mode, only forward when voice is active (wake word detected)
+        preroll = self._preroll
         if self._session.is_meeting_mode and not self._session.is_voice_active:
-            # TODO: Still transcribe for meeting notes, just don't send to Realtime API
+            if preroll is not None:
+                preroll.write(audio_bytes)
+            self._passive.push(audio_bytes, self._ctx.last_speaker_raw_id, is_silent, level_dbfs)
+            return
+        if not self._realtime_connected or self._preroll_pending:
+            # Activation in progress: hold the frame for the pre-roll replay
+            if preroll is not None and self._preroll_pending:
+                preroll.write(audio_bytes)
             return
 
-        # Handle barge-in: if user starts speaking while AIDA is responding,
-        # send StopAudio to ACS and truncate the Realtime API response
-        # TODO: Implement barge-in detection using VAD energy levels
-        # TODO: Send conversation.item.truncate to Realtime API
-        # TODO: Send StopAudio to ACS WebSocket
+        # Barge-in is driven by server VAD: input_audio_buffer.speech_started
+        # while the playout buffer is active triggers _barge_in().
+
+        samples = len(audio_bytes) // ACS_BYTES_PER_SAMPLE
+        if not self._inbound.passthrough:
+            audio_bytes = self._inbound.convert(audio_bytes)
 
         try:
             await self._realtime_client.send_audio(audio_bytes)
         except Exception:
             logger.exception("Failed to forward audio to Realtime API")
+            return
+
+        # The Realtime API's speech offsets count the audio it received
+        voiced = level_dbfs is not None and level_dbfs >= PARTICIPANT_VAD_THRESHOLD_DBFS
+        self._timeline.append(samples, self._acs_sample_rate, self._ctx.last_speaker_raw_id if voiced else "")
+
+        if not is_silent:
+            self._latency.mark_user_audio()
+
+    # ── Audio format negotiation ─────────────────────────────────────
+
+    async def _negotiate_audio_format(self) -> None:
+        """Switch the Realtime session to the session's audio format if it is not the default."""
+        audio_format = self._session.realtime_audio_format
+        if audio_format == "pcm16":
+            return
+        await self._realtime_client.send_event({
+            "type": "session.update",
+            "session": {"input_audio_format": audio_format, "output_audio_format": audio_format},
+        })
+        logger.info("Realtime audio format: %s (%s)", audio_format, self._inbound)
+
+    def _set_acs_sample_rate(self, sample_rate: int) -> None:
+        """Rebuild the transcoders for the PCM16 rate ACS announced."""
+        if sample_rate == self._acs_sample_rate:
+            return
+        if sample_rate <= 0:
+            logger.warning("Ignoring invalid ACS sample rate: %d", sample_rate)
+            return
+        self._acs_sample_rate = sample_rate
+        self._inbound, self._outbound = build_transcoders(sample_rate, self._session.realtime_audio_format)
+        self._playout.set_sample_rate(sample_rate)
+        self._passive.set_sample_rate(sample_rate)
+        if self._preroll is not None:
+            self._preroll = PcmRingBuffer(self._preroll_bytes(sample_rate))
+        self._session.participant_activity.set_sample_rate(sample_rate)
+        if self._recorder is not None:
+            self._recorder.set_sample_rate(sample_rate)
+        logger.info("ACS audio at %d Hz: inbound=%s, outbound=%s", sample_rate, self._inbound, self._outbound)
 
     # ── Realtime -> ACS ──────────────────────────────────────────────
 
+    async def _disconnect_realtime(self) -> None:
+        """
+        Close the Realtime session of a meeting that went back to passive.
+
+        The event loop is cancelled first, so the closed session does not
+        read as lost.  ``_activate_voice`` opens a new one on the next
+        wake word; its audio offsets start at zero.
+        """
+        task, self._realtime_to_acs_task = self._realtime_to_acs_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._realtime_client.close()
+        self._timeline.rebase(0)
+        self._speech_spans.clear()
+        logger.info("Realtime session closed on deactivation: session=%s", self._session.session_id)
+
     async def _realtime_to_acs_loop(self) -> None:
         """
         Read events from the Realtime API and route them appropriately.
@@ -261,78 +534,195 @@ class MeetingAudioWorker:
             raise
         except Exception:
             logger.exception("Realtime-to-ACS loop error: session=%s", self._session.session_id)
+            self._on_realtime_lost("realtime_error")
+        else:
+            if self._running:
+                # Reconnection gave up: the caller would be left in silence
+                self._on_realtime_lost("realtime_failed" if self._realtime_client.failed else "realtime_closed")
 
     async def _handle_realtime_event(self, event: dict[str, Any]) -> None:
         """
         Dispatch a single Realtime API event.
 
+        Routing goes through the ``_realtime_events`` table; audio deltas
+        take the dispatcher's fast path.  Handlers that never await are
+        plain methods so no coroutine is created for them.  Per-type
+        counts and handler time are available via ``get_stats()``.
+
         Args:
             event: Parsed JSON event from the Realtime API WebSocket.
         """
-        event_type = event.get("type", "")
+        pending = self._realtime_dispatch.dispatch(event.get("type", ""), event)
+        if pending is not None:
+            await pending
 
-        # ── Session events ───────────────────────────────────────────
-        if event_type == "session.created":
-            logger.info("Realtime session created: %s", event.get("session", {}).get("id", ""))
+    # ── Realtime reconnect ───────────────────────────────────────────
 
-        elif event_type == "session.updated":
-            logger.debug("Realtime session updated")
+    def _replay_history(self) -> list[tuple[str, str]]:
+        """The in-memory (recent) transcript as ``(role, text)`` pairs for restoring a new connection."""
+        return [
+            ("assistant", entry["text"]) if entry["speaker"] == "AIDA"
+            else ("user", f"{entry['speaker']}: {entry['text']}")
+            for entry in self._session.transcript_entries.window
+        ]
 
-        # ── Audio output ─────────────────────────────────────────────
-        elif event_type == "response.audio.delta":
-            # Forward audio to ACS WebSocket
-            audio_b64 = event.get("delta", "")
-            if audio_b64 and self._session.acs_ws:
-                await self._send_audio_to_acs(audio_b64)
-            self._ctx.is_speaking = True
+    def _on_realtime_reconnected(self, replayed_ms: float) -> None:
+        """
+        Rebase offset-keyed state on a new Realtime connection.
 
-        elif event_type == "response.audio.done":
-            self._ctx.is_speaking = False
+        Its audio offsets start at the first replayed sample, and the
+        speech items of the lost connection will never complete.
+        """
+        self._timeline.rebase(replayed_ms)
+        self._speech_spans.clear()
 
-        # ── Text output (for transcript) ─────────────────────────────
-        elif event_type == "response.audio_transcript.delta":
-            self._ctx.accumulated_text += event.get("delta", "")
+    # ── Session events ───────────────────────────────────────────────
 
-        elif event_type == "response.audio_transcript.done":
-            transcript_text = event.get("transcript", self._ctx.accumulated_text)
-            if transcript_text.strip():
-                self._session.add_transcript_entry("AIDA", transcript_text.strip())
-                self._ctx.entries_since_persist += 1
-                await self._maybe_persist_transcript()
-            self._ctx.accumulated_text = ""
+    @_realtime_events.on("session.created")
+    def _on_session_created(self, event: dict[str, Any]) -> None:
+        logger.info("Realtime session created: %s", event.get("session", {}).get("id", ""))
 
-        # ── User speech transcript ───────────────────────────────────
-        elif event_type == "conversation.item.input_audio_transcription.completed":
-            user_text = event.get("transcript", "")
-            if user_text.strip():
-                speaker = self._session.get_speaker_name(self._ctx.last_speaker_raw_id)
-                self._session.add_transcript_entry(speaker, user_text.strip())
-                self._ctx.entries_since_persist += 1
+    @_realtime_events.on("session.updated")
+    def _on_session_updated(self, event: dict[str, Any]) -> None:
+        logger.debug("Realtime session updated")
 
-                # Check for wake word in meeting mode
-                if self._session.is_meeting_mode:
-                    self._wake_word.check_transcript(user_text)
+    @_realtime_events.on("rate_limits.updated")
+    def _on_rate_limits_updated(self, event: dict[str, Any]) -> None:
+        logger.debug("Realtime rate limits: %s", event.get("rate_limits", []))
 
-                await self._maybe_persist_transcript()
+    # ── Audio output ─────────────────────────────────────────────────
 
-        # ── Tool calls ───────────────────────────────────────────────
-        elif event_type == "response.function_call_arguments.done":
-            await self._handle_tool_call(event)
+    @_realtime_events.on("response.audio.delta")
+    def _on_audio_delta(self, event: dict[str, Any]) -> None:
+        # Queue for paced playout to the ACS WebSocket
+        item_id = event.get("item_id", "")
+        if self._playout.discards(item_id):
+            # Still in flight from the model when the caller barged in
+            return
+        self._latency.mark_first_delta()
+        audio_b64 = event.get("delta", "")
+        if audio_b64 and self._session.acs_ws:
+            audio = base64.b64decode(audio_b64)
+            if not self._outbound.passthrough:
+                audio = self._outbound.convert(audio)
+            self._playout.enqueue(audio, item_id)
+        self._ctx.is_speaking = True
+
+    @_realtime_events.on("response.audio.done")
+    def _on_audio_done(self, event: dict[str, Any]) -> None:
+        self._playout.end_item()
+        self._ctx.is_speaking = False
+        self._wake_word.touch()
+
+    # ── Text output (for transcript) ─────────────────────────────────
+
+    @_realtime_events.on("response.audio_transcript.delta")
+    def _on_audio_transcript_delta(self, event: dict[str, Any]) -> None:
+        self._ctx.accumulated_text += event.get("delta", "")
+
+    @_realtime_events.on("response.audio_transcript.done")
+    async def _on_audio_transcript_done(self, event: dict[str, Any]) -> None:
+        transcript_text = event.get("transcript", self._ctx.accumulated_text)
+        if transcript_text.strip():
+            self._session.add_transcript_entry("AIDA", transcript_text.strip())
+            self._ctx.entries_since_persist += 1
+            await self._maybe_persist_transcript()
+        self._ctx.accumulated_text = ""
+
+    # ── Input buffer (server VAD) ────────────────────────────────────
+
+    @_realtime_events.on("input_audio_buffer.speech_started")
+    async def _on_speech_started(self, event: dict[str, Any]) -> None:
+        logger.debug("Speech started: item=%s, at=%sms", event.get("item_id", ""), event.get("audio_start_ms"))
+        item_id = event.get("item_id", "")
+        start_ms = event.get("audio_start_ms")
+        if item_id and start_ms is not None:
+            if len(self._speech_spans) >= _MAX_SPEECH_SPANS:
+                self._speech_spans.pop(next(iter(self._speech_spans)))
+            self._speech_spans[item_id] = [start_ms, None]
+        self._wake_word.touch()
+        if self._playout.active:
+            await self._barge_in()
+
+    @_realtime_events.on("input_audio_buffer.speech_stopped")
+    def _on_speech_stopped(self, event: dict[str, Any]) -> None:
+        logger.debug("Speech stopped: item=%s, at=%sms", event.get("item_id", ""), event.get("audio_end_ms"))
+        span = self._speech_spans.get(event.get("item_id", ""))
+        if span is not None:
+            span[1] = event.get("audio_end_ms")
+
+    @_realtime_events.on("input_audio_buffer.committed")
+    def _on_input_committed(self, event: dict[str, Any]) -> None:
+        self._latency.mark_committed()
+
+    # ── User speech transcript ───────────────────────────────────────
+
+    @_realtime_events.on("conversation.item.input_audio_transcription.completed")
+    async def _on_input_transcription_completed(self, event: dict[str, Any]) -> None:
+        # Only arrives while voice is active: the wake word is matched on passive transcripts
+        user_text = event.get("transcript", "")
+        span = self._speech_spans.pop(event.get("item_id", ""), None)
+        if user_text.strip():
+            speaker = self._session.get_speaker_name(self._speaker_for_span(span))
+            self._session.add_transcript_entry(speaker, user_text.strip())
+            self._ctx.entries_since_persist += 1
+            await self._maybe_persist_transcript()
+            # "Thanks AIDA": back to passive, which closes the Realtime session
+            if self._session.is_meeting_mode and self._wake_word.check_deactivate(user_text):
+                self._wake_word.deactivate(self._session)
+
+    def _speaker_for_span(self, span: list[float | None] | None) -> str:
+        """Dominant participant over a server VAD span (last frame's sender as fallback)."""
+        if span is not None:
+            start_ms, end_ms = span
+            if end_ms is None:
+                end_ms = self._timeline.position_ms
+            speaker = self._timeline.dominant_speaker(start_ms, end_ms)
+            if speaker:
+                return speaker
+        return self._ctx.last_speaker_raw_id
+
+    @_realtime_events.on("conversation.item.input_audio_transcription.failed")
+    def _on_input_transcription_failed(self, event: dict[str, Any]) -> None:
+        self._speech_spans.pop(event.get("item_id", ""), None)
+        logger.warning(
+            "Input transcription failed: item=%s, error=%s",
+            event.get("item_id", ""),
+            event.get("error", {}),
+        )
 
-        # ── Response lifecycle ───────────────────────────────────────
-        elif event_type == "response.created":
-            self._ctx.current_response_id = event.get("response", {}).get("id", "")
+    # ── Tool calls ───────────────────────────────────────────────────
 
-        elif event_type == "response.done":
-            self._ctx.current_response_id = ""
-            self._ctx.current_item_id = ""
+    @_realtime_events.on("response.function_call_arguments.done")
+    async def _on_function_call_arguments_done(self, event: dict[str, Any]) -> None:
+        await self._handle_tool_call(event)
 
-        # ── Error handling ───────────────────────────────────────────
-        elif event_type == "error":
-            logger.error("Realtime API error: %s", event.get("error", {}))
+    # ── Response lifecycle ───────────────────────────────────────────
 
-        else:
-            logger.debug("Unhandled Realtime event: %s", event_type)
+    @_realtime_events.on("response.created")
+    def _on_response_created(self, event: dict[str, Any]) -> None:
+        self._ctx.current_response_id = event.get("response", {}).get("id", "")
+        self._latency.mark_response_created()
+        self._wake_word.touch()
+
+    @_realtime_events.on("response.output_item.added")
+    def _on_output_item_added(self, event: dict[str, Any]) -> None:
+        # Remember the assistant item being spoken (barge-in truncation target)
+        item = event.get("item", {})
+        if item.get("type") == "message":
+            self._ctx.current_item_id = item.get("id", "")
+
+    @_realtime_events.on("response.done")
+    def _on_response_done(self, event: dict[str, Any]) -> None:
+        self._ctx.current_response_id = ""
+        self._ctx.current_item_id = ""
+        self._latency.mark_response_done()
+
+    # ── Error handling ───────────────────────────────────────────────
+
+    @_realtime_events.on("error")
+    def _on_error(self, event: dict[str, Any]) -> None:
+        logger.error("Realtime API error: %s", event.get("error", {}))
 
     # ── Tool Execution ───────────────────────────────────────────────
 
@@ -349,33 +739,70 @@ class MeetingAudioWorker:
 
         logger.info("Tool call: name=%s, call_id=%s", tool_name, call_id)
 
+        started = time.perf_counter()
+        self._ctx.pending_tool_calls[call_id] = {"name": tool_name, "started": started}
+        ok = False
         try:
-            args = json.loads(arguments_str)
-        except json.JSONDecodeError:
-            args = {}
-
-        try:
+            # Invalid arguments go straight back to the model to correct
+            args = parse_tool_arguments(tool_name, arguments_str)
             result = await execute_tool(tool_name, args, self._session)
             result_str = json.dumps(result) if isinstance(result, dict) else str(result)
+            ok = True
+        except ToolArgumentError as exc:
+            logger.info("Invalid tool arguments: %s", exc)
+            result_str = json.dumps(exc.to_result())
         except Exception:
             logger.exception("Tool execution failed: %s", tool_name)
             result_str = json.dumps({"error": f"Tool '{tool_name}' execution failed"})
+        finally:
+            self._ctx.pending_tool_calls.pop(call_id, None)
+            self._io.record_tool(tool_name, (time.perf_counter() - started) * 1000, ok)
+
+        # Send the tool result back to the Realtime API (dropped if the
+        # connection was lost meanwhile — the call belonged to it)
+        sent = await self._realtime_client.send_event({
+            "type": "conversation.item.create",
+            "item": {
+                "type": "function_call_output",
+                "call_id": call_id,
+                "output": result_str,
+            },
+        })
+        if sent:
+            await self._realtime_client.send_event({"type": "response.create"})
+
+    # ── Audio Output to ACS ──────────────────────────────────────────
 
-        # Send the tool result back to the Realtime API
-        # TODO: Use the RealtimeClient to send conversation.item.create
-        #       with type=function_call_output and trigger response.create
-        if self._realtime_client._ws and not self._realtime_client._ws.closed:
-            await self._realtime_client._ws.send_json({
-                "type": "conversation.item.create",
-                "item": {
-                    "type": "function_call_output",
-                    "call_id": call_id,
-                    "output": result_str,
-                },
+    async def _barge_in(self) -> None:
+        """
+        The caller started talking over AIDA: drop unplayed audio, tell
+        ACS to discard what it has buffered, and truncate the assistant
+        item at the point the caller actually heard.
+        """
+        item_id, played_ms = self._playout.flush()
+        self._ctx.is_speaking = False
+        logger.info("Barge-in: session=%s, item=%s, played_ms=%d", self._session.session_id, item_id, played_ms)
+
+        if self._session.acs_ws and not self._session.acs_ws.closed:
+            try:
+                await self._session.acs_ws.send_str(json.dumps({"kind": "StopAudio", "stopAudio": {}}))
+            except Exception:
+                logger.exception("Failed to send StopAudio to ACS WebSocket")
+
+        if item_id:
+            await self._realtime_client.send_event({
+                "type": "conversation.item.truncate",
+                "item_id": item_id,
+                "content_index": 0,
+                "audio_end_ms": played_ms,
             })
-            await self._realtime_client._ws.send_json({"type": "response.create"})
 
-    # ── Audio Output to ACS ──────────────────────────────────────────
+    async def _send_frame_to_acs(self, frame: bytes) -> None:
+        """Send one paced PCM frame from the playout buffer to ACS."""
+        self._io.outbound.add(len(frame), time.monotonic())
+        if self._recorder is not None:
+            self._recorder.write_outbound(frame)
+        await self._send_audio_to_acs(base64.b64encode(frame).decode("ascii"))
 
     async def _send_audio_to_acs(self, audio_b64: str) -> None:
         """
@@ -399,6 +826,171 @@ class MeetingAudioWorker:
             await self._session.acs_ws.send_str(message)
         except Exception:
             logger.exception("Failed to send audio to ACS WebSocket")
+            return
+        self._latency.mark_first_acs_byte()
+
+    # ── Passive meeting transcription ────────────────────────────────
+
+    async def _on_passive_transcript(self, utterance: Utterance, text: str) -> None:
+        """Add a passively transcribed utterance to the notes; activate on the wake word."""
+        speaker = self._session.get_speaker_name(utterance.speaker_raw_id)
+        self._session.add_transcript_entry(speaker, text, timestamp=utterance.started_at.isoformat())
+        self._ctx.entries_since_persist += 1
+        # An interim transcript of this utterance may already have activated
+        woke_on_interim = self._partial_wake.complete(f"passive-{utterance.segment}")
+        if not self._session.is_voice_active and not woke_on_interim and self._wake_word.check_transcript(text):
+            await self._activate_voice("passive", (datetime.now(UTC) - utterance.started_at).total_seconds())
+        await self._maybe_persist_transcript()
+
+    async def _on_passive_interim(self, utterance: Utterance, text: str) -> None:
+        """Activate as soon as the wake word appears in an utterance still being spoken."""
+        if self._session.is_voice_active or self._stopped:
+            return
+        if self._partial_wake.update(f"passive-{utterance.segment}", text):
+            await self._activate_voice("partial", (datetime.now(UTC) - utterance.started_at).total_seconds())
+
+    async def _activate_voice(self, source: str = "", elapsed: float | None = None) -> None:
+        """
+        Switch a passive meeting session to the Realtime API.
+
+        Args:
+            source: Where the wake word was heard (``partial`` for an
+                interim transcript, ``passive`` for a final one), for
+                the latency metric.
+            elapsed: Seconds from the start of that utterance to now.
+        """
+        was_active = self._session.is_voice_active
+        if source and elapsed is not None and not was_active:
+            record_wake_latency(source, elapsed)
+        self._passive.end_segment()
+        self._wake_word.activate(self._session)
+        if was_active or self._stopped:
+            return
+        if self._preroll is not None:
+            self._trim_preroll(elapsed)
+            self._preroll_pending = True
+        try:
+            if self._realtime_close_task is not None:
+                # Still closing the session of the previous activation
+                await self._realtime_close_task
+            if not self._realtime_connected:
+                try:
+                    await self._connect_realtime()
+                except Exception:
+                    logger.exception("Realtime connect on activation failed: session=%s", self._session.session_id)
+                    self._wake_word.deactivate(self._session)
+                    return
+            if self._preroll is not None:
+                await self._replay_preroll()
+        finally:
+            self._preroll_pending = False
+
+    def _on_voice_deactivated(self, session: VoiceSession) -> None:
+        """Wake word detector callback: release the Realtime session until the next wake word."""
+        if not session.is_meeting_mode or not self._realtime_connected or self._stopped:
+            return
+        self._realtime_connected = False
+        self._realtime_close_task = asyncio.create_task(self._disconnect_realtime())
+
+    # ── Pre-roll ─────────────────────────────────────────────────────
+
+    @staticmethod
+    def _preroll_bytes(sample_rate: int) -> int:
+        return WAKE_PREROLL_MS * sample_rate // 1000 * ACS_BYTES_PER_SAMPLE
+
+    def _trim_preroll(self, elapsed: float | None) -> None:
+        """Keep only the audio since the utterance with the wake word began (all if unknown)."""
+        if elapsed is None:
+            return
+        keep = int(max(0.0, elapsed) * self._acs_sample_rate) * ACS_BYTES_PER_SAMPLE
+        self._preroll.skip(len(self._preroll) - keep)
+
+    def _preroll_ms(self) -> int:
+        if self._preroll is None:
+            return 0
+        return len(self._preroll) * 1000 // (self._acs_sample_rate * ACS_BYTES_PER_SAMPLE)
+
+    async def _replay_preroll(self) -> None:
+        """
+        Send the held pre-roll to the Realtime API ahead of live audio.
+
+        Frames arriving meanwhile are appended to the ring (see
+        ``_forward_audio_to_realtime``) and drained by the same loop, so
+        the model hears the audio in order.
+        """
+        ring = self._preroll
+        chunk_bytes = self._acs_sample_rate * _PREROLL_CHUNK_MS // 1000 * ACS_BYTES_PER_SAMPLE
+        replayed = 0
+        while len(ring) and self._realtime_connected and not self._stopped:
+            pcm = ring.read(chunk_bytes)
+            samples = len(pcm) // ACS_BYTES_PER_SAMPLE
+            if not self._inbound.passthrough:
+                pcm = self._inbound.convert(pcm)
+            try:
+                await self._realtime_client.send_audio(pcm)
+            except Exception:
+                logger.exception("Failed to replay pre-roll to Realtime API")
+                break
+            self._timeline.append(samples, self._acs_sample_rate, "")
+            replayed += samples
+        ring.clear()
+        if replayed:
+            seconds = replayed / self._acs_sample_rate
+            _PREROLL_SECONDS.inc(seconds)
+            logger.info("Replayed %.1fs of pre-roll: session=%s", seconds, self._session.session_id)
+
+    # ── Timeouts ─────────────────────────────────────────────────────
+
+    def _on_timeout(self, reason: str) -> None:
+        """Timer wheel callback: the call went idle or ran too long."""
+        if self._stopped or self._end_task is not None:
+            return
+        logger.warning("Call timeout (%s): session=%s", reason, self._session.session_id)
+        _TIMEOUTS[reason].inc()
+        self._end_task = asyncio.create_task(self._end_call(reason))
+
+    def _on_reap(self, reason: str) -> None:
+        """Reaper callback: no human speech, or no human left, for too long."""
+        if self._stopped or self._end_task is not None:
+            return
+        logger.warning(
+            "Reaping call (%s): session=%s, humans=%s",
+            reason, self._session.session_id, self._reaper.humans,
+        )
+        self._end_task = asyncio.create_task(self._end_call(reason))
+
+    def _on_realtime_lost(self, reason: str) -> None:
+        """
+        The Realtime session is gone for good: end the call instead of
+        leaving the caller in silence.  Failed reconnect attempts have
+        already been reported to the admission circuit.
+        """
+        if self._stopped or self._end_task is not None:
+            return
+        logger.error("Realtime session lost (%s), ending call: session=%s", reason, self._session.session_id)
+        _REALTIME_LOST[reason].inc()
+        self._end_task = asyncio.create_task(self._end_call(reason))
+
+    def update_participants(self, humans: int) -> None:
+        """Apply a ``ParticipantsUpdated`` head count (bot and on-hold excluded)."""
+        self._reaper.participants(humans)
+
+    async def _end_call(self, reason: str) -> None:
+        """Hang up the ACS call, then stop through the normal path."""
+        call_connection_id = self._session.call_connection_id
+        if call_connection_id:
+            try:
+                await self._acs_client.hang_up(call_connection_id)
+            except Exception:
+                logger.exception("Hang-up failed (%s): call=%s", reason, call_connection_id)
+        await self.stop()
+        # Ends the gateway's receive loop if ACS has not closed the media socket itself
+        acs_ws = self._session.acs_ws
+        if acs_ws is not None and not acs_ws.closed:
+            try:
+                await acs_ws.close()
+            except Exception:
+                logger.exception("Failed to close ACS WebSocket: session=%s", self._session.session_id)
 
     # ── Transcript Persistence ───────────────────────────────────────
 
@@ -408,7 +1000,7 @@ class MeetingAudioWorker:
             await self._persist_transcript()
             self._ctx.entries_since_persist = 0
 
-    async def _persist_transcript(self) -> None:
+    async def _persist_transcript(self) -> bool:
         """
         Persist the current transcript to the data service.
 
@@ -416,18 +1008,97 @@ class MeetingAudioWorker:
         entries) and once at call end.  This ensures transcript data survives
         crashes — the CallDisconnected event may fire before the worker
         finishes processing.
+
+        Returns:
+            True once the transcript is stored (or empty).  Otherwise
+            ``stop()`` retains the spill file if
+            ``AIDA_TRANSCRIPT_RETAIN_HOURS`` is set.
         """
         if not self._session.transcript_entries:
-            return
+            return True
 
-        # TODO: POST to aida-data service:
+        # TODO: POST to aida-data service (read entries with
+        #   ``await transcript_entries.read()``, never by iterating on the loop):
         #   POST {DATA_SERVICE_URL}/api/transcripts/{meeting_id}
         #   Body: { "entries": [...], "session_id": ..., "is_final": false }
+        #   and return True on success.
         logger.info(
             "Persisting transcript: session=%s, entries=%d",
             self._session.session_id,
             len(self._session.transcript_entries),
         )
+        return False
+
+    # ── Stats ────────────────────────────────────────────────────────
+
+    def _mode(self) -> dict[str, Any]:
+        if self._stopped:
+            state = "stopped"
+        elif self._realtime_connected:
+            state = self._realtime_client.stats()["state"]
+        else:
+            state = "not_connected"
+        return {
+            "meeting_mode": self._session.is_meeting_mode,
+            "voice_active": self._session.is_voice_active,
+            "realtime": state,
+            "speaking": self._ctx.is_speaking,
+        }
+
+    def _queues(self) -> dict[str, Any]:
+        return {
+            "playout_buffered_ms": self._playout.buffered_ms,
+            "playout_in_flight_ms": self._playout.in_flight_ms(),
+            "realtime_buffered_ms": self._realtime_client.stats()["buffered_ms"] if self._realtime_connected else 0,
+            "passive_pending": self._passive.stats()["pending"],
+            "preroll_ms": self._preroll_ms(),
+            "pending_tool_calls": len(self._ctx.pending_tool_calls),
+        }
+
+    def get_summary(self) -> dict[str, Any]:
+        """One ``/admin/sessions`` row: mode, audio rates and queue depths."""
+        now = time.monotonic()
+        return {
+            "session_id": self._session.session_id,
+            "call_connection_id": self._session.call_connection_id,
+            "mode": self._mode(),
+            "inbound_fps": round(self._io.inbound.frames_per_second(now), 1),
+            "outbound_fps": round(self._io.outbound.frames_per_second(now), 1),
+            "seconds_since_audio": self._io.seconds_since_audio(now),
+            "queues": self._queues(),
+        }
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Return per-session runtime statistics.
+
+        Returns:
+            Dict with the mode, audio throughput per direction, queue
+            depths, tool latencies, the turn latency summary, per-type
+            Realtime event counts / cumulative handler time, and the
+            negotiated audio path for this session.
+        """
+        return {
+            "session_id": self._session.session_id,
+            "call_connection_id": self._session.call_connection_id,
+            "mode": self._mode(),
+            "io": self._io.snapshot(),
+            "queues": self._queues(),
+            "latency": self._latency.snapshot(),
+            "realtime_events": self._realtime_dispatch.stats(),
+            "audio": {
+                "acs_sample_rate": self._acs_sample_rate,
+                "realtime_format": self._session.realtime_audio_format,
+                "inbound": repr(self._inbound),
+                "outbound": repr(self._outbound),
+            },
+            "passive_transcription": self._passive.stats(),
+            "timeline": self._timeline.stats(),
+            "transcript": self._session.transcript_entries.stats(),
+            "recording": self._recorder.stats() if self._recorder is not None else None,
+            "reaper": self._reaper.stats(),
+            "realtime": self._realtime_client.stats() if self._realtime_connected else None,
+        }
 
     # ── Helpers ──────────────────────────────────────────────────────
 
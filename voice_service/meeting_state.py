@@ -9,7 +9,7 @@ the intelligence service when a meeting ends.
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
@@ -78,8 +78,8 @@ class MeetingSessionManager:
             "meeting_id": meeting_id,
             "call_connection_id": call_connection_id,
             "state": SessionState.CREATED.value,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "updated_at": datetime.now(UTC).isoformat(),
             "participants": [],
             "metadata": {},
         }
@@ -141,7 +141,7 @@ class MeetingSessionManager:
             state = state.value
 
         session["state"] = state
-        session["updated_at"] = datetime.now(timezone.utc).isoformat()
+        session["updated_at"] = datetime.now(UTC).isoformat()
         if metadata:
             session["metadata"].update(metadata)
 
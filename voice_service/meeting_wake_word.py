@@ -3,20 +3,43 @@ voice_service.meeting_wake_word — Wake word detection for meeting mode.
 
 In meeting mode AIDA listens passively to the conversation and only
 activates (starts responding via the Realtime API) when addressed
-directly.  This module provides simple text-based wake word detection.
+directly.  This module provides simple text-based wake word detection,
+on completed transcripts and — through ``PartialWakeMatcher`` — on the
+interim transcripts of an utterance still in progress.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import re
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from voice_service.timer_wheel import Timer, get_timer_wheel
+from voice_service.transcript_stream import get_stream_hub
+from voice_service.voice_metrics import REGISTRY
+
 if TYPE_CHECKING:
     from voice_service.voice_state import VoiceSession
 
 logger = logging.getLogger(__name__)
 
+# Silence after the last AIDA interaction before voice mode switches off (0 disables)
+WAKE_WORD_AUTO_DEACTIVATE_SECONDS = float(os.getenv("AIDA_WAKE_WORD_AUTO_DEACTIVATE_SECONDS", "30"))
+# Matched segments remembered until their final transcript; the oldest is dropped beyond this
+_MAX_PARTIAL_ITEMS = 64
+
+_WAKE_LATENCY = {
+    source: REGISTRY.histogram(
+        "aida_voice_wake_activation_seconds",
+        "Time from the start of the utterance containing the wake word to activation.",
+        buckets=(0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0),
+        labels={"source": source},
+    )
+    for source in ("partial", "passive")
+}
+
 # Wake word patterns — case-insensitive
 # "Hey AIDA", "AIDA", "Hey Ada", "Ada" (common mis-transcriptions)
 _WAKE_PATTERNS: list[re.Pattern] = [
@@ -41,16 +64,30 @@ class WakeWordDetector:
     or similar.  After responding, AIDA can be deactivated with phrases
     like "Thanks AIDA" or "That's all AIDA".
 
+    Once activated, voice mode switches off by itself after
+    ``auto_deactivate_seconds`` without an interaction (see ``touch()``),
+    on a timer in the process-wide timer wheel.
+
     TODO: Add Voice Activity Detection (VAD) for more sophisticated
           detection — energy-based filtering before running text matching.
     TODO: Consider a small on-device wake word model (e.g., Porcupine)
-          for lower latency detection before transcription completes.
-    TODO: Add configurable wake word timeout — auto-deactivate after
-          N seconds of silence following the last AIDA interaction.
+          for lower latency than interim transcripts.
+
+    Args:
+        auto_deactivate_seconds: Silence before auto-deactivation
+            (0 disables it).
+        on_deactivate: Called with the session when voice mode switches
+            off, whatever the cause (phrase, timeout or failed connect).
     """
 
-    def __init__(self, auto_deactivate_seconds: float = 30.0) -> None:
+    def __init__(
+        self,
+        auto_deactivate_seconds: float = WAKE_WORD_AUTO_DEACTIVATE_SECONDS,
+        on_deactivate: Callable[[VoiceSession], None] | None = None,
+    ) -> None:
         self._auto_deactivate_seconds = auto_deactivate_seconds
+        self._on_deactivate = on_deactivate
+        self._timer: Timer | None = None
 
     def check_transcript(self, text: str) -> bool:
         """
@@ -84,12 +121,13 @@ class WakeWordDetector:
                 return True
         return False
 
-    def activate(self, session: "VoiceSession") -> None:
+    def activate(self, session: VoiceSession) -> None:
         """
         Activate voice mode for the session.
 
         Sets ``is_voice_active = True`` so the audio worker begins
-        forwarding audio to the Realtime API.
+        forwarding audio to the Realtime API, and notifies live
+        transcript subscribers.
 
         Args:
             session: The VoiceSession to activate.
@@ -97,18 +135,98 @@ class WakeWordDetector:
         if not session.is_voice_active:
             session.is_voice_active = True
             logger.info("Voice activated: session=%s", session.session_id)
-
-    def deactivate(self, session: "VoiceSession") -> None:
+            get_stream_hub().publish_state(session.session_id, True)
+        if self._auto_deactivate_seconds > 0:
+            if self._timer is None:
+                self._timer = get_timer_wheel().schedule(self._auto_deactivate_seconds, self._auto_deactivate, session)
+            else:
+                self._timer.reset()
+
+    def deactivate(self, session: VoiceSession) -> None:
         """
         Deactivate voice mode for the session.
 
         Sets ``is_voice_active = False`` so the audio worker stops
         forwarding audio to the Realtime API (but continues collecting
-        transcript for meeting notes).
+        transcript for meeting notes), and calls ``on_deactivate``.
 
         Args:
             session: The VoiceSession to deactivate.
         """
+        self.close()
         if session.is_voice_active:
             session.is_voice_active = False
             logger.info("Voice deactivated: session=%s", session.session_id)
+            get_stream_hub().publish_state(session.session_id, False)
+            if self._on_deactivate is not None:
+                self._on_deactivate(session)
+
+    def touch(self) -> None:
+        """Record an interaction: restart the auto-deactivation countdown."""
+        if self._timer is not None:
+            self._timer.reset()
+
+    def close(self) -> None:
+        """Cancel the auto-deactivation timer (deactivation or session end)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _auto_deactivate(self, session: VoiceSession) -> None:
+        self._timer = None
+        logger.info(
+            "Voice auto-deactivated after %.0fs of silence: session=%s",
+            self._auto_deactivate_seconds,
+            session.session_id,
+        )
+        self.deactivate(session)
+
+
+def record_wake_latency(source: str, seconds: float) -> None:
+    """Observe wake-to-activation latency (``partial`` or ``passive``)."""
+    _WAKE_LATENCY[source].observe(max(0.0, seconds))
+
+
+class PartialWakeMatcher:
+    """
+    Wake-word matching on interim transcripts of an utterance in progress.
+
+    ``PassiveTranscriber`` transcribes the opening seconds of an open
+    utterance as it grows; each interim transcript replaces the previous
+    one for that segment and the wake patterns run over it.  A match is
+    accepted once text follows it, since the last word may still grow
+    ("Aida" -> "Aidan").  A segment reports a match once; ``complete()``
+    then tells the final-transcript handler not to activate again.
+    """
+
+    def __init__(self) -> None:
+        # Segments that matched, oldest first (bounded)
+        self._woke: dict[str, None] = {}
+
+    def update(self, item_id: str, text: str) -> bool:
+        """
+        Match the latest transcript of an open segment; True the first time it matches.
+
+        Args:
+            item_id: Segment being transcribed.
+            text: Its transcript so far.
+        """
+        if item_id in self._woke:
+            return False
+        text = text.rstrip()
+        for pattern in _WAKE_PATTERNS:
+            match = pattern.search(text)
+            if match is not None and match.end() < len(text):
+                if len(self._woke) >= _MAX_PARTIAL_ITEMS:
+                    self._woke.pop(next(iter(self._woke)))
+                self._woke[item_id] = None
+                logger.info("Wake word detected in interim transcript: %s", text[:80])
+                return True
+        return False
+
+    def complete(self, item_id: str) -> bool:
+        """Forget the segment; True if an interim transcript already matched."""
+        if item_id not in self._woke:
+            return False
+        del self._woke[item_id]
+        return True
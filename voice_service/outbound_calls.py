@@ -0,0 +1,205 @@
+"""
+voice_service.outbound_calls — Rate-limited outbound call placement.
+
+Outbound calls go through ``place_call()``: one ``create_call`` on the
+ACS client, then the meeting session for calls placed into a meeting.
+Call Automation throttles call creation per resource, so every call
+placed by the replica first takes a token from one process-wide bucket
+(``AIDA_CALL_CREATE_RATE_PER_SECOND``, bursts of
+``AIDA_CALL_CREATE_BURST``).  A create that is throttled anyway (HTTP
+429) is retried with backoff, up to ``AIDA_CALL_CREATE_RETRIES`` times.
+
+``place_calls()`` runs a batch — e.g. joining every standup of the day —
+with at most ``AIDA_CALL_BATCH_CONCURRENCY`` calls in flight and yields
+each result as it completes, so ``POST /api/calls/batch`` can stream
+them back instead of the job making hundreds of sequential requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+from aida_sdk.clients.acs_client import ACSClient
+from aida_sdk.config import settings
+
+from voice_service.call_reaper import note_bot_identity
+from voice_service.meeting_state import MeetingSessionManager
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Sustained call creations per second across the replica (0 disables the limit)
+CALL_CREATE_RATE_PER_SECOND = float(os.getenv("AIDA_CALL_CREATE_RATE_PER_SECOND", "5"))
+# Creations allowed back to back before the rate applies
+CALL_CREATE_BURST = int(os.getenv("AIDA_CALL_CREATE_BURST", "5"))
+# Retries of a create rejected with HTTP 429
+CALL_CREATE_RETRIES = int(os.getenv("AIDA_CALL_CREATE_RETRIES", "3"))
+# Calls of one batch in flight at once
+CALL_BATCH_CONCURRENCY = int(os.getenv("AIDA_CALL_BATCH_CONCURRENCY", "8"))
+# Calls accepted in one batch request
+CALL_BATCH_MAX_CALLS = int(os.getenv("AIDA_CALL_BATCH_MAX_CALLS", "500"))
+
+# First backoff after a throttled create; doubles per retry
+_RETRY_BACKOFF_SECONDS = 1.0
+
+_T = TypeVar("_T")
+
+_RATE_WAIT = REGISTRY.counter(
+    "aida_voice_call_create_rate_wait_seconds_total",
+    "Time outbound calls waited for the call-creation rate limit.",
+)
+_THROTTLED = REGISTRY.counter(
+    "aida_voice_call_create_throttled_total",
+    "Outbound call creations rejected by ACS with HTTP 429 (then retried).",
+)
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limit shared by concurrent callers.
+
+    Each ``acquire()`` takes a token, reserving the next one when the
+    bucket is empty and sleeping until it is due, so waiters are served
+    in arrival order without a lock.
+
+    Args:
+        rate: Tokens added per second (0 disables the limit).
+        burst: Bucket size.
+    """
+
+    def __init__(self, rate: float = CALL_CREATE_RATE_PER_SECOND, burst: int = CALL_CREATE_BURST) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> float:
+        """Take a token; returns the seconds waited for it."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        wait = -self._tokens / self.rate
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Give the reserved token back to the callers behind
+            self._tokens += 1
+            raise
+        return wait
+
+
+# Every call placed by the replica shares one bucket
+_bucket = TokenBucket()
+
+
+def _is_throttled(exc: Exception) -> bool:
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    return status == 429
+
+
+def media_config(media_streaming: bool = True) -> dict[str, Any] | None:
+    """Media streaming configuration pointing ACS at this replica's gateway."""
+    if not media_streaming:
+        return None
+    ws_host = settings.BOT_CALLBACK_HOST.replace("https://", "wss://").replace("http://", "ws://")
+    return {"transport_url": f"{ws_host}/voice-v2"}
+
+
+async def place_call(
+    acs: ACSClient,
+    meeting_manager: MeetingSessionManager,
+    target: str,
+    meeting_id: str = "",
+    media_streaming: bool = True,
+) -> str:
+    """
+    Create an outbound call, within the replica's call-creation rate.
+
+    Args:
+        acs: ACS client.
+        meeting_manager: Registers the call's meeting session.
+        target: Phone number or ACS raw ID to call.
+        meeting_id: Meeting the call belongs to (optional).
+        media_streaming: Stream the call's audio to the voice gateway.
+
+    Returns:
+        The new call's connection ID.
+
+    Raises:
+        Exception: Whatever the ACS client raised once retries ran out.
+    """
+    callback_uri = f"{settings.BOT_CALLBACK_HOST}/api/calls/webhook"
+    for attempt in range(CALL_CREATE_RETRIES + 1):
+        _RATE_WAIT.inc(await _bucket.acquire())
+        try:
+            result = await acs.create_call(
+                target=target,
+                callback_uri=callback_uri,
+                media_config=media_config(media_streaming),
+            )
+            break
+        except Exception as exc:
+            if not _is_throttled(exc) or attempt == CALL_CREATE_RETRIES:
+                raise
+            _THROTTLED.inc()
+            backoff = _RETRY_BACKOFF_SECONDS * 2**attempt
+            logger.warning("Call creation throttled, retrying in %.1fs: target=%s", backoff, target)
+            await asyncio.sleep(backoff)
+    connection_id = result.call_connection.call_connection_id
+    # The caller identity is the bot: not a human for the reaper
+    source = getattr(getattr(result, "call_connection_properties", None), "source", None)
+    note_bot_identity(getattr(source, "raw_id", "") or "")
+
+    if meeting_id:
+        await meeting_manager.create_session(meeting_id, connection_id)
+    return connection_id
+
+
+async def place_calls(
+    calls: Sequence[_T],
+    place: Callable[[int, _T], Awaitable[dict[str, Any]]],
+    concurrency: int = CALL_BATCH_CONCURRENCY,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Run ``place(index, call)`` for every call, yielding results as they complete.
+
+    ``place`` should report failures in its result; an exception is
+    logged and reported as ``failed``.  Closing the iterator early (the
+    client went away) cancels the calls not yet placed.
+
+    Args:
+        calls: Batch items, in request order.
+        place: Places one call and describes the outcome.
+        concurrency: Calls in flight at once.
+    """
+    pending = iter(enumerate(calls))
+    results: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def worker() -> None:
+        # Workers share one iterator, so each call is taken exactly once
+        for index, call in pending:
+            try:
+                result = await place(index, call)
+            except Exception:
+                logger.exception("Batch call %d failed", index)
+                result = {"index": index, "status": "failed", "error": "Internal error"}
+            results.put_nowait(result)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(max(1, concurrency), len(calls)))]
+    try:
+        for _ in range(len(calls)):
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,259 @@
+"""
+voice_service.participant_tracker — Per-participant audio activity and speaking time.
+
+ACS tags every ``AudioData`` frame with the ``participantRawId`` it came
+from.  The worker used to keep only the last one; with unmixed streams
+that throws away who is talking, for how long, and over whom.
+``ParticipantTracker`` keeps that per participant:
+
+  - a ring of the participant's most recent frames (``AIDA_PARTICIPANT_RING_MS``);
+  - frame energy, computed with NumPy from the ring slot just written;
+  - speaking time, talk spurts (turns), and interruptions — a spurt
+    starting while someone else holds the floor.
+
+Each participant is a slotted record with a preallocated NumPy frame
+ring, keyed by the interned raw ID.  The per-frame update is one dict
+lookup, one fixed-size copy and one dot product however many people
+are on the call; the floor is tracked as a single holder rather than by
+scanning every participant for overlap.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Recent audio kept per participant
+PARTICIPANT_RING_MS = int(os.getenv("AIDA_PARTICIPANT_RING_MS", "500"))
+# Frame energy (dBFS) counted as speech
+PARTICIPANT_VAD_THRESHOLD_DBFS = float(os.getenv("AIDA_PARTICIPANT_VAD_THRESHOLD_DBFS", "-45"))
+# Silence that ends a talk spurt (and releases the floor)
+PARTICIPANT_HANGOVER_MS = int(os.getenv("AIDA_PARTICIPANT_HANGOVER_MS", "400"))
+# Participants tracked per call; later ones are ignored
+PARTICIPANT_MAX = int(os.getenv("AIDA_PARTICIPANT_MAX", "256"))
+
+_FRAME_MS = 20
+# 10*log10 of full scale squared
+_FULL_SCALE_DB = 10.0 * math.log10(32768.0 * 32768.0)
+_NEVER = float("-inf")
+
+
+class _Participant:
+    """Activity state for one participant (one per raw ID)."""
+
+    __slots__ = (
+        "energy_db",
+        "frames",
+        "interrupted",
+        "interruptions",
+        "last_voiced",
+        "raw_id",
+        "ring",
+        "ring_bytes",
+        "ring_pos",
+        "rows",
+        "speaking_ms",
+        "turns",
+    )
+
+    def __init__(self, raw_id: str, ring_frames: int, frame_samples: int) -> None:
+        self.raw_id = raw_id
+        self.frames = 0
+        self.speaking_ms = 0.0
+        self.turns = 0
+        self.interruptions = 0
+        self.interrupted = 0
+        self.last_voiced = _NEVER
+        self.energy_db = _NEVER
+        self.ring = np.zeros((ring_frames, frame_samples), dtype="<i2")
+        # Byte view for copying frames in, row views for reading them back
+        self.ring_bytes = memoryview(self.ring).cast("B")
+        self.rows = list(self.ring)
+        self.ring_pos = 0
+
+
+class ParticipantTracker:
+    """
+    Per-participant activity for one call.
+
+    Args:
+        sample_rate: PCM16 rate of the frames passed to ``update()``.
+        ring_ms: Recent audio kept per participant.
+        threshold_dbfs: Frame level counted as speech.
+        hangover_ms: Silence that ends a talk spurt.
+        max_participants: Participants tracked before new ones are ignored.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        ring_ms: int = PARTICIPANT_RING_MS,
+        threshold_dbfs: float = PARTICIPANT_VAD_THRESHOLD_DBFS,
+        hangover_ms: int = PARTICIPANT_HANGOVER_MS,
+        max_participants: int = PARTICIPANT_MAX,
+    ) -> None:
+        self._threshold = threshold_dbfs
+        self._hangover = hangover_ms / 1000
+        self._max_participants = max_participants
+        self._ring_ms = ring_ms
+        self._participants: dict[str, _Participant] = {}
+        self._floor: _Participant | None = None
+        self._ignored = 0
+
+        self._sample_rate = sample_rate
+        self._frame_samples = 0
+        self._frame_bytes = 0
+        self._frame_ms = 0.0
+        self._ring_frames = 0
+        self._configure(sample_rate * _FRAME_MS // 1000)
+
+    # ── Storage ──────────────────────────────────────────────────────
+
+    def _configure(self, frame_samples: int) -> None:
+        """Size the frame rings for a frame length; drops recent audio."""
+        self._frame_samples = frame_samples
+        self._frame_bytes = frame_samples * 2
+        self._frame_ms = frame_samples * 1000 / self._sample_rate
+        self._ring_frames = max(1, int(self._ring_ms // max(self._frame_ms, 1.0)))
+        for participant in self._participants.values():
+            fresh = _Participant(participant.raw_id, self._ring_frames, frame_samples)
+            participant.ring, participant.ring_bytes, participant.rows = fresh.ring, fresh.ring_bytes, fresh.rows
+            participant.ring_pos = 0
+
+    def _add(self, raw_id: str) -> _Participant | None:
+        if len(self._participants) >= self._max_participants:
+            if not self._ignored:
+                logger.warning("Participant limit reached (%d); ignoring new participants", self._max_participants)
+            self._ignored += 1
+            return None
+        raw_id = sys.intern(raw_id)
+        participant = _Participant(raw_id, self._ring_frames, self._frame_samples)
+        self._participants[raw_id] = participant
+        return participant
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        """Switch the PCM rate (ACS ``AudioMetadata``); recent audio is dropped."""
+        if sample_rate != self._sample_rate and sample_rate > 0:
+            self._sample_rate = sample_rate
+            self._configure(sample_rate * _FRAME_MS // 1000)
+
+    # ── Per-frame update ─────────────────────────────────────────────
+
+    def update(self, raw_id: str, pcm: bytes, silent: bool = False, now: float | None = None) -> float:
+        """
+        Record one frame from ``raw_id``.
+
+        Args:
+            raw_id: ACS ``participantRawId`` of the frame.
+            pcm: PCM16 mono frame.
+            silent: ACS flagged the frame as silence (energy not computed).
+            now: Monotonic arrival time (defaults to now).
+
+        Returns:
+            The frame level in dBFS (``-inf`` for silent frames), so
+            callers gating on energy need not compute it again.
+        """
+        participant = self._participants.get(raw_id)
+        if participant is None:
+            participant = self._add(raw_id)
+            if participant is None:
+                return _NEVER
+        nbytes = len(pcm)
+        if nbytes != self._frame_bytes:
+            if nbytes % 2:
+                pcm, nbytes = pcm[:-1], nbytes - 1
+            if nbytes > self._frame_bytes:
+                self._configure(nbytes // 2)
+            elif nbytes < self._frame_bytes:
+                # Short frames are zero-padded
+                pcm = pcm + bytes(self._frame_bytes - nbytes)
+
+        pos = participant.ring_pos
+        offset = pos * self._frame_bytes
+        participant.ring_bytes[offset:offset + self._frame_bytes] = pcm
+        participant.ring_pos = (pos + 1) % self._ring_frames
+        participant.frames += 1
+
+        if silent:
+            participant.energy_db = _NEVER
+            return _NEVER
+        samples = participant.rows[pos].astype(np.float32)
+        mean_square = float(np.dot(samples, samples)) / (nbytes // 2 or 1)
+        level = 10.0 * math.log10(mean_square) - _FULL_SCALE_DB if mean_square > 0.0 else _NEVER
+        participant.energy_db = level
+        if level < self._threshold:
+            return level
+
+        # Voiced frame
+        if now is None:
+            now = time.monotonic()
+        participant.speaking_ms += self._frame_ms * nbytes / self._frame_bytes
+        floor = self._floor
+        if now - participant.last_voiced > self._hangover:
+            # New talk spurt; overlapping the floor holder is an interruption
+            participant.turns += 1
+            if floor is not None and floor is not participant and now - floor.last_voiced <= self._hangover:
+                participant.interruptions += 1
+                floor.interrupted += 1
+            self._floor = participant
+        elif floor is None or now - floor.last_voiced > self._hangover:
+            self._floor = participant
+        participant.last_voiced = now
+        return level
+
+    # ── Queries ──────────────────────────────────────────────────────
+
+    def recent_audio(self, raw_id: str) -> bytes:
+        """The participant's most recent frames, oldest first."""
+        participant = self._participants.get(raw_id)
+        if participant is None:
+            return b""
+        count = min(participant.frames, self._ring_frames)
+        pos = participant.ring_pos
+        return np.roll(participant.ring, -pos, axis=0)[self._ring_frames - count:].tobytes()
+
+    def is_speaking(self, raw_id: str, now: float | None = None) -> bool:
+        """Whether the participant is inside a talk spurt."""
+        participant = self._participants.get(raw_id)
+        if participant is None:
+            return False
+        return (time.monotonic() if now is None else now) - participant.last_voiced <= self._hangover
+
+    @property
+    def participant_count(self) -> int:
+        return len(self._participants)
+
+    def snapshot(self, name_for: Callable[[str], str] | None = None) -> list[dict[str, Any]]:
+        """
+        Per-participant analytics, most talkative first.
+
+        Args:
+            name_for: Resolves a raw ID to a display name.
+        """
+        participants = sorted(self._participants.values(), key=lambda p: p.speaking_ms, reverse=True)
+        total = sum(p.speaking_ms for p in participants)
+        now = time.monotonic()
+        return [
+            {
+                "participant_raw_id": p.raw_id,
+                "name": name_for(p.raw_id) if name_for else p.raw_id,
+                "speaking_seconds": round(p.speaking_ms / 1000, 1),
+                "speaking_share": round(p.speaking_ms / total, 3) if total else 0.0,
+                "turns": p.turns,
+                "interruptions": p.interruptions,
+                "interrupted": p.interrupted,
+                "is_speaking": now - p.last_voiced <= self._hangover,
+                "last_spoke_seconds_ago": round(now - p.last_voiced, 1) if p.last_voiced != _NEVER else None,
+                "energy_dbfs": round(p.energy_db, 1) if p.energy_db != _NEVER else None,
+            }
+            for p in participants
+        ]
@@ -0,0 +1,632 @@
+"""
+voice_service.passive_transcription — Low-cost transcription of passive meeting audio.
+
+In meeting mode AIDA only talks to the Realtime API once it has been
+addressed.  The audio heard before that — most of the meeting — still
+belongs in the meeting notes, but holding a bidirectional Realtime
+session open for it would cost a full conversational session per
+meeting.  ``PassiveTranscriber`` handles that audio instead:
+
+  - an energy VAD gates each ACS frame (frames ACS flags ``silent`` are
+    never inspected);
+  - ``UtteranceSegmenter`` cuts the voiced stream into utterances, with
+    a little pre-roll and a silence hangover, attributing each to the
+    participant who spoke most of its voiced frames;
+  - utterances are batched to a pluggable ``TranscriptionBackend`` on a
+    background task, so the audio path never waits on transcription;
+  - optionally, the opening seconds of the utterance in progress are
+    transcribed as it grows (interim transcripts), so the worker can
+    spot the wake word before the speaker stops talking.
+
+Backends are registered by name (``register_backend``) and selected with
+``AIDA_PASSIVE_TRANSCRIPTION_BACKEND``.  ``azure_openai`` posts WAV to
+an Azure OpenAI transcription deployment; ``none`` discards the audio
+(local development, load tests).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import os
+import time
+import wave
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import aiohttp
+import numpy as np
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+PASSIVE_TRANSCRIPTION_BACKEND = os.getenv("AIDA_PASSIVE_TRANSCRIPTION_BACKEND", "azure_openai")
+PASSIVE_TRANSCRIPTION_DEPLOYMENT = os.getenv("AIDA_PASSIVE_TRANSCRIPTION_DEPLOYMENT", "gpt-4o-mini-transcribe")
+PASSIVE_TRANSCRIPTION_API_VERSION = os.getenv("AIDA_PASSIVE_TRANSCRIPTION_API_VERSION", "2025-03-01-preview")
+# Concurrent backend requests across all sessions on the replica
+PASSIVE_TRANSCRIPTION_CONCURRENCY = int(os.getenv("AIDA_PASSIVE_TRANSCRIPTION_CONCURRENCY", "8"))
+
+# Frame energy (dBFS) above which a frame counts as speech
+PASSIVE_VAD_THRESHOLD_DBFS = float(os.getenv("AIDA_PASSIVE_VAD_THRESHOLD_DBFS", "-45"))
+# Silence that ends an utterance
+PASSIVE_SILENCE_MS = int(os.getenv("AIDA_PASSIVE_SILENCE_MS", "700"))
+# Utterances with less voiced audio than this are dropped (coughs, clicks)
+PASSIVE_MIN_SPEECH_MS = int(os.getenv("AIDA_PASSIVE_MIN_SPEECH_MS", "300"))
+# Long monologues are cut so transcripts keep flowing
+PASSIVE_MAX_UTTERANCE_MS = int(os.getenv("AIDA_PASSIVE_MAX_UTTERANCE_MS", "15000"))
+# Audio kept before the first voiced frame
+PASSIVE_PREROLL_MS = int(os.getenv("AIDA_PASSIVE_PREROLL_MS", "200"))
+
+# Batching: send when this many utterances are waiting, or the oldest has waited this long
+PASSIVE_BATCH_SIZE = int(os.getenv("AIDA_PASSIVE_BATCH_SIZE", "4"))
+PASSIVE_BATCH_WAIT_MS = int(os.getenv("AIDA_PASSIVE_BATCH_WAIT_MS", "1500"))
+# Oldest utterances are dropped beyond this many waiting per session
+PASSIVE_MAX_PENDING = int(os.getenv("AIDA_PASSIVE_MAX_PENDING", "50"))
+
+# Interim transcripts: the utterance so far is transcribed every this much audio (0 disables)
+PASSIVE_INTERIM_MS = int(os.getenv("AIDA_PASSIVE_INTERIM_MS", "1000"))
+# ...but only over its opening stretch, where a wake word is said (bounds the extra cost)
+PASSIVE_INTERIM_MAX_MS = int(os.getenv("AIDA_PASSIVE_INTERIM_MAX_MS", "3000"))
+
+_UTTERANCES = REGISTRY.counter(
+    "aida_voice_passive_utterances_total",
+    "Utterances segmented from passive meeting audio.",
+)
+_SPEECH_SECONDS = REGISTRY.counter(
+    "aida_voice_passive_speech_seconds_total",
+    "Seconds of passive meeting audio sent for transcription.",
+)
+_DROPPED = REGISTRY.counter(
+    "aida_voice_passive_utterances_dropped_total",
+    "Passive utterances dropped because the transcription backlog was full.",
+)
+_FAILURES = REGISTRY.counter(
+    "aida_voice_passive_transcription_failures_total",
+    "Passive utterances whose transcription request failed.",
+)
+_INTERIMS = REGISTRY.counter(
+    "aida_voice_passive_interim_requests_total",
+    "Interim transcription requests for passive utterances still in progress.",
+)
+_LATENCY = REGISTRY.histogram(
+    "aida_voice_passive_transcription_seconds",
+    "Time from the end of a passive utterance to its transcript.",
+    buckets=(0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0, 60.0),
+)
+
+
+@dataclass(slots=True)
+class Utterance:
+    """One segment of passive speech."""
+
+    speaker_raw_id: str
+    pcm: bytes
+    sample_rate: int
+    started_at: datetime
+    ended_at: float
+    """``time.monotonic()`` when the segment closed (for latency)."""
+    segment: int = 0
+    """Sequence number of the speech segment; shared by its interim snapshots."""
+
+    @property
+    def duration_ms(self) -> int:
+        return len(self.pcm) * 1000 // (self.sample_rate * 2)
+
+    def to_wav(self) -> bytes:
+        """The utterance as a mono PCM16 WAV file."""
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(self.pcm)
+        return buf.getvalue()
+
+
+# ── VAD and segmentation ─────────────────────────────────────────────
+
+def frame_dbfs(pcm: bytes) -> float:
+    """RMS level of a PCM16 frame in dBFS (``-inf`` for digital silence)."""
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32)
+    if not len(samples):
+        return float("-inf")
+    mean_square = float(np.dot(samples, samples)) / len(samples)
+    if mean_square <= 0.0:
+        return float("-inf")
+    return 10.0 * np.log10(mean_square / (32768.0 * 32768.0))
+
+
+class UtteranceSegmenter:
+    """
+    Splits a stream of PCM16 frames into utterances.
+
+    Args:
+        sample_rate: PCM16 mono sample rate of the frames.
+        threshold_dbfs: Frame level counted as speech.
+        silence_ms: Trailing silence that closes an utterance.
+        min_speech_ms: Voiced audio an utterance needs to be kept.
+        max_utterance_ms: Length at which an utterance is cut.
+        preroll_ms: Audio kept from before the first voiced frame.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        threshold_dbfs: float = PASSIVE_VAD_THRESHOLD_DBFS,
+        silence_ms: int = PASSIVE_SILENCE_MS,
+        min_speech_ms: int = PASSIVE_MIN_SPEECH_MS,
+        max_utterance_ms: int = PASSIVE_MAX_UTTERANCE_MS,
+        preroll_ms: int = PASSIVE_PREROLL_MS,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self._threshold = threshold_dbfs
+        self._silence_ms = silence_ms
+        self._min_speech_ms = min_speech_ms
+        self._max_utterance_ms = max_utterance_ms
+        self._preroll_ms = preroll_ms
+
+        self._preroll: deque[bytes] = deque()
+        self._preroll_bytes = 0
+        self._frames: list[bytes] = []
+        self._in_speech = False
+        self._started_at = datetime.now(UTC)
+        self._total_ms = 0.0
+        self._voiced_ms = 0.0
+        self._trailing_silence_ms = 0.0
+        self._speakers: Counter[str] = Counter()
+        # Incremented as each utterance opens
+        self.segment = 0
+
+    @property
+    def in_speech(self) -> bool:
+        """An utterance is open."""
+        return self._in_speech
+
+    @property
+    def utterance_ms(self) -> float:
+        """Length of the open utterance so far, pre-roll included."""
+        return self._total_ms
+
+    @property
+    def trailing_silence_ms(self) -> float:
+        """Silence since the open utterance's last voiced frame."""
+        return self._trailing_silence_ms
+
+    def _frame_ms(self, pcm: bytes) -> float:
+        return len(pcm) * 1000 / (self.sample_rate * 2)
+
+    def push(
+        self, pcm: bytes, speaker_raw_id: str = "", silent: bool = False, level_dbfs: float | None = None
+    ) -> Utterance | None:
+        """
+        Feed one frame.
+
+        Args:
+            pcm: PCM16 mono frame.
+            speaker_raw_id: Participant ACS attributed the frame to.
+            silent: ACS flagged the frame as silence (skips the VAD).
+            level_dbfs: Frame level if the caller already computed it.
+
+        Returns:
+            The utterance this frame closed, if any.
+        """
+        frame_ms = self._frame_ms(pcm)
+        if level_dbfs is None and not silent:
+            level_dbfs = frame_dbfs(pcm)
+        voiced = not silent and level_dbfs is not None and level_dbfs >= self._threshold
+
+        if not self._in_speech:
+            if not voiced:
+                self._remember_preroll(pcm)
+                return None
+            self._in_speech = True
+            self.segment += 1
+            self._frames = list(self._preroll)
+            self._total_ms = self._preroll_bytes * 1000 / (self.sample_rate * 2)
+            self._started_at = datetime.now(UTC) - timedelta(milliseconds=self._total_ms)
+            self._preroll.clear()
+            self._preroll_bytes = 0
+
+        self._frames.append(pcm)
+        self._total_ms += frame_ms
+        if voiced:
+            self._voiced_ms += frame_ms
+            self._trailing_silence_ms = 0.0
+            self._speakers[speaker_raw_id] += 1
+        else:
+            self._trailing_silence_ms += frame_ms
+
+        if self._trailing_silence_ms >= self._silence_ms or self._total_ms >= self._max_utterance_ms:
+            return self.flush()
+        return None
+
+    def _remember_preroll(self, pcm: bytes) -> None:
+        self._preroll.append(pcm)
+        self._preroll_bytes += len(pcm)
+        limit = self.sample_rate * 2 * self._preroll_ms // 1000
+        while self._preroll and self._preroll_bytes - len(self._preroll[0]) >= limit:
+            self._preroll_bytes -= len(self._preroll.popleft())
+
+    def _utterance(self) -> Utterance:
+        speaker = self._speakers.most_common(1)[0][0] if self._speakers else ""
+        return Utterance(
+            speaker_raw_id=speaker,
+            pcm=b"".join(self._frames),
+            sample_rate=self.sample_rate,
+            started_at=self._started_at,
+            ended_at=time.monotonic(),
+            segment=self.segment,
+        )
+
+    def snapshot(self) -> Utterance | None:
+        """The open utterance so far, without closing it (None if none is open)."""
+        return self._utterance() if self._in_speech else None
+
+    def flush(self) -> Utterance | None:
+        """Close the current utterance (if any) and reset."""
+        utterance = None
+        if self._in_speech and self._voiced_ms >= self._min_speech_ms:
+            utterance = self._utterance()
+        self._in_speech = False
+        self._frames = []
+        self._total_ms = self._voiced_ms = self._trailing_silence_ms = 0.0
+        self._speakers.clear()
+        return utterance
+
+
+# ── Backends ─────────────────────────────────────────────────────────
+
+class TranscriptionBackend:
+    """Base class for passive transcription backends."""
+
+    name = ""
+
+    async def transcribe(self, utterances: list[Utterance]) -> list[str | None]:
+        """
+        Transcribe a batch of utterances.
+
+        Returns:
+            One transcript per utterance, in order (``None`` when that
+            utterance could not be transcribed).
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+
+
+class NullTranscriptionBackend(TranscriptionBackend):
+    """Discards audio — for local development and load tests."""
+
+    name = "none"
+
+    async def transcribe(self, utterances: list[Utterance]) -> list[str | None]:
+        return [None] * len(utterances)
+
+
+class AzureOpenAITranscriptionBackend(TranscriptionBackend):
+    """
+    Azure OpenAI ``audio/transcriptions`` (one request per utterance,
+    sent concurrently per batch and capped across the replica).
+
+    Args:
+        endpoint: Azure OpenAI resource endpoint.
+        api_key: Resource API key.
+        deployment: Transcription model deployment name.
+        api_version: REST API version.
+        concurrency: Maximum requests in flight.
+    """
+
+    name = "azure_openai"
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str,
+        deployment: str = PASSIVE_TRANSCRIPTION_DEPLOYMENT,
+        api_version: str = PASSIVE_TRANSCRIPTION_API_VERSION,
+        concurrency: int = PASSIVE_TRANSCRIPTION_CONCURRENCY,
+    ) -> None:
+        self._url = f"{endpoint.rstrip('/')}/openai/deployments/{deployment}/audio/transcriptions"
+        self._params = {"api-version": api_version}
+        self._headers = {"api-key": api_key}
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._http: aiohttp.ClientSession | None = None
+
+    async def transcribe(self, utterances: list[Utterance]) -> list[str | None]:
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return list(await asyncio.gather(*(self._transcribe_one(u) for u in utterances)))
+
+    async def _transcribe_one(self, utterance: Utterance) -> str | None:
+        assert self._http is not None
+        form = aiohttp.FormData()
+        form.add_field("file", utterance.to_wav(), filename="utterance.wav", content_type="audio/wav")
+        form.add_field("response_format", "json")
+        async with self._semaphore:
+            try:
+                async with self._http.post(self._url, params=self._params, headers=self._headers, data=form) as resp:
+                    if resp.status != 200:
+                        logger.warning("Passive transcription failed: %d %s", resp.status, (await resp.text())[:200])
+                        return None
+                    body = await resp.json()
+            except (TimeoutError, aiohttp.ClientError) as exc:
+                logger.warning("Passive transcription request error: %s", exc)
+                return None
+        return body.get("text", "")
+
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+
+def _azure_openai_backend() -> TranscriptionBackend:
+    endpoint = os.getenv("AZURE_OPENAI_ENDPOINT", "")
+    api_key = os.getenv("AZURE_OPENAI_API_KEY", "")
+    if not endpoint or not api_key:
+        logger.warning("Passive transcription disabled: AZURE_OPENAI_ENDPOINT / AZURE_OPENAI_API_KEY not set")
+        return NullTranscriptionBackend()
+    return AzureOpenAITranscriptionBackend(endpoint, api_key)
+
+
+_BACKEND_FACTORIES: dict[str, Callable[[], TranscriptionBackend]] = {
+    NullTranscriptionBackend.name: NullTranscriptionBackend,
+    AzureOpenAITranscriptionBackend.name: _azure_openai_backend,
+}
+_backend: TranscriptionBackend | None = None
+
+
+def register_backend(name: str, factory: Callable[[], TranscriptionBackend]) -> None:
+    """Register a backend factory under ``name`` (replacing any existing one)."""
+    _BACKEND_FACTORIES[name] = factory
+
+
+def get_backend() -> TranscriptionBackend:
+    """
+    The replica's shared backend, created on first use from
+    ``AIDA_PASSIVE_TRANSCRIPTION_BACKEND``.
+    """
+    global _backend
+    if _backend is None:
+        factory = _BACKEND_FACTORIES.get(PASSIVE_TRANSCRIPTION_BACKEND)
+        if factory is None:
+            logger.warning("Unknown passive transcription backend %r, using none", PASSIVE_TRANSCRIPTION_BACKEND)
+            factory = NullTranscriptionBackend
+        _backend = factory()
+    return _backend
+
+
+def set_backend(backend: TranscriptionBackend | None) -> None:
+    """Replace the shared backend (``None`` resets to the configured one)."""
+    global _backend
+    _backend = backend
+
+
+async def close_backend() -> None:
+    """Close the shared backend on shutdown."""
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+
+
+# ── Per-session transcriber ──────────────────────────────────────────
+
+class PassiveTranscriber:
+    """
+    VAD-gated, batched transcription of one session's passive audio.
+
+    Interim transcripts (``on_interim``) are requested every
+    ``interim_ms`` of an open utterance up to ``interim_max_ms``, one
+    request in flight per session (a snapshot due meanwhile waits for
+    it).  They bypass batching, so a wake word is seen about one
+    interval after it is said.
+
+    Args:
+        on_transcript: Coroutine called with each utterance and its
+            (non-empty) transcript, in utterance order.
+        sample_rate: PCM16 rate of the frames passed to ``push()``.
+        backend: Transcription backend (defaults to the shared one).
+        on_interim: Coroutine called with a snapshot of the open
+            utterance and its transcript so far (None: no interims).
+        interim_ms: Audio between interim requests (0 disables them).
+        interim_max_ms: Utterance length after which no more interims
+            are requested.
+    """
+
+    def __init__(
+        self,
+        on_transcript: Callable[[Utterance, str], Awaitable[None]],
+        sample_rate: int,
+        backend: TranscriptionBackend | None = None,
+        batch_size: int = PASSIVE_BATCH_SIZE,
+        batch_wait_ms: int = PASSIVE_BATCH_WAIT_MS,
+        max_pending: int = PASSIVE_MAX_PENDING,
+        on_interim: Callable[[Utterance, str], Awaitable[None]] | None = None,
+        interim_ms: int = PASSIVE_INTERIM_MS,
+        interim_max_ms: int = PASSIVE_INTERIM_MAX_MS,
+    ) -> None:
+        self._on_transcript = on_transcript
+        self._on_interim = on_interim if interim_ms > 0 else None
+        self._interim_ms = interim_ms
+        self._interim_max_ms = interim_max_ms
+        # Segment the next interim belongs to, and the utterance length it is due at
+        self._interim_segment = 0
+        self._interim_due_ms = 0.0
+        self._interim_task: asyncio.Task | None = None
+        self._backend = backend
+        self._segmenter = UtteranceSegmenter(sample_rate)
+        self._batch_size = max(1, batch_size)
+        self._batch_wait = batch_wait_ms / 1000
+        self._max_pending = max_pending
+
+        self._pending: deque[Utterance] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+        self.utterances = 0
+        self.transcribed = 0
+        self.dropped = 0
+        self.interims = 0
+
+    # ── Input ────────────────────────────────────────────────────────
+
+    def push(
+        self, pcm: bytes, speaker_raw_id: str = "", silent: bool = False, level_dbfs: float | None = None
+    ) -> None:
+        """Feed one ACS frame of passive audio (never blocks)."""
+        utterance = self._segmenter.push(pcm, speaker_raw_id, silent, level_dbfs)
+        if utterance is not None:
+            self._submit(utterance)
+        elif self._on_interim is not None and self._segmenter.in_speech:
+            self._maybe_interim()
+
+    def end_segment(self) -> None:
+        """Close any utterance in progress (e.g. when voice mode activates)."""
+        utterance = self._segmenter.flush()
+        if utterance is not None:
+            self._submit(utterance)
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        """Switch to a new PCM rate, closing the utterance in progress."""
+        if sample_rate != self._segmenter.sample_rate:
+            self.end_segment()
+            segment = self._segmenter.segment
+            self._segmenter = UtteranceSegmenter(sample_rate)
+            # Keep numbering so segment ids stay unique within the session
+            self._segmenter.segment = segment
+
+    def _submit(self, utterance: Utterance) -> None:
+        self.utterances += 1
+        _UTTERANCES.inc()
+        _SPEECH_SECONDS.inc(utterance.duration_ms / 1000)
+        if len(self._pending) >= self._max_pending:
+            self._pending.popleft()
+            self.dropped += 1
+            _DROPPED.inc()
+        self._pending.append(utterance)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="passive-transcription")
+        self._wakeup.set()
+
+    # ── Interim transcripts ──────────────────────────────────────────
+
+    def _maybe_interim(self) -> None:
+        segmenter = self._segmenter
+        if segmenter.segment != self._interim_segment:
+            self._interim_segment = segmenter.segment
+            self._interim_due_ms = self._interim_ms
+        length = segmenter.utterance_ms
+        if length < self._interim_due_ms or self._interim_due_ms > self._interim_max_ms:
+            return
+        if segmenter.trailing_silence_ms:
+            # Nothing new said since the last voiced frame; the final transcript is close
+            return
+        if self._interim_task is not None and not self._interim_task.done():
+            return
+        self._interim_due_ms = length + self._interim_ms
+        snapshot = segmenter.snapshot()
+        self._interim_task = asyncio.create_task(self._interim(snapshot), name="passive-interim")
+
+    async def _interim(self, snapshot: Utterance) -> None:
+        self.interims += 1
+        _INTERIMS.inc()
+        backend = self._backend or get_backend()
+        try:
+            texts = await backend.transcribe([snapshot])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Passive interim transcription failed")
+            return
+        text = texts[0] if texts else None
+        if text and text.strip():
+            try:
+                await self._on_interim(snapshot, text.strip())
+            except Exception:
+                logger.exception("Passive interim handler failed")
+
+    # ── Batching ─────────────────────────────────────────────────────
+
+    async def _run(self) -> None:
+        pending = self._pending
+        while pending:
+            # Let a batch fill up unless it is already full or we are closing
+            deadline = pending[0].ended_at + self._batch_wait
+            while len(pending) < self._batch_size and not self._closing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except TimeoutError:
+                    break
+            batch = [pending.popleft() for _ in range(min(self._batch_size, len(pending)))]
+            await self._transcribe(batch)
+
+    async def _transcribe(self, batch: list[Utterance]) -> None:
+        backend = self._backend or get_backend()
+        try:
+            texts = await backend.transcribe(batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Passive transcription backend failed: %d utterance(s)", len(batch))
+            texts = [None] * len(batch)
+        now = time.monotonic()
+        for utterance, text in zip(batch, texts):
+            if text is None:
+                if backend.name != NullTranscriptionBackend.name:
+                    _FAILURES.inc()
+                continue
+            _LATENCY.observe(now - utterance.ended_at)
+            if text.strip():
+                self.transcribed += 1
+                try:
+                    await self._on_transcript(utterance, text.strip())
+                except Exception:
+                    logger.exception("Passive transcript handler failed")
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Close the last utterance and wait (bounded) for the backlog to be transcribed."""
+        self.end_segment()
+        self._closing = True
+        self._wakeup.set()
+        interim = self._interim_task
+        if interim is not None and not interim.done():
+            interim.cancel()
+            try:
+                await interim
+            except asyncio.CancelledError:
+                pass
+        task = self._task
+        if task is None or task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except TimeoutError:
+            logger.warning("Passive transcription backlog abandoned: %d utterance(s)", len(self._pending))
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> dict[str, int]:
+        """Per-session counts (for the worker's ``get_stats()``)."""
+        return {
+            "utterances": self.utterances,
+            "transcribed": self.transcribed,
+            "dropped": self.dropped,
+            "interims": self.interims,
+            "pending": len(self._pending),
+        }
@@ -0,0 +1,113 @@
+"""
+voice_service.pcm_ring — Bounded byte ring for buffered audio.
+
+A fixed-capacity ring over a preallocated NumPy byte array.  Writes
+never allocate; once full, the oldest audio is overwritten (always a
+whole number of samples), and the overwritten byte count is reported so
+callers can account for lost audio.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class PcmRingBuffer:
+    """
+    Keeps the most recent ``capacity_bytes`` of an audio stream.
+
+    Args:
+        capacity_bytes: Ring size (rounded down to whole samples).
+        sample_width: Bytes per sample; overwrites drop whole samples.
+    """
+
+    def __init__(self, capacity_bytes: int, sample_width: int = 2) -> None:
+        self.sample_width = sample_width
+        self._capacity = max(0, capacity_bytes - capacity_bytes % sample_width)
+        self._buf = np.zeros(self._capacity, dtype=np.uint8)
+        # Byte-level writes through a memoryview skip NumPy's per-call overhead
+        self._view = memoryview(self._buf)
+        self._start = 0
+        self._size = 0
+        self.dropped_bytes = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, data: bytes) -> int:
+        """
+        Append audio, overwriting the oldest if the ring is full.
+
+        Returns:
+            Bytes of older audio overwritten (or of ``data`` discarded
+            when the ring has no capacity).
+        """
+        n = len(data)
+        cap = self._capacity
+        if not n:
+            return 0
+        if not cap:
+            self.dropped_bytes += n
+            return n
+        if n >= cap:
+            dropped = self._size + n - cap
+            self._view[:] = memoryview(data)[n - cap:]
+            self._start = 0
+            self._size = cap
+        else:
+            dropped = 0
+            overflow = self._size + n - cap
+            if overflow > 0:
+                width = self.sample_width
+                dropped = min(self._size, -(-overflow // width) * width)
+                self._start = (self._start + dropped) % cap
+                self._size -= dropped
+            end = (self._start + self._size) % cap
+            first = min(n, cap - end)
+            if first == n:
+                self._view[end:end + n] = data
+            else:
+                src = memoryview(data)
+                self._view[end:cap] = src[:first]
+                self._view[:n - first] = src[first:]
+            self._size += n
+        self.dropped_bytes += dropped
+        return dropped
+
+    def _copy(self, count: int) -> bytes:
+        start = self._start
+        first = min(count, self._capacity - start)
+        if first == count:
+            return self._buf[start:start + count].tobytes()
+        return self._buf[start:].tobytes() + self._buf[:count - first].tobytes()
+
+    def read(self, max_bytes: int | None = None) -> bytes:
+        """Remove and return the oldest audio (up to ``max_bytes``, whole samples)."""
+        count = self._size if max_bytes is None else min(self._size, max_bytes - max_bytes % self.sample_width)
+        if count <= 0:
+            return b""
+        data = self._copy(count)
+        self._start = (self._start + count) % self._capacity
+        self._size -= count
+        return data
+
+    def skip(self, max_bytes: int) -> int:
+        """Drop the oldest audio (up to ``max_bytes``, whole samples) without copying it."""
+        count = min(self._size, max_bytes - max_bytes % self.sample_width)
+        if count <= 0:
+            return 0
+        self._start = (self._start + count) % self._capacity
+        self._size -= count
+        return count
+
+    def peek(self) -> bytes:
+        """Everything buffered, oldest first, without consuming it."""
+        return self._copy(self._size) if self._size else b""
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
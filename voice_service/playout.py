@@ -0,0 +1,259 @@
+"""
+voice_service.playout — Paced outbound playout buffer (Realtime -> ACS).
+
+The Realtime API produces ``response.audio.delta`` chunks much faster
+than real time.  Forwarding them as they arrive pushes whole responses
+into ACS in a few bursts, and on barge-in there is nothing left to
+cancel — the audio has already left.
+
+``PlayoutBuffer`` sits between the two:
+
+  - deltas are re-chunked into fixed frames (20 ms by default — the
+    ACS media streaming frame size);
+  - a pacer task releases frames against a playout clock, staying at
+    most ``lead_ms`` ahead of real time so ACS's own jitter buffer is
+    fed but not flooded;
+  - the clock tracks how much of the current item has actually been
+    played out (frames released minus the lead still in flight), which
+    is the ``audio_end_ms`` a ``conversation.item.truncate`` needs;
+  - ``flush()`` drops everything not yet released — barge-in is
+    instant — and discards deltas of the flushed items still arriving
+    from the model until a new item starts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+PLAYOUT_FRAME_MS = int(os.getenv("AIDA_PLAYOUT_FRAME_MS", "20"))
+# How far ahead of real time frames are released to ACS
+PLAYOUT_LEAD_MS = int(os.getenv("AIDA_PLAYOUT_LEAD_MS", "60"))
+# Oldest audio is dropped beyond this much buffered output
+PLAYOUT_MAX_BUFFER_MS = int(os.getenv("AIDA_PLAYOUT_MAX_BUFFER_MS", "120000"))
+
+_UNDERRUNS = REGISTRY.counter(
+    "aida_voice_playout_underruns_total",
+    "Times the playout buffer ran dry mid-item (model audio arriving slower than real time).",
+)
+_FLUSHED_MS = REGISTRY.counter(
+    "aida_voice_playout_flushed_ms_total",
+    "Milliseconds of unplayed assistant audio discarded by barge-in flushes.",
+)
+_DROPPED_FRAMES = REGISTRY.counter(
+    "aida_voice_playout_dropped_frames_total",
+    "Frames dropped because the playout buffer exceeded its maximum size.",
+)
+
+
+class PlayoutBuffer:
+    """
+    Per-session outbound audio buffer with real-time pacing.
+
+    Args:
+        send_frame: Coroutine sending one PCM frame to ACS.
+        sample_rate: PCM16 mono sample rate of the audio.
+        frame_ms: Frame duration released per send.
+        lead_ms: Maximum audio released ahead of the playout clock.
+        max_buffer_ms: Buffered audio beyond which the oldest frames
+            are dropped.
+    """
+
+    def __init__(
+        self,
+        send_frame: Callable[[bytes], Awaitable[None]],
+        sample_rate: int = 24000,
+        frame_ms: int = PLAYOUT_FRAME_MS,
+        lead_ms: int = PLAYOUT_LEAD_MS,
+        max_buffer_ms: int = PLAYOUT_MAX_BUFFER_MS,
+    ) -> None:
+        self._send_frame = send_frame
+        self._frame_ms = frame_ms
+        self._frame_seconds = frame_ms / 1000
+        self._frame_bytes = sample_rate * 2 * frame_ms // 1000
+        self._lead_seconds = lead_ms / 1000
+        self._max_frames = max(1, max_buffer_ms // frame_ms)
+
+        # (item_id, frame) awaiting release; _partial holds the sub-frame tail
+        self._frames: deque[tuple[str, bytes]] = deque()
+        self._partial = bytearray()
+        self._partial_item = ""
+        # Items cut off by the last flush; their late deltas are dropped
+        self._flushed_items: set[str] = set()
+
+        # Playout clock: monotonic time at which released audio finishes playing
+        self._clock_end = 0.0
+        self._playing_item = ""
+        self._item_released_ms = 0
+
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """Start the pacer task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._pace(), name="playout-pacer")
+
+    async def stop(self) -> None:
+        """Stop the pacer and discard buffered audio."""
+        self._frames.clear()
+        self._partial.clear()
+        self._flushed_items.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        """
+        Change the PCM sample rate of subsequent audio.
+
+        Only takes effect while nothing is buffered — ACS announces its
+        format before any model audio is produced.
+        """
+        frame_bytes = sample_rate * 2 * self._frame_ms // 1000
+        if frame_bytes == self._frame_bytes:
+            return
+        if self._frames or self._partial:
+            logger.warning("Playout sample rate change to %d Hz ignored: audio buffered", sample_rate)
+            return
+        self._frame_bytes = frame_bytes
+
+    # ── Input ────────────────────────────────────────────────────────
+
+    def enqueue(self, pcm: bytes, item_id: str = "") -> None:
+        """
+        Append model audio for ``item_id``, re-chunked into frames.
+
+        A change of item first closes the previous item's tail frame.
+        Audio of an item cut off by ``flush()`` is discarded.
+        """
+        if self._flushed_items:
+            if item_id in self._flushed_items:
+                _FLUSHED_MS.inc(len(pcm) * self._frame_ms // self._frame_bytes)
+                return
+            # A new item started: the flushed ones are over
+            self._flushed_items.clear()
+        if item_id != self._partial_item:
+            self.end_item()
+            self._partial_item = item_id
+        partial = self._partial
+        partial += pcm
+        frame_bytes = self._frame_bytes
+        if len(partial) < frame_bytes:
+            return
+        full = len(partial) - len(partial) % frame_bytes
+        frames = self._frames
+        view = bytes(partial[:full])
+        for offset in range(0, full, frame_bytes):
+            frames.append((item_id, view[offset:offset + frame_bytes]))
+        del partial[:full]
+        overflow = len(frames) - self._max_frames
+        if overflow > 0:
+            for _ in range(overflow):
+                frames.popleft()
+            _DROPPED_FRAMES.inc(overflow)
+        self._wakeup.set()
+
+    def end_item(self) -> None:
+        """Pad the current item's sub-frame tail with silence and queue it."""
+        if self._partial:
+            tail = bytes(self._partial) + bytes(self._frame_bytes - len(self._partial))
+            self._frames.append((self._partial_item, tail))
+            self._partial.clear()
+            self._wakeup.set()
+
+    # ── Barge-in ─────────────────────────────────────────────────────
+
+    def flush(self) -> tuple[str, int]:
+        """
+        Discard all unreleased audio and reset the playout clock.
+
+        Returns:
+            ``(item_id, played_ms)`` for the item that was playing —
+            the values for ``conversation.item.truncate``.
+        """
+        item_id, played_ms = self._playing_item, self.played_ms()
+        dropped_ms = (len(self._frames) * self._frame_ms) + self.in_flight_ms()
+        flushed = {item_id, self._partial_item}
+        flushed.update(frame_item for frame_item, _ in self._frames)
+        flushed.discard("")
+        self._flushed_items = flushed
+        self._frames.clear()
+        self._partial.clear()
+        self._clock_end = time.monotonic()
+        self._item_released_ms = played_ms
+        if dropped_ms:
+            _FLUSHED_MS.inc(dropped_ms)
+        return item_id, played_ms
+
+    def discards(self, item_id: str) -> bool:
+        """Whether audio for ``item_id`` would be dropped (cut off by a flush)."""
+        return item_id in self._flushed_items
+
+    # ── State ────────────────────────────────────────────────────────
+
+    def in_flight_ms(self) -> int:
+        """Audio released to ACS but not yet played out."""
+        return max(0, int((self._clock_end - time.monotonic()) * 1000))
+
+    def played_ms(self) -> int:
+        """Milliseconds of the current item played out so far."""
+        return max(0, self._item_released_ms - self.in_flight_ms())
+
+    @property
+    def buffered_ms(self) -> int:
+        """Audio waiting to be released (excluding in-flight audio)."""
+        return len(self._frames) * self._frame_ms + len(self._partial) * self._frame_ms // self._frame_bytes
+
+    @property
+    def active(self) -> bool:
+        """True while audio is queued or still playing out."""
+        return bool(self._frames) or self._clock_end > time.monotonic()
+
+    # ── Pacer ────────────────────────────────────────────────────────
+
+    async def _pace(self) -> None:
+        frames = self._frames
+        while True:
+            if not frames:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            now = time.monotonic()
+            if self._clock_end < now:
+                # Ran dry: playout restarts from now.  Mid-item that is an underrun.
+                if self._item_released_ms and frames[0][0] == self._playing_item:
+                    _UNDERRUNS.inc()
+                self._clock_end = now
+            ahead = self._clock_end - now
+            if ahead > self._lead_seconds:
+                await asyncio.sleep(ahead - self._lead_seconds)
+                continue
+
+            item_id, frame = frames.popleft()
+            if item_id != self._playing_item:
+                self._playing_item = item_id
+                self._item_released_ms = 0
+            self._clock_end += self._frame_seconds
+            self._item_released_ms += self._frame_ms
+            try:
+                await self._send_frame(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Playout frame send failed")
@@ -0,0 +1,423 @@
+"""
+voice_service.realtime_session — Realtime API connection that survives socket drops.
+
+A bare ``RealtimeClient`` socket that drops mid-call ends the worker's
+event loop and leaves the caller in silence.  ``ResilientRealtimeSession``
+wraps the client with the same surface the worker uses (``connect``,
+``send_audio``, ``receive_events``, ``close``) plus ``send_event`` for
+raw client events, and on a drop:
+
+  1. buffers inbound audio in a bounded ``PcmRingBuffer``
+     (``AIDA_REALTIME_RECONNECT_BUFFER_MS``, oldest audio overwritten);
+  2. reconnects with exponential backoff and jitter
+     (``AIDA_REALTIME_RECONNECT_ATTEMPTS``, ``..._BACKOFF_MS``);
+  3. restores the session: instructions and tools on connect, then every
+     ``session.update`` field sent since, then a compacted copy of the
+     recent transcript as conversation items;
+  4. replays the buffered audio and resumes live streaming.
+
+Each reconnect's gap (drop detected to live audio flowing again) is
+kept in ``reconnects`` and exported on ``/metrics``.  ``receive_events()``
+keeps yielding across reconnects and only ends when the session is
+closed or reconnection gives up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from aida_sdk.clients.realtime_client import RealtimeClient
+
+from voice_service.admission import REALTIME_AVAILABILITY
+from voice_service.pcm_ring import PcmRingBuffer
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+REALTIME_RECONNECT_ATTEMPTS = int(os.getenv("AIDA_REALTIME_RECONNECT_ATTEMPTS", "6"))
+REALTIME_RECONNECT_BACKOFF_MS = int(os.getenv("AIDA_REALTIME_RECONNECT_BACKOFF_MS", "250"))
+REALTIME_RECONNECT_BACKOFF_MAX_MS = int(os.getenv("AIDA_REALTIME_RECONNECT_BACKOFF_MAX_MS", "4000"))
+# Caller audio held while reconnecting; older audio is overwritten
+REALTIME_RECONNECT_BUFFER_MS = int(os.getenv("AIDA_REALTIME_RECONNECT_BUFFER_MS", "5000"))
+# Transcript restored into the new conversation
+REALTIME_REPLAY_ITEMS = int(os.getenv("AIDA_REALTIME_REPLAY_ITEMS", "12"))
+REALTIME_REPLAY_CHARS = int(os.getenv("AIDA_REALTIME_REPLAY_CHARS", "4000"))
+
+# Buffered audio is replayed in chunks of this length
+_REPLAY_CHUNK_MS = 200
+
+_GAP_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 20.0, 30.0)
+
+_RECONNECT_GAP = REGISTRY.histogram(
+    "aida_voice_realtime_reconnect_gap_seconds",
+    "Time from a Realtime socket drop to live audio flowing on the new connection.",
+    buckets=_GAP_BUCKETS,
+)
+_RECONNECTS_OK = REGISTRY.counter(
+    "aida_voice_realtime_reconnects_total",
+    "Realtime reconnects by outcome.",
+    labels={"outcome": "ok"},
+)
+_RECONNECTS_FAILED = REGISTRY.counter(
+    "aida_voice_realtime_reconnects_total",
+    "Realtime reconnects by outcome.",
+    labels={"outcome": "failed"},
+)
+_LOST_AUDIO_MS = REGISTRY.counter(
+    "aida_voice_realtime_reconnect_lost_audio_ms_total",
+    "Caller audio overwritten in the reconnect buffer before it could be replayed.",
+)
+
+_CONNECTED = "connected"
+_RECONNECTING = "reconnecting"
+_FAILED = "failed"
+_CLOSED = "closed"
+
+
+@dataclass(slots=True)
+class ReconnectRecord:
+    """One reconnect, as reported in ``stats()``."""
+
+    gap_ms: int
+    attempts: int
+    replayed_audio_ms: int
+    lost_audio_ms: int
+    replayed_items: int
+
+
+def compact_history(
+    entries: list[tuple[str, str]],
+    max_items: int = REALTIME_REPLAY_ITEMS,
+    max_chars: int = REALTIME_REPLAY_CHARS,
+) -> list[tuple[str, str]]:
+    """
+    Shrink a transcript to the most recent turns that fit a budget.
+
+    Consecutive entries with the same role are merged into one item;
+    then items are taken newest first until ``max_items`` or
+    ``max_chars`` is reached, the oldest one kept truncated from the
+    front if needed.
+
+    Args:
+        entries: ``(role, text)`` pairs, oldest first (role ``user`` or
+            ``assistant``).
+
+    Returns:
+        ``(role, text)`` pairs, oldest first.
+    """
+    merged: list[tuple[str, str]] = []
+    for role, text in entries:
+        text = text.strip()
+        if not text:
+            continue
+        if merged and merged[-1][0] == role:
+            merged[-1] = (role, f"{merged[-1][1]}\n{text}")
+        else:
+            merged.append((role, text))
+
+    kept: list[tuple[str, str]] = []
+    budget = max_chars
+    for role, text in reversed(merged):
+        if len(kept) >= max_items or budget <= 0:
+            break
+        if len(text) > budget:
+            text = "…" + text[len(text) - budget + 1:]
+        kept.append((role, text))
+        budget -= len(text)
+    kept.reverse()
+    return kept
+
+
+def _history_item(role: str, text: str) -> dict[str, Any]:
+    content_type = "text" if role == "assistant" else "input_text"
+    return {
+        "type": "conversation.item.create",
+        "item": {"type": "message", "role": role, "content": [{"type": content_type, "text": text}]},
+    }
+
+
+class ResilientRealtimeSession:
+    """
+    A Realtime API session that reconnects transparently.
+
+    Args:
+        name: Label for logs (the voice session ID).
+        bytes_per_second: Rate of the audio passed to ``send_audio``
+            (sizes the reconnect buffer and replay chunks).
+        sample_width: Bytes per sample of that audio.
+        history: Returns the conversation so far as ``(role, text)``
+            pairs, replayed (compacted) into a new connection.
+        on_reconnected: Called on a new connection just before buffered
+            audio is replayed, with the milliseconds about to be
+            replayed.  Realtime audio offsets restart at zero on a new
+            connection, so offset-keyed state must be rebased here.
+        client_factory: Creates the underlying client.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        bytes_per_second: int = 48000,
+        sample_width: int = 2,
+        history: Callable[[], list[tuple[str, str]]] | None = None,
+        on_reconnected: Callable[[float], Awaitable[None] | None] | None = None,
+        client_factory: Callable[[], Any] = RealtimeClient,
+        attempts: int = REALTIME_RECONNECT_ATTEMPTS,
+        backoff_ms: int = REALTIME_RECONNECT_BACKOFF_MS,
+        backoff_max_ms: int = REALTIME_RECONNECT_BACKOFF_MAX_MS,
+        buffer_ms: int = REALTIME_RECONNECT_BUFFER_MS,
+    ) -> None:
+        self.name = name
+        self._bytes_per_ms = bytes_per_second / 1000
+        self._history = history
+        self._on_reconnected = on_reconnected
+        self._client_factory = client_factory
+        self._attempts = max(1, attempts)
+        self._backoff = backoff_ms / 1000
+        self._backoff_max = backoff_max_ms / 1000
+        self._ring = PcmRingBuffer(int(buffer_ms * self._bytes_per_ms), sample_width)
+        self._replay_chunk = max(sample_width, int(_REPLAY_CHUNK_MS * self._bytes_per_ms))
+
+        self._client: Any = None
+        self._instructions = ""
+        self._tools: list[dict[str, Any]] = []
+        # Every session.update field sent after connect, re-sent on reconnect
+        self._session_config: dict[str, Any] = {}
+        self._state = _CLOSED
+        self._reconnect_task: asyncio.Task | None = None
+        self._dropped_at = 0.0
+        self.reconnects: deque[ReconnectRecord] = deque(maxlen=32)
+
+    @property
+    def connected(self) -> bool:
+        return self._state == _CONNECTED
+
+    @property
+    def reconnecting(self) -> bool:
+        return self._state == _RECONNECTING
+
+    @property
+    def failed(self) -> bool:
+        """Reconnection gave up; every failed attempt was reported to the Realtime circuit."""
+        return self._state == _FAILED
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    async def connect(self, instructions: str, tools: list[dict[str, Any]]) -> None:
+        """
+        Open the first connection.
+
+        Raises:
+            Whatever the client raises; the first connect is not retried.
+        """
+        self._instructions = instructions
+        self._tools = tools
+        client = self._client_factory()
+        await client.connect(instructions=instructions, tools=tools)
+        self._client = client
+        self._state = _CONNECTED
+
+    async def close(self) -> None:
+        """Close the connection and stop any reconnect in progress."""
+        self._state = _CLOSED
+        task, self._reconnect_task = self._reconnect_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        client, self._client = self._client, None
+        if client is not None:
+            await _close_quietly(client)
+        self._ring.clear()
+
+    # ── Sending ──────────────────────────────────────────────────────
+
+    async def send_audio(self, audio: bytes) -> None:
+        """Send input audio, or buffer it while reconnecting."""
+        if self._state == _CONNECTED:
+            try:
+                await self._client.send_audio(audio)
+                return
+            except Exception:
+                logger.warning("Realtime send failed, reconnecting: session=%s", self.name, exc_info=True)
+                self._begin_reconnect()
+        if self._state == _RECONNECTING:
+            self._ring.write(audio)
+
+    async def send_event(self, event: dict[str, Any]) -> bool:
+        """
+        Send a raw client event.
+
+        ``session.update`` fields are remembered and restored after a
+        reconnect.  Other events sent while disconnected are dropped —
+        they refer to items of the lost conversation.
+
+        Returns:
+            Whether the event was sent.
+        """
+        if event.get("type") == "session.update":
+            self._session_config.update(event.get("session", {}))
+        if self._state != _CONNECTED:
+            logger.debug("Realtime event not sent while %s: %s", self._state, event.get("type"))
+            return False
+        ws = self._client._ws
+        if ws is None or ws.closed:
+            self._begin_reconnect()
+            return False
+        try:
+            await ws.send_json(event)
+        except Exception:
+            logger.warning("Realtime event send failed, reconnecting: session=%s", self.name, exc_info=True)
+            self._begin_reconnect()
+            return False
+        return True
+
+    # ── Receiving ────────────────────────────────────────────────────
+
+    async def receive_events(self) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield server events across reconnects.
+
+        Ends when the session is closed or reconnection gives up.
+        """
+        while True:
+            if self._state == _CONNECTED:
+                client = self._client
+                try:
+                    async for event in client.receive_events():
+                        yield event
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.warning("Realtime receive failed: session=%s", self.name, exc_info=True)
+                if self._state == _CLOSED:
+                    return
+                if self._client is client and self._state == _CONNECTED:
+                    logger.warning("Realtime socket closed, reconnecting: session=%s", self.name)
+                    self._begin_reconnect()
+            task = self._reconnect_task
+            if task is not None and not task.done():
+                # wait() rather than await: close() cancelling the reconnect
+                # must end this iterator, not raise into the reader
+                await asyncio.wait((task,))
+            if self._state != _CONNECTED:
+                return
+
+    # ── Reconnect ────────────────────────────────────────────────────
+
+    def _begin_reconnect(self) -> None:
+        if self._state != _CONNECTED:
+            return
+        self._state = _RECONNECTING
+        self._dropped_at = time.monotonic()
+        self._ring.clear()
+        self._ring.dropped_bytes = 0
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        await _close_quietly(self._client)
+        delay = self._backoff
+        for attempt in range(1, self._attempts + 1):
+            if self._state != _RECONNECTING:
+                return
+            client = self._client_factory()
+            try:
+                await client.connect(instructions=self._instructions, tools=self._tools)
+                self._client = client
+                replayed_items = await self._restore(client)
+                replayed_ms = len(self._ring) / self._bytes_per_ms
+                if self._on_reconnected is not None:
+                    result = self._on_reconnected(replayed_ms)
+                    if inspect.isawaitable(result):
+                        await result
+                await self._replay(client)
+            except asyncio.CancelledError:
+                await _close_quietly(client)
+                raise
+            except Exception:
+                REALTIME_AVAILABILITY.record_failure()
+                logger.warning(
+                    "Realtime reconnect attempt %d/%d failed: session=%s",
+                    attempt, self._attempts, self.name, exc_info=True,
+                )
+                await _close_quietly(client)
+                if attempt < self._attempts:
+                    await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+                    delay = min(delay * 2, self._backoff_max)
+                continue
+
+            REALTIME_AVAILABILITY.record_success()
+            gap = time.monotonic() - self._dropped_at
+            lost_ms = self._ring.dropped_bytes / self._bytes_per_ms
+            record = ReconnectRecord(
+                gap_ms=round(gap * 1000),
+                attempts=attempt,
+                replayed_audio_ms=round(replayed_ms),
+                lost_audio_ms=round(lost_ms),
+                replayed_items=replayed_items,
+            )
+            self.reconnects.append(record)
+            _RECONNECT_GAP.observe(gap)
+            _RECONNECTS_OK.inc()
+            if lost_ms:
+                _LOST_AUDIO_MS.inc(lost_ms)
+            logger.info("Realtime reconnected: session=%s, %s", self.name, asdict(record))
+            return
+
+        self._state = _FAILED
+        self._ring.clear()
+        _RECONNECTS_FAILED.inc()
+        logger.error("Realtime reconnect gave up after %d attempts: session=%s", self._attempts, self.name)
+
+    async def _restore(self, client: Any) -> int:
+        """Re-apply session config and the compacted transcript; returns items sent."""
+        ws = client._ws
+        if self._session_config:
+            await ws.send_json({"type": "session.update", "session": dict(self._session_config)})
+        history = compact_history(self._history()) if self._history is not None else []
+        for role, text in history:
+            await ws.send_json(_history_item(role, text))
+        return len(history)
+
+    async def _replay(self, client: Any) -> None:
+        """
+        Send buffered audio, then go live.
+
+        Audio arriving during the replay keeps going to the ring, so
+        order is preserved; the switch to live happens only once the
+        ring is empty, with no await in between.
+        """
+        ring = self._ring
+        while len(ring):
+            await client.send_audio(ring.read(self._replay_chunk))
+        self._state = _CONNECTED
+
+    # ── Stats ────────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "state": self._state,
+            "reconnects": len(self.reconnects),
+            "buffered_ms": round(len(self._ring) / self._bytes_per_ms),
+            "recent": [asdict(r) for r in self.reconnects][-5:],
+        }
+
+
+async def _close_quietly(client: Any) -> None:
+    if client is None:
+        return
+    try:
+        await client.close()
+    except Exception:
+        logger.debug("Error closing Realtime client", exc_info=True)
@@ -0,0 +1,135 @@
+"""
+voice_service.session_stats — Live per-session audio throughput and tool latency.
+
+Backs ``/admin/sessions``: what a worker is actually doing while a call
+sounds bad.  Every audio frame in each direction updates a slotted
+``AudioDirection`` inline — frame and byte totals, the time of the last
+frame, and a fixed ring of per-second frame counts from which frames per
+second is read.  No locks (the worker runs on one event loop), no
+per-frame containers; the ring is rolled forward only when the second
+changes.  Tool calls, which are rare, keep per-tool count, error and
+latency slots.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+# Per-second frame counts kept; the rate is averaged over the complete ones
+_RATE_SLOTS = 6
+
+
+class AudioDirection:
+    """Frames, bytes and frame rate for one direction of a call's audio."""
+
+    __slots__ = ("_first_second", "_second", "_slots", "bytes", "frames", "last_at")
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.bytes = 0
+        self.last_at = 0.0
+        self._slots = [0] * _RATE_SLOTS
+        self._second = 0
+        self._first_second = 0
+
+    def add(self, nbytes: int, now: float) -> None:
+        """Count one frame of ``nbytes`` at monotonic time ``now``."""
+        self.frames += 1
+        self.bytes += nbytes
+        self.last_at = now
+        second = int(now)
+        if second != self._second:
+            if not self._first_second:
+                self._first_second = second
+            self._roll(second)
+        self._slots[second % _RATE_SLOTS] += 1
+
+    def _roll(self, second: int) -> None:
+        """Zero the slots of the seconds skipped since the last frame."""
+        slots = self._slots
+        for skipped in range(max(self._second + 1, second - _RATE_SLOTS + 1), second + 1):
+            slots[skipped % _RATE_SLOTS] = 0
+        self._second = second
+
+    def frames_per_second(self, now: float) -> float:
+        """Average over the last complete seconds (the current one is partial)."""
+        second = int(now)
+        complete = min(_RATE_SLOTS - 1, second - self._first_second)
+        if not self.frames or complete <= 0:
+            return 0.0
+        if second != self._second:
+            self._roll(second)
+        return (sum(self._slots) - self._slots[second % _RATE_SLOTS]) / complete
+
+    def snapshot(self, now: float) -> dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "frames_per_second": round(self.frames_per_second(now), 1),
+            "seconds_since_last": round(now - self.last_at, 3) if self.last_at else None,
+        }
+
+
+class _ToolSlots:
+    __slots__ = ("calls", "errors", "last_ms", "max_ms", "total_ms")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+
+
+class SessionStats:
+    """
+    Live counters for one session, read by ``/admin/sessions``.
+
+    ``inbound`` is caller audio from ACS, ``outbound`` is AIDA's audio
+    released to ACS.
+    """
+
+    __slots__ = ("_tools", "inbound", "outbound", "started_at")
+
+    def __init__(self) -> None:
+        self.inbound = AudioDirection()
+        self.outbound = AudioDirection()
+        self.started_at = time.monotonic()
+        self._tools: dict[str, _ToolSlots] = {}
+
+    def record_tool(self, name: str, elapsed_ms: float, ok: bool) -> None:
+        """Count one tool call and its latency."""
+        slots = self._tools.get(name)
+        if slots is None:
+            slots = self._tools[name] = _ToolSlots()
+        slots.calls += 1
+        slots.errors += not ok
+        slots.total_ms += elapsed_ms
+        slots.last_ms = elapsed_ms
+        slots.max_ms = max(slots.max_ms, elapsed_ms)
+
+    def seconds_since_audio(self, now: float) -> float | None:
+        """Time since the last frame in either direction (None before any)."""
+        last = max(self.inbound.last_at, self.outbound.last_at)
+        return round(now - last, 3) if last else None
+
+    def snapshot(self, now: float | None = None) -> dict[str, Any]:
+        if now is None:
+            now = time.monotonic()
+        return {
+            "uptime_seconds": round(now - self.started_at, 1),
+            "seconds_since_audio": self.seconds_since_audio(now),
+            "inbound": self.inbound.snapshot(now),
+            "outbound": self.outbound.snapshot(now),
+            "tools": {
+                name: {
+                    "calls": s.calls,
+                    "errors": s.errors,
+                    "avg_ms": round(s.total_ms / s.calls, 1),
+                    "max_ms": round(s.max_ms, 1),
+                    "last_ms": round(s.last_ms, 1),
+                }
+                for name, s in self._tools.items()
+            },
+        }
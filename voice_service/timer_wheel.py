@@ -0,0 +1,270 @@
+"""
+voice_service.timer_wheel — Process-wide hierarchical timer wheel.
+
+Per-session timeouts (wake-word auto-deactivation, idle media, maximum
+call duration) are reset constantly — the idle timer on every audio
+frame.  One ``asyncio`` sleep task or ``call_later`` handle per timer
+per session means a heap operation and a cancelled handle left in the
+loop's heap for every reset.  ``TimerWheel`` keeps every timer of the
+process in one hierarchical wheel instead:
+
+  - ``AIDA_TIMER_WHEEL_LEVELS`` levels of 64 slots; level 0 slots are one
+    tick (``AIDA_TIMER_TICK_MS``) wide, each level above 64x wider;
+  - a timer sits in the lowest level whose slot still holds it
+    uniquely, and moves down a level when its slot comes round;
+  - each slot is a dict keyed by timer, so schedule, reset and cancel
+    are O(1); a reset that lands in the same tick does nothing at all.
+
+One loop callback per tick drives the wheel, and only while timers are
+pending.  Timers fire within one tick of their deadline, never early.
+Callbacks run on the event loop and must not block; schedule a task for
+async work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Wheel resolution; timers fire up to one tick late
+TIMER_TICK_MS = int(os.getenv("AIDA_TIMER_TICK_MS", "100"))
+# 64 slots per level: at 100 ms ticks four levels cover ~19 days
+TIMER_WHEEL_LEVELS = int(os.getenv("AIDA_TIMER_WHEEL_LEVELS", "4"))
+
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+
+_FIRED = REGISTRY.counter(
+    "aida_voice_timers_fired_total",
+    "Timer wheel timers that expired and ran their callback.",
+)
+
+
+class Timer:
+    """
+    A scheduled callback; returned by ``TimerWheel.schedule()``.
+
+    ``reset()`` re-arms it (by default for its original delay) and
+    ``cancel()`` disarms it; both are O(1) and safe to call at any time,
+    including after it fired.
+    """
+
+    __slots__ = ("_slot", "_wheel", "args", "callback", "delay", "expires")
+
+    def __init__(self, wheel: TimerWheel, delay: float, callback: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        self.callback = callback
+        self.args = args
+        self.delay = delay
+        # Absolute tick at which the timer fires
+        self.expires = 0
+        self._wheel = wheel
+        self._slot: dict[Timer, None] | None = None
+
+    @property
+    def active(self) -> bool:
+        return self._slot is not None
+
+    def reset(self, delay: float | None = None) -> None:
+        """Re-arm to fire ``delay`` seconds from now (default: the original delay)."""
+        self._wheel.reset(self, delay)
+
+    def cancel(self) -> None:
+        self._wheel.cancel(self)
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel driven by the running event loop.
+
+    Args:
+        tick_ms: Slot width at level 0 (firing resolution).
+        levels: Number of 64-slot levels; deadlines beyond the top
+            level's span wait in an overflow slot.
+    """
+
+    def __init__(self, tick_ms: int = TIMER_TICK_MS, levels: int = TIMER_WHEEL_LEVELS) -> None:
+        self._tick_seconds = max(1, tick_ms) / 1000
+        self._levels = max(1, levels)
+        self._wheel: list[list[dict[Timer, None]]] = [
+            [{} for _ in range(_SLOTS)] for _ in range(self._levels)
+        ]
+        self._overflow: dict[Timer, None] = {}
+        self._origin = time.monotonic()
+        # Last tick processed; timers in the wheel all expire after it
+        self._tick = 0
+        self._count = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self.fired = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _now_tick(self) -> float:
+        return (time.monotonic() - self._origin) / self._tick_seconds
+
+    # ── Scheduling ───────────────────────────────────────────────────
+
+    def schedule(self, delay: float, callback: Callable[..., Any], *args: Any) -> Timer:
+        """Call ``callback(*args)`` on the loop about ``delay`` seconds from now."""
+        timer = Timer(self, delay, callback, args)
+        self._arm(timer, delay)
+        return timer
+
+    def reset(self, timer: Timer, delay: float | None = None) -> None:
+        """Re-arm ``timer`` (O(1); a no-op if the deadline stays in the same tick)."""
+        if delay is None:
+            delay = timer.delay
+        else:
+            timer.delay = delay
+        # Inlined _expiry(): this check runs per audio frame for idle timers
+        if timer._slot is not None and timer.expires == math.ceil(
+            (time.monotonic() - self._origin + delay) / self._tick_seconds
+        ):
+            return
+        self.cancel(timer)
+        self._arm(timer, delay)
+
+    def cancel(self, timer: Timer) -> None:
+        slot = timer._slot
+        if slot is not None:
+            # Absent if it is due in the tick being processed (see _process)
+            slot.pop(timer, None)
+            timer._slot = None
+            self._count -= 1
+
+    def _expiry(self, delay: float) -> int:
+        return math.ceil((time.monotonic() - self._origin + delay) / self._tick_seconds)
+
+    def _arm(self, timer: Timer, delay: float) -> None:
+        if not self._count:
+            # Nothing pending, so no tick can be skipped: catch up with the clock
+            self._tick = max(self._tick, int(self._now_tick()))
+        timer.expires = max(self._expiry(delay), self._tick + 1)
+        self._place(timer)
+        self._count += 1
+        if self._handle is None:
+            self._start_driver()
+
+    def _place(self, timer: Timer) -> None:
+        """Put a timer in the lowest level where its slot is unambiguous."""
+        expires, now = timer.expires, self._tick
+        for level in range(self._levels):
+            shift = _SLOT_BITS * (level + 1)
+            if expires >> shift == now >> shift:
+                slot = self._wheel[level][(expires >> (shift - _SLOT_BITS)) & _SLOT_MASK]
+                break
+        else:
+            slot = self._overflow
+        slot[timer] = None
+        timer._slot = slot
+
+    # ── Driving ──────────────────────────────────────────────────────
+
+    def _start_driver(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (e.g. benchmarks): timers fire only through advance()
+            return
+        next_at = self._origin + (self._tick + 1) * self._tick_seconds
+        self._handle = loop.call_later(max(0.0, next_at - time.monotonic()), self._on_tick)
+
+    def _on_tick(self) -> None:
+        self._handle = None
+        self.advance()
+        if self._count and self._handle is None:
+            self._start_driver()
+
+    def advance(self) -> None:
+        """Process every tick up to now, firing expired timers."""
+        target = int(self._now_tick())
+        while self._tick < target and self._count:
+            self._tick += 1
+            self._process(self._tick)
+        if not self._count:
+            self._tick = max(self._tick, target)
+
+    def _process(self, tick: int) -> None:
+        # Slots of higher levels coming round move their timers down, top first
+        if self._overflow and tick & ((1 << (_SLOT_BITS * self._levels)) - 1) == 0:
+            self._cascade(self._overflow)
+        for level in range(self._levels - 1, 0, -1):
+            shift = _SLOT_BITS * level
+            if tick & ((1 << shift) - 1) == 0:
+                self._cascade(self._wheel[level][(tick >> shift) & _SLOT_MASK])
+        slot = self._wheel[0][tick & _SLOT_MASK]
+        if not slot:
+            return
+        due = list(slot)
+        slot.clear()
+        for timer in due:
+            if timer._slot is not slot:
+                # Cancelled or re-armed by an earlier callback of this tick
+                continue
+            timer._slot = None
+            self._count -= 1
+            self.fired += 1
+            _FIRED.inc()
+            try:
+                timer.callback(*timer.args)
+            except Exception:
+                logger.exception("Timer callback failed: %r", timer.callback)
+
+    def _cascade(self, slot: dict[Timer, None]) -> None:
+        if not slot:
+            return
+        timers = list(slot)
+        slot.clear()
+        for timer in timers:
+            self._place(timer)
+
+    # ── Teardown / stats ─────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Stop the driver and drop every pending timer."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        for level in self._wheel:
+            for slot in level:
+                for timer in slot:
+                    timer._slot = None
+                slot.clear()
+        for timer in self._overflow:
+            timer._slot = None
+        self._overflow.clear()
+        self._count = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pending": self._count,
+            "overflow": len(self._overflow),
+            "fired": self.fired,
+            "tick_ms": round(self._tick_seconds * 1000),
+        }
+
+
+# ── Shared wheel ─────────────────────────────────────────────────────
+
+_wheel = TimerWheel()
+
+REGISTRY.gauge(
+    "aida_voice_timers_pending",
+    "Timers pending in the process-wide timer wheel.",
+    fn=lambda: len(_wheel),
+)
+
+
+def get_timer_wheel() -> TimerWheel:
+    """The process-wide timer wheel."""
+    return _wheel
@@ -0,0 +1,266 @@
+"""
+voice_service.tool_args — Precompiled validation of Realtime tool arguments.
+
+The model sends tool arguments as a JSON string.  Handed on unchecked,
+a wrong type or a missing field surfaces seconds later as a backend
+error the model cannot act on.  ``compile_validator()`` turns a tool's
+JSON schema (the subset ``VOICE_TOOLS`` uses) into a validator once, at
+import:
+
+  - every property gets a converter chosen by its ``type``, so a call
+    is one dict lookup and one converter call per property — no schema
+    walking per call;
+  - values of near-miss types are coerced the way the model gets them
+    wrong: ``"30"`` and ``30.0`` for integers, ``"true"`` for booleans,
+    a single string where a list of strings is expected;
+  - ``default`` values are filled in, ``minimum`` / ``maximum`` and
+    ``enum`` are enforced, required strings must not be blank, and
+    properties the schema does not declare are dropped.
+
+A failure raises ``ToolArgumentError`` listing every problem; the worker
+returns that to the model straight away so it can correct the call.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+_MISSING = object()
+
+_TRUE = frozenset({"true", "yes", "1"})
+_FALSE = frozenset({"false", "no", "0"})
+
+Converter = Callable[[Any], Any]
+Validator = Callable[[Any], dict[str, Any]]
+
+
+class ToolArgumentError(ValueError):
+    """Tool arguments that do not match the tool's schema."""
+
+    def __init__(self, tool_name: str, problems: list[str]) -> None:
+        super().__init__(f"Invalid arguments for {tool_name}: {'; '.join(problems)}")
+        self.tool_name = tool_name
+        self.problems = problems
+
+    def to_result(self) -> dict[str, Any]:
+        """The function_call_output sent back to the model."""
+        return {
+            "error": f"Invalid arguments for {self.tool_name}",
+            "problems": self.problems,
+            "hint": "Correct the arguments and call the tool again.",
+        }
+
+
+class _Invalid(Exception):
+    """Raised by converters; carries the problem without the property path."""
+
+
+def _describe(value: Any) -> str:
+    text = json.dumps(value, ensure_ascii=False) if not isinstance(value, str) else repr(value)
+    return text if len(text) <= 40 else text[:37] + "..."
+
+
+# ── Converters ───────────────────────────────────────────────────────
+
+def _string(value: Any) -> str:
+    if type(value) is str:
+        return value.strip()
+    if type(value) in (int, float):
+        return str(value)
+    raise _Invalid(f"expected a string, got {_describe(value)}")
+
+
+def _integer(value: Any) -> int:
+    if type(value) is int:
+        return value
+    if type(value) is float and value.is_integer():
+        return int(value)
+    if type(value) is str:
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise _Invalid(f"expected an integer, got {_describe(value)}")
+
+
+def _number(value: Any) -> float:
+    if type(value) in (int, float):
+        return value
+    if type(value) is str:
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise _Invalid(f"expected a number, got {_describe(value)}")
+
+
+def _boolean(value: Any) -> bool:
+    if type(value) is bool:
+        return value
+    if type(value) is str:
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    raise _Invalid(f"expected true or false, got {_describe(value)}")
+
+
+def _bounded(convert: Converter, minimum: float | None, maximum: float | None) -> Converter:
+    def check(value: Any) -> Any:
+        value = convert(value)
+        if minimum is not None and value < minimum:
+            raise _Invalid(f"must be at least {minimum}, got {value}")
+        if maximum is not None and value > maximum:
+            raise _Invalid(f"must be at most {maximum}, got {value}")
+        return value
+
+    return check
+
+
+def _one_of(convert: Converter, allowed: frozenset[Any]) -> Converter:
+    def check(value: Any) -> Any:
+        value = convert(value)
+        if value not in allowed:
+            raise _Invalid(f"must be one of {sorted(allowed)}, got {_describe(value)}")
+        return value
+
+    return check
+
+
+def _array(item: Converter) -> Converter:
+    def check(value: Any) -> list[Any]:
+        if type(value) is not list:
+            # A lone value where a list was expected ("attendees": "Priya")
+            value = [value]
+        out = []
+        for index, element in enumerate(value):
+            try:
+                out.append(item(element))
+            except _Invalid as exc:
+                raise _Invalid(f"item {index}: {exc}") from None
+        return out
+
+    return check
+
+
+def _object(validate: Callable[[Any, list[str]], dict[str, Any]]) -> Converter:
+    def check(value: Any) -> dict[str, Any]:
+        problems: list[str] = []
+        result = validate(value, problems)
+        if problems:
+            raise _Invalid("; ".join(problems))
+        return result
+
+    return check
+
+
+_SCALARS: dict[str, Converter] = {
+    "string": _string,
+    "integer": _integer,
+    "number": _number,
+    "boolean": _boolean,
+}
+
+
+def _compile_converter(schema: dict[str, Any]) -> Converter:
+    kind = schema.get("type", "string")
+    if kind == "array":
+        convert = _array(_compile_converter(schema.get("items", {})))
+    elif kind == "object":
+        convert = _object(_compile_object(schema))
+    elif kind in _SCALARS:
+        convert = _SCALARS[kind]
+    else:
+        raise ValueError(f"Unsupported schema type: {kind!r}")
+    if "minimum" in schema or "maximum" in schema:
+        convert = _bounded(convert, schema.get("minimum"), schema.get("maximum"))
+    if "enum" in schema:
+        convert = _one_of(convert, frozenset(schema["enum"]))
+    return convert
+
+
+def _compile_object(schema: dict[str, Any]) -> Callable[[Any, list[str]], dict[str, Any]]:
+    required = frozenset(schema.get("required", ()))
+    # (name, converter, default, required, blank-check) per property, fixed at compile time
+    fields = tuple(
+        (
+            name,
+            _compile_converter(prop),
+            prop.get("default", _MISSING),
+            name in required,
+            name in required and prop.get("type", "string") == "string",
+        )
+        for name, prop in schema.get("properties", {}).items()
+    )
+
+    def validate(raw: Any, problems: list[str]) -> dict[str, Any]:
+        if type(raw) is not dict:
+            problems.append(f"expected an object, got {_describe(raw)}")
+            return {}
+        out: dict[str, Any] = {}
+        for name, convert, default, is_required, not_blank in fields:
+            value = raw.get(name, _MISSING)
+            if value is _MISSING or value is None:
+                if default is not _MISSING:
+                    out[name] = default
+                elif is_required:
+                    problems.append(f"{name}: required")
+                continue
+            try:
+                value = convert(value)
+            except _Invalid as exc:
+                problems.append(f"{name}: {exc}")
+                continue
+            if not_blank and not value:
+                problems.append(f"{name}: must not be empty")
+                continue
+            out[name] = value
+        return out
+
+    return validate
+
+
+def compile_validator(tool_name: str, schema: dict[str, Any]) -> Validator:
+    """
+    Compile an object schema into ``validate(args) -> normalised args``.
+
+    Args:
+        tool_name: Reported in ``ToolArgumentError``.
+        schema: The tool's ``parameters`` JSON schema.
+
+    Raises:
+        ValueError: The schema uses a type this compiler does not support
+            (at compile time, not per call).
+    """
+    validate_object = _compile_object(schema)
+
+    def validate(args: Any) -> dict[str, Any]:
+        problems: list[str] = []
+        out = validate_object(args, problems)
+        if problems:
+            raise ToolArgumentError(tool_name, problems)
+        return out
+
+    return validate
+
+
+def parse_arguments(tool_name: str, arguments: str, validate: Validator | None) -> dict[str, Any]:
+    """
+    Decode a tool call's JSON argument string and validate it.
+
+    An empty string counts as no arguments.  Without a validator (an
+    unknown tool) the decoded object is returned as is.
+
+    Raises:
+        ToolArgumentError: Invalid JSON, or arguments failing the schema.
+    """
+    try:
+        args = json.loads(arguments) if arguments and arguments.strip() else {}
+    except json.JSONDecodeError as exc:
+        raise ToolArgumentError(tool_name, [f"arguments are not valid JSON ({exc.msg} at position {exc.pos})"]) from None
+    if validate is None:
+        return args if type(args) is dict else {}
+    return validate(args)
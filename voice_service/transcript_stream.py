@@ -0,0 +1,318 @@
+"""
+voice_service.transcript_stream — Live transcript fan-out to dashboards.
+
+Dashboards follow a call through
+``GET /api/sessions/{id}/transcript/stream`` (Server-Sent Events): new
+transcript entries as ``transcript`` events and wake-word activation
+changes as ``state`` events.  Each request carries a per-session stream
+token (``sign_stream_token``) signed with ``AIDA_TRANSCRIPT_STREAM_SECRET``
+by whichever backend hands the dashboard its session.
+
+Publishing runs on the audio path, so it never waits for a subscriber.
+Each event is encoded to its SSE frame once and the same bytes object is
+appended to every subscriber's bounded queue
+(``AIDA_TRANSCRIPT_STREAM_QUEUE`` frames).  A subscriber whose queue is
+full — its client is not reading fast enough — is evicted: its queue is
+dropped, it receives a final ``end`` event if the socket still accepts
+one, and the client reconnects to resume from the recent window.  A
+publish therefore costs one dict lookup when nobody is watching and an
+append per subscriber otherwise, however slow any one dashboard is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Frames buffered per subscriber before it is evicted as a slow consumer
+TRANSCRIPT_STREAM_QUEUE = int(os.getenv("AIDA_TRANSCRIPT_STREAM_QUEUE", "256"))
+# Subscribers per process across all sessions (further requests get 503)
+TRANSCRIPT_STREAM_MAX_SUBSCRIBERS = int(os.getenv("AIDA_TRANSCRIPT_STREAM_MAX_SUBSCRIBERS", "10000"))
+# Interval between SSE keep-alive comments on idle streams
+TRANSCRIPT_STREAM_HEARTBEAT_SECONDS = float(os.getenv("AIDA_TRANSCRIPT_STREAM_HEARTBEAT_SECONDS", "15"))
+# Key for per-session stream tokens (unset: every stream request is refused)
+TRANSCRIPT_STREAM_SECRET = os.getenv("AIDA_TRANSCRIPT_STREAM_SECRET", "")
+# Lifetime of tokens minted by sign_stream_token()
+TRANSCRIPT_STREAM_TOKEN_TTL_SECONDS = int(os.getenv("AIDA_TRANSCRIPT_STREAM_TOKEN_TTL_SECONDS", "3600"))
+# Comma-separated dashboard origins allowed to read the stream cross-origin (empty: none)
+TRANSCRIPT_STREAM_ALLOWED_ORIGINS = frozenset(
+    origin.strip() for origin in os.getenv("AIDA_TRANSCRIPT_STREAM_ALLOWED_ORIGINS", "").split(",") if origin.strip()
+)
+
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+_PUBLISHED = REGISTRY.counter(
+    "aida_voice_transcript_stream_events_total",
+    "Transcript and activation events published to live subscribers.",
+)
+_EVICTED_SLOW = REGISTRY.counter(
+    "aida_voice_transcript_stream_evictions_total",
+    "Live transcript subscribers closed by the server.",
+    labels={"reason": "slow_consumer"},
+)
+_EVICTED_ENDED = REGISTRY.counter(
+    "aida_voice_transcript_stream_evictions_total",
+    "Live transcript subscribers closed by the server.",
+    labels={"reason": "session_ended"},
+)
+
+
+def encode_event(event: str, payload: Any) -> bytes:
+    """One SSE frame (``event:`` + single-line JSON ``data:``)."""
+    return f"event: {event}\ndata: {_encode_json(payload)}\n\n".encode()
+
+
+HEARTBEAT_FRAME = b": keepalive\n\n"
+
+
+# ── Stream tokens ────────────────────────────────────────────────────
+
+def _token_signature(secret: str, session_id: str, expires: int) -> str:
+    return hmac.new(secret.encode(), f"{session_id}.{expires}".encode(), hashlib.sha256).hexdigest()
+
+
+def sign_stream_token(
+    session_id: str,
+    ttl_seconds: int = TRANSCRIPT_STREAM_TOKEN_TTL_SECONDS,
+    secret: str | None = None,
+) -> str:
+    """
+    Mint a token for following one session's stream.
+
+    The token is ``<expiry unix seconds>.<hex HMAC-SHA256 of
+    "<session_id>.<expiry>">``, so any backend holding the secret can
+    mint one without calling this service.
+
+    Args:
+        session_id: Session the token is valid for.
+        ttl_seconds: Seconds until the token expires.
+        secret: Signing key (default ``AIDA_TRANSCRIPT_STREAM_SECRET``).
+    """
+    secret = TRANSCRIPT_STREAM_SECRET if secret is None else secret
+    if not secret:
+        raise ValueError("AIDA_TRANSCRIPT_STREAM_SECRET is not set")
+    expires = int(time.time()) + ttl_seconds
+    return f"{expires}.{_token_signature(secret, session_id, expires)}"
+
+
+def verify_stream_token(session_id: str, token: str, secret: str | None = None) -> bool:
+    """Whether ``token`` is an unexpired stream token for ``session_id``."""
+    secret = TRANSCRIPT_STREAM_SECRET if secret is None else secret
+    expires, _, signature = token.partition(".")
+    if not secret or not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature.encode(), _token_signature(secret, session_id, int(expires)).encode())
+
+
+class TranscriptSubscriber:
+    """
+    One stream client: a bounded frame queue and its reader's wake-up.
+
+    The hub appends to ``_frames`` and resolves ``_waiter`` directly
+    (see ``TranscriptStreamHub.publish``); the handler drains with
+    ``next_frames()``.
+
+    Args:
+        session_id: Session being followed.
+        max_frames: Queue bound; a full queue gets the subscriber evicted.
+    """
+
+    __slots__ = ("_frames", "_waiter", "closed_reason", "delivered", "max_frames", "session_id")
+
+    def __init__(self, session_id: str, max_frames: int = TRANSCRIPT_STREAM_QUEUE) -> None:
+        self.session_id = session_id
+        self.max_frames = max(1, max_frames)
+        self.closed_reason = ""
+        self.delivered = 0
+        self._frames: deque[bytes] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+
+    @property
+    def closed(self) -> bool:
+        return bool(self.closed_reason)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def close(self, reason: str) -> None:
+        """Stop the stream; a slow consumer's backlog is discarded."""
+        if self.closed_reason:
+            return
+        self.closed_reason = reason
+        if reason == "slow_consumer":
+            self._frames.clear()
+        self.wake()
+
+    async def next_frames(self) -> list[bytes]:
+        """
+        Everything queued, waiting for the first frame if need be.
+
+        Returns an empty list when woken by the hub's heartbeat, or once
+        closed and drained.
+        """
+        if not self._frames and not self.closed_reason:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        frames = list(self._frames)
+        self._frames.clear()
+        self.delivered += len(frames)
+        return frames
+
+
+class TranscriptStreamHub:
+    """
+    Process-wide registry of stream subscribers, keyed by session.
+
+    Args:
+        max_subscribers: Cap across all sessions.
+        heartbeat_seconds: How often waiting subscribers are woken with
+            nothing to send, so handlers can write a keep-alive.
+    """
+
+    def __init__(
+        self,
+        max_subscribers: int = TRANSCRIPT_STREAM_MAX_SUBSCRIBERS,
+        heartbeat_seconds: float = TRANSCRIPT_STREAM_HEARTBEAT_SECONDS,
+    ) -> None:
+        self.max_subscribers = max_subscribers
+        self.heartbeat_seconds = heartbeat_seconds
+        # One timer for every idle subscriber rather than a timeout per wait
+        self._heartbeat: asyncio.TimerHandle | None = None
+        # Per session, subscribers in arrival order (a dict for O(1) removal)
+        self._sessions: dict[str, dict[TranscriptSubscriber, None]] = {}
+        self._count = 0
+        self.evicted = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._count
+
+    def has_subscribers(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    # ── Subscriptions ────────────────────────────────────────────────
+
+    def subscribe(self, session_id: str, max_frames: int = TRANSCRIPT_STREAM_QUEUE) -> TranscriptSubscriber | None:
+        """A new subscriber for the session, or None at the process cap."""
+        if self._count >= self.max_subscribers:
+            return None
+        subscriber = TranscriptSubscriber(session_id, max_frames)
+        self._sessions.setdefault(session_id, {})[subscriber] = None
+        self._count += 1
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.get_running_loop().call_later(self.heartbeat_seconds, self._beat)
+        return subscriber
+
+    def unsubscribe(self, subscriber: TranscriptSubscriber) -> None:
+        subscribers = self._sessions.get(subscriber.session_id)
+        if subscribers is None or subscribers.pop(subscriber, 0) is not None:
+            return
+        if not subscribers:
+            del self._sessions[subscriber.session_id]
+        self._count -= 1
+
+    def _beat(self) -> None:
+        self._heartbeat = None
+        if not self._count:
+            return
+        for subscribers in self._sessions.values():
+            for subscriber in subscribers:
+                subscriber.wake()
+        self._heartbeat = asyncio.get_running_loop().call_later(self.heartbeat_seconds, self._beat)
+
+    # ── Publishing ───────────────────────────────────────────────────
+
+    def publish(self, session_id: str, event: str, payload: Any) -> None:
+        """Queue an event for every subscriber of the session; never blocks."""
+        subscribers = self._sessions.get(session_id)
+        if not subscribers:
+            return
+        frame = encode_event(event, payload)
+        _PUBLISHED.inc()
+        # Inlined offer + wake: this loop runs per subscriber on the audio path
+        slow = []
+        for subscriber in subscribers:
+            frames = subscriber._frames
+            if len(frames) >= subscriber.max_frames:
+                slow.append(subscriber)
+                continue
+            frames.append(frame)
+            waiter = subscriber._waiter
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
+        for subscriber in slow:
+            logger.warning(
+                "Evicting slow transcript subscriber: session=%s, queued=%d",
+                session_id, subscriber.max_frames,
+            )
+            subscriber.close("slow_consumer")
+            self.unsubscribe(subscriber)
+            self.evicted += 1
+            _EVICTED_SLOW.inc()
+
+    def publish_transcript(self, session_id: str, entry: dict[str, str]) -> None:
+        self.publish(session_id, "transcript", entry)
+
+    def publish_state(self, session_id: str, is_voice_active: bool) -> None:
+        self.publish(session_id, "state", {"is_voice_active": is_voice_active})
+
+    # ── Teardown ─────────────────────────────────────────────────────
+
+    def end_session(self, session_id: str, reason: str = "session_ended") -> None:
+        """Close the session's subscribers once queued events are delivered."""
+        subscribers = self._sessions.pop(session_id, {})
+        for subscriber in subscribers:
+            subscriber.close(reason)
+        self._count -= len(subscribers)
+        if subscribers and reason == "session_ended":
+            _EVICTED_ENDED.inc(len(subscribers))
+
+    def close_all(self, reason: str = "shutdown") -> None:
+        for session_id in list(self._sessions):
+            self.end_session(session_id, reason)
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "sessions": len(self._sessions),
+            "subscribers": self._count,
+            "max_subscribers": self.max_subscribers,
+            "evicted": self.evicted,
+        }
+
+
+# ── Shared hub ───────────────────────────────────────────────────────
+
+_hub = TranscriptStreamHub()
+
+REGISTRY.gauge(
+    "aida_voice_transcript_stream_subscribers",
+    "Live transcript stream subscribers on this replica.",
+    fn=lambda: _hub.subscriber_count,
+)
+
+
+def get_stream_hub() -> TranscriptStreamHub:
+    """The process-wide subscriber hub."""
+    return _hub
@@ -0,0 +1,467 @@
+"""
+voice_service.transcript_window — Bounded-memory transcript with on-disk spill.
+
+An all-day workshop bridge produces tens of thousands of transcript
+entries; keeping them all in a list grows the replica's RSS for the
+life of the call.  ``TranscriptWindow`` keeps only the recent part in
+memory — at most ``AIDA_TRANSCRIPT_WINDOW_ENTRIES`` entries, spanning
+at most ``AIDA_TRANSCRIPT_WINDOW_MINUTES``, estimated at no more than
+``AIDA_TRANSCRIPT_MEMORY_KB`` — and appends older entries to a spill
+file.
+
+Spills are batched: each batch of up to ``_SPILL_BATCH`` entries is
+encoded in one call and written as one compact JSON-array line.  Only
+each spilled entry's timestamp (8 bytes) and each batch's file offset
+stay in memory, in ``array`` buffers.  Iteration, indexing and
+time-range queries stream across the spill file and the in-memory
+window transparently.  If the spill file cannot be written, the oldest
+entries are dropped (and counted) rather than letting memory grow.
+
+The synchronous readers read the spill file on the calling thread; code
+on the event loop uses ``read()`` and ``read_between()``, which do the
+file reads on a worker thread.
+
+A transcript that could not be persisted can be kept on disk
+(``retain()``, only when ``AIDA_TRANSCRIPT_RETAIN_HOURS`` is set).
+``sweep_retained()`` runs at startup and bounds those files by age and
+total size.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+import weakref
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import IO, Any
+
+import numpy as np
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_WINDOW_ENTRIES = int(os.getenv("AIDA_TRANSCRIPT_WINDOW_ENTRIES", "500"))
+TRANSCRIPT_WINDOW_MINUTES = float(os.getenv("AIDA_TRANSCRIPT_WINDOW_MINUTES", "30"))
+# Per-session ceiling for the in-memory window (estimated)
+TRANSCRIPT_MEMORY_KB = int(os.getenv("AIDA_TRANSCRIPT_MEMORY_KB", "512"))
+# Dedicated to spill files; empty uses aida-transcripts in the system temp directory
+TRANSCRIPT_SPILL_DIR = os.getenv("AIDA_TRANSCRIPT_SPILL_DIR", "") or os.path.join(tempfile.gettempdir(), "aida-transcripts")
+# Hours a transcript that could not be persisted is kept on disk (0: not kept)
+TRANSCRIPT_RETAIN_HOURS = float(os.getenv("AIDA_TRANSCRIPT_RETAIN_HOURS", "0"))
+# Total size of retained transcripts; the startup sweep deletes the oldest beyond it
+TRANSCRIPT_RETAIN_MAX_MB = int(os.getenv("AIDA_TRANSCRIPT_RETAIN_MAX_MB", "1024"))
+
+_SPILL_PREFIX = "aida-transcript-"
+_RETAINED_PREFIX = "aida-transcript-retained-"
+# Entries moved to disk at a time, at least (capped at a quarter of the window)
+_SPILL_BATCH = 32
+# Approximate CPython cost of one entry beyond its text: the dict, three
+# string objects, the ISO timestamp and the list / timestamp slots
+_ENTRY_OVERHEAD_BYTES = 400
+# Compact JSON; built once (json.dumps with options builds an encoder per call)
+_encode_line = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+_SPILLED = REGISTRY.counter(
+    "aida_voice_transcript_spilled_entries_total",
+    "Transcript entries moved from memory to the session spill file.",
+)
+_DROPPED = REGISTRY.counter(
+    "aida_voice_transcript_dropped_entries_total",
+    "Transcript entries discarded because the spill file could not be written.",
+)
+
+
+def _entry_bytes(entry: dict[str, str]) -> int:
+    return _ENTRY_OVERHEAD_BYTES + len(entry.get("speaker", "")) + len(entry.get("text", ""))
+
+
+def _epoch(timestamp: str) -> float:
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def sweep_retained(
+    spill_dir: str = TRANSCRIPT_SPILL_DIR,
+    max_age_hours: float = TRANSCRIPT_RETAIN_HOURS,
+    max_bytes: int = TRANSCRIPT_RETAIN_MAX_MB * 1024 * 1024,
+) -> int:
+    """
+    Delete retained transcripts older than ``max_age_hours``, and the
+    oldest beyond ``max_bytes`` in total.  Blocking — run at startup,
+    off the event loop.
+
+    Returns:
+        Files deleted.
+    """
+    try:
+        names = [name for name in os.listdir(spill_dir) if name.startswith(_RETAINED_PREFIX)]
+    except FileNotFoundError:
+        return 0
+    files = []
+    for name in names:
+        path = os.path.join(spill_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+
+    cutoff = time.time() - max_age_hours * 3600
+    kept_bytes = 0
+    deleted = 0
+    keeping = True
+    # Newest first: from the first file too old or over budget on, everything goes
+    for mtime, size, path in sorted(files, reverse=True):
+        keeping = keeping and mtime >= cutoff and kept_bytes + size <= max_bytes
+        if keeping:
+            kept_bytes += size
+            continue
+        try:
+            os.unlink(path)
+            deleted += 1
+        except OSError:
+            logger.warning("Could not delete retained transcript: %s", path, exc_info=True)
+    if deleted:
+        logger.info("Deleted %d retained transcripts from %s (%d bytes kept)", deleted, spill_dir, kept_bytes)
+    return deleted
+
+
+def _discard_spill(fh: IO[bytes], path: str) -> None:
+    try:
+        fh.close()
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class TranscriptWindow:
+    """
+    Transcript entries, recent ones in memory and the rest on disk.
+
+    Entries are ``{"speaker", "text", "timestamp"}`` dicts in the order
+    they were added.  Reads behave like a read-only sequence over the
+    whole transcript: ``len()``, iteration, ``[i]``, plus ``entries()``,
+    ``recent()`` and ``between()`` — these block on the spill file.  On
+    the event loop use ``await read()`` / ``await read_between()``.
+    ``window`` is the in-memory part.
+
+    Args:
+        max_entries: Entries kept in memory.
+        max_minutes: Age span kept in memory (by entry timestamp).
+        memory_limit_bytes: Estimated memory ceiling for the window.
+        spill_dir: Directory for the spill file (created on first spill).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = TRANSCRIPT_WINDOW_ENTRIES,
+        max_minutes: float = TRANSCRIPT_WINDOW_MINUTES,
+        memory_limit_bytes: int = TRANSCRIPT_MEMORY_KB * 1024,
+        spill_dir: str = TRANSCRIPT_SPILL_DIR,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._max_age = max_minutes * 60
+        self._batch = max(1, min(_SPILL_BATCH, self._max_entries // 4))
+        self._memory_limit = memory_limit_bytes
+        self._spill_dir = spill_dir
+
+        self._entries: list[dict[str, str]] = []
+        self._times: list[float] = []
+        self._bytes = 0
+        self._peak_bytes = 0
+
+        self._spilled = 0
+        self._spilled_times = array("d")
+        # Per batch: index of its first entry and its line's file offset
+        self._batch_first = array("q")
+        self._batch_offsets = array("q")
+        self._spill_path = ""
+        self._spill_file: IO[bytes] | None = None
+        self._spill_size = 0
+        self._finalizer: weakref.finalize | None = None
+        self._dropped = 0
+
+    # ── Sequence ─────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries) or self._spilled > 0
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        return self.entries()
+
+    def __getitem__(self, index: int) -> dict[str, str]:
+        total = len(self)
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError("transcript index out of range")
+        if index >= self._spilled:
+            return self._entries[index - self._spilled]
+        return next(self._read_spilled([index]))
+
+    @property
+    def window(self) -> list[dict[str, str]]:
+        """The in-memory entries, oldest first (do not modify)."""
+        return self._entries
+
+    # ── Writing ──────────────────────────────────────────────────────
+
+    def append(self, entry: dict[str, str], at: float | None = None) -> None:
+        """
+        Add an entry, spilling the oldest ones if the window is over a limit.
+
+        Args:
+            entry: The transcript entry.
+            at: Its timestamp in epoch seconds, if already known
+                (otherwise parsed from ``entry["timestamp"]``).
+        """
+        if at is None:
+            at = _epoch(entry.get("timestamp", ""))
+        self._entries.append(entry)
+        self._times.append(at)
+        self._bytes += _entry_bytes(entry)
+        self._peak_bytes = max(self._peak_bytes, self._bytes)
+        if (
+            len(self._entries) > self._max_entries
+            or self._bytes > self._memory_limit
+            or at - self._times[0] > self._max_age
+        ):
+            self._spill()
+
+    def _spill(self) -> None:
+        """Move the oldest entries (at least a batch) to the spill file."""
+        entries, times = self._entries, self._times
+        n = len(entries)
+        count = max(n - self._max_entries, min(self._batch, n))
+        # Enough to get back under the memory ceiling and the age span
+        freed = sum(_entry_bytes(e) for e in entries[:count])
+        while count < n and self._bytes - freed > self._memory_limit:
+            freed += _entry_bytes(entries[count])
+            count += 1
+        newest = times[-1]
+        while count < n - 1 and newest - times[count] > self._max_age:
+            freed += _entry_bytes(entries[count])
+            count += 1
+
+        line = (_encode_line(entries[:count]) + "\n").encode()
+        try:
+            fh = self._spill_file or self._open_spill()
+            fh.write(line)
+            fh.flush()
+        except OSError:
+            if not self._dropped:
+                logger.exception("Transcript spill failed, dropping oldest entries: %s", self._spill_path or self._spill_dir)
+            self._dropped += count
+            _DROPPED.inc(count)
+        else:
+            self._batch_first.append(self._spilled)
+            self._batch_offsets.append(self._spill_size)
+            self._spilled_times.extend(times[:count])
+            self._spilled += count
+            self._spill_size += len(line)
+            _SPILLED.inc(count)
+
+        del entries[:count]
+        del times[:count]
+        self._bytes -= freed
+
+    def _open_spill(self) -> IO[bytes]:
+        os.makedirs(self._spill_dir, exist_ok=True)
+        fd, self._spill_path = tempfile.mkstemp(prefix=_SPILL_PREFIX, suffix=".jsonl", dir=self._spill_dir)
+        self._spill_file = os.fdopen(fd, "wb")
+        # Remove the file even if the session is discarded without close()
+        self._finalizer = weakref.finalize(self, _discard_spill, self._spill_file, self._spill_path)
+        return self._spill_file
+
+    def retain(self) -> str:
+        """
+        Keep the spill file, completed with the in-memory window.
+
+        For a transcript that could not be persisted: the file is no
+        longer deleted by ``close()`` or garbage collection, and ends
+        with the window, so it holds the whole transcript (one JSON
+        array per line).  It is renamed ``aida-transcript-retained-*``
+        and left to ``sweep_retained()``.  A transcript that never
+        spilled keeps no file.  Blocking — run it off the event loop.
+
+        Returns:
+            The spill file path, or ``""`` if there is none.
+        """
+        fh, path = self._spill_file, self._spill_path
+        if fh is None:
+            return ""
+        try:
+            if self._entries:
+                fh.write((_encode_line(self._entries) + "\n").encode())
+            fh.close()
+        except OSError:
+            logger.exception("Could not complete retained transcript: %s", path)
+        name = _RETAINED_PREFIX + os.path.basename(path)[len(_SPILL_PREFIX):]
+        retained = os.path.join(os.path.dirname(path), name)
+        try:
+            os.replace(path, retained)
+            path = retained
+        except OSError:
+            logger.exception("Could not rename retained transcript: %s", path)
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        self._spill_file = None
+        return path
+
+    def close(self) -> None:
+        """Delete the spill file; call once the transcript has been persisted."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._spill_file = None
+        self._spilled = 0
+        self._spilled_times = array("d")
+        self._batch_first = array("q")
+        self._batch_offsets = array("q")
+        self._spill_size = 0
+
+    # ── Reading ──────────────────────────────────────────────────────
+
+    def _plan(self, indices: Iterable[int]) -> list[tuple[int, list[int]]]:
+        """Group ascending spilled ``indices`` by batch: ``(file offset, positions in the batch)``."""
+        first, offsets = self._batch_first, self._batch_offsets
+        plan: list[tuple[int, list[int]]] = []
+        current = -1
+        for index in indices:
+            k = bisect_right(first, index) - 1
+            if k != current:
+                plan.append((offsets[k], []))
+                current = k
+            plan[-1][1].append(index - first[k])
+        return plan
+
+    @staticmethod
+    def _read_batches(path: str, plan: list[tuple[int, list[int]]]) -> Iterator[dict[str, str]]:
+        """Entries picked by ``plan``; each batch line is read once."""
+        with open(path, "rb") as fh:
+            for offset, positions in plan:
+                fh.seek(offset)
+                batch = json.loads(fh.readline())
+                for position in positions:
+                    yield batch[position]
+
+    def _read_spilled(self, indices: Iterable[int]) -> Iterator[dict[str, str]]:
+        """Spilled entries at ascending ``indices``, read on the calling thread."""
+        return self._read_batches(self._spill_path, self._plan(indices))
+
+    async def _load_spilled(self, indices: Iterable[int]) -> list[dict[str, str]]:
+        """Spilled entries at ascending ``indices``, read on a worker thread."""
+        # Planned on the loop: the batch index only grows there
+        plan = self._plan(indices)
+        if not plan:
+            return []
+        return await asyncio.to_thread(lambda: list(self._read_batches(self._spill_path, plan)))
+
+    def entries(self, start: int = 0, stop: int | None = None) -> Iterator[dict[str, str]]:
+        """
+        Stream entries ``[start, stop)`` across disk and memory.
+
+        Entries added while iterating are not included, and entries
+        spilled meanwhile are read from disk, so the sequence stays
+        consistent.
+        """
+        total = len(self)
+        stop = total if stop is None else min(stop, total)
+        index = max(0, start)
+        while index < stop:
+            spilled = self._spilled
+            if index < spilled:
+                end = min(stop, spilled)
+                yield from self._read_spilled(range(index, end))
+                index = end
+            else:
+                yield self._entries[index - spilled]
+                index += 1
+
+    async def read(self, start: int = 0, stop: int | None = None) -> list[dict[str, str]]:
+        """
+        Entries ``[start, stop)`` as of the call, without blocking the loop.
+
+        Spilled entries are read from disk on a worker thread; entries
+        added or spilled meanwhile do not change the result.
+        """
+        total = len(self)
+        stop = total if stop is None else min(stop, total)
+        start = max(0, start)
+        spilled = self._spilled
+        recent = self._entries[max(0, start - spilled):max(0, stop - spilled)]
+        entries = await self._load_spilled(range(start, min(stop, spilled)))
+        entries.extend(recent)
+        return entries
+
+    async def read_between(self, start: datetime | float, end: datetime | float) -> list[dict[str, str]]:
+        """``between()`` without blocking the loop (spilled entries are read on a worker thread)."""
+        hits, recent = self._select_between(start, end)
+        entries = await self._load_spilled(hits)
+        entries.extend(recent)
+        return entries
+
+    def recent(self, count: int) -> list[dict[str, str]]:
+        """The last ``count`` entries, oldest first."""
+        return list(self.entries(len(self) - count))
+
+    def between(self, start: datetime | float, end: datetime | float) -> Iterator[dict[str, str]]:
+        """
+        Entries timestamped in ``[start, end)``, in transcript order.
+
+        Matches are selected when called, so later spills do not affect
+        the result.
+
+        Args:
+            start: Datetime or epoch seconds.
+            end: Datetime or epoch seconds.
+        """
+        return self._between(*self._select_between(start, end))
+
+    def _select_between(
+        self, start: datetime | float, end: datetime | float
+    ) -> tuple[list[int], list[dict[str, str]]]:
+        """Spilled indices and in-memory entries timestamped in ``[start, end)``."""
+        lo = start.timestamp() if isinstance(start, datetime) else start
+        hi = end.timestamp() if isinstance(end, datetime) else end
+        hits: list[int] = []
+        if self._spilled:
+            times = np.frombuffer(self._spilled_times, dtype=np.float64)
+            hits = np.flatnonzero((times >= lo) & (times < hi)).tolist()
+        recent = [entry for entry, at in zip(self._entries, self._times) if lo <= at < hi]
+        return hits, recent
+
+    def _between(self, hits: list[int], recent: list[dict[str, str]]) -> Iterator[dict[str, str]]:
+        if hits:
+            yield from self._read_spilled(hits)
+        yield from recent
+
+    # ── Stats ────────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self),
+            "in_memory": len(self._entries),
+            "memory_bytes": self._bytes,
+            "peak_memory_bytes": self._peak_bytes,
+            "index_bytes": self._spilled_times.itemsize * len(self._spilled_times) + 16 * len(self._batch_first),
+            "spilled": self._spilled,
+            "spill_bytes": self._spill_size,
+            "dropped": self._dropped,
+        }
@@ -0,0 +1,152 @@
+"""
+voice_service.turn_latency — Mouth-to-ear latency tracking per voice turn.
+
+A "turn" starts when the caller stops speaking and ends when the first
+byte of AIDA's reply is written to the ACS WebSocket.  The audio worker
+stamps five points along that path:
+
+  1. ``user_audio``      — last non-silent caller frame forwarded upstream
+  2. ``committed``       — ``input_audio_buffer.committed`` (server VAD)
+  3. ``response_created``— ``response.created``
+  4. ``first_delta``     — first ``response.audio.delta`` of the response
+  5. ``first_acs_byte``  — first successful write to the ACS socket
+
+and derives per-stage durations from them.  Each completed turn is
+recorded in a per-session histogram set and in the process-wide
+histograms exported on ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import time
+
+from voice_service.voice_metrics import REGISTRY, Histogram
+
+# Stage name -> (start mark, end mark)
+TURN_STAGES: dict[str, tuple[str, str]] = {
+    "vad_commit": ("user_audio", "committed"),
+    "response_start": ("committed", "response_created"),
+    "first_audio": ("response_created", "first_delta"),
+    "acs_send": ("first_delta", "first_acs_byte"),
+    "mouth_to_ear": ("user_audio", "first_acs_byte"),
+}
+
+_TURN_LATENCY_NAME = "aida_voice_turn_latency_seconds"
+_TURN_LATENCY_HELP = "Per-stage latency of a voice turn, from end of caller speech to first ACS byte."
+
+_PROCESS_HISTOGRAMS: dict[str, Histogram] = {
+    stage: REGISTRY.histogram(_TURN_LATENCY_NAME, _TURN_LATENCY_HELP, labels={"stage": stage})
+    for stage in TURN_STAGES
+}
+_TURNS_TOTAL = REGISTRY.counter("aida_voice_turns_total", "Completed voice turns (first reply audio delivered).")
+
+
+class TurnLatencyTracker:
+    """
+    Timestamps the key points of each voice turn for one session.
+
+    All marks are ``time.perf_counter()`` values and every ``mark_*``
+    method is a couple of attribute writes, so it is safe to call from
+    the per-frame audio path.
+    """
+
+    __slots__ = (
+        "_committed",
+        "_first_delta",
+        "_histograms",
+        "_last_user_audio",
+        "_response_created",
+        "_user_audio",
+        "last_turn",
+        "turns",
+    )
+
+    def __init__(self) -> None:
+        self._last_user_audio = 0.0
+        self._user_audio = 0.0
+        self._committed = 0.0
+        self._response_created = 0.0
+        self._first_delta = 0.0
+        self._histograms: dict[str, Histogram] = {
+            stage: Histogram(_TURN_LATENCY_NAME, _TURN_LATENCY_HELP) for stage in TURN_STAGES
+        }
+        self.turns = 0
+        """Number of completed turns in this session."""
+        self.last_turn: dict[str, float] = {}
+        """Stage durations (seconds) of the most recent completed turn."""
+
+    # ── Marks ────────────────────────────────────────────────────────
+
+    def mark_user_audio(self) -> None:
+        """Record that a non-silent caller frame was forwarded upstream."""
+        self._last_user_audio = time.perf_counter()
+
+    def mark_committed(self) -> None:
+        """Record ``input_audio_buffer.committed`` — a new turn begins."""
+        self._committed = time.perf_counter()
+        self._user_audio = self._last_user_audio
+        self._response_created = 0.0
+        self._first_delta = 0.0
+
+    def mark_response_created(self) -> None:
+        """Record ``response.created`` for the turn in progress."""
+        if self._committed and not self._response_created:
+            self._response_created = time.perf_counter()
+
+    def mark_first_delta(self) -> None:
+        """Record the first ``response.audio.delta`` of the turn."""
+        if self._response_created and not self._first_delta:
+            self._first_delta = time.perf_counter()
+
+    def mark_first_acs_byte(self) -> None:
+        """Record the first successful ACS write and close the turn."""
+        if not self._first_delta:
+            return
+        now = time.perf_counter()
+        marks = {
+            "user_audio": self._user_audio,
+            "committed": self._committed,
+            "response_created": self._response_created,
+            "first_delta": self._first_delta,
+            "first_acs_byte": now,
+        }
+        turn: dict[str, float] = {}
+        for stage, (start, end) in TURN_STAGES.items():
+            if not marks[start] or marks[end] < marks[start]:
+                continue
+            duration = marks[end] - marks[start]
+            turn[stage] = duration
+            self._histograms[stage].observe(duration)
+            _PROCESS_HISTOGRAMS[stage].observe(duration)
+
+        self.turns += 1
+        self.last_turn = turn
+        _TURNS_TOTAL.inc()
+        self._reset()
+
+    def mark_response_done(self) -> None:
+        """
+        Record ``response.done``.
+
+        A response that finished without audio (typically a function
+        call) leaves the turn open so the follow-up response, which
+        carries the tool result, is measured against the same commit.
+        """
+        if self._committed and not self._first_delta:
+            self._response_created = 0.0
+
+    def _reset(self) -> None:
+        self._committed = 0.0
+        self._user_audio = 0.0
+        self._response_created = 0.0
+        self._first_delta = 0.0
+
+    # ── Reporting ────────────────────────────────────────────────────
+
+    def snapshot(self) -> dict[str, object]:
+        """Per-session latency summary (count, mean, p50/p90/p99 per stage)."""
+        return {
+            "turns": self.turns,
+            "last_turn": self.last_turn,
+            "stages": {stage: hist.snapshot() for stage, hist in self._histograms.items()},
+        }
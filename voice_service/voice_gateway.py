@@ -11,17 +11,14 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
-from typing import Any
 
 import aiohttp
-from aiohttp import web
-from aiohttp.web import Request, WebSocketResponse
-
 from aida_sdk.clients.acs_client import ACSClient
+from aiohttp.web import Request, WebSocketResponse
 
-from voice_service.voice_state import VoiceSession
 from voice_service.meeting_audio_worker import MeetingAudioWorker
 from voice_service.meeting_state import MeetingSessionManager
+from voice_service.voice_state import VoiceSession
 
 logger = logging.getLogger(__name__)
 
@@ -67,9 +64,11 @@ class VoiceGateway:
         session_id = str(uuid.uuid4())
         logger.info("WebSocket connected: session_id=%s", session_id)
 
-        # Create a VoiceSession to track shared state
+        # Create a VoiceSession to track shared state.  ACS includes the
+        # call connection ID as a header on the media streaming upgrade.
         session = VoiceSession(
             session_id=session_id,
+            call_connection_id=request.headers.get("x-ms-call-connection-id", ""),
             acs_ws=ws,
         )
         self._active_sessions[session_id] = session
@@ -130,6 +129,10 @@ class VoiceGateway:
         """Retrieve an active audio worker by session ID."""
         return self._active_workers.get(session_id)
 
+    def list_workers(self) -> list[MeetingAudioWorker]:
+        """Active audio workers, oldest session first."""
+        return list(self._active_workers.values())
+
     def get_session_by_call_connection(self, call_connection_id: str) -> VoiceSession | None:
         """Look up a session by its ACS call connection ID."""
         for session in self._active_sessions.values():
@@ -137,6 +140,10 @@ class VoiceGateway:
                 return session
         return None
 
+    def call_connection_ids(self) -> set[str]:
+        """ACS call connection IDs of the active sessions."""
+        return {session.call_connection_id for session in self._active_sessions.values()}
+
     @property
     def active_session_count(self) -> int:
         """Number of currently active voice sessions."""
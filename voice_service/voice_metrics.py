@@ -0,0 +1,272 @@
+"""
+voice_service.voice_metrics — Process-wide metrics and Prometheus export.
+
+Provides three metric primitives — counters, gauges and fixed-bucket
+histograms — plus a registry that renders them in the Prometheus text
+exposition format for the ``GET /metrics`` endpoint.
+
+All updates happen on the event loop thread, so the primitives are
+plain attribute increments with no locking.  Histograms use a fixed,
+pre-sorted bucket list and a bisect lookup per observation.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Default latency buckets (seconds) — tuned for voice turn stages, which
+# range from a few milliseconds (socket writes) to several seconds
+# (model responses on a cold deployment).
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.4,
+    0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0,
+)
+
+
+def _format_labels(labels: dict[str, str] | None, extra: str = "") -> str:
+    """Render a label dict (plus an optional pre-rendered pair) as ``{k="v",...}``."""
+    parts = [f'{k}="{v}"' for k, v in (labels or {}).items()]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value the way Prometheus expects it."""
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if value == math.inf:
+        return "+Inf"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    __slots__ = ("help", "labels", "name", "value")
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: dict[str, str] | None = None) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the counter by ``amount``."""
+        self.value += amount
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        """Yield ``(name, labels, value)`` samples for export."""
+        yield self.name, _format_labels(self.labels), self.value
+
+
+class Gauge:
+    """
+    Point-in-time value.
+
+    Either set explicitly via ``set()``/``inc()``/``dec()`` or backed by
+    a zero-argument callable that is evaluated at scrape time.
+    """
+
+    __slots__ = ("_fn", "help", "labels", "name", "value")
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: dict[str, str] | None = None,
+        fn: Callable[[], float] | None = None,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.value: float = 0
+        self._fn = fn
+
+    def set(self, value: float) -> None:
+        """Set the gauge to ``value``."""
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the gauge by ``amount``."""
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Decrease the gauge by ``amount``."""
+        self.value -= amount
+
+    def get(self) -> float:
+        """Return the current value (evaluating the callback if set)."""
+        if self._fn is not None:
+            try:
+                return self._fn()
+            except Exception:
+                # A broken callback must not fail the whole /metrics scrape
+                logger.exception("Gauge callback failed: %s", self.name)
+                return math.nan
+        return self.value
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        """Yield ``(name, labels, value)`` samples for export."""
+        yield self.name, _format_labels(self.labels), self.get()
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Bucket upper bounds are fixed at construction; ``observe()`` is a
+    bisect plus two additions.  Counts are stored per bucket and made
+    cumulative only at export time.
+    """
+
+    __slots__ = ("buckets", "count", "counts", "help", "labels", "name", "sum")
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+        labels: dict[str, str] | None = None,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        # One extra slot for the implicit +Inf bucket
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the ``q`` quantile (0..1) by linear interpolation
+        within the bucket that contains it.
+
+        Returns 0.0 when the histogram is empty.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for i, bucket_count in enumerate(self.counts):
+            upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+            if cumulative + bucket_count >= rank and bucket_count:
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+            lower = upper
+        return self.buckets[-1]
+
+    def snapshot(self) -> dict[str, float]:
+        """Return count, mean and common percentiles as a plain dict."""
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99),
+        }
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        """Yield cumulative bucket, sum and count samples for export."""
+        cumulative = 0
+        for bound, bucket_count in zip((*self.buckets, math.inf), self.counts):
+            cumulative += bucket_count
+            le = f'le="{_format_value(bound)}"'
+            yield f"{self.name}_bucket", _format_labels(self.labels, le), cumulative
+        yield f"{self.name}_sum", _format_labels(self.labels), self.sum
+        yield f"{self.name}_count", _format_labels(self.labels), self.count
+
+
+Metric = Counter | Gauge | Histogram
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together on ``/metrics``.
+
+    Metrics sharing a name (but with different labels) are grouped
+    under one ``# HELP`` / ``# TYPE`` header.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[tuple[str, tuple[tuple[str, str], ...]], Metric] = {}
+
+    def _register(self, metric: Metric) -> Metric:
+        key = (metric.name, tuple(sorted((metric.labels or {}).items())))
+        existing = self._metrics.get(key)
+        if existing is not None:
+            return existing
+        self._metrics[key] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: dict[str, str] | None = None) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, help, labels))  # type: ignore[return-value]
+
+    def gauge(
+        self,
+        name: str,
+        help: str,
+        labels: dict[str, str] | None = None,
+        fn: Callable[[], float] | None = None,
+    ) -> Gauge:
+        """Get or create a gauge (optionally backed by a callback)."""
+        gauge: Gauge = self._register(Gauge(name, help, labels, fn))  # type: ignore[assignment]
+        if fn is not None:
+            # Re-bind the callback so a re-created app scrapes its own state
+            gauge._fn = fn
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+        labels: dict[str, str] | None = None,
+    ) -> Histogram:
+        """Get or create a fixed-bucket histogram."""
+        return self._register(Histogram(name, help, buckets, labels))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Render all registered metrics in Prometheus text format (0.0.4)."""
+        lines: list[str] = []
+        seen: set[str] = set()
+        for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+            if metric.name not in seen:
+                seen.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        lines.append("")
+        return "\n".join(lines)
+
+
+# Process-wide registry used by the /metrics endpoint
+REGISTRY = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
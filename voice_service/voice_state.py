@@ -9,12 +9,18 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from typing import Any
 
 import aiohttp
 from aiohttp.web import WebSocketResponse
 
+from voice_service.audio_codecs import REALTIME_AUDIO_FORMAT
+from voice_service.call_recorder import RECORDING_ENABLED
+from voice_service.participant_tracker import ParticipantTracker
+from voice_service.transcript_stream import get_stream_hub
+from voice_service.transcript_window import TranscriptWindow
+
 
 @dataclass
 class VoiceSession:
@@ -36,6 +42,8 @@ class VoiceSession:
     participants: list[str] = field(default_factory=list)
     speaker_map: dict[str, str] = field(default_factory=dict)
     """Maps ACS participantRawId -> display name."""
+    participant_activity: ParticipantTracker = field(default_factory=ParticipantTracker, repr=False)
+    """Per-participant speaking time, turns and interruptions from ACS audio."""
 
     # ── Mode flags ───────────────────────────────────────────────────
     is_meeting_mode: bool = False
@@ -43,6 +51,12 @@ class VoiceSession:
     is_voice_active: bool = False
     """True when AIDA is actively listening/responding (wake word activated)."""
 
+    # ── Audio format ─────────────────────────────────────────────────
+    realtime_audio_format: str = REALTIME_AUDIO_FORMAT
+    """Realtime API audio format (``pcm16``, ``g711_ulaw`` or ``g711_alaw``)."""
+    record: bool = RECORDING_ENABLED
+    """Capture inbound and outbound audio to a WAV recording."""
+
     # ── WebSocket handles ────────────────────────────────────────────
     realtime_ws: aiohttp.ClientWebSocketResponse | None = field(default=None, repr=False)
     """WebSocket connection to the OpenAI Realtime API."""
@@ -50,11 +64,11 @@ class VoiceSession:
     """WebSocket connection from the ACS media streaming platform."""
 
     # ── Transcript ───────────────────────────────────────────────────
-    transcript_entries: list[dict[str, str]] = field(default_factory=list)
-    """List of {"speaker": ..., "text": ..., "timestamp": ...} dicts."""
+    transcript_entries: TranscriptWindow = field(default_factory=TranscriptWindow, repr=False)
+    """{"speaker": ..., "text": ..., "timestamp": ...} dicts; older entries spill to disk."""
 
     # ── Timing ───────────────────────────────────────────────────────
-    start_time: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    start_time: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
 
     # ── Methods ──────────────────────────────────────────────────────
 
@@ -75,26 +89,34 @@ class VoiceSession:
         # Fallback: use last 8 chars of the raw ID
         return f"Speaker-{participant_raw_id[-8:]}" if participant_raw_id else "Unknown"
 
-    def add_transcript_entry(self, speaker: str, text: str) -> None:
+    def add_transcript_entry(self, speaker: str, text: str, timestamp: str | None = None) -> None:
         """
         Append a new transcript entry with an automatic timestamp.
 
+        The entry is also pushed to any live transcript subscribers.
+
         Args:
             speaker: Display name of the speaker.
             text: The spoken text (transcription result).
+            timestamp: ISO timestamp of when the speech started, for
+                entries transcribed after the fact (defaults to now).
         """
-        self.transcript_entries.append({
-            "speaker": speaker,
-            "text": text,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
+        at = None
+        if timestamp is None:
+            now = datetime.now(UTC)
+            timestamp, at = now.isoformat(), now.timestamp()
+        entry = {"speaker": speaker, "text": text, "timestamp": timestamp}
+        self.transcript_entries.append(entry, at)
+        get_stream_hub().publish_transcript(self.session_id, entry)
 
     def to_dict(self) -> dict[str, Any]:
         """
         Serialise the session state to a plain dict.
 
         Suitable for JSON serialisation, Redis storage, or API responses.
-        Excludes WebSocket handles (not serialisable).
+        Excludes WebSocket handles (not serialisable).  Only the
+        in-memory transcript window is included; iterate
+        ``transcript_entries`` for the full transcript.
 
         Returns:
             Dictionary representation of the session.
@@ -108,6 +130,7 @@ class VoiceSession:
             "speaker_map": self.speaker_map,
             "is_meeting_mode": self.is_meeting_mode,
             "is_voice_active": self.is_voice_active,
-            "transcript_entries": self.transcript_entries,
+            "transcript_entries": self.transcript_entries.window,
+            "transcript_count": len(self.transcript_entries),
             "start_time": self.start_time,
         }
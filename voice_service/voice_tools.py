@@ -1,10 +1,11 @@
 """
 voice_service.voice_tools — Tool definitions and dispatcher for the Realtime API.
 
-Defines the VOICE_TOOLS list (OpenAI function-calling schema) and the
-``execute_tool()`` dispatcher that routes tool calls to the appropriate
-handler.  Each tool typically calls an aida-sdk client or the data/
-intelligence service API.
+Defines the VOICE_TOOLS list (OpenAI function-calling schema), the
+argument validators compiled from it at import (``parse_tool_arguments()``)
+and the ``execute_tool()`` dispatcher that routes tool calls to the
+appropriate handler.  Each tool typically calls an aida-sdk client or
+the data/intelligence service API.
 """
 
 from __future__ import annotations
@@ -12,6 +13,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from voice_service.tool_args import (
+    ToolArgumentError,
+    Validator,
+    compile_validator,
+    parse_arguments,
+)
+from voice_service.voice_metrics import REGISTRY
 from voice_service.voice_state import VoiceSession
 
 logger = logging.getLogger(__name__)
@@ -27,7 +35,9 @@ VOICE_TOOLS: list[dict[str, Any]] = [
         "name": "get_call_context",
         "description": (
             "Get information about the current call — who is on the call, "
-            "how long it has been going, meeting subject, and participants."
+            "how long it has been going, meeting subject, and participants, "
+            "including how long each participant has spoken and how often "
+            "they interrupted or were interrupted."
         ),
         "parameters": {
             "type": "object",
@@ -72,6 +82,8 @@ VOICE_TOOLS: list[dict[str, Any]] = [
                     "type": "integer",
                     "description": "Number of days to look back (default 30).",
                     "default": 30,
+                    "minimum": 1,
+                    "maximum": 365,
                 },
             },
             "required": ["query"],
@@ -154,6 +166,8 @@ VOICE_TOOLS: list[dict[str, Any]] = [
                     "type": "integer",
                     "description": "Meeting duration in minutes (default 30).",
                     "default": 30,
+                    "minimum": 5,
+                    "maximum": 480,
                 },
             },
             "required": ["subject", "attendees", "time"],
@@ -199,6 +213,52 @@ VOICE_TOOLS: list[dict[str, Any]] = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Argument validation
+# ---------------------------------------------------------------------------
+
+# One validator per tool, compiled from its schema once at import
+_VALIDATORS: dict[str, Validator] = {
+    tool["name"]: compile_validator(tool["name"], tool["parameters"]) for tool in VOICE_TOOLS
+}
+
+_ARGUMENT_ERRORS = {
+    tool["name"]: REGISTRY.counter(
+        "aida_voice_tool_argument_errors_total",
+        "Tool calls rejected back to the model because their arguments failed validation.",
+        labels={"tool": tool["name"]},
+    )
+    for tool in VOICE_TOOLS
+}
+
+
+def parse_tool_arguments(tool_name: str, arguments: str) -> dict[str, Any]:
+    """
+    Decode, validate and normalise a tool call's JSON argument string.
+
+    Defaults from the schema are filled in and near-miss types coerced
+    (see ``voice_service.tool_args``).
+
+    Args:
+        tool_name: Name of the tool being called.
+        arguments: The ``arguments`` string from the Realtime API.
+
+    Returns:
+        Arguments ready for the tool handler.
+
+    Raises:
+        ToolArgumentError: The arguments cannot be fixed up; its
+            ``to_result()`` tells the model what to correct.
+    """
+    try:
+        return parse_arguments(tool_name, arguments, _VALIDATORS.get(tool_name))
+    except ToolArgumentError:
+        counter = _ARGUMENT_ERRORS.get(tool_name)
+        if counter is not None:
+            counter.inc()
+        raise
+
+
 # ---------------------------------------------------------------------------
 # Tool dispatcher
 # ---------------------------------------------------------------------------
@@ -218,7 +278,7 @@ async def execute_tool(
 
     Args:
         tool_name: Name of the tool to execute.
-        args: Parsed arguments from the Realtime API.
+        args: Arguments from ``parse_tool_arguments()``.
         session: The active VoiceSession (for call context).
 
     Returns:
@@ -248,6 +308,7 @@ async def _get_call_context(args: dict[str, Any], session: VoiceSession) -> dict
         "speaker_map": session.speaker_map,
         "start_time": session.start_time,
         "transcript_count": len(session.transcript_entries),
+        "participant_activity": session.participant_activity.snapshot(session.get_speaker_name),
     }
 
 
@@ -303,7 +364,7 @@ async def _send_email_draft(args: dict[str, Any], session: VoiceSession) -> dict
     #   result = await client.create_draft_email(to, subject, body)
     #   return {"status": "draft_created", "message_id": result["id"]}
 
-    logger.info("Email draft: to=%s, subject=%s", to, subject)
+    logger.info("Email draft: to=%s, subject=%s, body_chars=%d", to, subject, len(body))
     return {"status": "draft_created", "message": "TODO: Implement email draft via GraphClient"}
 
 
@@ -320,7 +381,13 @@ async def _schedule_meeting(args: dict[str, Any], session: VoiceSession) -> dict
     #   result = await client.create_event(subject, attendees, time, duration_minutes)
     #   return {"status": "scheduled", "event_id": result["id"]}
 
-    logger.info("Schedule meeting: subject=%s, attendees=%s, time=%s", subject, attendees, time)
+    logger.info(
+        "Schedule meeting: subject=%s, attendees=%s, time=%s, duration=%dmin",
+        subject,
+        attendees,
+        time,
+        duration_minutes,
+    )
     return {"status": "scheduled", "message": "TODO: Implement meeting scheduling via GraphClient"}
 
 
@@ -363,3 +430,8 @@ _TOOL_HANDLERS = {
     "web_search": _web_search,
     "get_action_status": _get_action_status,
 }
+
+
+def get_tool_handlers() -> dict[str, Any]:
+    """Return a copy of the tool name -> handler coroutine function registry."""
+    return dict(_TOOL_HANDLERS)
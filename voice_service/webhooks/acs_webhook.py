@@ -6,8 +6,13 @@ events: CallConnected, CallDisconnected, PlayCompleted,
 RecognizeCompleted, ParticipantsUpdated, MediaStreamingStarted,
 MediaStreamingStopped.
 
-Each event is routed to the appropriate handler which updates session
-state, manages audio workers, and triggers post-processing.
+The webhook only validates the batch, enqueues each event on the
+per-call ``CallEventQueue`` and acknowledges immediately — handlers can
+take seconds (``CallDisconnected`` stops the worker, which persists the
+transcript and triggers post-processing) and Event Grid retries slow
+deliveries.  Each event is then routed in the background to the
+appropriate handler which updates session state, manages audio
+workers, and triggers post-processing.
 """
 
 from __future__ import annotations
@@ -16,23 +21,36 @@ import json
 import logging
 from typing import Any
 
+from aiohttp import web
 from aiohttp.web import Request, Response, json_response
 
+from voice_service.call_reaper import count_humans
+from voice_service.event_dispatch import EventTable
+from voice_service.webhooks.dedup import EventDeduplicator
+from voice_service.webhooks.event_queue import CallEventQueue, QueuedEvent
+
 logger = logging.getLogger(__name__)
 
+# Call Automation event handlers, registered on the functions below
+_acs_events = EventTable("ACS", metric_name="aida_voice_acs_events_total")
+
 
 async def handle_acs_event(request: Request) -> Response:
     """
     Handle ACS Call Automation webhook events.
 
     ACS sends a JSON array of CloudEvent-formatted events to this
-    endpoint for each call lifecycle transition.
+    endpoint for each call lifecycle transition.  Events are enqueued
+    for background processing (ordered per call) and acknowledged
+    without waiting for their handlers.  Redelivered events are
+    acknowledged but not processed again.
 
     Args:
         request: The incoming aiohttp request containing ACS events.
 
     Returns:
-        200 OK to acknowledge receipt.
+        200 OK to acknowledge receipt, or 503 if the event queue is
+        full (Event Grid will redeliver).
     """
     try:
         body = await request.json()
@@ -43,6 +61,14 @@ async def handle_acs_event(request: Request) -> Response:
     # ACS sends events as a JSON array (CloudEvents batch)
     events: list[dict[str, Any]] = body if isinstance(body, list) else [body]
 
+    # Refuse the whole batch rather than half of it when saturated
+    queue: CallEventQueue | None = request.app.get("acs_event_queue")
+    if queue is not None and not queue.has_capacity(len(events)):
+        logger.warning("ACS event queue full: pending=%d, batch=%d", queue.pending, len(events))
+        return json_response({"error": "Event queue full"}, status=503)
+
+    dedup: EventDeduplicator | None = request.app.get("webhook_dedup")
+
     for event in events:
         # CloudEvents envelope
         event_type = event.get("type", "")
@@ -51,7 +77,6 @@ async def handle_acs_event(request: Request) -> Response:
         # Extract common fields
         call_connection_id = event_data.get("callConnectionId", "")
         server_call_id = event_data.get("serverCallId", "")
-        correlation_id = event_data.get("correlationId", "")
 
         logger.info(
             "ACS event: type=%s, call=%s, server_call=%s",
@@ -66,49 +91,47 @@ async def handle_acs_event(request: Request) -> Response:
             logger.info("Event Grid validation: code=%s", validation_code)
             return json_response({"validationResponse": validation_code})
 
-        # ── Call Connected ───────────────────────────────────────────
-        elif event_type == "Microsoft.Communication.CallConnected":
-            await _handle_call_connected(request, event_data, call_connection_id, server_call_id)
+        # At-least-once delivery — a redelivered event is acked, not re-run
+        if dedup is not None and dedup.is_duplicate(event, "acs"):
+            continue
 
-        # ── Call Disconnected ────────────────────────────────────────
-        elif event_type == "Microsoft.Communication.CallDisconnected":
-            await _handle_call_disconnected(request, event_data, call_connection_id)
-
-        # ── Play Completed ───────────────────────────────────────────
-        elif event_type == "Microsoft.Communication.PlayCompleted":
-            await _handle_play_completed(request, event_data, call_connection_id)
+        queued = QueuedEvent(event_type, event_data, call_connection_id)
+        if queue is None:
+            # No background queue (app not started) — handle inline
+            await process_acs_event(request.app, queued)
+        else:
+            queue.submit(queued)
 
-        # ── Recognize Completed ──────────────────────────────────────
-        elif event_type == "Microsoft.Communication.RecognizeCompleted":
-            await _handle_recognize_completed(request, event_data, call_connection_id)
+    return json_response({"status": "ok"})
 
-        # ── Participants Updated ─────────────────────────────────────
-        elif event_type == "Microsoft.Communication.ParticipantsUpdated":
-            await _handle_participants_updated(request, event_data, call_connection_id)
 
-        # ── Media Streaming Started ──────────────────────────────────
-        elif event_type == "Microsoft.Communication.MediaStreamingStarted":
-            await _handle_media_streaming_started(request, event_data, call_connection_id)
+async def process_acs_event(app: web.Application, event: QueuedEvent) -> None:
+    """
+    Run the handler registered for one queued ACS event.
 
-        # ── Media Streaming Stopped ──────────────────────────────────
-        elif event_type == "Microsoft.Communication.MediaStreamingStopped":
-            await _handle_media_streaming_stopped(request, event_data, call_connection_id)
+    Args:
+        app: The aiohttp application (for access to shared services).
+        event: The event accepted by ``handle_acs_event``.
+    """
+    pending = _ACS_DISPATCH.dispatch(event.event_type, app, event.data, event.call_connection_id)
+    if pending is not None:
+        await pending
 
-        else:
-            logger.debug("Unhandled ACS event type: %s", event_type)
 
-    return json_response({"status": "ok"})
+def get_acs_event_stats() -> dict[str, dict[str, float]]:
+    """Per-type ACS event counts and cumulative handler time for this process."""
+    return _ACS_DISPATCH.stats()
 
 
 # ---------------------------------------------------------------------------
 # Event handlers
 # ---------------------------------------------------------------------------
 
+@_acs_events.on("Microsoft.Communication.CallConnected")
 async def _handle_call_connected(
-    request: Request,
+    app: web.Application,
     data: dict[str, Any],
     call_connection_id: str,
-    server_call_id: str,
 ) -> None:
     """
     Handle CallConnected — the call is fully established.
@@ -118,10 +141,11 @@ async def _handle_call_connected(
     TODO: If meeting mode, start passive listening.
     TODO: If direct call, activate voice immediately.
     """
+    server_call_id = data.get("serverCallId", "")
     logger.info("Call connected: call=%s, server_call=%s", call_connection_id, server_call_id)
 
     # Access the voice gateway from the app
-    gateway = request.app.get("voice_gateway")
+    gateway = app.get("voice_gateway")
     if gateway:
         session = gateway.get_session_by_call_connection(call_connection_id)
         if session:
@@ -129,8 +153,9 @@ async def _handle_call_connected(
             logger.info("Session updated with server_call_id: session=%s", session.session_id)
 
 
+@_acs_events.on("Microsoft.Communication.CallDisconnected")
 async def _handle_call_disconnected(
-    request: Request,
+    app: web.Application,
     data: dict[str, Any],
     call_connection_id: str,
 ) -> None:
@@ -146,7 +171,7 @@ async def _handle_call_disconnected(
     """
     logger.info("Call disconnected: call=%s", call_connection_id)
 
-    gateway = request.app.get("voice_gateway")
+    gateway = app.get("voice_gateway")
     if gateway:
         session = gateway.get_session_by_call_connection(call_connection_id)
         if session:
@@ -156,8 +181,9 @@ async def _handle_call_disconnected(
                 await worker.stop()
 
 
+@_acs_events.on("Microsoft.Communication.PlayCompleted")
 async def _handle_play_completed(
-    request: Request,
+    app: web.Application,
     data: dict[str, Any],
     call_connection_id: str,
 ) -> None:
@@ -169,8 +195,9 @@ async def _handle_play_completed(
     logger.debug("Play completed: call=%s", call_connection_id)
 
 
+@_acs_events.on("Microsoft.Communication.RecognizeCompleted")
 async def _handle_recognize_completed(
-    request: Request,
+    app: web.Application,
     data: dict[str, Any],
     call_connection_id: str,
 ) -> None:
@@ -183,15 +210,17 @@ async def _handle_recognize_completed(
     logger.debug("Recognize completed: call=%s", call_connection_id)
 
 
+@_acs_events.on("Microsoft.Communication.ParticipantsUpdated")
 async def _handle_participants_updated(
-    request: Request,
+    app: web.Application,
     data: dict[str, Any],
     call_connection_id: str,
 ) -> None:
     """
     Handle ParticipantsUpdated — a participant joined or left.
 
-    Updates the session's participant list and speaker map.
+    Updates the session's participant list and speaker map, and gives
+    the worker the head count for the call reaper.
 
     TODO: Extract participant display names and raw IDs.
     TODO: Update session.participants and session.speaker_map.
@@ -205,7 +234,7 @@ async def _handle_participants_updated(
         len(participants),
     )
 
-    gateway = request.app.get("voice_gateway")
+    gateway = app.get("voice_gateway")
     if gateway:
         session = gateway.get_session_by_call_connection(call_connection_id)
         if session:
@@ -216,10 +245,14 @@ async def _handle_participants_updated(
                     session.speaker_map[raw_id] = display_name
                 if display_name and display_name not in session.participants:
                     session.participants.append(display_name)
+            worker = gateway.get_worker(session.session_id)
+            if worker:
+                worker.update_participants(count_humans(participants))
 
 
+@_acs_events.on("Microsoft.Communication.MediaStreamingStarted")
 async def _handle_media_streaming_started(
-    request: Request,
+    app: web.Application,
     data: dict[str, Any],
     call_connection_id: str,
 ) -> None:
@@ -234,8 +267,9 @@ async def _handle_media_streaming_started(
     logger.info("Media streaming started: call=%s", call_connection_id)
 
 
+@_acs_events.on("Microsoft.Communication.MediaStreamingStopped")
 async def _handle_media_streaming_stopped(
-    request: Request,
+    app: web.Application,
     data: dict[str, Any],
     call_connection_id: str,
 ) -> None:
@@ -247,3 +281,6 @@ async def _handle_media_streaming_stopped(
     TODO: Signal the audio worker to stop if still running.
     """
     logger.info("Media streaming stopped: call=%s", call_connection_id)
+
+
+_ACS_DISPATCH = _acs_events.bind()
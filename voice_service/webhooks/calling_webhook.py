@@ -13,9 +13,12 @@ import logging
 import uuid
 from typing import Any
 
+from aida_sdk.config import settings
 from aiohttp.web import Request, Response, json_response
 
-from aida_sdk.config import settings
+from voice_service.admission import AdmissionController
+from voice_service.call_reaper import note_bot_identity
+from voice_service.webhooks.dedup import EventDeduplicator
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +31,10 @@ async def handle_incoming_call(request: Request) -> Response:
     sends an IncomingCall event.  This handler:
       1. Extracts the incoming call context.
       2. Determines call mode (meeting join vs. direct call).
-      3. Answers the call with media streaming configuration.
-      4. Creates a meeting session (if applicable).
+      3. Checks admission control — an overloaded replica declines
+         with 503 and Retry-After instead of answering.
+      4. Answers the call with media streaming configuration.
+      5. Creates a meeting session (if applicable).
 
     Args:
         request: The incoming aiohttp request with call notification.
@@ -45,6 +50,7 @@ async def handle_incoming_call(request: Request) -> Response:
 
     # Handle as CloudEvents array or single event
     events: list[dict[str, Any]] = body if isinstance(body, list) else [body]
+    dedup: EventDeduplicator | None = request.app.get("webhook_dedup")
 
     for event in events:
         event_type = event.get("type", "")
@@ -57,7 +63,17 @@ async def handle_incoming_call(request: Request) -> Response:
 
         # ── Incoming Call ────────────────────────────────────────────
         if event_type == "Microsoft.Communication.IncomingCall":
-            return await _handle_incoming(request, event_data)
+            # A redelivered IncomingCall must not answer the call twice.
+            # The key is recorded before answering so a redelivery racing
+            # the answer is suppressed too.
+            if dedup is not None and dedup.is_duplicate(event, "incoming"):
+                return json_response({"status": "duplicate"})
+            response = await _handle_incoming(request, event_data)
+            if dedup is not None and response.status >= 300:
+                # Not answered (shed, not ready, answer failed): let the
+                # redelivery try again
+                dedup.forget(event)
+            return response
 
     return json_response({"status": "ok"})
 
@@ -71,7 +87,8 @@ async def _handle_incoming(request: Request, data: dict[str, Any]) -> Response:
         data: The IncomingCall event data payload.
 
     Returns:
-        JSON response with call connection details.
+        JSON response with call connection details, or 503 if the
+        call is shed by admission control.
     """
     incoming_call_context = data.get("incomingCallContext", "")
     caller_raw_id = data.get("from", {}).get("rawId", "")
@@ -87,9 +104,10 @@ async def _handle_incoming(request: Request, data: dict[str, Any]) -> Response:
     call_mode = "meeting" if is_meeting else "direct-call"
 
     logger.info(
-        "Incoming call: from=%s (%s), mode=%s, meeting_id=%s",
+        "Incoming call: from=%s (%s), to=%s, mode=%s, meeting_id=%s",
         caller_display_name,
         caller_raw_id,
+        to_raw_id,
         call_mode,
         meeting_id,
     )
@@ -98,6 +116,17 @@ async def _handle_incoming(request: Request, data: dict[str, Any]) -> Response:
         logger.error("Missing incomingCallContext — cannot answer call")
         return json_response({"error": "Missing incomingCallContext"}, status=400)
 
+    # Shed load before answering — a call we cannot carry degrades every other call
+    admission: AdmissionController | None = request.app.get("admission")
+    if admission:
+        decision = admission.evaluate(caller_raw_id, direct_call=not is_meeting)
+        if not decision.admitted:
+            return json_response(
+                {"error": "Not accepting new calls", "reason": decision.reason},
+                status=503,
+                headers=decision.reject_headers(),
+            )
+
     # Build callback URI for subsequent events
     callback_uri = f"{settings.BOT_CALLBACK_HOST}/api/calls/webhook"
 
@@ -124,6 +153,11 @@ async def _handle_incoming(request: Request, data: dict[str, Any]) -> Response:
         logger.exception("Failed to answer incoming call")
         return json_response({"error": "Failed to answer call"}, status=500)
 
+    # The callee, and the identity that answered, are the bot: not a human for the reaper
+    note_bot_identity(to_raw_id)
+    answered_by = getattr(getattr(result, "call_connection_properties", None), "answered_by", None)
+    note_bot_identity(getattr(answered_by, "raw_id", "") or "")
+
     # Create meeting session
     meeting_manager = request.app.get("meeting_manager")
     if meeting_manager:
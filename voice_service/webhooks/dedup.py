@@ -0,0 +1,123 @@
+"""
+voice_service.webhooks.dedup — Suppress redelivered webhook events.
+
+Event Grid and ACS deliver at-least-once: a slow or failed ack (or a
+transient network error on their side) leads to the same CloudEvent
+arriving again.  Without deduplication a redelivered CallDisconnected
+stops the worker twice — persisting the transcript and triggering
+post-processing twice — and a redelivered IncomingCall tries to answer
+a call that is already connected.
+
+Events are keyed by their CloudEvent ``id``.  Events without an id fall
+back to ``type`` + ``data.correlationId`` + ``data.sequenceNumber``;
+events with neither are never treated as duplicates.  Keys expire after
+a TTL and the cache is bounded, evicting the oldest keys first.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Event Grid backs off over minutes-to-hours; an hour covers the retries
+# that matter for a live call.
+DEDUP_TTL_SECONDS = float(os.getenv("AIDA_WEBHOOK_DEDUP_TTL_SECONDS", "3600"))
+DEDUP_MAX_ENTRIES = int(os.getenv("AIDA_WEBHOOK_DEDUP_MAX_ENTRIES", "20000"))
+
+
+def event_key(event: dict[str, Any]) -> str | None:
+    """
+    Identity of a CloudEvent for deduplication.
+
+    Returns:
+        The event ``id``, else ``type|correlationId|sequenceNumber``,
+        or ``None`` if the event carries nothing to key on.
+    """
+    event_id = event.get("id")
+    if event_id:
+        return str(event_id)
+    data = event.get("data") or {}
+    correlation_id = data.get("correlationId")
+    if not correlation_id:
+        return None
+    return f"{event.get('type', '')}|{correlation_id}|{data.get('sequenceNumber', '')}"
+
+
+class EventDeduplicator:
+    """
+    Bounded TTL set of recently seen event keys.
+
+    All keys share one TTL, so insertion order is also expiry order and
+    eviction only ever looks at the oldest entries.
+
+    Args:
+        ttl: Seconds a key is remembered.
+        max_entries: Maximum keys held; the oldest are evicted first.
+    """
+
+    def __init__(self, ttl: float = DEDUP_TTL_SECONDS, max_entries: int = DEDUP_MAX_ENTRIES) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+        self._suppressed = 0
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def _evict_expired(self, now: float) -> None:
+        expiry = self._expiry
+        while expiry and next(iter(expiry.values())) <= now:
+            expiry.popitem(last=False)
+
+    def is_duplicate(self, event: dict[str, Any], source: str) -> bool:
+        """
+        Check an event and remember it.
+
+        Args:
+            event: The CloudEvent envelope (``id``, ``type``, ``data``).
+            source: Webhook name, used as the metric label.
+
+        Returns:
+            True if the same event was seen within the TTL.
+        """
+        key = event_key(event)
+        if key is None:
+            return False
+        now = time.monotonic()
+        self._evict_expired(now)
+        if key in self._expiry:
+            self._suppressed += 1
+            REGISTRY.counter(
+                "aida_voice_webhook_duplicates_total",
+                "Redelivered webhook events suppressed by the dedup cache.",
+                labels={"webhook": source},
+            ).inc()
+            logger.info("Duplicate %s webhook event suppressed: type=%s, key=%s", source, event.get("type", ""), key)
+            return True
+        self._expiry[key] = now + self._ttl
+        if len(self._expiry) > self._max_entries:
+            self._expiry.popitem(last=False)
+        return False
+
+    def forget(self, event: dict[str, Any]) -> None:
+        """
+        Drop an event's key so a redelivery is processed again.
+
+        For events whose handling failed or was refused (e.g. a shed
+        IncomingCall): the sender retries them, and the retry must not
+        be suppressed as a duplicate.
+        """
+        key = event_key(event)
+        if key is not None:
+            self._expiry.pop(key, None)
+
+    def stats(self) -> dict[str, int]:
+        """Cache size and number of suppressed duplicates."""
+        return {"entries": len(self._expiry), "suppressed": self._suppressed}
@@ -0,0 +1,178 @@
+"""
+voice_service.webhooks.event_queue — Per-call ordered background event processing.
+
+The ACS webhook acknowledges Event Grid as soon as a batch is validated
+and enqueued; the handlers run afterwards on background tasks.  Events
+are kept in one FIFO per ``call_connection_id``:
+
+  - events for the same call are processed strictly in arrival order
+    (CallConnected before ParticipantsUpdated before CallDisconnected);
+  - different calls are processed concurrently, so a slow
+    CallDisconnected (worker stop, transcript persist, post-processing)
+    never delays another call's events.
+
+A call's drain task is started on its first event and exits when its
+queue is empty, so idle calls hold no task.  Queue depth and per-event
+queue wait / processing time are exported on ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from voice_service.voice_metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on events waiting across all calls; beyond this the
+# webhook answers 503 and Event Grid retries later.
+MAX_PENDING_EVENTS = int(os.getenv("AIDA_ACS_EVENT_QUEUE_MAX", "5000"))
+# How long shutdown waits for queued events before cancelling them
+DRAIN_TIMEOUT_SECONDS = float(os.getenv("AIDA_ACS_EVENT_DRAIN_SECONDS", "10"))
+
+_EVENT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_QUEUE_WAIT = REGISTRY.histogram(
+    "aida_voice_acs_event_latency_seconds",
+    "ACS webhook event latency by stage (queue wait, handler processing).",
+    buckets=_EVENT_BUCKETS,
+    labels={"stage": "queue_wait"},
+)
+_PROCESSING = REGISTRY.histogram(
+    "aida_voice_acs_event_latency_seconds",
+    "ACS webhook event latency by stage (queue wait, handler processing).",
+    buckets=_EVENT_BUCKETS,
+    labels={"stage": "processing"},
+)
+_FAILED = REGISTRY.counter(
+    "aida_voice_acs_event_failures_total",
+    "ACS webhook events whose handler raised.",
+)
+
+
+@dataclass(slots=True)
+class QueuedEvent:
+    """One ACS event accepted by the webhook and waiting to be handled."""
+
+    event_type: str
+    data: dict[str, Any]
+    call_connection_id: str
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class CallEventQueue:
+    """
+    FIFO per call with one drain task per call that has pending events.
+
+    Args:
+        process: Coroutine function handling a single event.  Exceptions
+            are logged and counted; processing continues with the next
+            event for the call.
+        max_pending: Maximum events waiting across all calls.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[QueuedEvent], Awaitable[None]],
+        max_pending: int = MAX_PENDING_EVENTS,
+    ) -> None:
+        self._process = process
+        self._max_pending = max_pending
+        self._queues: dict[str, deque[QueuedEvent]] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._pending = 0
+        self._processed = 0
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Events accepted but not yet handled (including in-flight ones)."""
+        return self._pending
+
+    @property
+    def active_calls(self) -> int:
+        """Calls that currently have a drain task."""
+        return len(self._tasks)
+
+    def has_capacity(self, count: int = 1) -> bool:
+        """Whether ``count`` more events can be accepted right now."""
+        return not self._closed and self._pending + count <= self._max_pending
+
+    def submit(self, event: QueuedEvent) -> bool:
+        """
+        Enqueue an event behind any pending events for the same call.
+
+        Returns:
+            False if the queue is closed or full (the event is dropped).
+        """
+        if not self.has_capacity():
+            return False
+        key = event.call_connection_id
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+        queue.append(event)
+        self._pending += 1
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._drain(key), name=f"acs-events:{key}")
+        return True
+
+    async def _drain(self, key: str) -> None:
+        queue = self._queues[key]
+        try:
+            while queue:
+                event = queue.popleft()
+                started = time.monotonic()
+                _QUEUE_WAIT.observe(started - event.enqueued_at)
+                try:
+                    await self._process(event)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    _FAILED.inc()
+                    logger.exception(
+                        "ACS event handler failed: type=%s, call=%s",
+                        event.event_type,
+                        event.call_connection_id,
+                    )
+                finally:
+                    _PROCESSING.observe(time.monotonic() - started)
+                    self._pending -= 1
+                    self._processed += 1
+        finally:
+            # Nothing can be appended between the empty check and here —
+            # submit() runs on the same loop — so dropping the queue is safe.
+            self._pending -= len(queue)
+            del self._queues[key]
+            del self._tasks[key]
+
+    async def close(self, timeout: float = DRAIN_TIMEOUT_SECONDS) -> None:
+        """Stop accepting events, wait for queued ones, then cancel stragglers."""
+        self._closed = True
+        tasks = list(self._tasks.values())
+        if not tasks:
+            return
+        logger.info("Draining ACS event queue: pending=%d, calls=%d", self._pending, len(tasks))
+        _, still_running = await asyncio.wait(tasks, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            await asyncio.gather(*still_running, return_exceptions=True)
+            logger.warning("ACS event queue drain timed out: %d call(s) cancelled", len(still_running))
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth and throughput counters."""
+        return {
+            "pending": self._pending,
+            "active_calls": len(self._tasks),
+            "processed": self._processed,
+            "queue_wait_p99_ms": round(_QUEUE_WAIT.quantile(0.99) * 1000, 2),
+            "processing_p99_ms": round(_PROCESSING.quantile(0.99) * 1000, 2),
+        }